@@ -8,7 +8,7 @@ import tempfile
 import wave
 from dataclasses import dataclass, field
 from time import monotonic
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from websockets.exceptions import ConnectionClosed
 from websockets.server import serve
@@ -40,7 +40,8 @@ class SessionContext:
     last_partial: str = ""
     partial_emitted: bool = False
     last_audio_at: float = 0.0
-    idle_task: Optional[asyncio.Task] = None
+    # Armed: loop timer (no task parked per session); firing: the finalizer task.
+    idle_task: Optional[Union[asyncio.TimerHandle, asyncio.Task]] = None
     last_request_meta: Dict[str, Any] = field(default_factory=dict)
     last_final_text: str = ""
     last_final_norm: str = ""
@@ -627,7 +628,9 @@ class LocalAIServer:
             return b""
 
     def _cancel_idle_timer(self, session: SessionContext) -> None:
-        if session.idle_task and not session.idle_task.done():
+        if isinstance(session.idle_task, asyncio.TimerHandle):
+            session.idle_task.cancel()
+        elif session.idle_task and not session.idle_task.done():
             try:
                 current_task = asyncio.current_task()
             except RuntimeError:
@@ -1026,8 +1029,6 @@ class LocalAIServer:
 
         async def _idle_promote() -> None:
             try:
-                timeout_sec = max(self.buffer_timeout_ms / 1000.0, 0.1)
-                await asyncio.sleep(timeout_sec)
                 recognizer = session.recognizer
                 if recognizer is None:
                     return
@@ -1058,7 +1059,13 @@ class LocalAIServer:
             finally:
                 session.idle_task = None
 
-        session.idle_task = asyncio.create_task(_idle_promote())
+        def _fire() -> None:
+            session.idle_task = asyncio.create_task(_idle_promote())
+
+        # Re-armed on every audio frame: a loop timer cancels in O(1) without
+        # spawning and cancelling a sleeping task per frame.
+        timeout_sec = max(self.buffer_timeout_ms / 1000.0, 0.1)
+        session.idle_task = asyncio.get_running_loop().call_later(timeout_sec, _fire)
 
     async def _handle_audio_payload(
         self,
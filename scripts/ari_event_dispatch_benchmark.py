@@ -0,0 +1,110 @@
+"""Measure ARI event handling cost and task growth under an event storm.
+
+Replays ``--events`` encoded ARI events spread over ``--channels`` channels,
+each event type having ``--handlers`` registered async handlers that yield
+zero to two times. ``legacy`` reproduces the previous listener:
+``json.loads`` plus one ``asyncio.create_task`` per handler per event. ``dispatcher`` uses
+``AriEventDispatcher`` (per-channel serial queues on ``--workers`` workers)
+with the module's decoder (orjson when installed). Reports CPU per event,
+peak live tasks, and per-channel ordering violations.
+
+Usage (from project root):
+
+    PYTHONPATH=. python3 scripts/ari_event_dispatch_benchmark.py --events 100000 --channels 500
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+import structlog
+
+from src.core import ari_dispatcher
+from src.core.ari_dispatcher import AriEventDispatcher
+
+_TYPES = ("StasisStart", "ChannelVarset", "ChannelDtmfReceived", "ChannelStateChange", "StasisEnd")
+
+
+def _messages(events: int, channels: int):
+    out = []
+    for index in range(events):
+        # Each channel's call lifecycle arrives as a burst, as ARI sends it.
+        channel_index = (index // len(_TYPES)) % channels
+        out.append(json.dumps({
+            "type": _TYPES[index % len(_TYPES)],
+            "timestamp": "2024-01-01T00:00:00.000+0000",
+            "application": "asterisk-ai-voice-agent",
+            "channel": {
+                "id": f"1700000000.{channel_index}",
+                "name": f"PJSIP/trunk-{channel_index:08x}",
+                "state": "Up",
+                "caller": {"name": "", "number": "5551234"},
+                "dialplan": {"context": "from-trunk", "exten": "s", "priority": 1},
+            },
+            "seq": index,
+        }))
+    return out
+
+
+async def _run(mode: str, messages, handlers: int, workers: int):
+    last_seq = {}
+    violations = 0
+    peak_tasks = 0
+
+    async def handler(event):
+        nonlocal violations
+        for _ in range(event["seq"] % 3):  # handlers take uneven time
+            await asyncio.sleep(0)
+        channel_id = event["channel"]["id"]
+        if event["seq"] < last_seq.get(channel_id, -1):
+            violations += 1
+        last_seq[channel_id] = event["seq"]
+
+    registry = {event_type: [handler] * handlers for event_type in _TYPES}
+    dispatcher = AriEventDispatcher(registry, workers=workers)
+    pending = set()
+    started = time.process_time()
+    for count, message in enumerate(messages):
+        if mode == "legacy":
+            event = json.loads(message)
+            for fn in registry.get(event.get("type"), ()):
+                task = asyncio.create_task(fn(event))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        else:
+            await dispatcher.dispatch(ari_dispatcher.loads(message))
+        if count % 100 == 0:
+            peak_tasks = max(peak_tasks, len(asyncio.all_tasks()))
+            await asyncio.sleep(0)  # the websocket read yields between frames
+    if mode == "legacy":
+        await asyncio.gather(*pending)
+    else:
+        await dispatcher.drain()
+        await dispatcher.stop()
+    cpu = time.process_time() - started
+    return cpu * 1e6 / len(messages), peak_tasks, violations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--channels", type=int, default=500)
+    parser.add_argument("--handlers", type=int, default=2, help="Handlers registered per event type")
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    messages = _messages(args.events, args.channels)
+
+    decoder = "orjson" if ari_dispatcher.orjson is not None else "json"
+    print(f"decoder for dispatcher mode: {decoder}")
+    print(f"{'mode':>10} {'us/event':>9} {'peak tasks':>11} {'order violations':>17}")
+    for mode in ("legacy", "dispatcher"):
+        per_event, peak, violations = asyncio.run(_run(mode, messages, args.handlers, args.workers))
+        print(f"{mode:>10} {per_event:>9.2f} {peak:>11} {violations:>17}")
+
+
+if __name__ == "__main__":
+    main()
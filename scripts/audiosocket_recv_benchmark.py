@@ -0,0 +1,130 @@
+"""Measure AudioSocket inbound parsing throughput (frames per second per core).
+
+A child process opens ``--connections`` loopback connections, performs the
+UUID handshake and then writes ``--frames`` 20 ms audio frames per
+connection as fast as the sockets accept them. The server process reports
+its own CPU time per frame delivered to the audio callback:
+
+* ``streamreader`` - the previous ``_connection_loop``: two
+  ``readexactly`` awaits per frame and an inline ``await on_audio``.
+* ``protocol``     - ``AudioSocketServer`` with the BufferedProtocol parser,
+  delivering a ``bytes`` copy per frame to ``on_audio`` (engine path).
+* ``batch``        - the same parser with ``on_audio_batch`` (memoryviews).
+
+Usage (from project root):
+
+    PYTHONPATH=. python3 scripts/audiosocket_recv_benchmark.py --connections 50 --frames 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import socket
+import time
+import uuid
+
+import structlog
+
+from src.audio.audiosocket_server import TYPE_AUDIO, TYPE_UUID, AudioSocketServer
+
+
+def _client(port: int, connections: int, frames: int, payload: int) -> None:
+    frame = bytes([TYPE_AUDIO]) + payload.to_bytes(2, "big") + b"\x00" * payload
+    block = frame * 50
+    socks = []
+    for _ in range(connections):
+        sock = socket.create_connection(("127.0.0.1", port))
+        sock.sendall(bytes([TYPE_UUID]) + (16).to_bytes(2, "big") + uuid.uuid4().bytes)
+        socks.append(sock)
+    for _ in range(frames // 50):
+        for sock in socks:
+            sock.sendall(block)
+    for sock in socks:
+        sock.close()
+
+
+async def _legacy_server(on_audio):
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                header = await reader.readexactly(3)
+                length = int.from_bytes(header[1:], "big")
+                payload = await reader.readexactly(length) if length else b""
+                if header[0] == TYPE_AUDIO:
+                    await on_audio("conn", payload)
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def _run(mode: str, connections: int, frames: int, payload: int) -> float:
+    expected = connections * (frames // 50) * 50
+    received = 0
+    done = asyncio.Event()
+    first = {}
+
+    def count(n: int) -> None:
+        nonlocal received
+        if not first:
+            first["cpu"] = time.process_time()
+        received += n
+        if received >= expected:
+            done.set()
+
+    async def on_audio(conn_id, data) -> None:
+        count(1)
+
+    async def on_audio_batch(conn_id, views) -> None:
+        count(len(views))
+
+    async def on_uuid(conn_id, uuid_str) -> bool:
+        return True
+
+    if mode == "streamreader":
+        server = await _legacy_server(on_audio)
+        port = server.sockets[0].getsockname()[1]
+    else:
+        server = AudioSocketServer(
+            "127.0.0.1",
+            0,
+            on_uuid=on_uuid,
+            on_audio=on_audio,
+            on_audio_batch=on_audio_batch if mode == "batch" else None,
+        )
+        await server.start()
+        port = server.port
+
+    client = multiprocessing.Process(target=_client, args=(port, connections, frames, payload))
+    client.start()
+    await asyncio.wait_for(done.wait(), timeout=300)
+    cpu = time.process_time() - first["cpu"]
+    client.join()
+    if mode == "streamreader":
+        server.close()
+        await server.wait_closed()
+    else:
+        await server.stop()
+    return received / cpu if cpu else float("inf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--frames", type=int, default=20000, help="Frames per connection")
+    parser.add_argument("--payload", type=int, default=320, help="Bytes per frame (320 = slin16 20 ms)")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    print(f"{'mode':>13} {'frames/s per core':>18}")
+    for mode in ("streamreader", "protocol", "batch"):
+        rate = asyncio.run(_run(mode, args.connections, args.frames, args.payload))
+        print(f"{mode:>13} {rate:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
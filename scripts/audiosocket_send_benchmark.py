@@ -0,0 +1,114 @@
+"""Measure AudioSocketServer outbound send CPU across many connections.
+
+Opens ``--connections`` loopback AudioSocket clients (handshake only; they
+pause reading so only server-side work is measured) and, every 20 ms, sends
+one audio frame to each. ``legacy`` reproduces the previous per-frame path
+(server lock for the writer lookup, header+payload concatenation, ``write``
+and ``await drain()`` per frame); ``queued`` uses ``send_audio`` with the
+per-connection queues, flushed once per loop iteration or every
+``send_coalesce_ms`` (``--coalesce``). Reports process CPU per second of audio and per
+frame, plus how long one 20 ms round of sends takes.
+
+Usage (from project root):
+
+    PYTHONPATH=. python3 scripts/audiosocket_send_benchmark.py --connections 500 --seconds 5
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+
+import structlog
+
+from src.audio.audiosocket_server import TYPE_AUDIO, TYPE_UUID, AudioSocketServer
+
+
+async def _legacy_send(server: AudioSocketServer, conn_id: str, payload: bytes) -> bool:
+    async with server._lock:
+        writer = server._writers.get(conn_id)
+    if not writer:
+        return False
+    frame = bytes([TYPE_AUDIO]) + len(payload).to_bytes(2, "big") + payload
+    writer.write(frame)
+    await writer.drain()
+    return True
+
+
+async def _run(mode: str, connections: int, seconds: float, payload_size: int, coalesce_ms: int = 0):
+    conn_ids = []
+
+    async def on_uuid(conn_id: str, uuid_str: str) -> bool:
+        conn_ids.append(conn_id)
+        return True
+
+    async def on_audio(conn_id: str, payload: bytes) -> None:
+        return None
+
+    server = AudioSocketServer("127.0.0.1", 0, on_uuid=on_uuid, on_audio=on_audio, send_queue_frames=50, send_coalesce_ms=coalesce_ms)
+    await server.start()
+    clients = []
+    for _ in range(connections):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(bytes([TYPE_UUID]) + (16).to_bytes(2, "big") + uuid.uuid4().bytes)
+        writer.transport.pause_reading()
+        clients.append(writer)
+    while len(conn_ids) < connections:
+        await asyncio.sleep(0.01)
+
+    payload = b"\xff" * payload_size
+    send = _legacy_send if mode == "legacy" else None
+    rounds = int(seconds / 0.02)
+    round_times = []
+    cpu_start = time.process_time()
+    next_at = time.monotonic()
+    for _ in range(rounds):
+        started = time.perf_counter()
+        if send is None:
+            for conn_id in conn_ids:
+                await server.send_audio(conn_id, payload)
+        else:
+            for conn_id in conn_ids:
+                await send(server, conn_id, payload)
+        round_times.append((time.perf_counter() - started) * 1000.0)
+        next_at += 0.02
+        await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+    cpu = time.process_time() - cpu_start
+
+    await server.stop()
+    for writer in clients:
+        writer.close()
+    frames = rounds * connections
+    return {
+        "cpu_ms_per_audio_sec": cpu * 1000.0 / (rounds * 0.02),
+        "us_per_frame": cpu * 1e6 / frames,
+        "round_p50_ms": statistics.median(round_times),
+        "round_max_ms": max(round_times),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--payload", type=int, default=320, help="Bytes per frame (320 = slin16 20 ms)")
+    parser.add_argument("--coalesce", type=int, nargs="*", default=[0, 40], help="send_coalesce_ms values for the queued path")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    print(f"{'mode':>10} {'cpu ms/s':>9} {'us/frame':>9} {'round p50':>10} {'round max':>10}")
+    runs = [("legacy", 0)] + [("queued", coalesce) for coalesce in args.coalesce]
+    for mode, coalesce in runs:
+        result = asyncio.run(_run(mode, args.connections, args.seconds, args.payload, coalesce))
+        label = mode if mode == "legacy" else f"queued/{coalesce}"
+        print(
+            f"{label:>10} {result['cpu_ms_per_audio_sec']:>9.1f} {result['us_per_frame']:>9.2f} "
+            f"{result['round_p50_ms']:>10.2f} {result['round_max_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
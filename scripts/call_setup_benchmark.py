@@ -0,0 +1,166 @@
+"""Measure time from StasisStart to first greeting audio against a slow ARI.
+
+Starts a fake ARI HTTP server in a separate process that answers every
+request after ``--latency-ms`` (plus up to ``--jitter-ms``), and drives
+``--calls`` concurrent call setups through the real ``ARIClient``:
+
+``sequential`` reproduces the previous handler: answer, create bridge, add
+the caller, read ``AI_PROVIDER`` and originate the AudioSocket channel one
+after another; once that channel enters Stasis it is added to the bridge and
+only then is the provider session started.
+
+``planner`` runs the same requests through ``CallSetupPlan`` with the
+dependency graph used by the engine, and starts the provider session while
+the AudioSocket channel joins the bridge.
+
+The AudioSocket channel enters Stasis ``--media-stasis-ms`` after its
+originate returns, and the provider produces its first greeting audio
+``--provider-ms`` after its session starts.
+
+Usage (from project root):
+
+    PYTHONPATH=. python3 scripts/call_setup_benchmark.py --latency-ms 20 --calls 20
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import random
+import statistics
+import time
+import uuid
+
+import aiohttp
+import structlog
+from aiohttp import web
+
+from src.ari_client import ARIClient
+from src.core.call_setup import CallSetupPlan
+
+
+def _serve_fake_ari(latency: float, jitter: float, ports) -> None:
+    """Fake ARI HTTP server, run in its own process like a real Asterisk."""
+    rng = random.Random(3)
+
+    async def handle(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency + rng.random() * jitter)
+        path = request.match_info["tail"]
+        if request.method == "POST" and path == "bridges":
+            return web.json_response({"id": f"bridge-{uuid.uuid4().hex[:8]}"})
+        if request.method == "POST" and path == "channels":
+            return web.json_response({"id": f"as-{uuid.uuid4().hex[:8]}"})
+        if path.endswith("/variable"):
+            return web.json_response({"value": ""})
+        return web.Response(status=204)
+
+    async def serve() -> None:
+        app = web.Application()
+        app.router.add_route("*", "/ari/{tail:.*}", handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0, backlog=4096)
+        await site.start()
+        ports.put(site._server.sockets[0].getsockname()[1])
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+async def _originate(client: ARIClient) -> str:
+    response = await client.send_command("POST", "channels", params={"endpoint": "AudioSocket/127.0.0.1:8090/x/c(ulaw)"})
+    return response["id"]
+
+
+async def _sequential(client: ARIClient, caller: str, media_stasis: float, provider: float) -> None:
+    await client.answer_channel(caller)
+    bridge_id = await client.create_bridge()
+    await client.add_channel_to_bridge(bridge_id, caller)
+    await client.send_command("GET", f"channels/{caller}/variable", params={"variable": "AI_PROVIDER"})
+    media_id = await _originate(client)
+    await asyncio.sleep(media_stasis)  # AudioSocket channel's StasisStart
+    await client.add_channel_to_bridge(bridge_id, media_id)
+    await asyncio.sleep(provider)  # provider session start to first greeting audio
+
+
+async def _planner(client: ARIClient, caller: str, media_stasis: float, provider: float) -> None:
+    plan = CallSetupPlan(caller)
+
+    async def create_bridge():
+        return await client.create_bridge()
+
+    async def add_caller():
+        await client.add_channel_to_bridge(plan.result("bridge"), caller)
+
+    async def session():
+        await asyncio.sleep(0)  # session store write
+
+    async def transport():
+        return await _originate(client)
+
+    plan.step("answer", lambda: client.answer_channel(caller))
+    plan.step("bridge", create_bridge)
+    plan.step("ai_provider", lambda: client.send_command(
+        "GET", f"channels/{caller}/variable", params={"variable": "AI_PROVIDER"}
+    ))
+    plan.step("session", session, after=("bridge",))
+    plan.step("caller_to_bridge", add_caller, after=("answer", "bridge"))
+    plan.step("resolve", session, after=("session", "ai_provider"))
+    plan.step("transport", transport, after=("session",))
+    await plan.run()
+
+    await asyncio.sleep(media_stasis)  # AudioSocket channel's StasisStart
+    await plan.wait("caller_to_bridge")
+    await plan.wait("resolve")
+    await asyncio.gather(
+        client.add_channel_to_bridge(plan.result("bridge"), plan.result("transport")),
+        asyncio.sleep(provider),
+    )
+
+
+async def _run(mode: str, url: str, args) -> list:
+    client = ARIClient("user", "pass", url, "bench")
+    client.http_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+    setup = _sequential if mode == "sequential" else _planner
+    # Warm the keep-alive pool, as on a long-running engine.
+    await asyncio.gather(*(client.send_command("GET", "asterisk/info") for _ in range(args.calls * 3)))
+
+    async def call(index: int) -> float:
+        started = time.perf_counter()
+        await setup(client, f"caller-{index}", args.media_stasis_ms / 1000, args.provider_ms / 1000)
+        return time.perf_counter() - started
+
+    try:
+        return await asyncio.gather(*(call(index) for index in range(args.calls)))
+    finally:
+        await client.disconnect()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20, help="Concurrent call setups")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="ARI response latency")
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--media-stasis-ms", type=float, default=20.0)
+    parser.add_argument("--provider-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=_serve_fake_ari, args=(args.latency_ms / 1000, args.jitter_ms / 1000, ports), daemon=True
+    )
+    server.start()
+    url = f"http://127.0.0.1:{ports.get(timeout=30)}/ari"
+    try:
+        print(f"{'mode':>10} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+        for mode in ("sequential", "planner"):
+            samples = sorted(asyncio.run(_run(mode, url, args)))
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            print(f"{mode:>10} {statistics.median(samples) * 1000:>8.1f} {p95 * 1000:>8.1f} {samples[-1] * 1000:>8.1f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
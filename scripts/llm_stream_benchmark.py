@@ -0,0 +1,127 @@
+"""Compare streamed vs buffered Chat Completions latency for OpenAILLMAdapter.
+
+Starts a local stand-in for the `/chat/completions` endpoint that emits one
+token every ``--token-delay-ms`` (SSE when ``stream: true``, a single JSON body
+otherwise) and reports, per mode, time-to-first-token, time-to-first-sentence
+and full-completion latency.
+
+Usage (from project root):
+
+    PYTHONPATH=. python3 scripts/llm_stream_benchmark.py --tokens 60 --token-delay-ms 25 --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+from aiohttp import web
+
+from src.config import AppConfig, OpenAIProviderConfig
+from src.pipelines.openai import OpenAILLMAdapter
+
+_REPLY = (
+    "Thanks for calling. I can help you with billing, scheduling and order status. "
+    "Which of those would you like to start with today? "
+    "You can also ask me to transfer you to a person at any time."
+)
+
+
+def _build_app(tokens: List[str], token_delay: float) -> web.Application:
+    async def completions(request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        if not payload.get("stream"):
+            await asyncio.sleep(token_delay * len(tokens))
+            body = {"choices": [{"message": {"content": "".join(tokens)}}]}
+            return web.json_response(body)
+
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for token in tokens:
+            await asyncio.sleep(token_delay)
+            chunk = {"choices": [{"delta": {"content": token}}]}
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", completions)
+    return app
+
+
+def _tokenize(text: str, count: int) -> List[str]:
+    words = text.split(" ")
+    tokens = [w if i == 0 else " " + w for i, w in enumerate(words)]
+    while len(tokens) < count:
+        tokens.extend(tokens[: count - len(tokens)])
+    return tokens[:count]
+
+
+async def _run(args: argparse.Namespace) -> None:
+    tokens = _tokenize(_REPLY, args.tokens)
+    runner = web.AppRunner(_build_app(tokens, args.token_delay_ms / 1000.0))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", args.port)
+    await site.start()
+
+    provider = OpenAIProviderConfig(api_key="bench", chat_base_url=f"http://127.0.0.1:{args.port}/v1")
+    app_config = AppConfig(
+        default_provider="openai",
+        providers={"openai": provider.model_dump()},
+        asterisk={"host": "127.0.0.1", "username": "bench", "password": "bench"},
+        llm={"initial_greeting": "hi", "prompt": "prompt", "model": "gpt-4o"},
+    )
+    adapter = OpenAILLMAdapter("openai_llm", app_config, provider, {"timeout_sec": 60})
+    results: Dict[str, Dict[str, List[float]]] = {
+        "buffered": {"ttft": [], "first_sentence": [], "complete": []},
+        "streamed": {"ttft": [], "first_sentence": [], "complete": []},
+    }
+
+    try:
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            await adapter.generate("bench", "hello", {}, {"stream": False})
+            elapsed = (time.perf_counter() - started) * 1000.0
+            # Without streaming nothing is usable until the body is complete.
+            for key in ("ttft", "first_sentence", "complete"):
+                results["buffered"][key].append(elapsed)
+
+            started = time.perf_counter()
+            first_delta = first_sentence = None
+            async for event in adapter.stream_generate("bench", "hello", {}, {}):
+                now = (time.perf_counter() - started) * 1000.0
+                if event.kind == "delta" and first_delta is None:
+                    first_delta = now
+                elif event.kind == "sentence" and first_sentence is None:
+                    first_sentence = now
+            results["streamed"]["ttft"].append(first_delta or 0.0)
+            results["streamed"]["first_sentence"].append(first_sentence or 0.0)
+            results["streamed"]["complete"].append((time.perf_counter() - started) * 1000.0)
+    finally:
+        await adapter.stop()
+        await runner.cleanup()
+
+    print(f"tokens={args.tokens} token_delay_ms={args.token_delay_ms} runs={args.runs}")
+    print(f"{'mode':<10} {'ttft_ms':>10} {'sentence_ms':>12} {'complete_ms':>12}")
+    for mode, series in results.items():
+        print(
+            f"{mode:<10} {statistics.median(series['ttft']):>10.1f} "
+            f"{statistics.median(series['first_sentence']):>12.1f} "
+            f"{statistics.median(series['complete']):>12.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=60)
+    parser.add_argument("--token-delay-ms", type=float, default=25.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=18765)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
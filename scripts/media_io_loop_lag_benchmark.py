@@ -0,0 +1,109 @@
+"""Measure event-loop lag caused by file-mode playback media I/O.
+
+Simulates ``--rate`` file playbacks per second for ``--seconds``: each one
+writes a ``--kb`` μ-law file, sets ownership, checks it is ready and removes
+it later. Every ``--missing-every``-th playback checks a file that never
+appears, as happens when TTS output fails to land.
+
+* ``legacy`` - the previous inline path: ``open``/``write``/``os.chown`` and
+  ``os.path.exists``/``getsize`` on the loop, ``time.sleep(0.1)`` polling up to
+  15 times for readiness (``ARIClient.play_audio_file``), inline ``os.remove``.
+* ``media_io`` - ``MediaIO`` on its executor with one async readiness check.
+
+A ``LoopLagMonitor`` samples every 10 ms; the script prints p50/p99/max lag.
+
+Usage (from project root):
+
+    PYTHONPATH=. python3 scripts/media_io_loop_lag_benchmark.py --rate 50 --seconds 5
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+import structlog
+
+from src.core.media_io import LoopLagMonitor, MediaIO
+
+
+class _RecordingMonitor(LoopLagMonitor):
+    def __init__(self, interval_sec: float):
+        super().__init__(interval_sec)
+        self.lags = []
+
+    def _sample(self) -> None:
+        self.lags.append(max(0.0, self._loop.time() - self._expected))
+        super()._sample()
+
+
+async def _legacy_playback(path: str, data: bytes, missing: bool) -> None:
+    if not missing:
+        with open(path, "wb") as f:
+            f.write(data)
+        try:
+            os.chown(path, 995, 995)
+        except OSError:
+            pass
+    target = path + ".missing" if missing else path
+    for _ in range(15):
+        if os.path.exists(target) and os.access(target, os.R_OK) and os.path.getsize(target) > 0:
+            break
+        time.sleep(0.1)
+    await asyncio.sleep(0.2)  # playback
+    if os.path.exists(path):
+        os.remove(path)
+
+
+async def _media_io_playback(media_io: MediaIO, path: str, data: bytes, missing: bool) -> None:
+    if not missing:
+        await media_io.write_file(path, data)
+    await media_io.ready_size(path + ".missing" if missing else path)
+    await asyncio.sleep(0.2)  # playback
+    await media_io.remove(path)
+
+
+async def _run(mode: str, rate: int, seconds: float, kb: int, missing_every: int) -> list:
+    media_io = MediaIO()
+    monitor = _RecordingMonitor(0.01)
+    monitor.start()
+    data = b"\xff" * (kb * 1024)
+    tasks = []
+    with tempfile.TemporaryDirectory() as media_dir:
+        total = int(rate * seconds)
+        for index in range(total):
+            path = os.path.join(media_dir, f"audio-{index}.ulaw")
+            missing = bool(missing_every) and index % missing_every == missing_every - 1
+            if mode == "legacy":
+                tasks.append(asyncio.create_task(_legacy_playback(path, data, missing)))
+            else:
+                tasks.append(asyncio.create_task(_media_io_playback(media_io, path, data, missing)))
+            await asyncio.sleep(1.0 / rate)
+        await asyncio.gather(*tasks)
+    monitor.stop()
+    media_io.shutdown()
+    return monitor.lags
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=50, help="Playbacks started per second")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--kb", type=int, default=64, help="Media file size (64 KB = 8 s of μ-law)")
+    parser.add_argument("--missing-every", type=int, default=100, help="Every Nth playback checks a missing file (0 = never)")
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    print(f"{'mode':>9} {'lag p50 ms':>11} {'lag p99 ms':>11} {'lag max ms':>11}")
+    for mode in ("legacy", "media_io"):
+        lags = sorted(asyncio.run(_run(mode, args.rate, args.seconds, args.kb, args.missing_every)))
+        p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+        print(f"{mode:>9} {statistics.median(lags) * 1000:>11.2f} {p99 * 1000:>11.2f} {lags[-1] * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Measure OpenAIRealtimeProvider uplink CPU cost per second of call audio.
+
+Feeds synthetic 20 ms AudioSocket frames (PCM16 @ 8 kHz) through
+``send_audio`` with server-side turn detection enabled and a no-op websocket,
+and reports CPU milliseconds spent per call-second plus websocket messages
+per call-second. ``legacy`` reproduces the previous per-frame path
+(resample + ``json.dumps`` for every frame); the other rows use the coalesced
+uplink at the given ``uplink_coalesce_ms``.
+
+Usage (from project root):
+
+    PYTHONPATH=. python3 scripts/realtime_uplink_benchmark.py --seconds 120 --coalesce 20 40 60 100
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import math
+import struct
+import time
+from typing import List
+
+from src.config import OpenAIRealtimeProviderConfig
+from src.providers.openai_realtime import OpenAIRealtimeProvider
+
+
+class _NullWebSocket:
+    closed = False
+
+    def __init__(self) -> None:
+        self.messages = 0
+
+    async def send(self, message) -> None:
+        self.messages += 1
+
+
+def _frames(seconds: int) -> List[bytes]:
+    frames = []
+    for idx in range(seconds * 50):
+        samples = (int(3000 * math.sin(2 * math.pi * 440 * (idx * 160 + n) / 8000)) for n in range(160))
+        frames.append(struct.pack("<160h", *samples))
+    return frames
+
+
+async def _noop(event) -> None:
+    return None
+
+
+def _provider(coalesce_ms: int) -> OpenAIRealtimeProvider:
+    config = OpenAIRealtimeProviderConfig(
+        api_key="bench",
+        input_encoding="slin16",
+        input_sample_rate_hz=8000,
+        turn_detection={"type": "server_vad"},
+        uplink_coalesce_ms=coalesce_ms,
+        uplink_queue_ms=max(500, coalesce_ms * 4),
+    )
+    provider = OpenAIRealtimeProvider(config, _noop)
+    provider.websocket = _NullWebSocket()
+    return provider
+
+
+async def _bench_legacy(frames: List[bytes]) -> tuple:
+    provider = _provider(20)
+    started = time.process_time()
+    for frame in frames:
+        pcm16 = provider._convert_inbound_audio(frame)
+        message = json.dumps({"type": "input_audio_buffer.append", "audio": base64.b64encode(pcm16).decode("ascii")})
+        async with provider._send_lock:
+            await provider.websocket.send(message)
+        await asyncio.sleep(0)
+    return time.process_time() - started, provider.websocket.messages
+
+
+async def _bench_coalesced(frames: List[bytes], coalesce_ms: int) -> tuple:
+    provider = _provider(coalesce_ms)
+    provider._start_uplink()
+    started = time.process_time()
+    for frame in frames:
+        await provider.send_audio(frame)
+        await asyncio.sleep(0)  # let the uplink task drain, as the event loop would between frames
+    while provider._uplink_queue.qsize():
+        await asyncio.sleep(0)
+    elapsed = time.process_time() - started
+    await provider._stop_uplink()
+    return elapsed, provider.websocket.messages
+
+
+async def _run(args: argparse.Namespace) -> None:
+    frames = _frames(args.seconds)
+    rows = [("legacy", await _bench_legacy(frames))]
+    for coalesce_ms in args.coalesce:
+        rows.append((f"{coalesce_ms}ms", await _bench_coalesced(frames, coalesce_ms)))
+
+    print(f"call_seconds={args.seconds} frames={len(frames)}")
+    print(f"{'mode':<8} {'cpu_ms/call_s':>14} {'msgs/call_s':>12}")
+    for label, (cpu_s, messages) in rows:
+        print(f"{label:<8} {cpu_s * 1000.0 / args.seconds:>14.3f} {messages / args.seconds:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=int, default=120)
+    parser.add_argument("--coalesce", type=int, nargs="+", default=[20, 40, 60, 100])
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Max concurrent calls vs. engine worker processes on a synthetic media load.
+
+Each simulated call does the per-frame work of the engine's media path on a
+20 ms cadence: μ-law decode, 8→16 kHz resample, energy VAD, and base64/JSON
+encoding of the uplink message; then the downlink: base64 decode of a 24 kHz
+provider chunk, 24→8 kHz resample and μ-law encode.
+
+For each worker count, calls are split evenly across that many processes
+(one event loop each, as in supervisor mode). A load is sustained when at
+least 99% of frames were processed and p99 frame lateness stayed under one
+frame (20 ms). The call count is doubled until a load fails, then bisected.
+
+Scaling is bounded by physical cores: on a single-core host every worker
+count reports about the same maximum.
+
+Usage (from project root):
+
+    PYTHONPATH=. python3 scripts/shard_scaling_benchmark.py --workers 1 2 4 --seconds 3
+"""
+
+import argparse
+import asyncio
+import audioop
+import base64
+import json
+import multiprocessing
+import os
+import random
+
+from src.audio.resampler import mulaw_to_pcm16le, pcm16le_to_mulaw, resample_audio
+
+FRAME_SEC = 0.02
+
+
+async def _call(index: int, seconds: float, lateness: list, frames: list) -> None:
+    rng = random.Random(index)
+    inbound = bytes(rng.randrange(256) for _ in range(160))  # 20 ms μ-law @ 8 kHz
+    downlink = base64.b64encode(os.urandom(960)).decode()      # 20 ms PCM16 @ 24 kHz
+    up_state = down_state = None
+    loop = asyncio.get_running_loop()
+    start = loop.time() + rng.random() * FRAME_SEC
+    due = start
+    done = 0
+    while due < start + seconds:
+        delay = due - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        lateness.append(loop.time() - due)
+        pcm8 = mulaw_to_pcm16le(inbound)
+        pcm16, up_state = resample_audio(pcm8, 8000, 16000, state=up_state)
+        speaking = audioop.rms(pcm16, 2) > 500
+        json.dumps({"type": "input_audio_buffer.append", "audio": base64.b64encode(pcm16).decode(), "vad": speaking})
+        chunk = base64.b64decode(downlink)
+        pcm_out, down_state = resample_audio(chunk, 24000, 8000, state=down_state)
+        pcm16le_to_mulaw(pcm_out)
+        done += 1
+        due += FRAME_SEC
+    frames.append(done)
+
+
+async def _worker_load(calls: int, seconds: float) -> tuple:
+    lateness: list = []
+    frames: list = []
+    await asyncio.gather(*(_call(index, seconds, lateness, frames) for index in range(calls)))
+    return lateness, sum(frames)
+
+
+def _worker(calls: int, seconds: float, results) -> None:
+    results.put(asyncio.run(_worker_load(calls, seconds)))
+
+
+def _trial(workers: int, calls: int, seconds: float) -> tuple:
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    shares = [calls // workers + (1 if index < calls % workers else 0) for index in range(workers)]
+    processes = [context.Process(target=_worker, args=(share, seconds, results)) for share in shares if share]
+    for process in processes:
+        process.start()
+    lateness: list = []
+    frames = 0
+    for _ in processes:
+        worker_lateness, worker_frames = results.get()
+        lateness.extend(worker_lateness)
+        frames += worker_frames
+    for process in processes:
+        process.join()
+    lateness.sort()
+    p99 = lateness[min(len(lateness) - 1, int(len(lateness) * 0.99))] if lateness else 0.0
+    expected = calls * int(seconds / FRAME_SEC)
+    sustained = frames >= expected * 0.99 and p99 < FRAME_SEC
+    return sustained, p99
+
+
+def _max_calls(workers: int, seconds: float, start: int) -> tuple:
+    low, high = 0, start
+    last_p99 = 0.0
+    while True:
+        ok, p99 = _trial(workers, high, seconds)
+        print(f"  workers={workers} calls={high:>5} p99_late={p99 * 1000:6.1f}ms {'ok' if ok else 'overloaded'}")
+        if not ok:
+            break
+        low, last_p99 = high, p99
+        high *= 2
+    while high - low > max(1, low // 20):
+        middle = (low + high) // 2
+        ok, p99 = _trial(workers, middle, seconds)
+        print(f"  workers={workers} calls={middle:>5} p99_late={p99 * 1000:6.1f}ms {'ok' if ok else 'overloaded'}")
+        if ok:
+            low, last_p99 = middle, p99
+        else:
+            high = middle
+    return low, last_p99
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each trial")
+    parser.add_argument("--start-calls", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"host cores: {os.cpu_count()}")
+    rows = []
+    for workers in args.workers:
+        rows.append((workers, *_max_calls(workers, args.seconds, args.start_calls)))
+    print(f"\n{'workers':>8} {'max calls':>10} {'p99 late ms':>12}")
+    for workers, calls, p99 in rows:
+        print(f"{workers:>8} {calls:>10} {p99 * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Measure StreamingPlaybackManager CPU cost per 20 ms AudioSocket frame.
+
+``legacy`` reproduces the previous hot path: for every provider chunk a
+``SessionStore.get_by_call_id`` + ``upsert_call`` round-trip plus three
+Prometheus ``labels()`` updates, and another ``get_by_call_id`` per frame
+sent. ``context`` drives the current path: per-chunk bookkeeping on the
+cached stream context, ``_send_audio_chunk`` using the cached connection
+handle, and the counter flush at ``session_flush_interval_ms`` cadence.
+
+Both modes run against a populated SessionStore (``--calls`` sessions) and a
+no-op AudioSocket server, so the numbers isolate the manager's own overhead.
+
+Usage (from project root):
+
+    PYTHONPATH=. python3 scripts/streaming_frame_benchmark.py --frames 50000 --calls 1000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+import structlog
+
+from src.core import streaming_playback_manager as spm
+from src.core.models import CallSession
+from src.core.session_store import SessionStore
+from src.core.streaming_playback_manager import StreamingPlaybackManager
+
+
+class _NullAudioSocket:
+    async def send_audio(self, conn_id, payload) -> bool:
+        return True
+
+
+async def _legacy(manager: StreamingPlaybackManager, call_id: str, frames: int) -> None:
+    store = manager.session_store
+    chunk = b"\xff" * 160
+    for _ in range(frames):
+        spm._STREAMING_BYTES_TOTAL.labels(call_id).inc(len(chunk))
+        spm._STREAMING_JITTER_DEPTH.labels(call_id).set(1)
+        spm._STREAMING_LAST_CHUNK_AGE.labels(call_id).set(0.0)
+        sess = await store.get_by_call_id(call_id)
+        sess.streaming_bytes_sent += len(chunk)
+        sess.streaming_jitter_buffer_depth = 1
+        await store.upsert_call(sess)
+        session = await store.get_by_call_id(call_id)
+        await manager.audiosocket_server.send_audio(session.audiosocket_conn_id, chunk)
+
+
+async def _context(manager: StreamingPlaybackManager, call_id: str, frames: int, flush_every: int) -> None:
+    context = spm._StreamContext(
+        call_id=call_id,
+        stream_id="bench",
+        bytes_metric=spm._STREAMING_BYTES_TOTAL.labels(call_id),
+        depth_metric=spm._STREAMING_JITTER_DEPTH.labels(call_id),
+    )
+    await manager._refresh_stream_context(context)
+    manager._stream_contexts[call_id] = context
+    manager._first_send_logged.add(call_id)
+    chunk = b"\xff" * 160
+    for index in range(frames):
+        context.bytes_pending += len(chunk)
+        context.jitter_depth = 1
+        await manager._send_audio_chunk(call_id, "bench", chunk)
+        if index % flush_every == flush_every - 1:
+            await manager._flush_stream_counters(context)
+    await manager._flush_stream_counters(context)
+
+
+async def _run(mode: str, frames: int, calls: int) -> float:
+    store = SessionStore()
+    for index in range(calls):
+        await store.upsert_call(
+            CallSession(call_id=f"call-{index}", caller_channel_id=f"call-{index}", audiosocket_conn_id=f"conn-{index}")
+        )
+    manager = StreamingPlaybackManager(
+        store, None, audio_transport="audiosocket", audiosocket_server=_NullAudioSocket()
+    )
+    flush_every = max(1, manager.session_flush_interval_ms // max(1, manager.chunk_size_ms))
+    started = time.process_time()
+    if mode == "legacy":
+        await _legacy(manager, "call-0", frames)
+    else:
+        await _context(manager, "call-0", frames, flush_every)
+    return (time.process_time() - started) / frames * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=50000)
+    parser.add_argument("--calls", type=int, default=1000, help="Sessions in the store")
+    args = parser.parse_args()
+
+    # Benchmark the code path, not log rendering.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    print(f"{'mode':>8} {'us/frame':>9} {'frames/s per core':>18}")
+    for mode in ("legacy", "context"):
+        per_frame = asyncio.run(_run(mode, args.frames, args.calls))
+        print(f"{mode:>8} {per_frame:>9.2f} {1e6 / per_frame:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Measure event-loop overhead of per-call timers: sleep tasks vs the shared timer wheel.
+
+Each simulated call holds one periodic keepalive timer (like the streaming
+keepalive) and one deadline that is re-armed as media arrives (like the
+transcript flush, capture fallback or idle finalizer). ``tasks`` reproduces
+the previous pattern (one ``asyncio.sleep`` task per timer, cancelled and
+re-created on every re-arm); ``wheel`` uses ``src.core.timer_wheel``.
+
+Reports CPU milliseconds per wall second, live asyncio tasks, and the
+lateness of a 10 ms probe sleep (p50/p99) as a proxy for loop lag.
+
+Usage (from project root):
+
+    PYTHONPATH=. python3 scripts/timer_wheel_benchmark.py --calls 1000 5000 --seconds 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+from src.core.timer_wheel import TimerWheel
+
+
+def _noop(*args) -> None:
+    return None
+
+
+class _TaskTimers:
+    def __init__(self) -> None:
+        self.deadlines: Dict[int, asyncio.Task] = {}
+        self.keepalives: List[asyncio.Task] = []
+
+    def start(self, calls: int, keepalive_sec: float) -> None:
+        async def keepalive(call: int) -> None:
+            while True:
+                await asyncio.sleep(keepalive_sec)
+                _noop(call)
+
+        self.keepalives = [asyncio.create_task(keepalive(call)) for call in range(calls)]
+
+    def rearm(self, call: int, delay_sec: float) -> None:
+        async def deadline() -> None:
+            await asyncio.sleep(delay_sec)
+            _noop(call)
+
+        previous = self.deadlines.get(call)
+        if previous and not previous.done():
+            previous.cancel()
+        self.deadlines[call] = asyncio.create_task(deadline())
+
+    async def stop(self) -> None:
+        tasks = self.keepalives + list(self.deadlines.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _WheelTimers:
+    def __init__(self) -> None:
+        self.wheel = TimerWheel()
+        self.deadlines: Dict[int, object] = {}
+
+    def start(self, calls: int, keepalive_sec: float) -> None:
+        for call in range(calls):
+            self.wheel.call_every(keepalive_sec, _noop, call)
+
+    def rearm(self, call: int, delay_sec: float) -> None:
+        previous = self.deadlines.get(call)
+        if previous is not None:
+            previous.cancel()
+        self.deadlines[call] = self.wheel.call_later(delay_sec, _noop, call)
+
+    async def stop(self) -> None:
+        await self.wheel.stop()
+
+
+async def _run(mode: str, calls: int, seconds: float, rearm_ms: int, keepalive_sec: float, deadline_sec: float) -> Dict[str, float]:
+    timers = _TaskTimers() if mode == "tasks" else _WheelTimers()
+    timers.start(calls, keepalive_sec)
+    for call in range(calls):
+        timers.rearm(call, deadline_sec)
+
+    stop_at = time.monotonic() + seconds
+    lateness: List[float] = []
+
+    async def media() -> None:
+        # Every call re-arms its deadline once per ``rearm_ms``, spread across 20 ms frames.
+        frames = max(1, rearm_ms // 20)
+        frame = 0
+        while time.monotonic() < stop_at:
+            for call in range(frame % frames, calls, frames):
+                timers.rearm(call, deadline_sec)
+            frame += 1
+            await asyncio.sleep(0.02)
+
+    async def probe() -> None:
+        while time.monotonic() < stop_at:
+            started = time.monotonic()
+            await asyncio.sleep(0.01)
+            lateness.append((time.monotonic() - started - 0.01) * 1000.0)
+
+    await asyncio.sleep(0.5)  # settle
+    cpu_start, wall_start = time.process_time(), time.monotonic()
+    live_tasks = len(asyncio.all_tasks())
+    await asyncio.gather(media(), probe())
+    cpu = time.process_time() - cpu_start
+    wall = time.monotonic() - wall_start
+    await timers.stop()
+
+    lateness.sort()
+    return {
+        "cpu_ms_per_sec": cpu * 1000.0 / wall,
+        "tasks": live_tasks,
+        "lag_p50_ms": statistics.median(lateness) if lateness else 0.0,
+        "lag_p99_ms": lateness[int(len(lateness) * 0.99) - 1] if lateness else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--rearm-ms", type=int, default=200, help="How often each call re-arms its deadline")
+    parser.add_argument("--keepalive-sec", type=float, default=5.0)
+    parser.add_argument("--deadline-sec", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{'calls':>6} {'mode':>6} {'cpu ms/s':>9} {'tasks':>7} {'lag p50':>8} {'lag p99':>8}")
+    for calls in args.calls:
+        for mode in ("tasks", "wheel"):
+            result = asyncio.run(
+                _run(mode, calls, args.seconds, args.rearm_ms, args.keepalive_sec, args.deadline_sec)
+            )
+            print(
+                f"{calls:>6} {mode:>6} {result['cpu_ms_per_sec']:>9.1f} {result['tasks']:>7d} "
+                f"{result['lag_p50_ms']:>8.2f} {result['lag_p99_ms']:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,14 @@ Focuses on robust connection and logging to debug startup issues.
 """
 
 import asyncio
-import json
-import os
+import random
 import time
 import uuid
 import audioop
-import wave
-from typing import Dict, Any, Optional, Callable, List
+from types import SimpleNamespace
+from typing import Awaitable, Dict, Any, Optional, Callable, List, Set
 import aiohttp
+from prometheus_client import Counter, Gauge, Histogram
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import websockets
 import structlog
@@ -21,14 +21,60 @@ from websockets.exceptions import ConnectionClosed
 from websockets.legacy.client import WebSocketClientProtocol
 
 from .config import AsteriskConfig
+from .core.ari_dispatcher import AriEventDispatcher, JSONDecodeError, loads
+from .core.http_client import get_named_http_client_manager
+from .core.media_io import get_media_io
+from .core.media_store import get_media_store
+from .core.timer_wheel import get_timer_wheel
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_ARI_EVENTS_RECEIVED = Counter(
+    "ai_agent_ari_events_received_total",
+    "ARI websocket events received and decoded",
+    labelnames=("event_type",),
+)
+_ARI_EVENTS_HANDLED = Counter(
+    "ai_agent_ari_events_handled_total",
+    "ARI websocket events that had at least one registered handler",
+    labelnames=("event_type",),
+)
+_ARI_SUBSCRIPTIONS = Gauge(
+    "ai_agent_ari_subscriptions",
+    "Channels/bridges the ARI app is explicitly subscribed to",
+)
+_ARI_CONNECTED = Gauge(
+    "ai_agent_ari_connected",
+    "1 while the ARI event websocket is connected",
+)
+_ARI_RECONNECT_ATTEMPTS = Counter(
+    "ai_agent_ari_reconnect_attempts_total",
+    "ARI websocket reconnect attempts",
+    labelnames=("result",),  # result: success|failure
+)
+_ARI_RECONNECT_SECONDS = Histogram(
+    "ai_agent_ari_reconnect_seconds",
+    "Time from losing the ARI websocket until it was reconnected",
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+
 class ARIClient:
     """A client for interacting with the Asterisk REST Interface (ARI)."""
 
-    def __init__(self, username: str, password: str, base_url: str, app_name: str):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        base_url: str,
+        app_name: str,
+        event_workers: int = 16,
+        event_queue_max: int = 5000,
+        subscribe_all: bool = False,
+        reconnect_backoff_min_sec: float = 0.5,
+        reconnect_backoff_max_sec: float = 30.0,
+        http_pool_size: int = 20,
+    ):
         self.username = username
         self.password = password
         self.app_name = app_name
@@ -36,13 +82,37 @@ class ARIClient:
         ws_host = base_url.replace("http://", "").split('/')[0]
         safe_username = quote(username)
         safe_password = quote(password)
-        self.ws_url = f"ws://{ws_host}/ari/events?api_key={safe_username}:{safe_password}&app={app_name}&subscribeAll=true&subscribe=ChannelAudioFrame"
+        # Without subscribeAll the app only sees its own Stasis channels plus the
+        # channels/bridges subscribed explicitly through subscribe()/unsubscribe().
+        self.subscribe_all = subscribe_all
+        self.ws_url = (
+            f"ws://{ws_host}/ari/events?api_key={safe_username}:{safe_password}&app={app_name}"
+            f"&subscribeAll={'true' if subscribe_all else 'false'}&subscribe=ChannelAudioFrame"
+        )
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
         self.http_session: Optional[aiohttp.ClientSession] = None
+        # Dedicated REST pool: provider traffic on the shared pool cannot starve call control.
+        self.http_pool_size = max(1, int(http_pool_size))
         self.running = False
         self.event_handlers: Dict[str, List[Callable]] = {}
+        # Event sources ("channel:<id>", "bridge:<id>") the app is subscribed to,
+        # with pending changes flushed in one REST call per direction.
+        self.subscriptions: Set[str] = set()
+        self._pending_subscribe: Set[str] = set()
+        self._pending_unsubscribe: Set[str] = set()
+        self._subscription_task: Optional[asyncio.Task] = None
+        # Per-channel ordered handling of websocket events on a bounded worker pool
+        self.dispatcher = AriEventDispatcher(
+            self.event_handlers, workers=event_workers, max_pending=event_queue_max
+        )
         self.active_playbacks: Dict[str, str] = {}
         self.audio_frame_handler: Optional[Callable] = None
+        # Supervised reconnect (run()): jittered exponential backoff, then the
+        # on_reconnect handlers resynchronise state missed while disconnected.
+        self.reconnect_backoff_min_sec = max(0.01, float(reconnect_backoff_min_sec))
+        self.reconnect_backoff_max_sec = max(self.reconnect_backoff_min_sec, float(reconnect_backoff_max_sec))
+        self._reconnect_handlers: List[Callable[[], Awaitable[Any]]] = []
+        self._closing = False
 
     def on_event(self, event_type: str, handler: Callable):
         """Alias for add_event_handler for backward compatibility."""
@@ -58,7 +128,13 @@ class ARIClient:
         logger.info("Connecting to ARI...")
         try:
             # First, test HTTP connection to ensure ARI is available
-            self.http_session = aiohttp.ClientSession(auth=aiohttp.BasicAuth(self.username, self.password))
+            pool = get_named_http_client_manager(
+                "ari",
+                SimpleNamespace(limit=self.http_pool_size, limit_per_host=self.http_pool_size),
+            )
+            self.http_session = pool.session(
+                auth=aiohttp.BasicAuth(self.username, self.password)
+            )
             async with self.http_session.get(f"{self.http_url}/asterisk/info") as response:
                 if response.status != 200:
                     raise ConnectionError(f"Failed to connect to ARI HTTP endpoint. Status: {response.status}")
@@ -67,6 +143,8 @@ class ARIClient:
             # Then, connect to the WebSocket
             self.websocket = await websockets.connect(self.ws_url)
             self.running = True
+            self._closing = False
+            _ARI_CONNECTED.set(1)
             logger.info("Successfully connected to ARI WebSocket.")
         except Exception as e:
             logger.error("Failed to connect to ARI, will retry...", error=str(e), exc_info=True)
@@ -86,23 +164,26 @@ class ARIClient:
 
             async for message in self.websocket:
                 try:
-                    event_data = json.loads(message)
-                    event_type = event_data.get("type")
-                    
-                    # Handle audio frames from ExternalMedia connections
-                    if event_type == "ChannelAudioFrame":
-                        channel = event_data.get('channel', {})
-                        channel_id = channel.get('id')
-                        logger.debug("ChannelAudioFrame received", channel_id=channel_id)
-                        asyncio.create_task(self._on_audio_frame(channel, event_data))
-                    
-                    # Handle other events
-                    if event_type and event_type in self.event_handlers:
-                        for handler in self.event_handlers[event_type]:
-                            # Call the handler with just the event data
-                            asyncio.create_task(handler(event_data))
-                except json.JSONDecodeError:
+                    event_data = loads(message)
+                except JSONDecodeError:
                     logger.warning("Failed to decode ARI event JSON", message=message)
+                    continue
+                if not isinstance(event_data, dict):
+                    continue
+                event_type = event_data.get("type")
+                _ARI_EVENTS_RECEIVED.labels(event_type or "unknown").inc()
+
+                # Handle audio frames from ExternalMedia connections
+                if event_type == "ChannelAudioFrame":
+                    channel = event_data.get('channel', {})
+                    logger.debug("ChannelAudioFrame received", channel_id=channel.get('id'))
+                    await self.dispatcher.dispatch(
+                        event_data, lambda event, channel=channel: self._on_audio_frame(channel, event)
+                    )
+
+                # Registered handlers run in order per channel; waits here when the queue is full
+                if await self.dispatcher.dispatch(event_data):
+                    _ARI_EVENTS_HANDLED.labels(event_type).inc()
         except ConnectionClosed:
             logger.warning("ARI WebSocket connection closed.")
             self.running = False
@@ -110,17 +191,161 @@ class ARIClient:
             logger.error("An error occurred in the ARI listener", exc_info=True)
             self.running = False
 
+    def on_reconnect(self, handler: Callable[[], Awaitable[Any]]) -> None:
+        """Register ``handler`` to run after ``run()`` re-establishes the websocket."""
+        self._reconnect_handlers.append(handler)
+
+    async def run(self) -> None:
+        """Listen for events until ``disconnect()``, reconnecting whenever the websocket drops."""
+        while not self._closing:
+            await self.start_listening()
+            if self._closing:
+                break
+            _ARI_CONNECTED.set(0)
+            dropped = time.monotonic()
+            if not await self._reconnect():
+                break
+            _ARI_RECONNECT_SECONDS.observe(time.monotonic() - dropped)
+            # Asterisk may have dropped the app's subscriptions with the websocket.
+            self._pending_subscribe = set(self.subscriptions)
+            self._pending_unsubscribe.clear()
+            self._schedule_subscription_flush()
+            # Resync alongside the listener so events are not held up behind REST calls.
+            asyncio.create_task(self._run_reconnect_handlers())
+        _ARI_CONNECTED.set(0)
+
+    async def _run_reconnect_handlers(self) -> None:
+        for handler in list(self._reconnect_handlers):
+            try:
+                await handler()
+            except Exception:
+                logger.error("ARI reconnect handler failed", handler=getattr(handler, "__name__", repr(handler)), exc_info=True)
+
+    async def _reconnect(self) -> bool:
+        """Reconnect the websocket with jittered exponential backoff; False once disconnect() is called."""
+        attempt = 0
+        while not self._closing:
+            ceiling = min(self.reconnect_backoff_max_sec, self.reconnect_backoff_min_sec * (2 ** attempt))
+            delay = random.uniform(ceiling / 2, ceiling)
+            logger.warning("ARI websocket lost; reconnecting", attempt=attempt + 1, delay_sec=round(delay, 2))
+            await asyncio.sleep(delay)
+            if self._closing:
+                break
+            try:
+                websocket = await websockets.connect(self.ws_url)
+            except Exception as exc:
+                _ARI_RECONNECT_ATTEMPTS.labels("failure").inc()
+                logger.warning("ARI websocket reconnect failed", attempt=attempt + 1, error=str(exc))
+                attempt += 1
+                continue
+            if self._closing:
+                await websocket.close()
+                break
+            _ARI_RECONNECT_ATTEMPTS.labels("success").inc()
+            self.websocket = websocket
+            self.running = True
+            _ARI_CONNECTED.set(1)
+            logger.info("ARI websocket reconnected", attempts=attempt + 1)
+            return True
+        return False
+
+    async def list_channels(self) -> Optional[List[Dict[str, Any]]]:
+        """All channels on the Asterisk server, or None if the request failed."""
+        response = await self.send_command("GET", "channels")
+        return response if isinstance(response, list) else None
+
+    async def list_bridges(self) -> Optional[List[Dict[str, Any]]]:
+        """All bridges on the Asterisk server, or None if the request failed."""
+        response = await self.send_command("GET", "bridges")
+        return response if isinstance(response, list) else None
+
+    async def playback_exists(self, playback_id: str) -> bool:
+        """False only when Asterisk reports the playback gone (404)."""
+        response = await self.send_command("GET", f"playbacks/{playback_id}", tolerate_statuses=[404])
+        return not (isinstance(response, dict) and response.get("status") == 404)
+
     async def disconnect(self):
         """Disconnect from the ARI WebSocket and close the HTTP session."""
+        self._closing = True
         self.running = False
+        _ARI_CONNECTED.set(0)
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
+        await self.dispatcher.stop()
+        if self._subscription_task and not self._subscription_task.done():
+            self._subscription_task.cancel()
+        self.subscriptions.clear()
+        self._pending_subscribe.clear()
+        self._pending_unsubscribe.clear()
+        _ARI_SUBSCRIPTIONS.set(0)
         if self.http_session and not self.http_session.closed:
             await self.http_session.close()
             self.http_session = None
         logger.info("Disconnected from ARI.")
 
+    def subscribe(self, *sources: str) -> None:
+        """Subscribe the app to event sources such as ``channel:<id>`` or ``bridge:<id>``.
+
+        Non-blocking: changes made in the same loop iteration are sent together
+        via ``applications/{app}/subscription`` by a background flush.
+        """
+        if self.subscribe_all:
+            return
+        added = [source for source in sources if source and source not in self.subscriptions]
+        if not added:
+            return
+        self.subscriptions.update(added)
+        self._pending_subscribe.update(added)
+        self._pending_unsubscribe.difference_update(added)
+        self._schedule_subscription_flush()
+
+    def unsubscribe(self, *sources: str) -> None:
+        """Drop event sources previously passed to ``subscribe``; unknown sources are ignored."""
+        removed = [source for source in sources if source in self.subscriptions]
+        if not removed:
+            return
+        self.subscriptions.difference_update(removed)
+        for source in removed:
+            if source in self._pending_subscribe:
+                self._pending_subscribe.discard(source)
+            else:
+                self._pending_unsubscribe.add(source)
+        self._schedule_subscription_flush()
+
+    def _schedule_subscription_flush(self) -> None:
+        _ARI_SUBSCRIPTIONS.set(len(self.subscriptions))
+        if self._subscription_task is None or self._subscription_task.done():
+            self._subscription_task = asyncio.create_task(self.flush_subscriptions())
+
+    async def flush_subscriptions(self) -> None:
+        """Send pending subscription changes (also awaited by tests)."""
+        await asyncio.sleep(0)  # pick up every change made in the current loop iteration
+        while self._pending_subscribe or self._pending_unsubscribe:
+            added, self._pending_subscribe = self._pending_subscribe, set()
+            removed, self._pending_unsubscribe = self._pending_unsubscribe, set()
+            if added:
+                await self._send_subscription("POST", sorted(added))
+            if removed:
+                await self._send_subscription("DELETE", sorted(removed))
+
+    async def _send_subscription(self, method: str, sources: List[str]) -> None:
+        resource = f"applications/{quote(self.app_name)}/subscription"
+        # 400/404/422: a source already gone (hung up, destroyed) or not subscribed.
+        tolerated = [400, 404, 422]
+        response = await self.send_command(
+            method, resource, params={"eventSource": ",".join(sources)}, tolerate_statuses=tolerated
+        )
+        status = response.get("status") if isinstance(response, dict) else None
+        if status is None or status < 400:
+            return
+        if len(sources) > 1:
+            # One missing source fails the whole batch; retry individually.
+            for source in sources:
+                await self._send_subscription(method, [source])
+            return
+        logger.debug("ARI subscription change skipped", method=method, event_source=sources[0], status=status)
+
     def add_event_handler(self, event_type: str, handler: Callable):
         """Register a handler for a specific ARI event type."""
         if event_type not in self.event_handlers:
@@ -215,6 +440,18 @@ class ARIClient:
         if response and response.get("status") == 404:
             logger.debug("Channel hangup failed (404), likely already hung up.", channel_id=channel_id)
 
+    async def move_channel(self, channel_id: str, app: str, app_args: Optional[List[str]] = None) -> bool:
+        """Move a channel from this Stasis application to ``app`` (Asterisk 16.6+)."""
+        params = {"app": app}
+        if app_args:
+            params["appArgs"] = ",".join(app_args)
+        # 404: channel gone; 409: channel not in Stasis; 422: target app not registered.
+        response = await self.send_command(
+            "POST", f"channels/{channel_id}/move", params=params, tolerate_statuses=[404, 409, 422]
+        )
+        status = response.get("status") if isinstance(response, dict) else None
+        return status is None or status < 400
+
     async def execute_application(self, channel_id: str, app_name: str, app_data: str) -> bool:
         """Execute an Asterisk application on a channel."""
         try:
@@ -267,6 +504,7 @@ class ARIClient:
             
             if response.get("id"):
                 logger.info("Bridge created", bridge_id=response["id"], bridge_type=bridge_type)
+                self.subscribe(f"bridge:{response['id']}")
                 return response["id"]
             else:
                 logger.error("Failed to create bridge", response=response)
@@ -347,29 +585,14 @@ class ARIClient:
             logger.debug("Writing ulaw audio file to ai-generated subdirectory", path=container_path)
             
             logger.debug("Writing ulaw audio file", path=container_path, size=len(audio_data))
-            with open(container_path, "wb") as f:
-                f.write(audio_data)
+            # Written and chowned to the asterisk user (995:995) on the media I/O executor;
+            # the file is complete once the await returns.
+            file_size = await get_media_io().write_file(container_path, audio_data)
+            await get_media_store().add(container_path, file_size)
             
             # Audio generated as ulaw format at 8000 Hz for Asterisk compatibility
-            logger.debug("Ulaw audio file written (generated as ulaw at 8000 Hz)", path=container_path)
-            
-            # Change ownership to asterisk user so Asterisk can read the file
-            # Use hardcoded UID/GID since pwd.getpwnam doesn't work in container
-            try:
-                asterisk_uid = 995  # asterisk user UID
-                asterisk_gid = 995  # asterisk group GID
-                os.chown(container_path, asterisk_uid, asterisk_gid)
-                logger.debug("Changed file ownership to asterisk user", path=container_path, uid=asterisk_uid, gid=asterisk_gid)
-            except Exception as e:
-                logger.warning("Failed to change file ownership", path=container_path, error=str(e))
-            
-            logger.debug("Verifying file creation", path=container_path, exists=os.path.exists(container_path))
-            if os.path.exists(container_path):
-                file_size = os.path.getsize(container_path)
-                logger.debug("File created successfully", path=container_path, size=file_size)
-                
-                # File is ready for playback
-                logger.debug("Attempting to play media", channel_id=channel_id, media_uri=asterisk_media_uri)
+            logger.debug("Ulaw audio file written (generated as ulaw at 8000 Hz)", path=container_path, size=file_size)
+            logger.debug("Attempting to play media", channel_id=channel_id, media_uri=asterisk_media_uri)
 
             playback = await self.play_media(channel_id, asterisk_media_uri)
             if playback and 'id' in playback:
@@ -382,6 +605,7 @@ class ARIClient:
                 logger.error("Failed to initiate audio playback", 
                            channel_id=channel_id, 
                            playback_response=playback)
+                await get_media_store().release(container_path)
         except Exception as e:
             logger.error("Failed to play audio file", channel_id=channel_id, error=str(e), exc_info=True)
 
@@ -391,14 +615,12 @@ class ARIClient:
         file_path = self.active_playbacks.pop(playback_id, None)
         if file_path:
             # Add a delay to ensure Asterisk has finished with the file
-            import asyncio
             await asyncio.sleep(2.0)
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                    logger.debug("Successfully deleted audio file", file_path=file_path)
-                except OSError:
-                    logger.error("Error deleting audio file", file_path=file_path, exc_info=True)
+            try:
+                await get_media_store().release(file_path)
+                logger.debug("Released audio file", file_path=file_path)
+            except OSError:
+                logger.error("Error deleting audio file", file_path=file_path, exc_info=True)
         
         # Call the engine's PlaybackFinished handler if it exists
         if hasattr(self, 'engine') and hasattr(self.engine, '_on_playback_finished'):
@@ -406,26 +628,10 @@ class ARIClient:
 
     async def cleanup_call_files(self, channel_id: str):
         """Clean up any remaining audio files for a specific call."""
-        import os
-        import glob
-        
-        # Clean up any files that might be associated with this call
-        # Look for files in the ai-generated directory that might be orphaned
-        ai_generated_dir = "/mnt/asterisk_media/ai-generated"
-        if os.path.exists(ai_generated_dir):
-            # Find any files that might be associated with this call
-            # This is a safety net for files that weren't cleaned up by playback_finished
-            pattern = os.path.join(ai_generated_dir, "response-*.ulaw")
-            files = glob.glob(pattern)
-            
-            for file_path in files:
-                try:
-                    # Check if file is older than 30 seconds (safety check)
-                    if os.path.getmtime(file_path) < (time.time() - 30):
-                        os.remove(file_path)
-                        logger.debug("Cleaned up orphaned audio file", file_path=file_path)
-                except OSError as e:
-                    logger.debug("Could not clean up file", file_path=file_path, error=str(e))
+        # Safety net for files that weren't cleaned up by playback_finished: the media
+        # store reclaims orphans and stale references without touching files in use.
+        counts = await get_media_store().sweep()
+        logger.debug("Media store swept at call cleanup", channel_id=channel_id, **counts)
 
     async def _on_audio_frame(self, channel, event):
         """Handles incoming raw audio frames from the snoop channel."""
@@ -465,38 +671,13 @@ class ARIClient:
     async def play_audio_file(self, channel_id: str, file_path: str) -> bool:
         """Play an audio file to the specified channel with enhanced error handling."""
         try:
-            import time
             start_time = time.time()
             
-            # Enhanced file verification with detailed logging
-            for attempt in range(15):  # Try up to 15 times (1.5 seconds total)
-                if os.path.exists(file_path):
-                    if os.access(file_path, os.R_OK):
-                        file_size = os.path.getsize(file_path)
-                        if file_size > 0:
-                            logger.debug(f"File verified: {file_path} ({file_size} bytes) - attempt {attempt + 1}")
-                            break
-                        else:
-                            logger.warning(f"File exists but is empty: {file_path} - attempt {attempt + 1}")
-                    else:
-                        logger.warning(f"File exists but not readable: {file_path} (permissions: {oct(os.stat(file_path).st_mode)[-3:]}) - attempt {attempt + 1}")
-                else:
-                    logger.warning(f"File not found: {file_path} - attempt {attempt + 1}")
-                
-                time.sleep(0.1)  # 100ms delay
-            
-            # Final verification
-            if not os.path.exists(file_path):
-                logger.error(f"Audio file not found after 15 attempts: {file_path}")
-                return False
-            
-            if not os.access(file_path, os.R_OK):
-                logger.error(f"Audio file not readable: {file_path} (permissions: {oct(os.stat(file_path).st_mode)[-3:]})")
-                return False
-
-            file_size = os.path.getsize(file_path)
-            if file_size == 0:
-                logger.error(f"Audio file is empty: {file_path}")
+            # One readiness check on the media I/O executor: callers write the file
+            # through MediaIO before playing it, so it is complete by now.
+            file_size = await get_media_io().ready_size(file_path)
+            if file_size is None:
+                logger.error(f"Audio file missing, unreadable or empty: {file_path}")
                 return False
 
             # Set channel variable for debugging
@@ -532,34 +713,20 @@ class ARIClient:
             pcm_data = audioop.ulaw2lin(ulaw_data, 2)  # 2 bytes per sample (16-bit)
             
             # Create timestamped filename for better debugging
-            import time
             timestamp = int(time.time() * 1000)  # milliseconds
             filename = f"audio_{timestamp}_{len(pcm_data)}.wav"
             temp_file_path = f"/tmp/asterisk-audio/{filename}"
             
-            # Write WAV file
-            with wave.open(temp_file_path, 'wb') as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(2)  # 2 bytes per sample (16-bit)
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(pcm_data)
-            
-            # Set proper permissions for Asterisk to read the file
-            os.chmod(temp_file_path, 0o644)  # rw-r--r--
-            
-            # Force filesystem sync and verify file exists
-            os.sync()  # Force filesystem sync
+            # Write the WAV file, fsync it and make it readable by Asterisk (rw-r--r--)
+            # on the media I/O executor; it is accessible once the await returns.
+            media_io = get_media_io()
+            await media_io.write_wav(temp_file_path, pcm_data, sample_rate, 0o644)
+            file_size = await media_io.ready_size(temp_file_path)
+            if file_size:
+                logger.debug(f"Created WAV file: {temp_file_path} ({file_size} bytes)")
+                return temp_file_path
             
-            # Wait and verify file is accessible
-            for attempt in range(10):  # Try up to 10 times (1 second total)
-                if os.path.exists(temp_file_path) and os.access(temp_file_path, os.R_OK):
-                    file_size = os.path.getsize(temp_file_path)
-                    if file_size > 0:
-                        logger.debug(f"Created WAV file: {temp_file_path} ({file_size} bytes) - attempt {attempt + 1}")
-                        return temp_file_path
-                time.sleep(0.1)  # 100ms delay
-            
-            logger.error(f"Failed to create accessible WAV file after 10 attempts: {temp_file_path}")
+            logger.error(f"Created WAV file is not accessible: {temp_file_path}")
             return ""
             
         except Exception as e:
@@ -568,12 +735,14 @@ class ARIClient:
 
 
     async def cleanup_audio_file(self, file_path: str, delay: float = 5.0):
-        """Clean up an audio file after a delay."""
+        """Schedule removal of an audio file after a delay on the shared timer wheel."""
+        return get_timer_wheel().call_later(delay, self._unlink_audio_file, file_path)
+
+    @staticmethod
+    async def _unlink_audio_file(file_path: str) -> None:
         try:
-            await asyncio.sleep(delay)
-            if os.path.exists(file_path):
-                os.unlink(file_path)
-                logger.debug(f"Cleaned up audio file: {file_path}")
+            await get_media_store().release(file_path)
+            logger.debug(f"Cleaned up audio file: {file_path}")
         except Exception as e:
             logger.error(f"Error cleaning up audio file {file_path}: {e}")
 
@@ -692,6 +861,7 @@ class ARIClient:
                            channel_id=response["id"], 
                            external_host=external_host,
                            format=format)
+                self.subscribe(f"channel:{response['id']}")
                 return response
             else:
                 logger.error("Failed to create External Media channel", response=response)
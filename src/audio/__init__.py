@@ -10,10 +10,19 @@ from .resampler import (
     resample_audio,
     convert_pcm16le_to_target_format,
 )
+from .dtx import UplinkDTX
+from .streaming import Base64JSONFieldDecoder, StreamingAudioConverter
+from .vad_segmenter import FixedSegmenter, UtteranceSegmenter, create_segmenter
 
 __all__ = [
     "mulaw_to_pcm16le",
     "pcm16le_to_mulaw",
     "resample_audio",
     "convert_pcm16le_to_target_format",
+    "Base64JSONFieldDecoder",
+    "StreamingAudioConverter",
+    "UtteranceSegmenter",
+    "FixedSegmenter",
+    "create_segmenter",
+    "UplinkDTX",
 ]
@@ -4,6 +4,12 @@ This server implements the TLV protocol used by the Asterisk AudioSocket
 application.  It accepts inbound TCP connections, performs the mandatory UUID
 handshake, and streams bidirectional audio frames between Asterisk and the AI
 engine.
+
+Inbound frames are parsed by a ``BufferedProtocol`` straight out of a
+reusable receive buffer: every complete TLV frame in a read becomes a
+memoryview, and the frames of one read are handed to the connection's
+dispatcher as a batch. The buffer region is only reused once the dispatcher
+has released the batch, so the views stay valid while callbacks run.
 """
 
 from __future__ import annotations
@@ -11,8 +17,10 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import socket
+import struct
 import uuid
-from typing import Awaitable, Callable, Dict, Optional
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 from prometheus_client import Counter, Gauge
 
@@ -40,6 +48,239 @@ _AUDIO_BYTES_TX = Counter(
     "ai_agent_audiosocket_tx_bytes_total",
     "Total bytes transmitted over AudioSocket connections",
 )
+_AUDIO_TX_DROPPED = Counter(
+    "ai_agent_audiosocket_tx_dropped_frames_total",
+    "Outbound audio frames dropped because a connection's send queue was full",
+)
+_AUDIO_TX_STALLED = Counter(
+    "ai_agent_audiosocket_tx_backpressure_total",
+    "Writer flushes that waited for the socket buffer to drain",
+)
+
+_HEADER = struct.Struct("!BH")
+
+Frame = Tuple[int, memoryview]
+
+
+class _AudioSocketConnection(asyncio.BufferedProtocol):
+    """One AudioSocket TCP connection: TLV parsing on the read side, a minimal writer on the other.
+
+    Exposes the subset of the ``StreamWriter`` interface the server uses
+    (``write``/``writelines``/``drain``/``close``/``is_closing``/``transport``).
+    """
+
+    _MAX_QUEUED_BATCHES = 64  # pause reading if the dispatcher falls this far behind
+
+    def __init__(
+        self,
+        server: "AudioSocketServer",
+        buffer_size: int = 64 * 1024,
+        write_high_water: Optional[int] = None,
+    ) -> None:
+        self._server = server
+        self._write_high_water = write_high_water
+        self.conn_id = uuid.uuid4().hex
+        self.transport: Optional[asyncio.Transport] = None
+        self._buffer_size = buffer_size
+        self._buf = bytearray(buffer_size)
+        self._view = memoryview(self._buf)
+        self._start = 0  # first byte not yet parsed into a frame
+        self._end = 0  # end of received data
+        self._batches: Deque[List[Frame]] = deque()
+        self._outstanding = 0  # batches handed out and not yet released
+        self._wakeup = asyncio.Event()
+        self._eof = False
+        self._reading_paused = False
+        self._write_paused = False
+        self._drain_waiter: Optional[asyncio.Future] = None
+        self._closed: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    # -- protocol callbacks ----------------------------------------------------
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+        if self._write_high_water is not None:
+            # Pause writing at the outbound queue's threshold; otherwise drain() returns at
+            # once below asyncio's 64 KiB default and a congested writer re-arms every loop.
+            transport.set_write_buffer_limits(high=self._write_high_water)  # type: ignore[attr-defined]
+        self._server._connection_made(self)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._end == len(self._buf):
+            self._reclaim()
+        return self._view[self._end:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        end = self._end = self._end + nbytes
+        buf = self._buf
+        view = self._view
+        start = self._start
+        batch: List[Frame] = []
+        while end - start >= 3:
+            stop = start + 3 + ((buf[start + 1] << 8) | buf[start + 2])
+            if stop > end:
+                break
+            batch.append((buf[start], view[start + 3:stop]))
+            start = stop
+        self._start = start
+        if batch:
+            self._batches.append(batch)
+            self._outstanding += 1
+            self._wakeup.set()
+            if len(self._batches) >= self._MAX_QUEUED_BATCHES and not self._reading_paused:
+                self._reading_paused = True
+                self.transport.pause_reading()
+        elif start == end and not self._outstanding:
+            self._start = self._end = 0
+
+    def eof_received(self) -> bool:
+        self._eof = True
+        self._wakeup.set()
+        return False
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._eof = True
+        self._wakeup.set()
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_exception(exc or ConnectionResetError("Connection lost"))
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self) -> None:
+        self._write_paused = True
+
+    def resume_writing(self) -> None:
+        self._write_paused = False
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    # -- dispatcher side -------------------------------------------------------
+    async def next_batch(self) -> Optional[List[Frame]]:
+        """Next batch of parsed frames, or None once the peer has gone away."""
+        while not self._batches:
+            if self._eof:
+                return None
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        return self._batches.popleft()
+
+    def release(self) -> None:
+        """Mark the oldest handed-out batch consumed; its buffer region may be reused."""
+        self._outstanding -= 1
+        if self._reading_paused and len(self._batches) < self._MAX_QUEUED_BATCHES // 2:
+            self._reading_paused = False
+            if not self.transport.is_closing():
+                self.transport.resume_reading()
+        if not self._outstanding and self._start == self._end:
+            self._start = self._end = 0
+
+    def _reclaim(self) -> None:
+        pending = self._end - self._start
+        if self._outstanding or pending >= len(self._buf):
+            # Views into the current buffer are still in use (or a frame is larger than it):
+            # continue in a fresh buffer and let the old one go when its views are released.
+            size = max(self._buffer_size, pending * 2)
+            fresh = bytearray(size)
+            fresh[:pending] = self._view[self._start:self._end]
+            self._buf = fresh
+            self._view = memoryview(fresh)
+        else:
+            self._buf[:pending] = bytes(self._view[self._start:self._end])
+        self._start, self._end = 0, pending
+
+    # -- writer side -----------------------------------------------------------
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        return self.transport.get_extra_info(name, default) if self.transport else default
+
+    def write(self, data: Union[bytes, memoryview]) -> None:
+        self.transport.write(data)
+
+    def writelines(self, data: List[Union[bytes, memoryview]]) -> None:
+        self.transport.writelines(data)
+
+    def is_closing(self) -> bool:
+        return self.transport is None or self.transport.is_closing()
+
+    async def drain(self) -> None:
+        if self.transport is None or self.transport.is_closing():
+            await asyncio.sleep(0)
+            if self._closed.done():
+                raise ConnectionResetError("Connection lost")
+        if not self._write_paused:
+            return
+        if self._drain_waiter is None or self._drain_waiter.done():
+            self._drain_waiter = asyncio.get_running_loop().create_future()
+        await self._drain_waiter
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+
+    async def wait_closed(self) -> None:
+        await self._closed
+
+
+class _OutboundQueue:
+    """Per-connection send queue.
+
+    ``send_audio`` only appends (header, payload) pairs. Once per event-loop
+    iteration the server flushes every connection with queued frames in a
+    single ``writelines`` call each. When a peer stops reading and the socket
+    buffer passes ``high_water``, the connection's writer task waits for it
+    to drain while new frames keep queueing; past ``max_frames`` the oldest
+    are dropped, so callers are never stalled.
+    """
+
+    __slots__ = ("writer", "frames", "max_frames", "high_water", "dropped", "task", "closed")
+
+    def __init__(self, writer: _AudioSocketConnection, *, max_frames: int, high_water: int) -> None:
+        self.writer = writer
+        self.frames: Deque[Union[bytes, memoryview]] = deque()
+        self.max_frames = max_frames
+        self.high_water = high_water
+        self.dropped = 0
+        self.task: Optional[asyncio.Task[None]] = None
+        self.closed = False
+
+    def put(self, header: bytes, payload: Union[bytes, memoryview]) -> None:
+        frames = self.frames
+        if len(frames) >= self.max_frames * 2:
+            # Late audio is useless: drop the oldest frame instead of waiting.
+            frames.popleft()
+            frames.popleft()
+            self.dropped += 1
+            _AUDIO_TX_DROPPED.inc()
+        frames.append(header)
+        frames.append(payload)
+
+    def flush(self, conn_id: str) -> int:
+        """Write everything queued; returns audio payload bytes handed to the transport."""
+        if self.closed or not self.frames or (self.task is not None and not self.task.done()):
+            return 0
+        writer = self.writer
+        if writer.is_closing():
+            self.frames.clear()
+            return 0
+        if writer.transport.get_write_buffer_size() > self.high_water:
+            _AUDIO_TX_STALLED.inc()
+            self.task = asyncio.create_task(self._drain_then_flush(conn_id))
+            return 0
+        batch = list(self.frames)
+        self.frames.clear()
+        writer.writelines(batch)
+        return sum(len(part) for part in batch[1::2])
+
+    async def _drain_then_flush(self, conn_id: str) -> None:
+        try:
+            await self.writer.drain()
+        except (ConnectionError, RuntimeError) as exc:
+            logger.debug("AudioSocket writer stopped", conn_id=conn_id, error=str(exc))
+            self.closed = True
+            self.frames.clear()
+            return
+        self.task = None
+        _AUDIO_BYTES_TX.inc(self.flush(conn_id))
 
 
 class AudioSocketServer:
@@ -54,6 +295,10 @@ class AudioSocketServer:
         on_audio: Callable[[str, bytes], Awaitable[None]],
         on_disconnect: Optional[Callable[[str], Awaitable[None]]] = None,
         on_dtmf: Optional[Callable[[str, str], Awaitable[None]]] = None,
+        on_audio_batch: Optional[Callable[[str, List[memoryview]], Awaitable[None]]] = None,
+        send_queue_frames: int = 25,
+        send_high_water_bytes: int = 64 * 1024,
+        send_coalesce_ms: int = 0,
     ) -> None:
         self.host = host
         self.port = port
@@ -61,10 +306,21 @@ class AudioSocketServer:
         self._on_audio = on_audio
         self._on_disconnect = on_disconnect
         self._on_dtmf = on_dtmf
+        # Zero-copy consumers get the audio frames of one socket read as memoryviews,
+        # valid until the callback returns; ``on_audio`` receives a bytes copy per frame.
+        self._on_audio_batch = on_audio_batch
 
         self._server: Optional[asyncio.base_events.Server] = None
         self._connection_tasks: Dict[str, asyncio.Task[None]] = {}
-        self._writers: Dict[str, asyncio.StreamWriter] = {}
+        self._writers: Dict[str, _AudioSocketConnection] = {}
+        self._outbound: Dict[str, _OutboundQueue] = {}
+        self._pending_flush: Dict[str, _OutboundQueue] = {}
+        self._flush_scheduled = False
+        self._send_coalesce_sec = max(0, int(send_coalesce_ms)) / 1000.0
+        self._send_queue_frames = max(1, int(send_queue_frames))
+        self._send_high_water_bytes = max(1024, int(send_high_water_bytes))
+        # Audio frame headers for the usual 20 ms payload sizes, built once.
+        self._audio_headers: Dict[int, bytes] = {size: _HEADER.pack(TYPE_AUDIO, size) for size in (160, 320, 640)}
         self._conn_to_uuid: Dict[str, str] = {}
         self._lock = asyncio.Lock()
         self._first_audio_logged: Dict[str, bool] = {}
@@ -77,8 +333,9 @@ class AudioSocketServer:
             logger.warning("AudioSocket server already running")
             return
 
-        self._server = await asyncio.start_server(
-            self._handle_client,
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: _AudioSocketConnection(self, write_high_water=self._send_high_water_bytes),
             host=self.host,
             port=self.port,
         )
@@ -98,10 +355,16 @@ class AudioSocketServer:
         async with self._lock:
             tasks = list(self._connection_tasks.values())
             writers = list(self._writers.values())
+            outbound = list(self._outbound.values())
             self._connection_tasks.clear()
             self._writers.clear()
+            self._outbound.clear()
             self._conn_to_uuid.clear()
 
+        for queue in outbound:
+            queue.closed = True
+            if queue.task:
+                queue.task.cancel()
         for task in tasks:
             task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -123,36 +386,49 @@ class AudioSocketServer:
     # ------------------------------------------------------------------
     # Connection helpers
     # ------------------------------------------------------------------
-    async def _handle_client(
-        self,
-        reader: asyncio.StreamReader,
-        writer: asyncio.StreamWriter,
-    ) -> None:
-        conn_id = uuid.uuid4().hex
-        peer = writer.get_extra_info("peername")
+    def _connection_made(self, connection: _AudioSocketConnection) -> None:
+        asyncio.get_running_loop().create_task(self._handle_client(connection))
+
+    async def _handle_client(self, connection: _AudioSocketConnection) -> None:
+        conn_id = connection.conn_id
+        peer = connection.get_extra_info("peername")
         logger.info("AudioSocket connection accepted", conn_id=conn_id, peer=peer)
 
         try:
-            sock = writer.get_extra_info("socket")
+            sock = connection.get_extra_info("socket")
             if sock:
                 sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         except Exception:
             logger.debug("Failed to set TCP_NODELAY on AudioSocket connection", conn_id=conn_id)
 
+        outbound = _OutboundQueue(
+            connection,
+            max_frames=self._send_queue_frames,
+            high_water=self._send_high_water_bytes,
+        )
         async with self._lock:
-            self._writers[conn_id] = writer
+            self._writers[conn_id] = connection
+            self._outbound[conn_id] = outbound
             _AUDIO_CONN_ACTIVE.inc()
 
-        connection_task = asyncio.create_task(self._connection_loop(conn_id, reader, writer))
+        connection_task = asyncio.create_task(self._connection_loop(conn_id, connection))
         async with self._lock:
             self._connection_tasks[conn_id] = connection_task
 
         try:
             await connection_task
+        except asyncio.CancelledError:
+            pass
         finally:
+            outbound.closed = True
+            if outbound.task:
+                outbound.task.cancel()
+            if outbound.dropped:
+                logger.info("AudioSocket outbound frames dropped", conn_id=conn_id, dropped=outbound.dropped)
             async with self._lock:
                 self._connection_tasks.pop(conn_id, None)
                 self._writers.pop(conn_id, None)
+                self._outbound.pop(conn_id, None)
                 self._conn_to_uuid.pop(conn_id, None)
                 with contextlib.suppress(ValueError):
                     _AUDIO_CONN_ACTIVE.dec()
@@ -160,88 +436,21 @@ class AudioSocketServer:
     async def _connection_loop(
         self,
         conn_id: str,
-        reader: asyncio.StreamReader,
-        writer: asyncio.StreamWriter,
+        writer: _AudioSocketConnection,
     ) -> None:
         handshake_complete = False
         try:
             while True:
-                header = await reader.readexactly(3)
-                msg_type = header[0]
-                length = int.from_bytes(header[1:], "big")
-                payload = b""
-                if length:
-                    payload = await reader.readexactly(length)
-
-                if not handshake_complete:
-                    if msg_type != TYPE_UUID:
-                        logger.warning(
-                            "AudioSocket connection received non-UUID frame before handshake",
-                            conn_id=conn_id,
-                            msg_type=msg_type,
-                        )
-                        await self._send_error(writer, b"missing-uuid")
-                        return
-
-                    uuid_str = self._decode_uuid(payload)
-                    if not uuid_str:
-                        logger.warning("Invalid UUID payload from AudioSocket client", conn_id=conn_id)
-                        await self._send_error(writer, b"invalid-uuid")
-                        return
-
-                    ok = await self._on_uuid(conn_id, uuid_str)
-                    if not ok:
-                        logger.warning(
-                            "AudioSocket UUID rejected",
-                            conn_id=conn_id,
-                            uuid=uuid_str,
-                        )
-                        await self._send_error(writer, b"uuid-rejected")
-                        return
-
-                    async with self._lock:
-                        self._conn_to_uuid[conn_id] = uuid_str
-                    handshake_complete = True
-                    logger.info("AudioSocket UUID bound", conn_id=conn_id, uuid=uuid_str)
-                    continue
-
-                # Post-handshake frames
-                if msg_type == TYPE_AUDIO:
-                    if payload:
-                        _AUDIO_BYTES_RX.inc(len(payload))
-                        # One-time first inbound audio frame log for this connection
-                        if not self._first_audio_logged.get(conn_id):
-                            self._first_audio_logged[conn_id] = True
-                            logger.info(
-                                "AudioSocket inbound first audio",
-                                conn_id=conn_id,
-                                bytes=len(payload),
-                            )
-                        await self._on_audio(conn_id, payload)
-                elif msg_type == TYPE_DTMF:
-                    if self._on_dtmf and payload:
-                        try:
-                            digit = payload.decode("ascii", errors="ignore")
-                        except Exception:
-                            digit = ""
-                        if digit:
-                            await self._on_dtmf(conn_id, digit[0])
-                elif msg_type in (TYPE_TERMINATE, TYPE_ERROR):
-                    logger.info(
-                        "AudioSocket connection terminated by peer",
-                        conn_id=conn_id,
-                        msg_type=msg_type,
-                    )
+                batch = await writer.next_batch()
+                if batch is None:
+                    logger.info("AudioSocket client closed connection", conn_id=conn_id)
                     return
-                else:
-                    logger.debug(
-                        "Unknown AudioSocket frame type received",
-                        conn_id=conn_id,
-                        msg_type=msg_type,
-                        length=len(payload),
-                    )
-        except asyncio.IncompleteReadError:
-            logger.info("AudioSocket client closed connection", conn_id=conn_id)
+                try:
+                    if await self._dispatch_batch(conn_id, writer, batch, handshake_complete):
+                        return
+                finally:
+                    writer.release()
+                handshake_complete = conn_id in self._conn_to_uuid
         except Exception as exc:  # noqa: BLE001
             logger.error("AudioSocket connection error", conn_id=conn_id, error=str(exc), exc_info=True)
         finally:
@@ -251,23 +460,135 @@ class AudioSocketServer:
             if self._on_disconnect:
                 await self._on_disconnect(conn_id)
 
-    async def send_audio(self, conn_id: str, audio_payload: bytes) -> bool:
-        """Send a PCM16 8k audio frame to the AudioSocket peer."""
-        async with self._lock:
-            writer = self._writers.get(conn_id)
-        if not writer:
-            logger.debug("Attempted to send audio on closed connection", conn_id=conn_id)
-            return False
+    async def _dispatch_batch(
+        self,
+        conn_id: str,
+        writer: _AudioSocketConnection,
+        batch: List[Frame],
+        handshake_complete: bool,
+    ) -> bool:
+        """Handle one batch of parsed frames; returns True when the connection should close."""
+        audio: List[memoryview] = []
+        for msg_type, payload in batch:
+            if not handshake_complete:
+                if msg_type != TYPE_UUID:
+                    logger.warning(
+                        "AudioSocket connection received non-UUID frame before handshake",
+                        conn_id=conn_id,
+                        msg_type=msg_type,
+                    )
+                    await self._send_error(writer, b"missing-uuid")
+                    return True
+
+                uuid_str = self._decode_uuid(bytes(payload))
+                if not uuid_str:
+                    logger.warning("Invalid UUID payload from AudioSocket client", conn_id=conn_id)
+                    await self._send_error(writer, b"invalid-uuid")
+                    return True
+
+                ok = await self._on_uuid(conn_id, uuid_str)
+                if not ok:
+                    logger.warning(
+                        "AudioSocket UUID rejected",
+                        conn_id=conn_id,
+                        uuid=uuid_str,
+                    )
+                    await self._send_error(writer, b"uuid-rejected")
+                    return True
+
+                async with self._lock:
+                    self._conn_to_uuid[conn_id] = uuid_str
+                handshake_complete = True
+                logger.info("AudioSocket UUID bound", conn_id=conn_id, uuid=uuid_str)
+                continue
+
+            # Post-handshake frames
+            if msg_type == TYPE_AUDIO:
+                if payload:
+                    audio.append(payload)
+                continue
+            # Deliver audio received ahead of a control frame first to keep ordering.
+            if audio:
+                await self._deliver_audio(conn_id, audio)
+                audio = []
+            if msg_type == TYPE_DTMF:
+                if self._on_dtmf and payload:
+                    digit = bytes(payload).decode("ascii", errors="ignore")
+                    if digit:
+                        await self._on_dtmf(conn_id, digit[0])
+            elif msg_type in (TYPE_TERMINATE, TYPE_ERROR):
+                logger.info(
+                    "AudioSocket connection terminated by peer",
+                    conn_id=conn_id,
+                    msg_type=msg_type,
+                )
+                return True
+            else:
+                logger.debug(
+                    "Unknown AudioSocket frame type received",
+                    conn_id=conn_id,
+                    msg_type=msg_type,
+                    length=len(payload),
+                )
+        if audio:
+            await self._deliver_audio(conn_id, audio)
+        return False
+
+    async def _deliver_audio(self, conn_id: str, frames: List[memoryview]) -> None:
+        _AUDIO_BYTES_RX.inc(sum(len(frame) for frame in frames))
+        # One-time first inbound audio frame log for this connection
+        if not self._first_audio_logged.get(conn_id):
+            self._first_audio_logged[conn_id] = True
+            logger.info(
+                "AudioSocket inbound first audio",
+                conn_id=conn_id,
+                bytes=len(frames[0]),
+            )
+        if self._on_audio_batch is not None:
+            await self._on_audio_batch(conn_id, frames)
+            return
+        for frame in frames:
+            await self._on_audio(conn_id, bytes(frame))
 
-        frame = bytes([TYPE_AUDIO]) + len(audio_payload).to_bytes(2, "big") + audio_payload
-        try:
-            writer.write(frame)
-            await writer.drain()
-            _AUDIO_BYTES_TX.inc(len(audio_payload))
-            return True
-        except Exception as exc:  # noqa: BLE001
-            logger.error("Failed to send audio over AudioSocket", conn_id=conn_id, error=str(exc), exc_info=True)
+    async def send_audio(self, conn_id: str, audio_payload: Union[bytes, memoryview]) -> bool:
+        """Queue an audio frame for the AudioSocket peer; never waits on the socket."""
+        return self.queue_audio(conn_id, audio_payload)
+
+    def queue_audio(self, conn_id: str, audio_payload: Union[bytes, memoryview]) -> bool:
+        """Synchronous form of ``send_audio`` for callers outside a coroutine."""
+        outbound = self._outbound.get(conn_id)
+        if outbound is None or outbound.closed or outbound.writer.is_closing():
+            logger.debug("Attempted to send audio on closed connection", conn_id=conn_id)
             return False
+        size = len(audio_payload)
+        header = self._audio_headers.get(size)
+        if header is None:
+            header = _HEADER.pack(TYPE_AUDIO, size)
+        outbound.put(header, audio_payload)
+        self._pending_flush[conn_id] = outbound
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            loop = asyncio.get_running_loop()
+            if self._send_coalesce_sec:
+                loop.call_later(self._send_coalesce_sec, self._flush_outbound)
+            else:
+                loop.call_soon(self._flush_outbound)
+        return True
+
+    def _flush_outbound(self) -> None:
+        """Write the frames queued during this loop iteration, one batch per connection."""
+        self._flush_scheduled = False
+        pending, self._pending_flush = self._pending_flush, {}
+        sent = 0
+        for conn_id, outbound in pending.items():
+            try:
+                sent += outbound.flush(conn_id)
+            except Exception as exc:  # noqa: BLE001
+                outbound.closed = True
+                outbound.frames.clear()
+                logger.error("Failed to send audio over AudioSocket", conn_id=conn_id, error=str(exc))
+        if sent:
+            _AUDIO_BYTES_TX.inc(sent)
 
     def get_connection_count(self) -> int:
         return len(self._writers)
@@ -277,8 +598,7 @@ class AudioSocketServer:
 
     async def disconnect(self, conn_id: str) -> None:
         """Proactively close a connection (used during call cleanup)."""
-        async with self._lock:
-            writer = self._writers.get(conn_id)
+        writer = self._writers.get(conn_id)
         if not writer:
             return
         writer.close()
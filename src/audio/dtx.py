@@ -0,0 +1,160 @@
+"""
+Discontinuous transmission (DTX) gate for realtime provider uplinks.
+
+Realtime providers receive every inbound 20 ms frame as a websocket message,
+even though much of a call is caller silence. ``UplinkDTX`` classifies each
+frame with VAD and forwards speech plus a trailing hangover of silence, then
+suppresses frames (optionally letting one through every ``keepalive_ms`` as
+comfort noise) until speech resumes. A short pre-roll of suppressed frames is
+replayed on resume so word onsets are not clipped.
+
+The hangover must cover the provider's server-side end-of-turn silence window
+(e.g. OpenAI ``turn_detection.silence_duration_ms``) or turns will only close
+when the next audio arrives. ``take_turn_latency`` reports the time from the
+caller's last voiced frame to the provider's reply, which grows when that
+happens.
+"""
+
+from __future__ import annotations
+
+import audioop
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+try:
+    import webrtcvad  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - exercised when py-webrtcvad is absent
+    webrtcvad = None
+
+_WEBRTC_RATES = (8000, 16000, 32000, 48000)
+_WEBRTC_FRAME_MS = (10, 20, 30)
+
+
+class UplinkDTX:
+    """Decide which inbound frames are forwarded to a realtime provider."""
+
+    def __init__(
+        self,
+        *,
+        hangover_ms: int = 600,
+        keepalive_ms: int = 0,
+        preroll_ms: int = 60,
+        aggressiveness: int = 0,
+        energy_threshold: int = 500,
+        use_webrtc: bool = True,
+    ):
+        self.hangover_ms = max(0, int(hangover_ms))
+        self.keepalive_ms = max(0, int(keepalive_ms))
+        self._preroll_ms = max(0, int(preroll_ms))
+        self._energy_threshold = int(energy_threshold)
+        self._vad = None
+        if use_webrtc and webrtcvad is not None:
+            self._vad = webrtcvad.Vad(min(3, max(0, int(aggressiveness))))
+
+        self._active = False
+        self._silence_ms = 0.0
+        self._since_keepalive_ms = 0.0
+        self._preroll: Deque[Tuple[bytes, float]] = deque()
+        self._preroll_total_ms = 0.0
+        self._last_voice_at: Optional[float] = None
+
+        self.frames_in = 0
+        self.bytes_in = 0
+        self.bytes_sent = 0
+        self.keepalives = 0
+        self.talkspurts = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(0, self.bytes_in - self.bytes_sent - sum(len(f) for f, _ in self._preroll))
+
+    @property
+    def suppressed_ratio(self) -> float:
+        if not self.bytes_in:
+            return 0.0
+        return self.bytes_saved / self.bytes_in
+
+    def process(self, frame: bytes, pcm16: bytes, sample_rate: int) -> List[bytes]:
+        """Return the frames (in their original encoding) to send for ``frame``.
+
+        ``pcm16`` is the same audio as mono PCM16 at ``sample_rate`` and is only
+        used for classification.
+        """
+        if not frame:
+            return []
+        duration_ms = len(pcm16) * 1000.0 / (2 * sample_rate) if pcm16 and sample_rate else 20.0
+        self.frames_in += 1
+        self.bytes_in += len(frame)
+
+        if self._is_speech(pcm16, sample_rate, duration_ms):
+            out: List[bytes] = []
+            if not self._active:
+                out.extend(f for f, _ in self._preroll)
+                self._clear_preroll()
+                self._active = True
+                self.talkspurts += 1
+            self._silence_ms = 0.0
+            self._last_voice_at = time.monotonic()
+            out.append(frame)
+            return self._sent(out)
+
+        if self._active:
+            self._silence_ms += duration_ms
+            if self._silence_ms >= self.hangover_ms:
+                self._active = False
+                self._since_keepalive_ms = 0.0
+            return self._sent([frame])
+
+        self._since_keepalive_ms += duration_ms
+        if self.keepalive_ms and self._since_keepalive_ms >= self.keepalive_ms:
+            # Forward real background audio as comfort noise so the provider's
+            # connection and server VAD keep seeing a live stream.
+            self._since_keepalive_ms = 0.0
+            self.keepalives += 1
+            return self._sent([frame])
+
+        self._preroll.append((frame, duration_ms))
+        self._preroll_total_ms += duration_ms
+        while self._preroll and self._preroll_total_ms - self._preroll[0][1] >= self._preroll_ms:
+            _, dropped_ms = self._preroll.popleft()
+            self._preroll_total_ms -= dropped_ms
+        return []
+
+    def take_turn_latency(self) -> Optional[float]:
+        """Seconds since the last voiced frame, reported once per caller turn.
+
+        Call when the provider's reply starts; returns None if no speech was
+        seen since the previous call.
+        """
+        if self._last_voice_at is None:
+            return None
+        latency = time.monotonic() - self._last_voice_at
+        self._last_voice_at = None
+        return latency
+
+    def _sent(self, frames: List[bytes]) -> List[bytes]:
+        self.bytes_sent += sum(len(f) for f in frames)
+        return frames
+
+    def _clear_preroll(self) -> None:
+        self._preroll.clear()
+        self._preroll_total_ms = 0.0
+
+    def _is_speech(self, pcm16: bytes, sample_rate: int, duration_ms: float) -> bool:
+        if not pcm16:
+            return False
+        if (
+            self._vad is not None
+            and sample_rate in _WEBRTC_RATES
+            and round(duration_ms) in _WEBRTC_FRAME_MS
+            and len(pcm16) == int(sample_rate * round(duration_ms) / 1000) * 2
+        ):
+            try:
+                return bool(self._vad.is_speech(pcm16, sample_rate))
+            except Exception:
+                self._vad = None
+        return audioop.rms(pcm16, 2) >= self._energy_threshold
+
+
+__all__ = ["UplinkDTX"]
@@ -0,0 +1,184 @@
+"""
+Incremental audio decoding helpers for streamed provider responses.
+
+TTS providers deliver audio over HTTP bodies that can be consumed chunk by
+chunk. These helpers convert such bodies into fixed-size downstream frames as
+bytes arrive, preserving resampler state across chunk boundaries, and extract
+base64 audio embedded in a JSON field without waiting for the whole document.
+"""
+
+from __future__ import annotations
+
+import base64
+from typing import List, Optional, Sequence
+
+from .resampler import convert_pcm16le_to_target_format, mulaw_to_pcm16le, resample_audio
+
+_MULAW_ENCODINGS = ("ulaw", "mulaw", "mu-law", "g711_ulaw")
+
+
+def _bytes_per_sample(encoding: str) -> int:
+    return 1 if (encoding or "").lower() in _MULAW_ENCODINGS else 2
+
+
+class StreamingAudioConverter:
+    """Convert a chunked audio stream into target-format frames of ``chunk_ms``."""
+
+    def __init__(
+        self,
+        source_encoding: str,
+        source_rate: int,
+        target_encoding: str,
+        target_rate: int,
+        chunk_ms: int,
+    ):
+        self._source_is_mulaw = (source_encoding or "").lower() in _MULAW_ENCODINGS
+        self._source_rate = int(source_rate)
+        self._target_encoding = target_encoding
+        self._target_rate = int(target_rate)
+        bytes_per_sample = _bytes_per_sample(target_encoding)
+        self.frame_bytes = max(bytes_per_sample, int(self._target_rate * (chunk_ms / 1000.0) * bytes_per_sample))
+        self._carry = b""
+        self._resample_state: Optional[tuple] = None
+        self._pending = bytearray()
+        self.output_bytes = 0
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Convert ``data`` and return every complete frame now available."""
+        if not data:
+            return []
+        if self._source_is_mulaw:
+            pcm = mulaw_to_pcm16le(data)
+        else:
+            # Keep PCM16 sample alignment across arbitrary network chunking.
+            data = self._carry + data
+            usable = len(data) - (len(data) % 2)
+            pcm, self._carry = data[:usable], data[usable:]
+        if not pcm:
+            return []
+        if self._source_rate != self._target_rate:
+            pcm, self._resample_state = resample_audio(
+                pcm, self._source_rate, self._target_rate, state=self._resample_state
+            )
+        self._pending.extend(convert_pcm16le_to_target_format(pcm, self._target_encoding))
+        return self._drain(final=False)
+
+    def flush(self) -> List[bytes]:
+        """Return the trailing partial frame, if any."""
+        return self._drain(final=True)
+
+    def _drain(self, *, final: bool) -> List[bytes]:
+        frames: List[bytes] = []
+        size = self.frame_bytes
+        offset = 0
+        while len(self._pending) - offset >= size:
+            frames.append(bytes(self._pending[offset : offset + size]))
+            offset += size
+        if final and len(self._pending) > offset:
+            frames.append(bytes(self._pending[offset:]))
+            offset = len(self._pending)
+        if offset:
+            del self._pending[:offset]
+        self.output_bytes += sum(len(frame) for frame in frames)
+        return frames
+
+
+class Base64JSONFieldDecoder:
+    """Decode a base64 string field (e.g. ``audioContent``) from a streamed JSON body.
+
+    Bytes before the field are retained so callers can fall back to treating
+    the body as raw audio when the field never appears.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        self._patterns = [b'"' + key.encode("ascii") + b'"' for key in keys]
+        self._lookbehind = max(len(p) for p in self._patterns) + 8
+        self._scan = bytearray()
+        self._raw = bytearray()
+        self._state = "search"  # search -> colon -> value -> done
+        self._b64 = bytearray()
+        self.found = False
+
+    @property
+    def raw(self) -> bytes:
+        return bytes(self._raw)
+
+    def feed(self, data: bytes) -> bytes:
+        """Consume a body chunk and return the audio bytes decoded so far."""
+        if not data or self._state == "done":
+            return b""
+        if self._state == "search":
+            self._raw.extend(data)
+        self._scan.extend(data)
+        return self._advance()
+
+    def finish(self) -> bytes:
+        """Decode any buffered base64 remainder at end of body."""
+        if not self._b64:
+            return b""
+        padded = bytes(self._b64) + b"=" * (-len(self._b64) % 4)
+        self._b64.clear()
+        try:
+            return base64.b64decode(padded)
+        except (base64.binascii.Error, ValueError):
+            return b""
+
+    def _advance(self) -> bytes:
+        while self._state in ("search", "colon"):
+            if self._state == "search":
+                hits = [(self._scan.find(p), p) for p in self._patterns]
+                hits = [(idx, p) for idx, p in hits if idx >= 0]
+                if not hits:
+                    if len(self._scan) > self._lookbehind:
+                        del self._scan[: len(self._scan) - self._lookbehind]
+                    return b""
+                idx, pattern = min(hits)
+                del self._scan[: idx + len(pattern)]
+                self._state = "colon"
+            # A key must be followed by ':' and a string; anything else means
+            # the match was a value or a non-string field, so keep searching.
+            stripped = bytes(self._scan).lstrip(b" \t\r\n")
+            if not stripped:
+                return b""
+            if stripped[:1] != b":":
+                self._state = "search"
+                continue
+            value = stripped[1:].lstrip(b" \t\r\n")
+            if not value:
+                return b""
+            if value[:1] != b'"':
+                self._state = "search"
+                self._scan = bytearray(value)
+                continue
+            self._scan = bytearray(value[1:])
+            self._state = "value"
+            self.found = True
+            self._raw.clear()
+        if self._state == "value":
+            end = self._scan.find(b'"')
+            segment = self._scan if end < 0 else self._scan[:end]
+            self._b64.extend(segment.replace(b"\\", b"").translate(None, b" \t\r\n"))
+            if end >= 0:
+                self._state = "done"
+                self._scan.clear()
+                return self._decode_ready() + self.finish()
+            self._scan.clear()
+            return self._decode_ready()
+        return b""
+
+    def _decode_ready(self) -> bytes:
+        usable = len(self._b64) - (len(self._b64) % 4)
+        if usable <= 0:
+            return b""
+        block = bytes(self._b64[:usable])
+        del self._b64[:usable]
+        try:
+            return base64.b64decode(block)
+        except (base64.binascii.Error, ValueError):
+            return b""
+
+
+__all__ = [
+    "StreamingAudioConverter",
+    "Base64JSONFieldDecoder",
+]
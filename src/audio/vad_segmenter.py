@@ -0,0 +1,286 @@
+"""
+Voice-activity based utterance segmentation for PCM16 audio streams.
+
+Chunked STT backends bill and latency-scale per request, so sending fixed
+slices of audio wastes requests on silence and splits words at arbitrary
+boundaries. ``UtteranceSegmenter`` consumes PCM16 mono audio in arbitrary
+chunk sizes, classifies fixed frames as speech or silence (WebRTC VAD when
+available, RMS energy otherwise) and emits complete utterances with leading
+and trailing padding.
+"""
+
+from __future__ import annotations
+
+import audioop
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+try:
+    import webrtcvad  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - exercised when py-webrtcvad is absent
+    webrtcvad = None
+
+_WEBRTC_RATES = (8000, 16000, 32000, 48000)
+_WEBRTC_FRAME_MS = (10, 20, 30)
+_OPTION_KEYS = (
+    "frame_ms",
+    "aggressiveness",
+    "start_frames",
+    "end_silence_frames",
+    "padding_ms",
+    "max_utterance_ms",
+    "min_speech_ms",
+    "energy_threshold",
+    "use_webrtc",
+)
+
+
+class UtteranceSegmenter:
+    """Group PCM16 mono frames into padded speech utterances.
+
+    ``feed`` returns every utterance completed by the supplied audio; ``flush``
+    returns the in-progress utterance at end of stream. Utterances with less
+    than ``min_speech_ms`` of detected speech are dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = 16000,
+        frame_ms: int = 20,
+        aggressiveness: int = 0,
+        start_frames: int = 3,
+        end_silence_frames: int = 25,
+        padding_ms: int = 200,
+        max_utterance_ms: int = 10000,
+        min_speech_ms: int = 200,
+        energy_threshold: int = 500,
+        use_webrtc: bool = True,
+    ):
+        self.sample_rate = int(sample_rate)
+        self.frame_ms = int(frame_ms)
+        self.frame_bytes = int(self.sample_rate * self.frame_ms / 1000) * 2
+        self._start_frames = max(1, int(start_frames))
+        self._end_silence_frames = max(1, int(end_silence_frames))
+        self._padding_frames = max(0, int(padding_ms) // self.frame_ms)
+        self._max_bytes = max(self.frame_bytes, int(max_utterance_ms) // self.frame_ms * self.frame_bytes)
+        self._min_speech_frames = max(1, int(min_speech_ms) // self.frame_ms)
+        self._energy_threshold = int(energy_threshold)
+
+        self._vad = None
+        if (
+            use_webrtc
+            and webrtcvad is not None
+            and self.sample_rate in _WEBRTC_RATES
+            and self.frame_ms in _WEBRTC_FRAME_MS
+        ):
+            self._vad = webrtcvad.Vad(min(3, max(0, int(aggressiveness))))
+
+        self._pending = bytearray()
+        self._preroll: Deque[bytes] = deque(maxlen=self._padding_frames + self._start_frames)
+        self._speech_run = 0
+        self._silence_run = 0
+        self._triggered = False
+        self._utterance = bytearray()
+        self._utterance_speech_frames = 0
+
+        self.frames_total = 0
+        self.frames_speech = 0
+        self.utterances = 0
+        self.bytes_in = 0
+        self.bytes_emitted = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        vad_config: Any,
+        overrides: Optional[Dict[str, Any]] = None,
+        *,
+        sample_rate: int = 16000,
+    ) -> "UtteranceSegmenter":
+        """Build a segmenter from ``VADConfig`` detection settings plus per-pipeline overrides.
+
+        Only speech detection (aggressiveness, onset frames, padding) follows the
+        ``vad`` section. Its end-of-utterance silence and length limits are tuned
+        for long legacy utterances (1 s of silence), so the end of a turn keeps
+        this class's defaults unless the pipeline overrides them.
+        """
+        params: Dict[str, Any] = {"sample_rate": sample_rate}
+        if vad_config is not None:
+            params.update(
+                aggressiveness=getattr(vad_config, "webrtc_aggressiveness", 0),
+                start_frames=getattr(vad_config, "webrtc_start_frames", 3),
+                padding_ms=getattr(vad_config, "utterance_padding_ms", 200),
+            )
+        for key, value in (overrides or {}).items():
+            if key in _OPTION_KEYS and value is not None:
+                params[key] = value
+        return cls(**params)
+
+    @property
+    def speech_ratio(self) -> float:
+        """Fraction of classified frames that contained speech."""
+        if not self.frames_total:
+            return 0.0
+        return self.frames_speech / self.frames_total
+
+    @property
+    def dropped_bytes(self) -> int:
+        """Bytes consumed that were not (and will not be) emitted in an utterance."""
+        return max(0, self.bytes_in - self.bytes_emitted - len(self._utterance) - len(self._preroll) * self.frame_bytes)
+
+    def feed(self, pcm16: bytes) -> List[bytes]:
+        """Consume PCM16 audio and return the utterances it completed."""
+        if not pcm16:
+            return []
+        self._pending.extend(pcm16)
+        size = self.frame_bytes
+        completed: List[bytes] = []
+        offset = 0
+        while len(self._pending) - offset >= size:
+            frame = bytes(self._pending[offset : offset + size])
+            offset += size
+            utterance = self._process_frame(frame)
+            if utterance:
+                completed.append(utterance)
+        if offset:
+            del self._pending[:offset]
+        return completed
+
+    def flush(self) -> List[bytes]:
+        """Return the in-progress utterance (if it holds enough speech) and reset."""
+        if self._triggered and self._pending:
+            self._utterance.extend(self._pending)
+        self.bytes_in += len(self._pending)
+        self._pending.clear()
+        completed: List[bytes] = []
+        if self._triggered:
+            utterance = self._finish_utterance(trailing_silence=self._silence_run)
+            if utterance:
+                completed.append(utterance)
+        self._preroll.clear()
+        self._speech_run = 0
+        return completed
+
+    def _is_speech(self, frame: bytes) -> bool:
+        if self._vad is not None:
+            try:
+                return bool(self._vad.is_speech(frame, self.sample_rate))
+            except Exception:
+                self._vad = None
+        return audioop.rms(frame, 2) >= self._energy_threshold
+
+    def _process_frame(self, frame: bytes) -> Optional[bytes]:
+        speech = self._is_speech(frame)
+        self.frames_total += 1
+        self.bytes_in += len(frame)
+        if speech:
+            self.frames_speech += 1
+
+        if not self._triggered:
+            self._speech_run = self._speech_run + 1 if speech else 0
+            self._preroll.append(frame)
+            if self._speech_run < self._start_frames:
+                return None
+            # Keep the configured lead-in padding ahead of the first voiced frame.
+            keep = self._padding_frames + self._speech_run
+            lead = list(self._preroll)[-keep:]
+            self._utterance = bytearray(b"".join(lead))
+            self._utterance_speech_frames = self._speech_run
+            self._preroll.clear()
+            self._triggered = True
+            self._silence_run = 0
+            return None
+
+        self._utterance.extend(frame)
+        if speech:
+            self._utterance_speech_frames += 1
+            self._silence_run = 0
+        else:
+            self._silence_run += 1
+
+        if self._silence_run >= self._end_silence_frames:
+            return self._finish_utterance(trailing_silence=self._silence_run)
+        if len(self._utterance) >= self._max_bytes:
+            # Force a split on long monologues but stay triggered for the rest.
+            utterance = self._emit(bytes(self._utterance), self._utterance_speech_frames)
+            self._utterance = bytearray()
+            self._utterance_speech_frames = 0
+            return utterance
+        return None
+
+    def _finish_utterance(self, *, trailing_silence: int) -> Optional[bytes]:
+        excess = max(0, trailing_silence - self._padding_frames) * self.frame_bytes
+        data = bytes(self._utterance[: len(self._utterance) - excess] if excess else self._utterance)
+        utterance = self._emit(data, self._utterance_speech_frames)
+        self._utterance = bytearray()
+        self._utterance_speech_frames = 0
+        self._triggered = False
+        self._speech_run = 0
+        self._silence_run = 0
+        return utterance
+
+    def _emit(self, data: bytes, speech_frames: int) -> Optional[bytes]:
+        if not data or speech_frames < self._min_speech_frames:
+            return None
+        self.utterances += 1
+        self.bytes_emitted += len(data)
+        return data
+
+
+class FixedSegmenter:
+    """Commit every ``commit_bytes`` of audio regardless of content (legacy cadence)."""
+
+    def __init__(self, commit_bytes: int):
+        self.commit_bytes = max(2, int(commit_bytes))
+        self._pending = bytearray()
+        self.utterances = 0
+        self.bytes_in = 0
+        self.bytes_emitted = 0
+
+    @property
+    def speech_ratio(self) -> Optional[float]:
+        return None
+
+    @property
+    def dropped_bytes(self) -> int:
+        return 0
+
+    def feed(self, pcm16: bytes) -> List[bytes]:
+        if not pcm16:
+            return []
+        self.bytes_in += len(pcm16)
+        self._pending.extend(pcm16)
+        if len(self._pending) < self.commit_bytes:
+            return []
+        return self._emit()
+
+    def flush(self) -> List[bytes]:
+        return self._emit() if self._pending else []
+
+    def _emit(self) -> List[bytes]:
+        chunk = bytes(self._pending)
+        self._pending.clear()
+        self.utterances += 1
+        self.bytes_emitted += len(chunk)
+        return [chunk]
+
+
+def create_segmenter(
+    options: Optional[Dict[str, Any]],
+    vad_config: Any,
+    *,
+    commit_bytes: int,
+    sample_rate: int = 16000,
+):
+    """Return the segmenter selected by ``options['mode']`` (``vad`` or ``fixed``)."""
+    params = dict(options or {})
+    mode = str(params.pop("mode", "vad") or "vad").lower()
+    if mode == "fixed":
+        return FixedSegmenter(commit_bytes)
+    if mode != "vad":
+        raise ValueError(f"Unknown STT segmentation mode: {mode}")
+    return UtteranceSegmenter.from_config(vad_config, params, sample_rate=sample_rate)
+
+
+__all__ = ["UtteranceSegmenter", "FixedSegmenter", "create_segmenter"]
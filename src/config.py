@@ -21,6 +21,17 @@ class AsteriskConfig(BaseModel):
     username: str
     password: str
     app_name: str = Field(default="ai-voice-agent")
+    # ARI websocket events: ordered per channel, handled by a bounded worker pool
+    event_workers: int = Field(default=16)
+    event_queue_max: int = Field(default=5000)
+    # false: receive events only for our Stasis channels and the channels/bridges the
+    # engine subscribes to; true restores the whole-box firehose (subscribeAll=true)
+    subscribe_all: bool = Field(default=False)
+    # Jittered exponential backoff between websocket reconnect attempts
+    reconnect_backoff_min_sec: float = Field(default=0.5)
+    reconnect_backoff_max_sec: float = Field(default=30.0)
+    # Connections in the ARI client's own REST pool (separate from http_client)
+    http_pool_size: int = Field(default=20)
 
 class ExternalMediaConfig(BaseModel):
     rtp_host: str = Field(default="0.0.0.0")
@@ -34,6 +45,9 @@ class AudioSocketConfig(BaseModel):
     host: str = Field(default="0.0.0.0")
     port: int = Field(default=8090)
     format: str = Field(default="ulaw")  # 'ulaw' or 'slin16'
+    send_queue_frames: int = Field(default=25)  # Outbound frames queued per connection before the oldest are dropped
+    send_high_water_bytes: int = Field(default=65536)  # Socket buffer level at which the writer task waits to drain
+    send_coalesce_ms: int = Field(default=0)  # 0 = flush every loop iteration; >0 batches frames into fewer socket writes
 
 
 class LocalProviderConfig(BaseModel):
@@ -61,6 +75,9 @@ class DeepgramProviderConfig(BaseModel):
     base_url: str = Field(default="https://api.deepgram.com")
     tts_voice: Optional[str] = None
     stt_language: str = Field(default="en-US")
+    # Warm pool of pre-connected agent websockets (0 disables prewarming)
+    pool_size: int = Field(default=0)
+    pool_idle_timeout_sec: float = Field(default=60.0)
 
 
 class OpenAIProviderConfig(BaseModel):
@@ -101,6 +118,17 @@ class N8nProviderConfig(BaseModel):
     webhook_url: str
     response_json_key: str = Field(default="response")
     timeout_sec: float = Field(default=10.0)
+    # Dedicated keep-alive pool for the webhook origin (0 = use the shared HTTP pool)
+    pool_size: int = Field(default=0)
+    keepalive_timeout_sec: float = Field(default=120.0)
+    # Accept chunked/NDJSON replies and surface text as it arrives
+    stream: bool = Field(default=False)
+    # Cache replies keyed by normalized transcript + selected context keys (0 = disabled).
+    # No keys: reuse only within the same call; with keys: shared by callers whose
+    # context has equal values for all of them (skipped when any is missing).
+    cache_ttl_sec: float = Field(default=0.0)
+    cache_max_entries: int = Field(default=512)
+    cache_context_keys: List[str] = Field(default_factory=list)
 
 
 class OpenAIRealtimeProviderConfig(BaseModel):
@@ -122,6 +150,15 @@ class OpenAIRealtimeProviderConfig(BaseModel):
     response_modalities: List[str] = Field(default_factory=lambda: ["text", "audio"])
     # Optional explicit greeting to speak immediately on connect
     greeting: Optional[str] = None
+    # Uplink batching with server-side turn detection: inbound frames are coalesced
+    # into one input_audio_buffer.append per uplink_coalesce_ms (20 = per frame; a
+    # partial batch is sent once it has waited that long), and at most
+    # uplink_queue_ms of batches wait for the socket before the oldest is dropped.
+    uplink_coalesce_ms: int = Field(default=60)
+    uplink_queue_ms: int = Field(default=500)
+    # Warm pool of connected, session.update-configured websockets (0 disables prewarming)
+    pool_size: int = Field(default=0)
+    pool_idle_timeout_sec: float = Field(default=60.0)
     # Optional server-side turn detection configuration
     # If provided, will be sent in session.update
     class TurnDetectionConfig(BaseModel):
@@ -166,6 +203,77 @@ class VADConfig(BaseModel):
     fallback_buffer_size: int = 128000
 
 
+class UplinkDTXConfig(BaseModel):
+    """Silence suppression for inbound audio forwarded to realtime providers."""
+    enabled: bool = Field(default=False)
+    # Provider names to gate; empty means every realtime provider.
+    providers: List[str] = Field(default_factory=list)
+    # Trailing silence still sent after speech; keep >= the provider's server VAD silence window.
+    hangover_ms: int = Field(default=600)
+    # Forward one background frame every N ms while suppressed (0 = suppress entirely).
+    keepalive_ms: int = Field(default=0)
+    # Suppressed audio replayed ahead of the first voiced frame to protect word onsets.
+    preroll_ms: int = Field(default=60)
+    energy_threshold: int = Field(default=500)
+
+
+class HttpClientConfig(BaseModel):
+    """Shared aiohttp connector used by REST adapters and the ARI client."""
+    limit: int = Field(default=100)
+    limit_per_host: int = Field(default=20)
+    keepalive_timeout_sec: float = Field(default=60.0)
+    dns_cache_ttl_sec: int = Field(default=300)
+    # Opt-in: open keep-alive connections to provider REST origins at engine startup.
+    # Sends a HEAD / to every origin, so it stays off unless the operator enables it.
+    preconnect: bool = Field(default=False)
+    preconnect_urls: List[str] = Field(default_factory=list)
+    preconnect_timeout_sec: float = Field(default=5.0)
+
+
+class MediaIOConfig(BaseModel):
+    """Executor for playback media files and event-loop lag sampling."""
+    workers: int = Field(default=4)                  # Threads reserved for media file I/O
+    loop_lag_interval_ms: int = Field(default=250)   # Event-loop lag sampling period
+
+
+class MediaStoreConfig(BaseModel):
+    """Budget and sweeping for generated playback files in the media directory."""
+    max_bytes: int = Field(default=0)                # 0 = fs_budget_fraction of the filesystem size
+    max_files: int = Field(default=2000)
+    fs_budget_fraction: float = Field(default=0.5)
+    sweep_interval_sec: float = Field(default=30.0)
+    orphan_age_sec: float = Field(default=120.0)     # Untracked files older than this are removed
+    max_ref_age_sec: float = Field(default=600.0)    # Playback references held longer are reclaimed
+
+
+class BridgePoolConfig(BaseModel):
+    """Idle mixing bridges (and ExternalMedia channels) created ahead of calls."""
+    size: int = Field(default=0)                     # Idle bridges kept ready (0 disables the pool)
+    external_media: bool = Field(default=True)       # With audio_transport externalmedia, pre-attach an ExternalMedia channel
+    idle_timeout_sec: float = Field(default=300.0)   # Idle bridges older than this are recycled
+    health_check_interval_sec: float = Field(default=30.0)
+
+
+class WorkersConfig(BaseModel):
+    """Engine worker processes behind a supervisor that routes each call to one worker."""
+    count: int = Field(default=1)                    # 1 runs a single engine in-process (no supervisor)
+    restart_backoff_sec: float = Field(default=1.0)  # Delay before restarting a worker that exited
+    shutdown_timeout_sec: float = Field(default=15.0)  # Grace period for workers on SIGTERM
+
+
+class CircuitBreakerConfig(BaseModel):
+    """Per-component health tracking and circuit breaking for pipeline adapters."""
+    # Off by default: an open breaker reroutes or fails calls, so it is opt-in.
+    enabled: bool = Field(default=False)
+    window: int = Field(default=20)                  # Rolling calls considered per component
+    min_calls: int = Field(default=5)                # Calls required before the breaker may open
+    error_rate_threshold: float = Field(default=0.5)
+    # Calls slower than this count as failures (0 = latency ignored)
+    slow_call_ms: int = Field(default=0)
+    open_sec: float = Field(default=30.0)            # Time spent open before a half-open trial
+    half_open_max_calls: int = Field(default=1)
+
+
 class StreamingConfig(BaseModel):
     sample_rate: int = Field(default=8000)
     jitter_buffer_ms: int = Field(default=50)
@@ -177,6 +285,9 @@ class StreamingConfig(BaseModel):
     low_watermark_ms: int = Field(default=80)
     provider_grace_ms: int = Field(default=500)
     logging_level: str = Field(default="info")
+    playout_max_buffer_ms: int = Field(default=1000)   # Frames queued ahead of the AudioSocket playout scheduler
+    playout_max_catchup_frames: int = Field(default=3)  # Extra frames sent on a late tick before re-anchoring
+    session_flush_interval_ms: int = Field(default=1000)  # How often per-stream counters are written to the session
 
 
 class LoggingConfig(BaseModel):
@@ -184,11 +295,27 @@ class LoggingConfig(BaseModel):
     level: str = Field(default="info")  # debug|info|warning|error|critical
 
 
+class HedgePolicyConfig(BaseModel):
+    """Race a secondary component when the primary exceeds its learned latency budget."""
+    secondary: str
+    percentile: float = Field(default=0.9)
+    initial_budget_ms: int = Field(default=1500)   # Used until min_samples latencies are observed
+    min_budget_ms: int = Field(default=200)
+    max_budget_ms: int = Field(default=5000)
+    window: int = Field(default=200)               # Rolling latency samples kept per component
+    min_samples: int = Field(default=20)
+    options: Dict[str, Any] = Field(default_factory=dict)  # Options passed to the secondary
+
+
 class PipelineEntry(BaseModel):
     stt: str
     llm: str
     tts: str
     options: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    # Optional per-role hedging policy keyed by "stt", "llm" or "tts"
+    hedging: Dict[str, HedgePolicyConfig] = Field(default_factory=dict)
+    # Pipeline used while a component of this pipeline has an open circuit breaker
+    fallback: Optional[str] = None
 
 
 # Milestone7: Compose canonical component names for provider-backed pipelines.
@@ -238,6 +365,10 @@ def _normalize_pipelines(config_data: Dict[str, Any]) -> None:
                 "tts": raw_entry.get("tts", components["tts"]),
                 "options": options_block,
             }
+            if raw_entry.get("hedging"):
+                normalized_entry["hedging"] = raw_entry["hedging"]
+            if raw_entry.get("fallback"):
+                normalized_entry["fallback"] = raw_entry["fallback"]
 
             normalized[pipeline_name] = normalized_entry
             continue
@@ -260,6 +391,13 @@ class AppConfig(BaseModel):
     vad: Optional[VADConfig] = Field(default_factory=VADConfig)
     streaming: Optional[StreamingConfig] = Field(default_factory=StreamingConfig)
     barge_in: Optional[BargeInConfig] = Field(default_factory=BargeInConfig)
+    uplink_dtx: Optional[UplinkDTXConfig] = Field(default_factory=UplinkDTXConfig)
+    http_client: Optional[HttpClientConfig] = Field(default_factory=HttpClientConfig)
+    media_io: Optional[MediaIOConfig] = Field(default_factory=MediaIOConfig)
+    media_store: Optional[MediaStoreConfig] = Field(default_factory=MediaStoreConfig)
+    bridge_pool: Optional[BridgePoolConfig] = Field(default_factory=BridgePoolConfig)
+    workers: Optional[WorkersConfig] = Field(default_factory=WorkersConfig)
+    circuit_breaker: Optional[CircuitBreakerConfig] = Field(default_factory=CircuitBreakerConfig)
     logging: Optional[LoggingConfig] = Field(default_factory=LoggingConfig)
     pipelines: Dict[str, PipelineEntry] = Field(default_factory=dict)
     active_pipeline: Optional[str] = None
@@ -0,0 +1,238 @@
+"""
+Ordered, bounded dispatch of ARI websocket events.
+
+The listener used to ``json.loads`` every message and spawn one task per
+registered handler per event, so events for the same channel could run out
+of order (StasisEnd racing StasisStart) and an event storm produced an
+unbounded number of tasks. ``AriEventDispatcher`` routes each event to a
+serial queue keyed by the object it concerns (channel, bridge, playback
+target) and runs the queues on a fixed pool of worker tasks:
+
+* events with the same key run one at a time, in arrival order, with all
+  handlers for an event awaited in registration order;
+* at most ``workers`` handlers run concurrently across all keys, and a key
+  re-joins the back of the ready queue after each event so a busy channel
+  cannot starve the others;
+* once ``max_pending`` events are queued, ``dispatch`` waits, pushing back on
+  the websocket reader instead of growing memory.
+
+Messages are decoded with ``orjson`` when it is installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from ..logging_config import get_logger
+
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+logger = get_logger(__name__)
+
+Handler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+JSONDecodeError: Tuple[type, ...] = (json.JSONDecodeError,) + ((orjson.JSONDecodeError,) if orjson else ())
+
+
+def loads(message: Any) -> Any:
+    """Decode an ARI websocket message (``str`` or ``bytes``)."""
+    if orjson is not None:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+_ARI_EVENT_QUEUE_DEPTH = Gauge(
+    "ai_agent_ari_event_queue_depth",
+    "ARI events received but not yet handled",
+)
+_ARI_EVENT_ACTIVE_KEYS = Gauge(
+    "ai_agent_ari_event_active_keys",
+    "Channels/bridges with ARI events queued or being handled",
+)
+_ARI_EVENT_QUEUE_WAIT = Histogram(
+    "ai_agent_ari_event_queue_wait_seconds",
+    "Time from receiving an ARI event to its handlers starting",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+_ARI_EVENT_HANDLER_SECONDS = Histogram(
+    "ai_agent_ari_event_handler_seconds",
+    "Time spent running all handlers for one ARI event",
+    labelnames=("event_type",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+_ARI_EVENT_HANDLER_ERRORS = Counter(
+    "ai_agent_ari_event_handler_errors_total",
+    "ARI event handlers that raised",
+    labelnames=("event_type",),
+)
+
+
+def event_key(event: Dict[str, Any]) -> str:
+    """Serialisation key: the channel, bridge or playback target an event concerns."""
+    channel = event.get("channel")
+    if isinstance(channel, dict) and channel.get("id"):
+        return f"channel:{channel['id']}"
+    playback = event.get("playback")
+    if isinstance(playback, dict):
+        target = playback.get("target_uri")
+        if target:
+            return target
+    bridge = event.get("bridge")
+    if isinstance(bridge, dict) and bridge.get("id"):
+        return f"bridge:{bridge['id']}"
+    return ""
+
+
+class AriEventDispatcher:
+    """Per-key serial queues over a bounded pool of worker tasks."""
+
+    def __init__(
+        self,
+        handlers: Dict[str, List[Handler]],
+        *,
+        workers: int = 16,
+        max_pending: int = 5000,
+    ):
+        # Shared with ARIClient.event_handlers, so handlers added later are seen.
+        self.handlers = handlers
+        self.workers = max(1, int(workers))
+        self.max_pending = max(1, int(max_pending))
+        self._queues: Dict[str, Deque[Tuple[float, Dict[str, Any], Optional[Handler]]]] = {}
+        self._ready: Optional[asyncio.Queue] = None
+        self._busy: Set[str] = set()
+        self._pending = 0
+        self._blocked = 0
+        self._space: Optional[asyncio.Condition] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _ensure_started(self) -> None:
+        if self._tasks:
+            return
+        self._ready = asyncio.Queue()
+        self._space = asyncio.Condition()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"ari-event-worker-{index}") for index in range(self.workers)
+        ]
+
+    async def dispatch(self, event: Dict[str, Any], handler: Optional[Handler] = None) -> bool:
+        """Queue ``event`` behind earlier events with the same key; ``False`` if nothing handles it.
+
+        ``handler`` runs instead of the registered handlers for the event type.
+        """
+        if handler is None and not self.handlers.get(event.get("type")):
+            return False
+        self._ensure_started()
+        if self._pending >= self.max_pending:
+            self._blocked += 1
+            try:
+                async with self._space:
+                    await self._space.wait_for(lambda: self._pending < self.max_pending)
+            finally:
+                self._blocked -= 1
+        key = event_key(event)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            _ARI_EVENT_ACTIVE_KEYS.set(len(self._queues))
+        queue.append((time.perf_counter(), event, handler))
+        self._pending += 1
+        self._idle.clear()
+        _ARI_EVENT_QUEUE_DEPTH.set(self._pending)
+        if key not in self._busy and len(queue) == 1:
+            self._ready.put_nowait(key)
+        return True
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._idle is not None:
+            await self._idle.wait()
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._queues.clear()
+        self._busy.clear()
+        self._pending = 0
+        if self._idle is not None:
+            self._idle.set()
+        _ARI_EVENT_QUEUE_DEPTH.set(0)
+        _ARI_EVENT_ACTIVE_KEYS.set(0)
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._ready.get()
+            queue = self._queues.get(key)
+            if not queue:
+                continue
+            self._busy.add(key)
+            received, event, handler = queue.popleft()
+            try:
+                await self._run(event, handler, received)
+            finally:
+                self._busy.discard(key)
+                self._pending -= 1
+                _ARI_EVENT_QUEUE_DEPTH.set(self._pending)
+                if queue:
+                    self._ready.put_nowait(key)
+                else:
+                    self._queues.pop(key, None)
+                    _ARI_EVENT_ACTIVE_KEYS.set(len(self._queues))
+                if self._blocked and self._pending < self.max_pending:
+                    async with self._space:
+                        self._space.notify_all()
+                if not self._pending:
+                    self._idle.set()
+
+    async def _run(self, event: Dict[str, Any], handler: Optional[Handler], received: float) -> None:
+        event_type = event.get("type") or "unknown"
+        started = time.perf_counter()
+        _ARI_EVENT_QUEUE_WAIT.observe(started - received)
+        handlers = [handler] if handler is not None else list(self.handlers.get(event_type, ()))
+        for fn in handlers:
+            try:
+                await fn(event)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise  # the worker itself is being stopped
+                # A handler awaited something that was cancelled under it; the worker must survive.
+                _ARI_EVENT_HANDLER_ERRORS.labels(event_type).inc()
+                logger.error(
+                    "ARI event handler cancelled",
+                    event_type=event_type,
+                    handler=getattr(fn, "__name__", repr(fn)),
+                )
+            except Exception:
+                _ARI_EVENT_HANDLER_ERRORS.labels(event_type).inc()
+                logger.error(
+                    "ARI event handler failed",
+                    event_type=event_type,
+                    handler=getattr(fn, "__name__", repr(fn)),
+                    exc_info=True,
+                )
+        _ARI_EVENT_HANDLER_SECONDS.labels(event_type).observe(time.perf_counter() - started)
+
+
+__all__ = ["AriEventDispatcher", "JSONDecodeError", "event_key", "loads"]
@@ -0,0 +1,252 @@
+"""
+Pool of idle mixing bridges created ahead of calls.
+
+Creating the bridge (and, with the ExternalMedia transport, the
+ExternalMedia channel and adding it to that bridge) are the slowest ARI
+steps of call setup. ``BridgePool`` keeps up to ``size`` of them ready:
+a call takes one at StasisStart and owns it from then on (cleanup destroys
+it as before), and the pool replenishes itself in the background.
+
+Idle entries are health-checked every ``health_check_interval_sec`` with a
+``GET bridges/{id}``; an entry whose bridge is gone or whose channel set no
+longer matches is discarded, as is one idle longer than
+``idle_timeout_sec`` or one for which Asterisk reports BridgeDestroyed or
+ChannelDestroyed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_BRIDGE_POOL_ACQUIRE_TOTAL = Counter(
+    "ai_agent_bridge_pool_acquire_total",
+    "Call setups served a pooled bridge (hit) or creating one inline (miss)",
+    labelnames=("result",),
+)
+_BRIDGE_POOL_SETUP_SAVED_SECONDS = Histogram(
+    "ai_agent_bridge_pool_setup_saved_seconds",
+    "Bridge/ExternalMedia creation latency taken off the call path by a pool hit",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+_BRIDGE_POOL_RECYCLED_TOTAL = Counter(
+    "ai_agent_bridge_pool_recycled_total",
+    "Pooled bridges discarded without being used",
+    labelnames=("reason",),  # reason: idle|stale|destroyed|shutdown
+)
+_BRIDGE_POOL_IDLE = Gauge(
+    "ai_agent_bridge_pool_idle",
+    "Idle pooled bridges currently held",
+)
+
+
+@dataclass
+class PooledBridge:
+    bridge_id: str
+    external_media_id: Optional[str] = None
+    created_at: float = 0.0
+    setup_sec: float = 0.0
+
+
+class BridgePool:
+    """Keep ``size`` idle bridges (optionally with an ExternalMedia channel attached) ready for calls."""
+
+    def __init__(
+        self,
+        ari_client: Any,
+        *,
+        size: int,
+        idle_timeout_sec: float = 300.0,
+        health_check_interval_sec: float = 30.0,
+        create_external_media: Optional[Callable[[], Awaitable[Optional[str]]]] = None,
+        retry_backoff_sec: float = 2.0,
+    ):
+        self.ari_client = ari_client
+        self.size = max(0, int(size))
+        self.idle_timeout_sec = max(1.0, float(idle_timeout_sec))
+        self.health_check_interval_sec = max(1.0, float(health_check_interval_sec))
+        self._create_external_media = create_external_media
+        self._retry_backoff_sec = retry_backoff_sec
+        self._idle: Deque[PooledBridge] = deque()
+        # bridge and channel ids of idle entries -> entry, for destroy events and StasisStart
+        self._owned: Dict[str, PooledBridge] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._last_check = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def owns_channel(self, channel_id: str) -> bool:
+        """True for an ExternalMedia channel held by an idle pooled bridge."""
+        return channel_id in self._owned
+
+    async def start(self) -> None:
+        if self.size <= 0 or self._task:
+            return
+        self.ari_client.add_event_handler("BridgeDestroyed", self._on_destroyed)
+        self.ari_client.add_event_handler("ChannelDestroyed", self._on_destroyed)
+        self._last_check = time.monotonic()
+        self._running = True
+        self._task = asyncio.create_task(self._maintain())
+        logger.info(
+            "Bridge pool started",
+            size=self.size,
+            external_media=self._create_external_media is not None,
+        )
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        # wait_for() can swallow a cancel that races with a wakeup; the flag ends the loop regardless.
+        self._running = False
+        if task:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        while self._idle:
+            await self._discard(self._take(self._idle[0]), "shutdown")
+
+    def acquire(self) -> Optional[PooledBridge]:
+        """Hand an idle bridge to a call, or ``None`` if the caller must create one inline."""
+        now = time.monotonic()
+        while self._idle:
+            entry = self._take(self._idle[0])
+            if now - entry.created_at > self.idle_timeout_sec:
+                asyncio.create_task(self._discard(entry, "idle"))
+                continue
+            self.hits += 1
+            _BRIDGE_POOL_ACQUIRE_TOTAL.labels("hit").inc()
+            _BRIDGE_POOL_SETUP_SAVED_SECONDS.observe(entry.setup_sec)
+            self._wakeup.set()
+            return entry
+        self.misses += 1
+        _BRIDGE_POOL_ACQUIRE_TOTAL.labels("miss").inc()
+        self._wakeup.set()
+        return None
+
+    async def check(self) -> int:
+        """Verify every idle bridge against Asterisk; returns the number discarded."""
+        self._last_check = time.monotonic()
+        entries = list(self._idle)
+        healthy = await asyncio.gather(*(self._healthy(entry) for entry in entries), return_exceptions=True)
+        discarded = 0
+        for entry, ok in zip(entries, healthy):
+            if ok is True or entry.bridge_id not in self._owned:
+                continue  # healthy, or handed to a call while checking
+            await self._discard(self._take(entry), "stale")
+            discarded += 1
+        return discarded
+
+    async def _healthy(self, entry: PooledBridge) -> bool:
+        response = await self.ari_client.send_command("GET", f"bridges/{entry.bridge_id}", tolerate_statuses=[404])
+        if not isinstance(response, dict) or response.get("id") != entry.bridge_id:
+            return False
+        expected = {entry.external_media_id} if entry.external_media_id else set()
+        return set(response.get("channels") or ()) == expected
+
+    async def _maintain(self) -> None:
+        while self._running:
+            now = time.monotonic()
+            if now - self._last_check >= self.health_check_interval_sec:
+                await self.check()
+            while self._idle and now - self._idle[0].created_at > self.idle_timeout_sec:
+                await self._discard(self._take(self._idle[0]), "idle")
+            if len(self._idle) < self.size:
+                try:
+                    entry = await self._create()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.warning("Bridge pool create failed", exc_info=True)
+                    await asyncio.sleep(self._retry_backoff_sec)
+                    continue
+                self._idle.append(entry)
+                self._owned[entry.bridge_id] = entry
+                if entry.external_media_id:
+                    self._owned[entry.external_media_id] = entry
+                self._update_gauge()
+                continue
+            self._wakeup.clear()
+            # Wake on acquire() to replenish, or at the next health check.
+            timeout = max(0.0, self._last_check + self.health_check_interval_sec - time.monotonic())
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+    async def _create(self) -> PooledBridge:
+        started = time.monotonic()
+        bridge_id = await self.ari_client.create_bridge(bridge_type="mixing")
+        if not bridge_id:
+            raise RuntimeError("Failed to create pooled bridge")
+        entry = PooledBridge(bridge_id)
+        if self._create_external_media is not None:
+            try:
+                entry.external_media_id = await self._create_external_media()
+                if not entry.external_media_id:
+                    raise RuntimeError("Failed to create pooled ExternalMedia channel")
+                if not await self.ari_client.add_channel_to_bridge(bridge_id, entry.external_media_id):
+                    raise RuntimeError("Failed to add pooled ExternalMedia channel to bridge")
+            except BaseException:
+                await self._release_resources(entry)
+                raise
+        entry.created_at = time.monotonic()
+        entry.setup_sec = entry.created_at - started
+        return entry
+
+    async def _on_destroyed(self, event: Dict[str, Any]) -> None:
+        for key in ("bridge", "channel"):
+            obj = event.get(key)
+            entry = self._owned.get(obj.get("id")) if isinstance(obj, dict) else None
+            if entry is not None:
+                await self._discard(self._take(entry), "destroyed")
+                self._wakeup.set()
+
+    def _take(self, entry: PooledBridge) -> PooledBridge:
+        with contextlib.suppress(ValueError):
+            self._idle.remove(entry)
+        self._owned.pop(entry.bridge_id, None)
+        if entry.external_media_id:
+            self._owned.pop(entry.external_media_id, None)
+        self._update_gauge()
+        return entry
+
+    async def _discard(self, entry: PooledBridge, reason: str) -> None:
+        _BRIDGE_POOL_RECYCLED_TOTAL.labels(reason).inc()
+        logger.debug(
+            "Pooled bridge discarded",
+            bridge_id=entry.bridge_id,
+            external_media_id=entry.external_media_id,
+            reason=reason,
+        )
+        await self._release_resources(entry)
+
+    async def _release_resources(self, entry: PooledBridge) -> None:
+        try:
+            if entry.external_media_id:
+                await self.ari_client.hangup_channel(entry.external_media_id)
+            await self.ari_client.destroy_bridge(entry.bridge_id)
+        except Exception:
+            logger.debug("Pooled bridge teardown failed", bridge_id=entry.bridge_id, exc_info=True)
+        sources = [f"bridge:{entry.bridge_id}"]
+        if entry.external_media_id:
+            sources.append(f"channel:{entry.external_media_id}")
+        self.ari_client.unsubscribe(*sources)
+
+    def _update_gauge(self) -> None:
+        _BRIDGE_POOL_IDLE.set(len(self._idle))
+
+
+__all__ = ["BridgePool", "PooledBridge"]
@@ -0,0 +1,194 @@
+"""
+Concurrent call setup.
+
+The caller's StasisStart handler used to issue its ARI requests one after
+another (answer, create bridge, add caller, read ``AI_PROVIDER``, originate
+the media channel), so time to the first greeting grew with every REST round
+trip. ``CallSetupPlan`` describes setup as a small dependency graph: each
+step starts as soon as the steps it depends on have finished, independent
+steps run concurrently, and the first failure cancels the rest.
+
+Each plan records a timeline of when every step started and finished
+relative to StasisStart. Steps that happen in later event handlers (adding
+the media channel to the bridge, starting the provider session) are timed
+with ``track`` and the first outbound audio with ``record_first_audio``, so
+``ai_agent_call_setup_*`` covers the whole path to the greeting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from prometheus_client import Histogram
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default cap on how long a later handler waits for a setup step (wait())
+WAIT_TIMEOUT_SEC = 30.0
+
+_SETUP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_CALL_SETUP_STEP_SECONDS = Histogram(
+    "ai_agent_call_setup_step_seconds",
+    "Duration of one call setup step",
+    labelnames=("step",),
+    buckets=_SETUP_BUCKETS,
+)
+_CALL_SETUP_STEP_DONE_SECONDS = Histogram(
+    "ai_agent_call_setup_step_done_seconds",
+    "Time from the caller's StasisStart until a call setup step finished",
+    labelnames=("step",),
+    buckets=_SETUP_BUCKETS,
+)
+_CALL_SETUP_FIRST_AUDIO_SECONDS = Histogram(
+    "ai_agent_call_setup_first_audio_seconds",
+    "Time from the caller's StasisStart until the first outbound audio",
+    buckets=_SETUP_BUCKETS,
+)
+
+
+class CallSetupPlan:
+    """Dependency graph of setup steps for one call, with a per-step timeline."""
+
+    def __init__(self, call_id: str, *, started: Optional[float] = None):
+        self.call_id = call_id
+        self.started = time.monotonic() if started is None else started
+        self.first_audio: Optional[float] = None
+        # step -> (start offset, end offset) in seconds since ``started``
+        self.timeline: Dict[str, Tuple[float, float]] = {}
+        self._steps: Dict[str, Tuple[Callable[[], Awaitable[Any]], Tuple[str, ...]]] = {}
+        self._done: Dict[str, asyncio.Future] = {}
+
+    def step(self, name: str, fn: Callable[[], Awaitable[Any]], *, after: Iterable[str] = ()) -> None:
+        """Register ``fn`` to run once every step in ``after`` has finished."""
+        after = tuple(after)
+        unknown = [dep for dep in after if dep not in self._steps]
+        if name in self._steps or unknown:
+            raise ValueError(f"invalid call setup step {name!r} (unknown dependencies: {unknown})")
+        self._steps[name] = (fn, after)
+        self._future(name)
+
+    def _future(self, name: str) -> asyncio.Future:
+        future = self._done.get(name)
+        if future is None:
+            future = self._done[name] = asyncio.get_running_loop().create_future()
+        return future
+
+    async def run(self) -> None:
+        """Run all registered steps; re-raises the first failure after cancelling the others."""
+        tasks: List[asyncio.Task] = [
+            asyncio.create_task(self._run_step(name, fn, after), name=f"call-setup-{name}")
+            for name, (fn, after) in self._steps.items()
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for future in self._done.values():
+                if not future.done():
+                    future.cancel()
+                elif not future.cancelled():
+                    future.exception()  # retrieved: failures are reported by run()
+            raise
+
+    async def _run_step(self, name: str, fn: Callable[[], Awaitable[Any]], after: Tuple[str, ...]) -> Any:
+        for dep in after:
+            await asyncio.shield(self._done[dep])
+        return await self.track(name, fn())
+
+    async def track(self, name: str, awaitable: Awaitable[Any]) -> Any:
+        """Await ``awaitable`` as step ``name``, recording it in the timeline."""
+        future = self._future(name)
+        begin = time.monotonic()
+        try:
+            result = await awaitable
+        except BaseException as exc:
+            if not future.done():
+                if isinstance(exc, Exception):
+                    future.set_exception(exc)
+                else:
+                    future.cancel()
+            raise
+        finally:
+            end = time.monotonic()
+            self.timeline[name] = (begin - self.started, end - self.started)
+            _CALL_SETUP_STEP_SECONDS.labels(name).observe(end - begin)
+        _CALL_SETUP_STEP_DONE_SECONDS.labels(name).observe(end - self.started)
+        if not future.done():
+            future.set_result(result)
+        return result
+
+    async def wait(self, name: str, timeout: Optional[float] = WAIT_TIMEOUT_SEC) -> Any:
+        """Result of step ``name``, waiting for it to finish.
+
+        Raises the step's exception if it failed, ``RuntimeError`` if setup was
+        aborted before it ran, and ``asyncio.TimeoutError`` after ``timeout``.
+        Only a cancellation of the waiting task itself propagates as
+        ``CancelledError``.
+        """
+        try:
+            return await asyncio.wait_for(asyncio.shield(self._future(name)), timeout)
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise
+            raise RuntimeError(f"call setup aborted before step {name!r} finished") from None
+
+    def result(self, name: str) -> Any:
+        return self._done[name].result()
+
+    def mark_first_audio(self) -> bool:
+        """Record the first outbound audio; ``False`` if it was already recorded."""
+        if self.first_audio is not None:
+            return False
+        self.first_audio = time.monotonic() - self.started
+        _CALL_SETUP_FIRST_AUDIO_SECONDS.observe(self.first_audio)
+        return True
+
+    def summary(self) -> Dict[str, Any]:
+        steps = {
+            name: f"{begin * 1000:.0f}-{end * 1000:.0f}ms"
+            for name, (begin, end) in sorted(self.timeline.items(), key=lambda item: item[1])
+        }
+        first_audio = None if self.first_audio is None else round(self.first_audio * 1000)
+        return {"setup_steps": steps, "first_audio_ms": first_audio}
+
+
+_plans: Dict[str, CallSetupPlan] = {}
+
+
+def start_call_setup(call_id: str) -> CallSetupPlan:
+    """Create and register the setup plan for ``call_id``."""
+    plan = _plans[call_id] = CallSetupPlan(call_id)
+    return plan
+
+
+def get_call_setup(call_id: str) -> Optional[CallSetupPlan]:
+    return _plans.get(call_id)
+
+
+def finish_call_setup(call_id: str) -> Optional[CallSetupPlan]:
+    """Forget the plan for ``call_id`` (at call cleanup)."""
+    return _plans.pop(call_id, None)
+
+
+def record_first_audio(call_id: str) -> None:
+    """Mark the first outbound audio for ``call_id`` and log its setup timeline."""
+    plan = _plans.get(call_id)
+    if plan is not None and plan.mark_first_audio():
+        logger.info("Call setup timeline", call_id=call_id, **plan.summary())
+
+
+__all__ = [
+    "CallSetupPlan",
+    "finish_call_setup",
+    "get_call_setup",
+    "record_first_audio",
+    "start_call_setup",
+]
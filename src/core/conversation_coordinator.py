@@ -7,7 +7,6 @@ engine can make gating decisions with a single source of truth.
 
 from __future__ import annotations
 
-import asyncio
 from typing import Dict, Optional, TYPE_CHECKING
 
 import structlog
@@ -15,6 +14,7 @@ from prometheus_client import Counter, Gauge
 
 from .models import CallSession
 from .session_store import SessionStore
+from .timer_wheel import TimerHandle, get_timer_wheel
 
 if TYPE_CHECKING:  # pragma: no cover
     from .playback_manager import PlaybackManager
@@ -54,7 +54,7 @@ class ConversationCoordinator:
     def __init__(self, session_store: SessionStore, playback_manager: Optional["PlaybackManager"] = None):
         self._session_store = session_store
         self._playback_manager = playback_manager
-        self._capture_fallback_tasks: Dict[str, asyncio.Task] = {}
+        self._capture_fallback_tasks: Dict[str, TimerHandle] = {}
         self._barge_in_seen: Dict[str, bool] = {}
         self._barge_in_totals: Dict[str, int] = {}
 
@@ -161,9 +161,9 @@ class ConversationCoordinator:
         """Ensure audio capture is eventually re-enabled after a delay."""
         await self._cancel_capture_fallback(call_id)
 
-        async def _task():
+        async def _fire():
+            self._capture_fallback_tasks.pop(call_id, None)
             try:
-                await asyncio.sleep(delay)
                 session = await self._session_store.get_by_call_id(call_id)
                 if not session:
                     return
@@ -173,13 +173,10 @@ class ConversationCoordinator:
                 await self._session_store.upsert_call(session)
                 _AUDIO_CAPTURE_GAUGE.labels(call_id).set(1)
                 logger.info("🎤 ConversationCoordinator fallback re-enabled capture", call_id=call_id)
-            except asyncio.CancelledError:
-                logger.debug("ConversationCoordinator capture fallback cancelled", call_id=call_id)
             except Exception:  # pragma: no cover - defensive logging
                 logger.exception("ConversationCoordinator capture fallback failed", call_id=call_id)
 
-        task = asyncio.create_task(_task())
-        self._capture_fallback_tasks[call_id] = task
+        self._capture_fallback_tasks[call_id] = get_timer_wheel().call_later(delay, _fire)
 
     async def get_summary(self) -> Dict[str, Optional[int]]:
         """Summarise conversation metrics for health reporting."""
@@ -194,13 +191,10 @@ class ConversationCoordinator:
         }
 
     async def _cancel_capture_fallback(self, call_id: str) -> None:
-        task = self._capture_fallback_tasks.pop(call_id, None)
-        if task and not task.done():
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        handle = self._capture_fallback_tasks.pop(call_id, None)
+        if handle and not handle.done():
+            handle.cancel()
+            logger.debug("ConversationCoordinator capture fallback cancelled", call_id=call_id)
 
     def _set_state_metric(self, call_id: str, state: str) -> None:
         for known_state in _CONVERSATION_STATES:
@@ -0,0 +1,224 @@
+"""
+Process-wide HTTP client layer shared by REST adapters and the ARI client.
+
+Every adapter used to build a default ``aiohttp.ClientSession`` lazily, so each
+one owned a private connection pool and the first request of every adapter
+paid DNS plus a full TLS handshake in the middle of a call. The manager owns a
+single tuned ``TCPConnector`` (limits, keep-alive, DNS cache); adapters get
+lightweight sessions bound to it with ``connector_owner=False``, so closing an
+adapter session never tears down the shared keep-alive pool. Configured
+origins can be pre-connected at startup, and per-host connection and latency
+metrics are collected through an aiohttp ``TraceConfig``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import aiohttp
+from prometheus_client import Counter, Histogram
+from yarl import URL
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_HTTP_REQUEST_SECONDS = Histogram(
+    "ai_agent_http_request_seconds",
+    "Latency from request start to response headers, per upstream host",
+    labelnames=("host",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0),
+)
+_HTTP_CONNECTIONS_TOTAL = Counter(
+    "ai_agent_http_connections_total",
+    "Upstream connections used per host (created = new TCP/TLS, reused = keep-alive)",
+    labelnames=("host", "kind"),
+)
+_HTTP_CONNECT_SECONDS = Histogram(
+    "ai_agent_http_connect_seconds",
+    "Time spent establishing a new upstream connection (DNS + TCP + TLS)",
+    labelnames=("host",),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5),
+)
+
+
+def _build_trace_config() -> aiohttp.TraceConfig:
+    trace = aiohttp.TraceConfig()
+
+    async def on_request_start(session, ctx, params):
+        ctx.host = params.url.host or "unknown"
+        ctx.started = time.perf_counter()
+
+    async def on_request_end(session, ctx, params):
+        _HTTP_REQUEST_SECONDS.labels(ctx.host).observe(time.perf_counter() - ctx.started)
+
+    async def on_connection_create_start(session, ctx, params):
+        ctx.connect_started = time.perf_counter()
+
+    async def on_connection_create_end(session, ctx, params):
+        host = getattr(ctx, "host", "unknown")
+        _HTTP_CONNECTIONS_TOTAL.labels(host, "created").inc()
+        _HTTP_CONNECT_SECONDS.labels(host).observe(time.perf_counter() - ctx.connect_started)
+
+    async def on_connection_reuseconn(session, ctx, params):
+        _HTTP_CONNECTIONS_TOTAL.labels(getattr(ctx, "host", "unknown"), "reused").inc()
+
+    trace.on_request_start.append(on_request_start)
+    trace.on_request_end.append(on_request_end)
+    trace.on_connection_create_start.append(on_connection_create_start)
+    trace.on_connection_create_end.append(on_connection_create_end)
+    trace.on_connection_reuseconn.append(on_connection_reuseconn)
+    return trace
+
+
+class HttpClientManager:
+    """Own the shared connector and hand out sessions bound to it."""
+
+    def __init__(self, config: Optional[Any] = None):
+        self._config = config or SimpleNamespace()
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._trace_config = _build_trace_config()
+        self._retiring: Set[asyncio.Future] = set()
+
+    def _setting(self, name: str, default: Any) -> Any:
+        value = getattr(self._config, name, None)
+        return default if value is None else value
+
+    @property
+    def connector(self) -> aiohttp.TCPConnector:
+        loop = asyncio.get_running_loop()
+        if self._connector is None or self._connector.closed or self._loop is not loop:
+            if self._connector is not None and not self._connector.closed:
+                self._retire(self._connector, self._loop, loop)
+            self._loop = loop
+            self._connector = aiohttp.TCPConnector(
+                limit=int(self._setting("limit", 100)),
+                limit_per_host=int(self._setting("limit_per_host", 20)),
+                keepalive_timeout=float(self._setting("keepalive_timeout_sec", 60.0)),
+                ttl_dns_cache=int(self._setting("dns_cache_ttl_sec", 300)),
+                enable_cleanup_closed=True,
+            )
+        return self._connector
+
+    def _retire(
+        self,
+        connector: aiohttp.TCPConnector,
+        owner_loop: Optional[asyncio.AbstractEventLoop],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Close a connector built on a previous event loop instead of leaking its sockets."""
+        if owner_loop is not None and owner_loop.is_running() and owner_loop is not loop:
+            # Still serving another thread: its transports may only be touched there.
+            asyncio.run_coroutine_threadsafe(_close_connector(connector), owner_loop)
+            return
+        task = loop.create_task(_close_connector(connector))
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    def session(self, **kwargs: Any) -> aiohttp.ClientSession:
+        """Return a session on the shared pool; closing it leaves the pool intact."""
+        kwargs.setdefault("trace_configs", [self._trace_config])
+        return aiohttp.ClientSession(connector=self.connector, connector_owner=False, **kwargs)
+
+    async def preconnect(self, urls: Iterable[str]) -> List[str]:
+        """Open keep-alive connections to each distinct origin in ``urls``.
+
+        Any HTTP response (including 4xx) proves the connection is up; it is
+        returned to the pool for the first real request to reuse.
+        """
+        origins: List[str] = []
+        seen: Set[str] = set()
+        for raw in urls:
+            try:
+                url = URL(str(raw))
+            except Exception:
+                continue
+            if url.scheme not in ("http", "https") or not url.host:
+                continue
+            origin = str(url.origin())
+            if origin not in seen:
+                seen.add(origin)
+                origins.append(origin)
+        if not origins:
+            return []
+
+        timeout = aiohttp.ClientTimeout(total=float(self._setting("preconnect_timeout_sec", 5.0)))
+        warmed: List[str] = []
+        async with self.session(timeout=timeout) as session:
+
+            async def _warm(origin: str) -> None:
+                try:
+                    async with session.head(origin + "/", allow_redirects=False) as response:
+                        await response.read()
+                    warmed.append(origin)
+                except Exception as exc:
+                    logger.debug("HTTP pre-connect failed", origin=origin, error=str(exc))
+
+            await asyncio.gather(*(_warm(origin) for origin in origins))
+        logger.info("HTTP pre-connect complete", warmed=warmed, requested=len(origins))
+        return warmed
+
+    async def close(self) -> None:
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
+        self._loop = None
+
+
+async def _close_connector(connector: aiohttp.BaseConnector) -> None:
+    try:
+        await connector.close()
+    except Exception:
+        logger.debug("Closing stale HTTP connector failed", exc_info=True)
+
+
+_manager: Optional[HttpClientManager] = None
+_named_managers: Dict[str, HttpClientManager] = {}
+
+
+def configure_http_clients(config: Optional[Any]) -> HttpClientManager:
+    """Install the process-wide manager built from ``HttpClientConfig``."""
+    global _manager
+    _manager = HttpClientManager(config)
+    return _manager
+
+
+def get_http_client_manager() -> HttpClientManager:
+    global _manager
+    if _manager is None:
+        _manager = HttpClientManager()
+    return _manager
+
+
+def get_named_http_client_manager(name: str, config: Optional[Any] = None) -> HttpClientManager:
+    """Return a dedicated pool for one upstream, created from ``config`` on first use."""
+    manager = _named_managers.get(name)
+    if manager is None:
+        manager = _named_managers[name] = HttpClientManager(config)
+    return manager
+
+
+async def close_http_clients() -> None:
+    """Close the shared pool and every dedicated pool."""
+    for manager in [get_http_client_manager(), *_named_managers.values()]:
+        await manager.close()
+    _named_managers.clear()
+
+
+def shared_session_factory() -> aiohttp.ClientSession:
+    """Default ``session_factory`` for REST adapters."""
+    return get_http_client_manager().session()
+
+
+__all__ = [
+    "HttpClientManager",
+    "close_http_clients",
+    "configure_http_clients",
+    "get_http_client_manager",
+    "get_named_http_client_manager",
+    "shared_session_factory",
+]
@@ -0,0 +1,272 @@
+"""
+Media file I/O on a dedicated executor, plus an event-loop lag monitor.
+
+File playback writes μ-law/WAV files to the shared Asterisk media directory,
+sets ownership, checks they are readable and removes them afterwards. Those
+calls used to run inline on the event loop (``open``/``write``/``os.chown``,
+``os.sync()`` and ``time.sleep`` polling for readiness), so one slow tmpfs or
+NFS write stalled every call on the engine. ``MediaIO`` runs each operation
+on a small thread pool reserved for media files, so a burst of file I/O can
+never starve the default executor used elsewhere, and exposes async methods
+that time every operation in ``ai_agent_media_io_seconds``.
+
+``LoopLagMonitor`` schedules a callback every ``interval`` and records how
+late it ran in ``ai_agent_event_loop_lag_seconds``; a blocking call anywhere
+on the loop shows up there directly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import glob
+import os
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+
+from prometheus_client import Gauge, Histogram
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Asterisk user/group inside the shared-media containers (pwd lookups do not resolve there).
+ASTERISK_OWNER: Tuple[int, int] = (995, 995)
+
+_MEDIA_IO_SECONDS = Histogram(
+    "ai_agent_media_io_seconds",
+    "Media file operation latency as seen by the caller (executor queueing + I/O)",
+    labelnames=("op",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+_EVENT_LOOP_LAG_SECONDS = Histogram(
+    "ai_agent_event_loop_lag_seconds",
+    "How late a periodic event-loop callback ran compared with its schedule",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+_EVENT_LOOP_LAG_LAST = Gauge(
+    "ai_agent_event_loop_lag_last_seconds",
+    "Most recent event-loop lag sample",
+)
+
+
+def _write_file(path: str, data: bytes, owner: Optional[Tuple[int, int]]) -> int:
+    with open(path, "wb") as f:
+        f.write(data)
+    if owner is not None:
+        try:
+            os.chown(path, owner[0], owner[1])
+        except OSError as e:
+            logger.warning("Failed to set media file ownership", file_path=path, error=str(e))
+    return len(data)
+
+
+def _write_wav(path: str, pcm: bytes, sample_rate: int, mode: int) -> int:
+    with open(path, "wb") as f:
+        with wave.open(f, "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(pcm)
+        f.flush()
+        os.fsync(f.fileno())
+        size = f.tell()
+    os.chmod(path, mode)
+    return size
+
+
+def _ready_size(path: str) -> Optional[int]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if st.st_size <= 0 or not os.access(path, os.R_OK):
+        return None
+    return st.st_size
+
+
+def _remove(path: str) -> bool:
+    if os.path.exists(path):
+        os.remove(path)
+        return True
+    return False
+
+
+def _remove_stale(pattern: str, max_age_sec: float) -> int:
+    cutoff = time.time() - max_age_sec
+    removed = 0
+    for path in glob.glob(pattern):
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError as e:
+            logger.debug("Could not clean up media file", file_path=path, error=str(e))
+    return removed
+
+
+def _scan(root: str) -> List[Tuple[str, int, float]]:
+    entries = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        st = entry.stat(follow_symlinks=False)
+                        entries.append((entry.path, st.st_size, st.st_mtime))
+                except OSError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def _filesystem(root: str) -> Tuple[str, int, int]:
+    real = os.path.realpath(root)
+    fstype, best = "unknown", ""
+    try:
+        with open("/proc/mounts") as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount_point = fields[1]
+                inside = real == mount_point or real.startswith(mount_point.rstrip("/") + "/")
+                if inside and len(mount_point) > len(best):
+                    best, fstype = mount_point, fields[2]
+    except OSError:
+        pass
+    st = os.statvfs(real)
+    return fstype, st.f_blocks * st.f_frsize, st.f_bavail * st.f_frsize
+
+
+class MediaIO:
+    """Async media file operations backed by a dedicated thread pool."""
+
+    def __init__(self, workers: int = 4):
+        self.workers = max(1, int(workers))
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="media-io")
+        return self._executor
+
+    async def _run(self, op: str, fn: Callable[..., Any], *args: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool(), fn, *args)
+        finally:
+            _MEDIA_IO_SECONDS.labels(op).observe(time.perf_counter() - started)
+
+    async def write_file(self, path: str, data: bytes, owner: Optional[Tuple[int, int]] = ASTERISK_OWNER) -> int:
+        """Write ``data`` to ``path`` and hand it to ``owner``; returns bytes written."""
+        return await self._run("write", _write_file, path, data, owner)
+
+    async def write_wav(self, path: str, pcm: bytes, sample_rate: int = 8000, mode: int = 0o644) -> int:
+        """Write 16-bit mono PCM as a WAV file, fsync it and set ``mode``; returns file size."""
+        return await self._run("write_wav", _write_wav, path, pcm, sample_rate, mode)
+
+    async def ready_size(self, path: str) -> Optional[int]:
+        """Size of ``path`` if it exists, is readable and non-empty; otherwise ``None``."""
+        return await self._run("check", _ready_size, path)
+
+    async def remove(self, path: str) -> bool:
+        """Remove ``path`` if present; returns whether a file was removed."""
+        return await self._run("remove", _remove, path)
+
+    async def remove_stale(self, pattern: str, max_age_sec: float) -> int:
+        """Remove files matching ``pattern`` older than ``max_age_sec``; returns how many."""
+        return await self._run("remove_stale", _remove_stale, pattern, max_age_sec)
+
+    async def scan(self, root: str) -> List[Tuple[str, int, float]]:
+        """``(path, size, mtime)`` for every regular file directly under ``root``."""
+        return await self._run("scan", _scan, root)
+
+    async def filesystem(self, root: str) -> Tuple[str, int, int]:
+        """``(fstype, total_bytes, free_bytes)`` of the filesystem holding ``root``."""
+        return await self._run("statvfs", _filesystem, root)
+
+    def shutdown(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LoopLagMonitor:
+    """Samples event-loop scheduling lag every ``interval_sec``."""
+
+    def __init__(self, interval_sec: float = 0.25):
+        self.interval_sec = max(0.01, float(interval_sec))
+        self.max_lag = 0.0
+        self.samples = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._expected = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._handle is not None
+
+    def start(self) -> None:
+        if self._handle is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._arm()
+
+    def stop(self) -> None:
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            handle.cancel()
+
+    def _arm(self) -> None:
+        self._expected = self._loop.time() + self.interval_sec
+        self._handle = self._loop.call_at(self._expected, self._sample)
+
+    def _sample(self) -> None:
+        lag = max(0.0, self._loop.time() - self._expected)
+        self.samples += 1
+        if lag > self.max_lag:
+            self.max_lag = lag
+        _EVENT_LOOP_LAG_SECONDS.observe(lag)
+        _EVENT_LOOP_LAG_LAST.set(lag)
+        self._arm()
+
+
+_media_io: Optional[MediaIO] = None
+_lag_monitor: Optional[LoopLagMonitor] = None
+
+
+def configure_media_io(config: Optional[Any]) -> MediaIO:
+    """Install the process-wide ``MediaIO``/``LoopLagMonitor`` built from ``MediaIOConfig``."""
+    global _media_io, _lag_monitor
+    if _media_io is not None:
+        _media_io.shutdown()
+    _media_io = MediaIO(workers=getattr(config, "workers", 4))
+    _lag_monitor = LoopLagMonitor(getattr(config, "loop_lag_interval_ms", 250) / 1000.0)
+    return _media_io
+
+
+def get_media_io() -> MediaIO:
+    global _media_io
+    if _media_io is None:
+        _media_io = MediaIO()
+    return _media_io
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    global _lag_monitor
+    if _lag_monitor is None:
+        _lag_monitor = LoopLagMonitor()
+    return _lag_monitor
+
+
+__all__ = [
+    "ASTERISK_OWNER",
+    "LoopLagMonitor",
+    "MediaIO",
+    "configure_media_io",
+    "get_loop_lag_monitor",
+    "get_media_io",
+]
@@ -0,0 +1,288 @@
+"""
+Lifecycle manager for generated playback media (``ai-generated`` directory).
+
+Generated prompts used to be deleted only on ``PlaybackFinished`` paths, so a
+missed event, a barge-in or a crash leaked the file until the tmpfs filled
+and every later playback failed. ``MediaStore`` owns the directory:
+
+* every file written for playback is registered with its size and a
+  reference per active playback; releasing the last reference deletes it;
+* a byte and file-count budget is enforced on every add by evicting
+  unreferenced files in LRU order (when ``max_bytes`` is 0 the budget is
+  ``fs_budget_fraction`` of the filesystem, so it tracks the RAM disk size);
+* a sweeper on the shared timer wheel, run once at startup, removes
+  untracked files older than ``orphan_age_sec`` (left by a crash or missed
+  cleanup) and reclaims references held longer than ``max_ref_age_sec``;
+* usage, budget and filesystem free space are exported as gauges.
+
+All filesystem work goes through ``MediaIO``; bookkeeping is in-memory and
+loop-thread only.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from prometheus_client import Counter, Gauge
+
+from ..logging_config import get_logger
+from .media_io import MediaIO, get_media_io
+from .timer_wheel import TimerHandle, get_timer_wheel
+
+logger = get_logger(__name__)
+
+_MEDIA_STORE_BYTES = Gauge("ai_agent_media_store_bytes", "Bytes of generated media tracked by the media store")
+_MEDIA_STORE_FILES = Gauge("ai_agent_media_store_files", "Generated media files tracked by the media store")
+_MEDIA_STORE_REFERENCED = Gauge(
+    "ai_agent_media_store_referenced_files",
+    "Tracked media files with at least one active playback",
+)
+_MEDIA_STORE_BUDGET_BYTES = Gauge("ai_agent_media_store_budget_bytes", "Effective media store byte budget")
+_MEDIA_STORE_FS_FREE_BYTES = Gauge(
+    "ai_agent_media_store_fs_free_bytes",
+    "Free bytes on the filesystem holding the media directory",
+)
+_MEDIA_STORE_RECLAIMED = Counter(
+    "ai_agent_media_store_reclaimed_total",
+    "Media files removed by the store",
+    labelnames=("reason",),  # released | evicted | orphan | stale_ref
+)
+_MEDIA_STORE_OVER_BUDGET = Counter(
+    "ai_agent_media_store_over_budget_total",
+    "Adds that left the store over budget because every remaining file was in use",
+)
+
+
+@dataclass
+class MediaEntry:
+    path: str
+    size: int
+    created: float = field(default_factory=time.monotonic)
+    refs: int = 0
+    last_acquired: float = field(default_factory=time.monotonic)
+
+
+class MediaStore:
+    """Reference-counted, budgeted owner of one media directory."""
+
+    def __init__(
+        self,
+        root: str,
+        *,
+        max_bytes: int = 0,
+        max_files: int = 2000,
+        fs_budget_fraction: float = 0.5,
+        sweep_interval_sec: float = 30.0,
+        orphan_age_sec: float = 120.0,
+        max_ref_age_sec: float = 600.0,
+        media_io: Optional[MediaIO] = None,
+    ):
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+        self.max_files = max(0, int(max_files))
+        self.fs_budget_fraction = min(1.0, max(0.0, float(fs_budget_fraction)))
+        self.sweep_interval_sec = max(1.0, float(sweep_interval_sec))
+        self.orphan_age_sec = max(0.0, float(orphan_age_sec))
+        self.max_ref_age_sec = max(0.0, float(max_ref_age_sec))
+        self._media_io = media_io
+        # LRU order: least recently acquired first.
+        self._entries: "OrderedDict[str, MediaEntry]" = OrderedDict()
+        self.bytes_used = 0
+        self.budget_bytes = self.max_bytes
+        self.fstype = "unknown"
+        self._sweeper: Optional[TimerHandle] = None
+
+    @property
+    def media_io(self) -> MediaIO:
+        return self._media_io or get_media_io()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._entries
+
+    def refs(self, path: str) -> int:
+        entry = self._entries.get(path)
+        return entry.refs if entry else 0
+
+    async def start(self) -> None:
+        """Size the budget from the filesystem, reclaim orphans and start the sweeper."""
+        await self.sweep()
+        if self._sweeper is None:
+            self._sweeper = get_timer_wheel().call_every(self.sweep_interval_sec, self.sweep)
+        logger.info(
+            "Media store started",
+            root=self.root,
+            fstype=self.fstype,
+            budget_bytes=self.budget_bytes,
+            max_files=self.max_files,
+            files=len(self._entries),
+        )
+
+    def stop(self) -> None:
+        sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.cancel()
+
+    async def add(self, path: str, size: int, *, acquire: bool = True) -> None:
+        """Track a newly written file (holding one reference by default) and enforce the budget."""
+        entry = self._entries.get(path)
+        if entry is None:
+            entry = self._entries[path] = MediaEntry(path=path, size=int(size))
+            self.bytes_used += entry.size
+        else:
+            self.bytes_used += int(size) - entry.size
+            entry.size = int(size)
+        if acquire:
+            self._touch(entry)
+        await self._enforce_budget()
+        self._publish()
+
+    def acquire(self, path: str) -> bool:
+        """Take a reference for a playback of an already tracked file."""
+        entry = self._entries.get(path)
+        if entry is None:
+            return False
+        self._touch(entry)
+        self._publish()
+        return True
+
+    async def release(self, path: str, *, remove: bool = True) -> None:
+        """Drop a playback reference; the file is deleted once unreferenced when ``remove``.
+
+        Files the store does not track (written before it started, or outside
+        its directory) are simply removed.
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            if remove:
+                await self.media_io.remove(path)
+            return
+        entry.refs = max(0, entry.refs - 1)
+        if entry.refs == 0 and remove:
+            await self._reclaim(entry, "released")
+        self._publish()
+
+    async def sweep(self) -> Dict[str, int]:
+        """Reclaim orphaned files and stale references, refresh filesystem gauges."""
+        counts = {"orphan": 0, "stale_ref": 0, "evicted": 0}
+        try:
+            self.fstype, total, free = await self.media_io.filesystem(self.root)
+            _MEDIA_STORE_FS_FREE_BYTES.set(free)
+            if not self.max_bytes:
+                self.budget_bytes = int(total * self.fs_budget_fraction)
+        except OSError as e:
+            logger.debug("Media store statvfs failed", root=self.root, error=str(e))
+
+        now_mono = time.monotonic()
+        if self.max_ref_age_sec:
+            for entry in list(self._entries.values()):
+                if entry.refs and now_mono - entry.last_acquired > self.max_ref_age_sec:
+                    logger.warning(
+                        "Reclaiming media file with stale playback reference",
+                        file_path=entry.path,
+                        refs=entry.refs,
+                        held_sec=round(now_mono - entry.last_acquired, 1),
+                    )
+                    entry.refs = 0
+                    await self._reclaim(entry, "stale_ref")
+                    counts["stale_ref"] += 1
+
+        now_wall = time.time()
+        for path, size, mtime in await self.media_io.scan(self.root):
+            if path in self._entries or now_wall - mtime < self.orphan_age_sec:
+                continue
+            try:
+                if await self.media_io.remove(path):
+                    _MEDIA_STORE_RECLAIMED.labels("orphan").inc()
+                    counts["orphan"] += 1
+            except OSError as e:
+                logger.debug("Could not remove orphaned media file", file_path=path, error=str(e))
+
+        counts["evicted"] = await self._enforce_budget()
+        self._publish()
+        if counts["orphan"] or counts["stale_ref"] or counts["evicted"]:
+            logger.info("Media store sweep reclaimed files", root=self.root, **counts)
+        return counts
+
+    def _touch(self, entry: MediaEntry) -> None:
+        entry.refs += 1
+        entry.last_acquired = time.monotonic()
+        self._entries.move_to_end(entry.path)
+
+    def _over_budget(self) -> bool:
+        if self.max_files and len(self._entries) > self.max_files:
+            return True
+        return bool(self.budget_bytes) and self.bytes_used > self.budget_bytes
+
+    async def _enforce_budget(self) -> int:
+        evicted = 0
+        if not self._over_budget():
+            return evicted
+        for entry in list(self._entries.values()):
+            if not self._over_budget():
+                break
+            if entry.refs:
+                continue
+            await self._reclaim(entry, "evicted")
+            evicted += 1
+        if self._over_budget():
+            _MEDIA_STORE_OVER_BUDGET.inc()
+            logger.warning(
+                "Media store over budget with every file in use",
+                root=self.root,
+                bytes_used=self.bytes_used,
+                budget_bytes=self.budget_bytes,
+                files=len(self._entries),
+            )
+        return evicted
+
+    async def _reclaim(self, entry: MediaEntry, reason: str) -> None:
+        if self._entries.pop(entry.path, None) is None:
+            return
+        self.bytes_used -= entry.size
+        try:
+            await self.media_io.remove(entry.path)
+        except OSError as e:
+            logger.warning("Error removing media file", file_path=entry.path, reason=reason, error=str(e))
+        _MEDIA_STORE_RECLAIMED.labels(reason).inc()
+
+    def _publish(self) -> None:
+        _MEDIA_STORE_BYTES.set(self.bytes_used)
+        _MEDIA_STORE_FILES.set(len(self._entries))
+        _MEDIA_STORE_REFERENCED.set(sum(1 for entry in self._entries.values() if entry.refs))
+        _MEDIA_STORE_BUDGET_BYTES.set(self.budget_bytes)
+
+
+_store: Optional[MediaStore] = None
+
+
+def configure_media_store(config: Optional[Any], root: str) -> MediaStore:
+    """Install the process-wide store for ``root`` built from ``MediaStoreConfig``."""
+    global _store
+    if _store is not None:
+        _store.stop()
+    _store = MediaStore(
+        root,
+        max_bytes=getattr(config, "max_bytes", 0),
+        max_files=getattr(config, "max_files", 2000),
+        fs_budget_fraction=getattr(config, "fs_budget_fraction", 0.5),
+        sweep_interval_sec=getattr(config, "sweep_interval_sec", 30.0),
+        orphan_age_sec=getattr(config, "orphan_age_sec", 120.0),
+        max_ref_age_sec=getattr(config, "max_ref_age_sec", 600.0),
+    )
+    return _store
+
+
+def get_media_store() -> MediaStore:
+    global _store
+    if _store is None:
+        _store = MediaStore("/mnt/asterisk_media/ai-generated")
+    return _store
+
+
+__all__ = ["MediaEntry", "MediaStore", "configure_media_store", "get_media_store"]
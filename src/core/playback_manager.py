@@ -6,7 +6,6 @@ a clean interface for playing audio with deterministic playback IDs and
 token-aware gating.
 """
 
-import asyncio
 import time
 import os
 import inspect
@@ -15,6 +14,10 @@ import structlog
 
 from src.core.session_store import SessionStore
 from src.core.models import PlaybackRef, CallSession
+from src.core.media_io import get_media_io
+from src.core.media_store import get_media_store
+from src.core.call_setup import record_first_audio
+from src.core.timer_wheel import get_timer_wheel
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from src.core.conversation_coordinator import ConversationCoordinator
@@ -152,6 +155,7 @@ class PlaybackManager:
             
             # Track playback reference
             await self.session_store.add_playback(playback_ref)
+            record_first_audio(call_id)
             
             # Schedule token-aware fallback to ensure gating is cleared even if PlaybackFinished is missed
             if audio_size > 0:
@@ -236,29 +240,20 @@ class PlaybackManager:
         return f"{playback_type}:{call_id}:{ts}{suffix}"
     
     async def _create_audio_file(self, audio_bytes: bytes, playback_id: str) -> Optional[str]:
-        """Create audio file from bytes."""
+        """Create audio file from bytes (written on the media I/O executor)."""
         try:
             # Generate unique filename
             filename = f"audio-{playback_id.replace(':', '-')}.ulaw"
             file_path = os.path.join(self.media_dir, filename)
             
-            # Write audio data
-            with open(file_path, 'wb') as f:
-                f.write(audio_bytes)
-            
-            # Set file ownership for Asterisk readability (UID:GID 995:995)
-            try:
-                os.chown(file_path, 995, 995)
-                logger.debug("Audio file ownership set for Asterisk",
-                            file_path=file_path)
-            except OSError as e:
-                logger.warning("Failed to set file ownership for Asterisk",
-                              file_path=file_path,
-                              error=str(e))
+            # Write audio data and hand ownership to Asterisk (UID:GID 995:995)
+            size = await get_media_io().write_file(file_path, audio_bytes)
+            # Tracked with one reference until PlaybackFinished releases it
+            await get_media_store().add(file_path, size)
             
             logger.debug("Audio file created",
                         file_path=file_path,
-                        size=len(audio_bytes))
+                        size=size)
             
             return file_path
             
@@ -318,12 +313,11 @@ class PlaybackManager:
             return False
     
     async def _cleanup_audio_file(self, audio_file: str) -> None:
-        """Clean up audio file after playback."""
+        """Release the playback's reference; the media store deletes the file once unused."""
         try:
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
-                logger.debug("Audio file cleaned up",
-                           file_path=audio_file)
+            await get_media_store().release(audio_file)
+            logger.debug("Audio file released",
+                       file_path=audio_file)
         except Exception as e:
             logger.warning("Error cleaning up audio file",
                          file_path=audio_file,
@@ -350,8 +344,8 @@ class PlaybackManager:
                         audio_duration=audio_duration,
                         fallback_delay=fallback_delay)
             
-            # Schedule the fallback task
-            asyncio.create_task(self._gating_fallback_task(call_id, playback_id, fallback_delay))
+            # Schedule the fallback check on the shared timer wheel
+            get_timer_wheel().call_later(fallback_delay, self._gating_fallback_task, call_id, playback_id)
             
         except Exception as e:
             logger.error("Error scheduling gating fallback",
@@ -359,18 +353,15 @@ class PlaybackManager:
                         playback_id=playback_id,
                         error=str(e))
     
-    async def _gating_fallback_task(self, call_id: str, playback_id: str, delay: float) -> None:
+    async def _gating_fallback_task(self, call_id: str, playback_id: str) -> None:
         """
-        Fallback task that clears gating token after delay if still active.
+        Fallback check, fired by the timer wheel, that clears the gating token if still active.
         
         Args:
             call_id: Call ID
             playback_id: Playback ID to clear
-            delay: Delay in seconds before checking
         """
         try:
-            await asyncio.sleep(delay)
-            
             # Check if playback is still active
             playback_ref = await self.session_store.get_playback(playback_id)
             if playback_ref:
@@ -0,0 +1,295 @@
+"""
+Central playout scheduler for paced (AudioSocket) streaming.
+
+Pacing each call with ``await asyncio.sleep(frame)`` after every send lets
+send time and loop lag accumulate into drift, and runs one pacing loop per
+call. Here a single task ticks on absolute monotonic deadlines
+(``origin + n * frame``) and, on every tick, emits the due frame for every
+active stream. When the loop wakes late it emits the missed frames as well,
+up to ``max_catchup_frames``; beyond that the schedule is re-anchored to the
+current time and the skipped ticks are recorded as drift instead of being
+burst onto the wire.
+
+Streams buffer until ``prebuffer_frames`` are queued (or the producer has
+finished), and after an underrun re-buffer until ``rebuffer_frames`` are
+available, mirroring the jitter-buffer start and low-watermark behaviour.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_PLAYOUT_ACTIVE_STREAMS = Gauge(
+    "ai_agent_playout_active_streams",
+    "Streams registered with the playout scheduler",
+)
+_PLAYOUT_UNDERRUNS_TOTAL = Counter(
+    "ai_agent_playout_underruns_total",
+    "Ticks on which a playing stream had no frame ready",
+)
+_PLAYOUT_CATCHUP_FRAMES_TOTAL = Counter(
+    "ai_agent_playout_catchup_frames_total",
+    "Extra frames emitted to compensate for a late tick",
+)
+_PLAYOUT_SKIPPED_TICKS_TOTAL = Counter(
+    "ai_agent_playout_skipped_ticks_total",
+    "Ticks dropped when lateness exceeded the catch-up limit",
+)
+_PLAYOUT_TICK_LATENESS = Histogram(
+    "ai_agent_playout_tick_lateness_seconds",
+    "How late the playout scheduler woke relative to its deadline",
+    buckets=(0.001, 0.002, 0.005, 0.01, 0.02, 0.04, 0.08, 0.16, 0.5),
+)
+
+SendFrame = Callable[[bytes], Awaitable[bool]]
+
+
+@dataclass
+class PlayoutStats:
+    frames_sent: int = 0
+    underruns: int = 0
+    gap_frames: int = 0
+    catchup_frames: int = 0
+    skipped_ticks: int = 0
+    max_lateness_ms: float = 0.0
+    # Wall time since start minus audio time accounted for (frames sent + gap slots).
+    drift_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "frames_sent": self.frames_sent,
+            "underruns": self.underruns,
+            "gap_frames": self.gap_frames,
+            "catchup_frames": self.catchup_frames,
+            "skipped_ticks": self.skipped_ticks,
+            "max_lateness_ms": round(self.max_lateness_ms, 2),
+            "drift_ms": round(self.drift_ms, 2),
+        }
+
+
+@dataclass
+class PlayoutStream:
+    """Frame queue for one stream; fed by the producer, drained by the scheduler."""
+
+    key: str
+    send: SendFrame
+    prebuffer_frames: int = 1
+    rebuffer_frames: int = 0
+    max_queued_frames: int = 50
+    frames: Deque[bytes] = field(default_factory=deque)
+    stats: PlayoutStats = field(default_factory=PlayoutStats)
+    playing: bool = False
+    finished: bool = False
+    failed: bool = False
+    started_at: Optional[float] = None
+    _room: asyncio.Event = field(default_factory=asyncio.Event)
+    _drained: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def __post_init__(self) -> None:
+        self._room.set()
+        self._drained.set()
+
+    async def put(self, frame: bytes) -> bool:
+        """Queue one frame, waiting while the stream is at its buffer limit.
+
+        Returns False once the transport has failed.
+        """
+        while len(self.frames) >= self.max_queued_frames and not self.failed:
+            self._room.clear()
+            await self._room.wait()
+        if self.failed:
+            return False
+        self.frames.append(frame)
+        self._drained.clear()
+        return True
+
+    def finish(self) -> None:
+        """Mark the producer done; queued frames are played without re-buffering."""
+        self.finished = True
+
+    async def drain(self) -> bool:
+        """Wait until every queued frame has been sent (or the stream failed)."""
+        self.finish()
+        if self.frames and not self.failed:
+            await self._drained.wait()
+        return not self.failed
+
+    def _ready(self) -> bool:
+        if self.playing:
+            return True
+        threshold = self.prebuffer_frames if self.started_at is None else self.rebuffer_frames
+        return bool(self.frames) and (len(self.frames) >= threshold or self.finished)
+
+    def _after_pop(self) -> None:
+        if len(self.frames) < self.max_queued_frames:
+            self._room.set()
+        if not self.frames:
+            self._drained.set()
+
+    def _fail(self) -> None:
+        self.failed = True
+        self.frames.clear()
+        self._room.set()
+        self._drained.set()
+
+
+class PlayoutScheduler:
+    """One pacing task emitting ``frame_ms`` frames for every registered stream."""
+
+    def __init__(self, *, frame_ms: int = 20, max_catchup_frames: int = 3):
+        self.frame_sec = max(1, int(frame_ms)) / 1000.0
+        self.max_catchup_frames = max(0, int(max_catchup_frames))
+        self._streams: Dict[str, PlayoutStream] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def register(
+        self,
+        key: str,
+        send: SendFrame,
+        *,
+        prebuffer_frames: int = 1,
+        rebuffer_frames: int = 0,
+        max_queued_frames: int = 50,
+    ) -> PlayoutStream:
+        previous = self._streams.get(key)
+        if previous is not None:
+            previous._fail()
+        stream = PlayoutStream(
+            key=key,
+            send=send,
+            prebuffer_frames=max(1, int(prebuffer_frames)),
+            rebuffer_frames=max(0, int(rebuffer_frames)),
+            max_queued_frames=max(1, int(max_queued_frames)),
+        )
+        self._streams[key] = stream
+        _PLAYOUT_ACTIVE_STREAMS.set(len(self._streams))
+        self._ensure_driver()
+        return stream
+
+    def unregister(self, key: str, stream: Optional[PlayoutStream] = None) -> Optional[PlayoutStream]:
+        current = self._streams.get(key)
+        if current is None or (stream is not None and current is not stream):
+            return None
+        del self._streams[key]
+        _PLAYOUT_ACTIVE_STREAMS.set(len(self._streams))
+        if current.frames:
+            current._fail()
+        return current
+
+    def get(self, key: str) -> Optional[PlayoutStream]:
+        return self._streams.get(key)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        for stream in self._streams.values():
+            stream._fail()
+        self._streams.clear()
+        _PLAYOUT_ACTIVE_STREAMS.set(0)
+
+    # -- internals -----------------------------------------------------------------
+
+    def _ensure_driver(self) -> None:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._task = None
+            self._wakeup = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        assert self._wakeup is not None
+        while True:
+            if not self._streams:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            origin = loop.time()
+            tick = 0
+            while self._streams:
+                deadline = origin + tick * self.frame_sec
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                lateness = max(0.0, loop.time() - deadline)
+                _PLAYOUT_TICK_LATENESS.observe(lateness)
+                behind = int(lateness / self.frame_sec)
+                frames_due = 1 + min(behind, self.max_catchup_frames)
+                skipped = behind - (frames_due - 1)
+                if skipped:
+                    # Too far behind to catch up without bursting: re-anchor.
+                    _PLAYOUT_SKIPPED_TICKS_TOTAL.inc(skipped)
+                    origin += skipped * self.frame_sec
+                await self._emit(frames_due, skipped, lateness, loop.time())
+                tick += frames_due
+
+    async def _emit(self, frames_due: int, skipped: int, lateness: float, now: float) -> None:
+        lateness_ms = lateness * 1000.0
+        for stream in list(self._streams.values()):
+            if stream.failed:
+                continue
+            stats = stream.stats
+            if not stream._ready():
+                if stream.started_at is not None and not stream.finished:
+                    stats.gap_frames += frames_due  # re-buffering after an underrun
+                    self._update_drift(stream, now)
+                continue
+            if stream.started_at is None:
+                stream.started_at = now
+            stream.playing = True
+            stats.max_lateness_ms = max(stats.max_lateness_ms, lateness_ms)
+            stats.skipped_ticks += skipped
+            for index in range(frames_due):
+                if not stream.frames:
+                    if not stream.finished:
+                        stats.underruns += 1
+                        stats.gap_frames += frames_due - index
+                        _PLAYOUT_UNDERRUNS_TOTAL.inc()
+                        stream.playing = False
+                    break
+                frame = stream.frames.popleft()
+                stream._after_pop()
+                if index:
+                    stats.catchup_frames += 1
+                    _PLAYOUT_CATCHUP_FRAMES_TOTAL.inc()
+                try:
+                    ok = await stream.send(frame)
+                except Exception:
+                    logger.debug("Playout send raised", stream=stream.key, exc_info=True)
+                    ok = False
+                if not ok:
+                    stream._fail()
+                    break
+                stats.frames_sent += 1
+            self._update_drift(stream, now)
+
+    def _update_drift(self, stream: PlayoutStream, now: float) -> None:
+        stats = stream.stats
+        accounted = (stats.frames_sent + stats.gap_frames) * self.frame_sec
+        stats.drift_ms = ((now - stream.started_at) + self.frame_sec - accounted) * 1000.0
+
+
+__all__ = ["PlayoutScheduler", "PlayoutStats", "PlayoutStream"]
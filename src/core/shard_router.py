@@ -0,0 +1,141 @@
+"""
+Route calls from the front Stasis application to engine worker processes.
+
+With ``workers.count > 1`` the supervisor connects to ARI as the configured
+``asterisk.app_name`` (the application the dialplan sends callers to) and
+each worker connects as its own application, ``<app_name>-w<index>``. On a
+caller's StasisStart the router moves the channel into the least-loaded
+worker's application with ``POST channels/{id}/move``; from then on Asterisk
+delivers that call's events, and those of every channel the worker creates
+for it, only to that worker.
+
+The router keeps an explicit subscription on each routed channel so it sees
+ChannelDestroyed and can release the worker's slot. ``reconcile()`` lists
+channels over ARI to release slots whose destroy event was missed.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from prometheus_client import Counter, Gauge
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_SHARD_CALLS_ROUTED_TOTAL = Counter(
+    "ai_agent_shard_calls_routed_total",
+    "Caller channels moved to a worker's Stasis application",
+    labelnames=("worker", "result"),  # result: moved|failed
+)
+_SHARD_ACTIVE_CALLS = Gauge(
+    "ai_agent_shard_active_calls",
+    "Calls currently owned by each engine worker",
+    labelnames=("worker",),
+)
+_SHARD_UNROUTABLE_TOTAL = Counter(
+    "ai_agent_shard_unroutable_total",
+    "Caller channels hung up because no worker accepted them",
+)
+
+
+def worker_app_name(app_name: str, index: int) -> str:
+    """Stasis application name used by engine worker ``index``."""
+    return f"{app_name}-w{index}"
+
+
+class ShardRouter:
+    """Assign each caller channel to one worker application and track per-worker call counts."""
+
+    def __init__(self, ari_client: Any, worker_apps: Sequence[str]):
+        self.ari_client = ari_client
+        self.worker_apps = list(worker_apps)
+        self.active: List[int] = [0] * len(self.worker_apps)
+        self.available: List[bool] = [True] * len(self.worker_apps)
+        # caller channel id -> owning worker index
+        self._calls: Dict[str, int] = {}
+
+    def start(self) -> None:
+        self.ari_client.add_event_handler("StasisStart", self._on_stasis_start)
+        self.ari_client.add_event_handler("ChannelDestroyed", self._on_channel_destroyed)
+        for index in range(len(self.worker_apps)):
+            _SHARD_ACTIVE_CALLS.labels(str(index)).set(0)
+
+    def owner(self, channel_id: str) -> Optional[int]:
+        return self._calls.get(channel_id)
+
+    def set_available(self, index: int, available: bool) -> None:
+        """Include or skip worker ``index`` when routing new calls."""
+        self.available[index] = available
+
+    def candidates(self) -> List[int]:
+        """Available workers, least loaded first."""
+        return sorted(
+            (index for index, up in enumerate(self.available) if up),
+            key=lambda index: (self.active[index], index),
+        )
+
+    async def _on_stasis_start(self, event: Dict[str, Any]) -> None:
+        channel_id = (event.get("channel") or {}).get("id")
+        if not channel_id or channel_id in self._calls:
+            return
+        # Keep receiving this channel's events once it has left our application.
+        self.ari_client.subscribe(f"channel:{channel_id}")
+        args = [str(arg) for arg in (event.get("args") or [])]
+        for index in self.candidates():
+            if await self.ari_client.move_channel(channel_id, self.worker_apps[index], args):
+                self._assign(channel_id, index)
+                _SHARD_CALLS_ROUTED_TOTAL.labels(str(index), "moved").inc()
+                logger.info("Call routed to worker", channel_id=channel_id, worker=index)
+                return
+            _SHARD_CALLS_ROUTED_TOTAL.labels(str(index), "failed").inc()
+            logger.warning("Worker rejected call", channel_id=channel_id, worker=index)
+        _SHARD_UNROUTABLE_TOTAL.inc()
+        logger.error("No worker accepted call; hanging up", channel_id=channel_id)
+        self.ari_client.unsubscribe(f"channel:{channel_id}")
+        await self.ari_client.hangup_channel(channel_id)
+
+    async def _on_channel_destroyed(self, event: Dict[str, Any]) -> None:
+        channel_id = (event.get("channel") or {}).get("id")
+        if channel_id:
+            self._release(channel_id)
+
+    async def release_worker(self, index: int) -> int:
+        """Hang up the calls of worker ``index`` after it exited; they lost their engine state."""
+        orphaned = [channel_id for channel_id, owner in self._calls.items() if owner == index]
+        for channel_id in orphaned:
+            self._release(channel_id)
+            await self.ari_client.hangup_channel(channel_id)
+        if orphaned:
+            logger.warning("Hung up calls of exited worker", worker=index, calls=len(orphaned))
+        return len(orphaned)
+
+    async def reconcile(self) -> int:
+        """Release calls whose channel no longer exists; returns how many were released."""
+        # Only judge calls routed before the listing was requested.
+        routed = list(self._calls)
+        channels = await self.ari_client.list_channels()
+        if channels is None:
+            return 0
+        live = {channel.get("id") for channel in channels}
+        gone = [channel_id for channel_id in routed if channel_id not in live]
+        for channel_id in gone:
+            self._release(channel_id)
+        return len(gone)
+
+    def _assign(self, channel_id: str, index: int) -> None:
+        self._calls[channel_id] = index
+        self.active[index] += 1
+        _SHARD_ACTIVE_CALLS.labels(str(index)).set(self.active[index])
+
+    def _release(self, channel_id: str) -> None:
+        index = self._calls.pop(channel_id, None)
+        if index is None:
+            return
+        self.active[index] -= 1
+        _SHARD_ACTIVE_CALLS.labels(str(index)).set(self.active[index])
+        self.ari_client.unsubscribe(f"channel:{channel_id}")
+
+
+__all__ = ["ShardRouter", "worker_app_name"]
@@ -8,13 +8,17 @@ It includes automatic fallback to file playback on errors or timeouts.
 
 import asyncio
 import time
-from typing import Optional, Dict, Any, TYPE_CHECKING, Set
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, TYPE_CHECKING, Set
 import structlog
 from prometheus_client import Counter, Gauge
 import math
 import audioop
 
 from src.core.session_store import SessionStore
+from src.core.call_setup import record_first_audio
+from src.core.timer_wheel import TimerHandle, get_timer_wheel
+from src.core.playout_scheduler import PlayoutScheduler, PlayoutStream
 from src.core.models import CallSession, PlaybackRef
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
@@ -61,6 +65,31 @@ _STREAMING_KEEPALIVE_TIMEOUTS_TOTAL = Counter(
 )
 
 
+@dataclass
+class _StreamContext:
+    """Per-stream transport handle and counters, cached so the frame path skips SessionStore.
+
+    Counters accumulate here and are flushed to the session and Prometheus
+    every ``session_flush_interval_ms`` and at stream end.
+    """
+    call_id: str
+    stream_id: str
+    conn_id: Optional[str] = None
+    conns: List[str] = field(default_factory=list)
+    ssrc: Optional[int] = None
+    bytes_pending: int = 0
+    keepalives_pending: int = 0
+    jitter_depth: int = 0
+    flush_timer: Optional[TimerHandle] = None
+    bytes_metric: Any = None
+    depth_metric: Any = None
+
+    def bind(self, session: Any) -> None:
+        self.conn_id = getattr(session, "audiosocket_conn_id", None)
+        self.conns = list(dict.fromkeys(getattr(session, "audiosocket_conns", []) or []))
+        self.ssrc = getattr(session, "ssrc", None)
+
+
 class StreamingPlaybackManager:
     """
     Manages streaming audio playback with automatic fallback to file playback.
@@ -99,13 +128,15 @@ class StreamingPlaybackManager:
         # Streaming state
         self.active_streams: Dict[str, Dict[str, Any]] = {}  # call_id -> stream_info
         self.jitter_buffers: Dict[str, asyncio.Queue] = {}  # call_id -> audio_queue
-        self.keepalive_tasks: Dict[str, asyncio.Task] = {}  # call_id -> keepalive_task
+        self.keepalive_tasks: Dict[str, TimerHandle] = {}  # call_id -> keepalive timer (shared timer wheel)
         # Per-call remainder buffer for precise frame sizing
         self.frame_remainders: Dict[str, bytes] = {}
         # First outbound frame logged tracker
         self._first_send_logged: Set[str] = set()
         # Startup gating to allow jitter buffers to fill before playback begins
         self._startup_ready: Dict[str, bool] = {}
+        # call_id -> cached transport handle and counters for the active stream
+        self._stream_contexts: Dict[str, _StreamContext] = {}
         
         # Configuration defaults
         self.sample_rate = self.streaming_config.get('sample_rate', 8000)
@@ -118,8 +149,18 @@ class StreamingPlaybackManager:
         self.min_start_ms = max(0, int(self.streaming_config.get('min_start_ms', 120)))
         self.low_watermark_ms = max(0, int(self.streaming_config.get('low_watermark_ms', 80)))
         self.provider_grace_ms = max(0, int(self.streaming_config.get('provider_grace_ms', 500)))
+        self.session_flush_interval_ms = max(100, int(self.streaming_config.get('session_flush_interval_ms', 1000)))
         self.min_start_chunks = max(1, int(math.ceil(self.min_start_ms / max(1, self.chunk_size_ms))))
         self.low_watermark_chunks = max(0, int(math.ceil(self.low_watermark_ms / max(1, self.chunk_size_ms))))
+        # AudioSocket frames are paced by one shared scheduler on absolute deadlines
+        self.playout = PlayoutScheduler(
+            frame_ms=self.chunk_size_ms,
+            max_catchup_frames=self.streaming_config.get('playout_max_catchup_frames', 3),
+        )
+        self.playout_max_frames = max(
+            self.min_start_chunks,
+            int(math.ceil(int(self.streaming_config.get('playout_max_buffer_ms', 1000)) / max(1, self.chunk_size_ms))),
+        )
         # Logging verbosity override
         self.logging_level = (self.streaming_config.get('logging_level') or "info").lower()
         if self.logging_level == "debug":
@@ -196,14 +237,46 @@ class StreamingPlaybackManager:
                            stream_id=stream_id)
                 return None
             
+            context = _StreamContext(
+                call_id=call_id,
+                stream_id=stream_id,
+                bytes_metric=_STREAMING_BYTES_TOTAL.labels(call_id),
+                depth_metric=_STREAMING_JITTER_DEPTH.labels(call_id),
+            )
+            context.bind(session)
+            context.flush_timer = get_timer_wheel().call_every(
+                self.session_flush_interval_ms / 1000.0,
+                self._flush_stream_counters,
+                context,
+            )
+            previous_context = self._stream_contexts.get(call_id)
+            if previous_context and previous_context.flush_timer:
+                previous_context.flush_timer.cancel()
+            self._stream_contexts[call_id] = context
+
+            if self.audio_transport == "audiosocket":
+                self.playout.register(
+                    call_id,
+                    lambda frame: self._send_audio_chunk(call_id, stream_id, frame),
+                    prebuffer_frames=self.min_start_chunks,
+                    rebuffer_frames=self.low_watermark_chunks,
+                    max_queued_frames=self.playout_max_frames,
+                )
+
             # Start streaming task
             streaming_task = asyncio.create_task(
                 self._stream_audio_loop(call_id, stream_id, audio_chunks, jitter_buffer)
             )
             
-            # Start keepalive task
-            keepalive_task = asyncio.create_task(
-                self._keepalive_loop(call_id, stream_id)
+            # Start keepalive timer
+            previous_keepalive = self.keepalive_tasks.pop(call_id, None)
+            if previous_keepalive:
+                previous_keepalive.cancel()
+            keepalive_task = get_timer_wheel().call_every(
+                self.keepalive_interval_ms / 1000.0,
+                self._keepalive_tick,
+                call_id,
+                stream_id,
             )
             self.keepalive_tasks[call_id] = keepalive_task
             
@@ -259,26 +332,24 @@ class StreamingPlaybackManager:
                         logger.info("🎵 STREAMING PLAYBACK - End of stream",
                                    call_id=call_id,
                                    stream_id=stream_id)
+                        # Let the playout scheduler send what is still queued
+                        playout = self.playout.get(call_id)
+                        if playout and not await playout.drain():
+                            await self._record_fallback(call_id, "transport-failure")
                         break
                     
                     # Update timing
                     now = time.time()
                     last_send_time = now
-                    if call_id in self.active_streams:
-                        self.active_streams[call_id]['last_chunk_time'] = now
-                        self.active_streams[call_id]['chunks_sent'] += 1
-                    # Update metrics and session counters for queued chunk
-                    try:
-                        _STREAMING_BYTES_TOTAL.labels(call_id).inc(len(chunk))
-                        _STREAMING_JITTER_DEPTH.labels(call_id).set(jitter_buffer.qsize())
-                        _STREAMING_LAST_CHUNK_AGE.labels(call_id).set(0.0)
-                        sess = await self.session_store.get_by_call_id(call_id)
-                        if sess:
-                            sess.streaming_bytes_sent += len(chunk)
-                            sess.streaming_jitter_buffer_depth = jitter_buffer.qsize()
-                            await self.session_store.upsert_call(sess)
-                    except Exception:
-                        logger.debug("Streaming metrics update failed", call_id=call_id)
+                    stream_info = self.active_streams.get(call_id)
+                    if stream_info:
+                        stream_info['last_chunk_time'] = now
+                        stream_info['chunks_sent'] += 1
+                    # Counters are flushed to the session and metrics off the chunk path
+                    context = self._stream_contexts.get(call_id)
+                    if context:
+                        context.bytes_pending += len(chunk)
+                        context.jitter_depth = jitter_buffer.qsize()
                     
                     # Add to jitter buffer
                     await jitter_buffer.put(chunk)
@@ -320,6 +391,8 @@ class StreamingPlaybackManager:
         jitter_buffer: asyncio.Queue
     ) -> bool:
         """Process audio chunks from jitter buffer."""
+        if self.audio_transport == "audiosocket":
+            return await self._enqueue_playout(call_id, stream_id, jitter_buffer)
         try:
             # Hold playback until jitter buffer has the minimum startup chunks
             ready = self._startup_ready.get(call_id, False)
@@ -355,33 +428,10 @@ class StreamingPlaybackManager:
                 if not processed_chunk:
                     continue
 
-                if self.audio_transport == "audiosocket":
-                    # Segment to fixed 20ms frames and pace sends
-                    fmt = (self.audiosocket_format or "ulaw").lower()
-                    bytes_per_sample = 1 if fmt in ("ulaw", "mulaw", "mu-law") else 2
-                    frame_size = int(self.sample_rate * (self.chunk_size_ms / 1000.0) * bytes_per_sample)
-                    if frame_size <= 0:
-                        frame_size = 160 if bytes_per_sample == 1 else 320  # 8k@20ms
-
-                    pending = self.frame_remainders.get(call_id, b"") + processed_chunk
-                    offset = 0
-                    total_len = len(pending)
-                    while (total_len - offset) >= frame_size:
-                        frame = pending[offset:offset + frame_size]
-                        offset += frame_size
-                        success = await self._send_audio_chunk(call_id, stream_id, frame)
-                        if not success:
-                            return False
-                        # Pacing: sleep for chunk duration to avoid overrun
-                        await asyncio.sleep(self.chunk_size_ms / 1000.0)
-
-                    # Save remainder for next round
-                    self.frame_remainders[call_id] = pending[offset:]
-                else:
-                    # ExternalMedia/RTP path: send as-is (RTP layer handles timing)
-                    success = await self._send_audio_chunk(call_id, stream_id, processed_chunk)
-                    if not success:
-                        return False
+                # ExternalMedia/RTP path: send as-is (RTP layer handles timing)
+                success = await self._send_audio_chunk(call_id, stream_id, processed_chunk)
+                if not success:
+                    return False
 
         except Exception as e:
             logger.error("Error processing jitter buffer",
@@ -391,6 +441,50 @@ class StreamingPlaybackManager:
 
         return True
     
+    async def _enqueue_playout(
+        self,
+        call_id: str,
+        stream_id: str,
+        jitter_buffer: asyncio.Queue
+    ) -> bool:
+        """Segment buffered chunks into fixed frames for the playout scheduler.
+
+        Pacing, warm-up and low-watermark re-buffering happen in the scheduler;
+        ``put`` applies backpressure once ``playout_max_buffer_ms`` is queued.
+        """
+        playout: Optional[PlayoutStream] = self.playout.get(call_id)
+        if playout is None:
+            return False
+        try:
+            fmt = (self.audiosocket_format or "ulaw").lower()
+            bytes_per_sample = 1 if fmt in ("ulaw", "mulaw", "mu-law") else 2
+            frame_size = int(self.sample_rate * (self.chunk_size_ms / 1000.0) * bytes_per_sample)
+            if frame_size <= 0:
+                frame_size = 160 if bytes_per_sample == 1 else 320  # 8k@20ms
+
+            while not jitter_buffer.empty():
+                processed_chunk = await self._process_audio_chunk(jitter_buffer.get_nowait())
+                if not processed_chunk:
+                    continue
+                pending = self.frame_remainders.get(call_id, b"") + processed_chunk
+                offset = 0
+                total_len = len(pending)
+                while (total_len - offset) >= frame_size:
+                    if not await playout.put(pending[offset:offset + frame_size]):
+                        return False
+                    offset += frame_size
+                # Save remainder for next round
+                self.frame_remainders[call_id] = pending[offset:]
+            context = self._stream_contexts.get(call_id)
+            if context:
+                context.jitter_depth = len(playout.frames)
+        except Exception as e:
+            logger.error("Error queueing playout frames",
+                        call_id=call_id,
+                        error=str(e))
+            return False
+        return True
+
     async def _process_audio_chunk(self, chunk: bytes) -> Optional[bytes]:
         """Process audio chunk for streaming.
 
@@ -417,19 +511,25 @@ class StreamingPlaybackManager:
     async def _send_audio_chunk(self, call_id: str, stream_id: str, chunk: bytes) -> bool:
         """Send audio chunk via configured streaming transport."""
         try:
-            session = await self.session_store.get_by_call_id(call_id)
-            if not session:
-                logger.warning("Cannot stream audio - session not found", call_id=call_id)
-                return False
+            context = self._stream_contexts.get(call_id)
+            if context is None or context.stream_id != stream_id:
+                # No active stream context (e.g. direct send): resolve from the session.
+                context = _StreamContext(call_id=call_id, stream_id=stream_id)
+                if not await self._refresh_stream_context(context):
+                    logger.warning("Cannot stream audio - session not found", call_id=call_id)
+                    return False
 
             if self.audio_transport == "externalmedia":
                 if not self.rtp_server:
                     logger.warning("Streaming transport unavailable (no RTP server)", call_id=call_id)
                     return False
 
-                ssrc = getattr(session, "ssrc", None)
-                success = await self.rtp_server.send_audio(call_id, chunk, ssrc=ssrc)
-                if not success:
+                if context.ssrc is None:
+                    await self._refresh_stream_context(context)
+                success = await self.rtp_server.send_audio(call_id, chunk, ssrc=context.ssrc)
+                if success:
+                    record_first_audio(call_id)
+                else:
                     logger.warning("RTP streaming send failed", call_id=call_id, stream_id=stream_id)
                 return success
 
@@ -437,7 +537,10 @@ class StreamingPlaybackManager:
                 if not self.audiosocket_server:
                     logger.warning("Streaming transport unavailable (no AudioSocket server)", call_id=call_id)
                     return False
-                conn_id = getattr(session, "audiosocket_conn_id", None)
+                if not context.conn_id:
+                    # The AudioSocket connection may bind after the stream started.
+                    await self._refresh_stream_context(context)
+                conn_id = context.conn_id
                 if not conn_id:
                     logger.warning("Streaming transport missing AudioSocket connection", call_id=call_id)
                     return False
@@ -456,9 +559,10 @@ class StreamingPlaybackManager:
                         conn_id=conn_id,
                     )
                     self._first_send_logged.add(call_id)
+                    record_first_audio(call_id)
                 # Optional broadcast mode for diagnostics
                 if self.audiosocket_broadcast_debug:
-                    conns = list(set(getattr(session, 'audiosocket_conns', []) or []))
+                    conns = context.conns
                     sent = 0
                     for cid in conns or [conn_id]:
                         if await self.audiosocket_server.send_audio(cid, chunk):
@@ -471,6 +575,9 @@ class StreamingPlaybackManager:
                     return True
                 # Normal single-conn send
                 success = await self.audiosocket_server.send_audio(conn_id, chunk)
+                if not success and await self._refresh_stream_context(context) and context.conn_id != conn_id:
+                    # Connection was replaced mid-stream; retry once on the new one.
+                    success = bool(context.conn_id) and await self.audiosocket_server.send_audio(context.conn_id, chunk)
                 if not success:
                     logger.warning("AudioSocket streaming send failed", call_id=call_id, stream_id=stream_id)
                 return success
@@ -488,6 +595,34 @@ class StreamingPlaybackManager:
                         exc_info=True)
             return False
 
+    async def _refresh_stream_context(self, context: _StreamContext) -> bool:
+        """Re-read the transport handle from the session; False if the session is gone."""
+        session = await self.session_store.get_by_call_id(context.call_id)
+        if not session:
+            return False
+        context.bind(session)
+        return True
+
+    async def _flush_stream_counters(self, context: _StreamContext) -> None:
+        """Push accumulated per-stream counters to Prometheus and the call session."""
+        bytes_pending, context.bytes_pending = context.bytes_pending, 0
+        keepalives_pending, context.keepalives_pending = context.keepalives_pending, 0
+        try:
+            if context.bytes_metric is not None and bytes_pending:
+                context.bytes_metric.inc(bytes_pending)
+            if context.depth_metric is not None:
+                context.depth_metric.set(context.jitter_depth)
+            if not (bytes_pending or keepalives_pending):
+                return
+            sess = await self.session_store.get_by_call_id(context.call_id)
+            if sess:
+                sess.streaming_bytes_sent += bytes_pending
+                sess.streaming_jitter_buffer_depth = context.jitter_depth
+                sess.streaming_keepalive_sent += keepalives_pending
+                await self.session_store.upsert_call(sess)
+        except Exception:
+            logger.debug("Streaming counter flush failed", call_id=context.call_id, exc_info=True)
+
     def set_transport(
         self,
         *,
@@ -574,61 +709,53 @@ class StreamingPlaybackManager:
                         error=str(e),
                         exc_info=True)
     
-    async def _keepalive_loop(self, call_id: str, stream_id: str) -> None:
-        """Keepalive loop to maintain streaming connection."""
+    async def _keepalive_tick(self, call_id: str, stream_id: str) -> None:
+        """Periodic keepalive check for one stream, driven by the shared timer wheel."""
         try:
-            while call_id in self.active_streams:
-                await asyncio.sleep(self.keepalive_interval_ms / 1000.0)
-                
-                # Check if stream is still active
-                if call_id not in self.active_streams:
-                    break
-                
-                # Check for timeout
-                stream_info = self.active_streams[call_id]
-                time_since_last_chunk = time.time() - stream_info['last_chunk_time']
-                _STREAMING_LAST_CHUNK_AGE.labels(call_id).set(max(0.0, time_since_last_chunk))
-                _STREAMING_KEEPALIVES_SENT_TOTAL.labels(call_id).inc()
+            stream_info = self.active_streams.get(call_id)
+            if not stream_info or stream_info.get('stream_id') != stream_id:
+                return
+
+            # Check for timeout
+            time_since_last_chunk = time.time() - stream_info['last_chunk_time']
+            _STREAMING_LAST_CHUNK_AGE.labels(call_id).set(max(0.0, time_since_last_chunk))
+            _STREAMING_KEEPALIVES_SENT_TOTAL.labels(call_id).inc()
+            context = self._stream_contexts.get(call_id)
+            if context and context.stream_id == stream_id:
+                context.keepalives_pending += 1
+
+            if time_since_last_chunk > (self.connection_timeout_ms / 1000.0):
+                logger.warning("🎵 STREAMING PLAYBACK - Connection timeout",
+                             call_id=call_id,
+                             stream_id=stream_id,
+                             time_since_last_chunk=time_since_last_chunk)
+                _STREAMING_KEEPALIVE_TIMEOUTS_TOTAL.labels(call_id).inc()
+                # Stop this stream's keepalive before falling back
+                stream_info['keepalive_task'].cancel()
+                if self.keepalive_tasks.get(call_id) is stream_info['keepalive_task']:
+                    del self.keepalive_tasks[call_id]
                 try:
                     sess = await self.session_store.get_by_call_id(call_id)
                     if sess:
-                        sess.streaming_keepalive_sent += 1
+                        sess.streaming_keepalive_timeouts += 1
+                        sess.last_streaming_error = f"keepalive-timeout>{time_since_last_chunk:.2f}s"
                         await self.session_store.upsert_call(sess)
                 except Exception:
                     pass
-                
-                if time_since_last_chunk > (self.connection_timeout_ms / 1000.0):
-                    logger.warning("🎵 STREAMING PLAYBACK - Connection timeout",
-                                 call_id=call_id,
-                                 stream_id=stream_id,
-                                 time_since_last_chunk=time_since_last_chunk)
-                    _STREAMING_KEEPALIVE_TIMEOUTS_TOTAL.labels(call_id).inc()
-                    try:
-                        sess = await self.session_store.get_by_call_id(call_id)
-                        if sess:
-                            sess.streaming_keepalive_timeouts += 1
-                            sess.last_streaming_error = f"keepalive-timeout>{time_since_last_chunk:.2f}s"
-                            await self.session_store.upsert_call(sess)
-                    except Exception:
-                        pass
-                    await self._fallback_to_file_playback(call_id, stream_id)
-                    break
-                
-                # Send keepalive (placeholder)
-                logger.debug("🎵 STREAMING KEEPALIVE - Sending keepalive",
-                           call_id=call_id,
-                           stream_id=stream_id)
-        
-        except asyncio.CancelledError:
-            logger.debug("Keepalive loop cancelled",
-                        call_id=call_id,
-                        stream_id=stream_id)
+                await self._fallback_to_file_playback(call_id, stream_id)
+                return
+
+            # Send keepalive (placeholder)
+            logger.debug("🎵 STREAMING KEEPALIVE - Sending keepalive",
+                       call_id=call_id,
+                       stream_id=stream_id)
+
         except Exception as e:
-            logger.error("Error in keepalive loop",
+            logger.error("Error in keepalive tick",
                         call_id=call_id,
                         stream_id=stream_id,
                         error=str(e))
-    
+
     async def stop_streaming_playback(self, call_id: str) -> bool:
         """Stop streaming playback for a call."""
         try:
@@ -681,8 +808,22 @@ class StreamingPlaybackManager:
             
             # Remove from active streams
             if call_id in self.active_streams:
-                del self.active_streams[call_id]
+                stream_info = self.active_streams.pop(call_id)
+                keepalive = stream_info.get('keepalive_task')
+                if keepalive:
+                    keepalive.cancel()
+                    if self.keepalive_tasks.get(call_id) is keepalive:
+                        del self.keepalive_tasks[call_id]
             
+            playout = self.playout.unregister(call_id)
+            playout_stats = playout.stats.as_dict() if playout else None
+            context = self._stream_contexts.get(call_id)
+            if context and context.stream_id == stream_id:
+                del self._stream_contexts[call_id]
+                if context.flush_timer:
+                    context.flush_timer.cancel()
+                await self._flush_stream_counters(context)
+
             # Clean up jitter buffer
             if call_id in self.jitter_buffers:
                 del self.jitter_buffers[call_id]
@@ -722,6 +863,7 @@ class StreamingPlaybackManager:
                         low_watermark=self.low_watermark_ms,
                         min_start=self.min_start_ms,
                         provider_grace_ms=self.provider_grace_ms,
+                        playout=playout_stats,
                     )
             except Exception:
                 logger.debug("Streaming tuning summary unavailable", call_id=call_id)
@@ -0,0 +1,268 @@
+"""
+Shared hierarchical timer wheel for per-call deadlines and periodic work.
+
+Per-call housekeeping (stream keepalives, gating fallbacks, capture
+re-enable, transcript flush, file cleanup) used to run as one
+``asyncio.sleep`` task per timer, so at 1k calls the loop carried thousands
+of parked tasks, timer-heap entries and cancellation round-trips. The wheel
+keeps all of them in hashed slots driven by a single task: scheduling and
+cancelling are O(1) dictionary operations, and the loop wakes once per tick
+no matter how many timers are pending. A callback that returns an awaitable
+is run as a task only when it fires.
+
+Slots are hierarchical (Varghese & Lauck): level 0 holds timers due within
+one revolution of ``tick_ms``; timers further out sit in coarser levels and
+cascade down as the lower wheel wraps.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+from prometheus_client import Gauge
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_TIMERS_PENDING = Gauge(
+    "ai_agent_timer_wheel_pending",
+    "Timers pending in the shared timer wheel",
+)
+
+
+class TimerHandle:
+    """Returned by ``call_later``/``call_every``; ``cancel()`` is O(1)."""
+
+    __slots__ = ("_wheel", "_callback", "_args", "_interval_ticks", "_bucket", "deadline", "cancelled", "fired")
+
+    def __init__(self, wheel: "TimerWheel", callback: Callable[..., Any], args: tuple, interval_ticks: int = 0):
+        self._wheel = wheel
+        self._callback = callback
+        self._args = args
+        self._interval_ticks = interval_ticks
+        self._bucket: Optional[Dict["TimerHandle", None]] = None
+        self.deadline = 0
+        self.cancelled = False
+        self.fired = False
+
+    def cancel(self) -> None:
+        if self.cancelled:
+            return
+        self.cancelled = True
+        self._wheel._remove(self)
+
+    def done(self) -> bool:
+        return self.cancelled or (self.fired and not self._interval_ticks)
+
+
+class TimerWheel:
+    """Hashed hierarchical timer wheel driven by one asyncio task."""
+
+    def __init__(self, *, tick_ms: int = 10, wheel_sizes: Sequence[int] = (256, 64, 64, 64)):
+        self.tick_sec = max(1, int(tick_ms)) / 1000.0
+        self._sizes = [max(2, int(size)) for size in wheel_sizes]
+        self._spans: List[int] = []
+        span = 1
+        for size in self._sizes:
+            self._spans.append(span)
+            span *= size
+        self._levels: List[List[Dict[TimerHandle, None]]] = [[{} for _ in range(size)] for size in self._sizes]
+        self._tick = 0
+        self._origin = 0.0
+        self._count = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def call_later(self, delay_sec: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """Run ``callback(*args)`` once after ``delay_sec``."""
+        handle = TimerHandle(self, callback, args)
+        self._schedule(handle, self._delay_ticks(delay_sec))
+        return handle
+
+    def call_every(self, interval_sec: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """Run ``callback(*args)`` every ``interval_sec`` until the handle is cancelled.
+
+        An async callback is re-armed only after it completes, so runs never overlap.
+        """
+        ticks = self._delay_ticks(interval_sec)
+        handle = TimerHandle(self, callback, args, interval_ticks=ticks)
+        self._schedule(handle, ticks)
+        return handle
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        for level in self._levels:
+            for bucket in level:
+                for handle in bucket:
+                    handle.cancelled = True
+                    handle._bucket = None
+                bucket.clear()
+        self._count = 0
+        _TIMERS_PENDING.set(0)
+
+    # -- internals -----------------------------------------------------------------
+
+    def _delay_ticks(self, delay_sec: float) -> int:
+        return max(1, int(math.ceil(max(0.0, float(delay_sec)) / self.tick_sec)))
+
+    def _ensure_driver(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # New event loop (e.g. after a restart): timers from the old one are void.
+            if self._loop is not None:
+                for level in self._levels:
+                    for bucket in level:
+                        bucket.clear()
+                self._count = 0
+            self._loop = loop
+            self._task = None
+            self._wakeup = asyncio.Event()
+            self._origin = loop.time()
+            self._tick = 0
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+        return loop
+
+    def _now_tick(self, loop: asyncio.AbstractEventLoop) -> int:
+        return int((loop.time() - self._origin) / self.tick_sec)
+
+    def _schedule(self, handle: TimerHandle, ticks: int) -> None:
+        loop = self._ensure_driver()
+        now_tick = self._now_tick(loop)
+        if self._count == 0:
+            # Nothing pending, so the wheel can jump straight to the current time.
+            self._tick = max(self._tick, now_tick)
+        # Measure from the clock even when the driver lags behind it, or the
+        # timer would fire early by the lag.
+        handle.deadline = max(self._tick, now_tick) + ticks
+        self._insert(handle)
+        self._count += 1
+        _TIMERS_PENDING.set(self._count)
+        if self._count == 1 and self._wakeup is not None:
+            self._wakeup.set()
+
+    def _insert(self, handle: TimerHandle) -> None:
+        delta = handle.deadline - self._tick
+        last = len(self._sizes) - 1
+        for level, (span, size) in enumerate(zip(self._spans, self._sizes)):
+            if delta < span * size or level == last:
+                if delta >= span * size:
+                    # Beyond the wheel's range: park in the farthest slot and re-cascade.
+                    slot = (self._tick // span + size - 1) % size
+                else:
+                    slot = (handle.deadline // span) % size
+                bucket = self._levels[level][slot]
+                bucket[handle] = None
+                handle._bucket = bucket
+                return
+
+    def _remove(self, handle: TimerHandle) -> None:
+        bucket = handle._bucket
+        if bucket is not None and handle in bucket:
+            del bucket[handle]
+            handle._bucket = None
+            self._count -= 1
+            _TIMERS_PENDING.set(self._count)
+
+    def _advance(self) -> None:
+        self._tick += 1
+        tick = self._tick
+        for level in range(1, len(self._sizes)):
+            span = self._spans[level]
+            if tick % span:
+                break
+            bucket = self._levels[level][(tick // span) % self._sizes[level]]
+            if bucket:
+                pending = list(bucket)
+                bucket.clear()
+                for handle in pending:
+                    self._insert(handle)
+
+        bucket = self._levels[0][tick % self._sizes[0]]
+        if not bucket:
+            return
+        due = list(bucket)
+        bucket.clear()
+        for handle in due:
+            handle._bucket = None
+            if handle.deadline > tick:
+                self._insert(handle)
+                continue
+            self._count -= 1
+            self._fire(handle)
+        _TIMERS_PENDING.set(self._count)
+
+    def _fire(self, handle: TimerHandle) -> None:
+        handle.fired = True
+        try:
+            result = handle._callback(*handle._args)
+        except Exception:
+            logger.exception("Timer callback failed", callback=getattr(handle._callback, "__qualname__", None))
+            result = None
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._running.add(task)
+            task.add_done_callback(lambda done, h=handle: self._task_done(done, h))
+        elif handle._interval_ticks and not handle.cancelled:
+            self._rearm(handle)
+
+    def _task_done(self, task: asyncio.Task, handle: TimerHandle) -> None:
+        self._running.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Timer callback failed",
+                callback=getattr(handle._callback, "__qualname__", None),
+                error=str(task.exception()),
+            )
+        if handle._interval_ticks and not handle.cancelled:
+            self._rearm(handle)
+
+    def _rearm(self, handle: TimerHandle) -> None:
+        if self._loop is None or self._loop.is_closed():
+            return
+        self._schedule(handle, handle._interval_ticks)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        assert self._wakeup is not None
+        while True:
+            if self._count == 0:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            next_at = self._origin + (self._tick + 1) * self.tick_sec
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+            target = self._now_tick(loop)
+            while self._tick < target and self._count:
+                self._advance()
+            if not self._count:
+                self._tick = max(self._tick, target)
+
+
+_wheel: Optional[TimerWheel] = None
+
+
+def get_timer_wheel() -> TimerWheel:
+    """Process-wide timer wheel shared by per-call timers."""
+    global _wheel
+    if _wheel is None:
+        _wheel = TimerWheel()
+    return _wheel
+
+
+__all__ = ["TimerHandle", "TimerWheel", "get_timer_wheel"]
@@ -10,7 +10,7 @@ import uuid
 import audioop
 import base64
 from collections import deque
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 
 # Simple audio capture system removed - not used in production
 
@@ -23,7 +23,7 @@ except ImportError:
     WEBRTC_VAD_AVAILABLE = False
     webrtcvad = None
 
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
 
 from .ari_client import ARIClient
 from aiohttp import web
@@ -36,20 +36,64 @@ from .config import (
     DeepgramProviderConfig,
     OpenAIRealtimeProviderConfig,
 )
-from .pipelines import PipelineOrchestrator, PipelineOrchestratorError, PipelineResolution
+from .pipelines import (
+    PipelineOrchestrator,
+    PipelineOrchestratorError,
+    PipelineResolution,
+    call_component,
+    stream_component,
+)
+from .pipelines.base import LLMStreamEvent
+from .pipelines.health import CircuitOpenError
+from .pipelines.metrics import STT_SEGMENTS_TOTAL, STT_SPEECH_RATIO
 from .logging_config import get_logger, configure_logging
 from .rtp_server import RTPServer
 from .audio.audiosocket_server import AudioSocketServer
+from .audio.dtx import UplinkDTX
+from .audio.vad_segmenter import FixedSegmenter, create_segmenter
 from .providers.base import AIProviderInterface
 from .providers.deepgram import DeepgramProvider
 from .providers.local import LocalProvider
 from .providers.openai_realtime import OpenAIRealtimeProvider
 from .core import SessionStore, PlaybackManager, ConversationCoordinator
 from .core.streaming_playback_manager import StreamingPlaybackManager
+from .core.http_client import close_http_clients, configure_http_clients, get_http_client_manager
+from .core.media_io import configure_media_io, get_loop_lag_monitor, get_media_io
+from .core.media_store import configure_media_store
+from .core.bridge_pool import BridgePool
+from .core.call_setup import finish_call_setup, get_call_setup, start_call_setup
 from .core.models import CallSession
+from .core.timer_wheel import TimerHandle, get_timer_wheel
 
 logger = get_logger(__name__)
 
+_UPLINK_DTX_FRAMES = Counter(
+    "ai_agent_uplink_dtx_frames_total",
+    "Inbound frames seen by the uplink DTX gate",
+    labelnames=("provider", "action"),  # action: sent|suppressed
+)
+_UPLINK_DTX_BYTES_SAVED = Counter(
+    "ai_agent_uplink_dtx_bytes_saved_total",
+    "Inbound audio bytes not forwarded to realtime providers because of DTX",
+    labelnames=("provider",),
+)
+_UPLINK_DTX_TURN_LATENCY = Histogram(
+    "ai_agent_uplink_dtx_turn_latency_seconds",
+    "Time from the caller's last voiced uplink frame to the provider's first reply audio",
+    labelnames=("provider",),
+    buckets=(0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0),
+)
+_ARI_RESYNC_SECONDS = Histogram(
+    "ai_agent_ari_resync_seconds",
+    "Time to reconcile sessions against Asterisk after an ARI reconnect",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+_ARI_RESYNC_CLEANED = Counter(
+    "ai_agent_ari_resync_cleaned_total",
+    "Sessions and playbacks found gone in Asterisk during an ARI resync",
+    labelnames=("kind",),  # kind: session|playback
+)
+
 
 class AudioFrameProcessor:
     """Processes audio in 40ms frames to prevent voice queue backlog."""
@@ -123,12 +167,22 @@ class Engine:
 
     def __init__(self, config: AppConfig):
         self.config = config
+        # Process-wide HTTP connection pool shared by REST adapters and ARI
+        configure_http_clients(getattr(config, "http_client", None))
+        # Media file writes/cleanup run on a dedicated executor; loop lag is sampled alongside
+        configure_media_io(getattr(config, "media_io", None))
         base_url = f"http://{config.asterisk.host}:{config.asterisk.port}/ari"
         self.ari_client = ARIClient(
             username=config.asterisk.username,
             password=config.asterisk.password,
             base_url=base_url,
-            app_name=config.asterisk.app_name
+            app_name=config.asterisk.app_name,
+            event_workers=config.asterisk.event_workers,
+            event_queue_max=config.asterisk.event_queue_max,
+            subscribe_all=config.asterisk.subscribe_all,
+            reconnect_backoff_min_sec=config.asterisk.reconnect_backoff_min_sec,
+            reconnect_backoff_max_sec=config.asterisk.reconnect_backoff_max_sec,
+            http_pool_size=config.asterisk.http_pool_size,
         )
         # Set engine reference for event propagation
         self.ari_client.engine = self
@@ -142,6 +196,8 @@ class Engine:
             conversation_coordinator=self.conversation_coordinator,
         )
         self.conversation_coordinator.set_playback_manager(self.playback_manager)
+        # Owns generated prompt files: refcounts, size budget and orphan sweeping
+        self.media_store = configure_media_store(getattr(config, "media_store", None), self.playback_manager.media_dir)
 
         # Initialize streaming playback manager
         streaming_config = {}
@@ -158,6 +214,9 @@ class Engine:
                 'low_watermark_ms': config.streaming.low_watermark_ms,
                 'provider_grace_ms': config.streaming.provider_grace_ms,
                 'logging_level': config.streaming.logging_level,
+                'playout_max_buffer_ms': config.streaming.playout_max_buffer_ms,
+                'playout_max_catchup_frames': config.streaming.playout_max_catchup_frames,
+                'session_flush_interval_ms': config.streaming.session_flush_interval_ms,
             }
         # Debug/diagnostics: allow broadcasting outbound frames to all AudioSocket conns
         try:
@@ -230,8 +289,13 @@ class Engine:
         self._pipeline_tasks: Dict[str, asyncio.Task] = {}
         # Track calls where a pipeline was explicitly requested via AI_PROVIDER
         self._pipeline_forced: Dict[str, bool] = {}
+        # Per-call uplink DTX gates for realtime providers (see config.uplink_dtx)
+        self._uplink_dtx: Dict[str, UplinkDTX] = {}
+        self._uplink_dtx_hangover_warned = False
         # Health server runner
         self._health_runner: Optional[web.AppRunner] = None
+        # Idle bridges created ahead of calls (config.bridge_pool); started once ARI is connected
+        self.bridge_pool: Optional[BridgePool] = None
 
         # Event handlers
         self.ari_client.on_event("StasisStart", self._handle_stasis_start)
@@ -296,6 +360,17 @@ class Engine:
                 exc_info=True,
             )
 
+        get_loop_lag_monitor().start()
+        try:
+            await self.media_store.start()
+        except Exception:
+            logger.warning("Media store startup sweep failed", root=self.media_store.root, exc_info=True)
+
+        # Warm keep-alive connections to provider REST origins off the call path
+        http_cfg = getattr(self.config, "http_client", None)
+        if http_cfg is not None and http_cfg.preconnect:
+            asyncio.create_task(self._preconnect_http_origins())
+
         # 2) Start health server EARLY so diagnostics are available even if transport/ARI fail
         try:
             asyncio.create_task(self._start_health_server())
@@ -319,8 +394,12 @@ class Engine:
                     port=port,
                     on_uuid=self._audiosocket_handle_uuid,
                     on_audio=self._audiosocket_handle_audio,
+                    on_audio_batch=self._audiosocket_handle_audio_batch,
                     on_disconnect=self._audiosocket_handle_disconnect,
                     on_dtmf=self._audiosocket_handle_dtmf,
+                    send_queue_frames=self.config.audiosocket.send_queue_frames,
+                    send_high_water_bytes=self.config.audiosocket.send_high_water_bytes,
+                    send_coalesce_ms=self.config.audiosocket.send_coalesce_ms,
                 )
                 await self.audio_socket_server.start()
                 logger.info("AudioSocket server listening", host=host, port=port)
@@ -374,7 +453,10 @@ class Engine:
         await self.ari_client.connect()
         # Add PlaybackFinished event handler for timing control
         self.ari_client.add_event_handler("PlaybackFinished", self._on_playback_finished)
-        asyncio.create_task(self.ari_client.start_listening())
+        # Reconcile sessions with Asterisk after the websocket drops and reconnects
+        self.ari_client.on_reconnect(self._resync_ari_state)
+        asyncio.create_task(self.ari_client.run())
+        await self._start_bridge_pool()
         logger.info("Engine started and listening for calls.")
 
     async def stop(self):
@@ -383,7 +465,16 @@ class Engine:
         sessions = await self.session_store.get_all_sessions()
         for session in sessions:
             await self._cleanup_call(session.call_id)
+        if self.bridge_pool:
+            await self.bridge_pool.stop()
+            self.bridge_pool = None
         await self.ari_client.disconnect()
+        for name, provider in self.providers.items():
+            if hasattr(provider, 'stop_pool'):
+                try:
+                    await provider.stop_pool()
+                except Exception:
+                    logger.debug("Provider warm pool stop error", provider=name, exc_info=True)
         # Stop RTP server if running
         if hasattr(self, 'rtp_server') and self.rtp_server:
             await self.rtp_server.stop()
@@ -396,6 +487,15 @@ class Engine:
                 await self._health_runner.cleanup()
         except Exception:
             logger.debug("Health server cleanup error", exc_info=True)
+        try:
+            await close_http_clients()
+        except Exception:
+            logger.debug("HTTP client manager close error", exc_info=True)
+        await get_timer_wheel().stop()
+        await self.streaming_playback_manager.playout.stop()
+        get_loop_lag_monitor().stop()
+        self.media_store.stop()
+        get_media_io().shutdown()
         # Milestone7: ensure orchestrator releases component assignments before shutdown.
         try:
             await self.pipeline_orchestrator.stop()
@@ -403,6 +503,102 @@ class Engine:
             logger.debug("Pipeline orchestrator stop error", exc_info=True)
         logger.info("Engine stopped.")
 
+    async def _start_bridge_pool(self) -> None:
+        pool_cfg = getattr(self.config, "bridge_pool", None)
+        if not pool_cfg or pool_cfg.size <= 0:
+            return
+        create_external_media = None
+        if self.config.audio_transport == "externalmedia" and pool_cfg.external_media:
+            # One RTP port serves every call (matched by SSRC), so channels can be created ahead.
+            create_external_media = self._start_external_media_channel
+        self.bridge_pool = BridgePool(
+            self.ari_client,
+            size=pool_cfg.size,
+            idle_timeout_sec=pool_cfg.idle_timeout_sec,
+            health_check_interval_sec=pool_cfg.health_check_interval_sec,
+            create_external_media=create_external_media,
+        )
+        await self.bridge_pool.start()
+
+    async def _resync_ari_state(self) -> None:
+        """Clean up sessions whose channels or bridge vanished while ARI was disconnected."""
+        started = time.monotonic()
+        # Snapshot before listing so calls that start during the resync are never judged.
+        sessions = [
+            (session, {
+                channel_id for channel_id in (
+                    session.caller_channel_id,
+                    session.local_channel_id,
+                    session.external_media_id,
+                    session.audiosocket_channel_id,
+                ) if channel_id
+            })
+            for session in await self.session_store.get_all_sessions()
+        ]
+        channels, bridges = await asyncio.gather(self.ari_client.list_channels(), self.ari_client.list_bridges())
+        if channels is None or bridges is None:
+            logger.warning("ARI resync skipped; could not list channels or bridges")
+            return
+        live_channels = {channel.get("id") for channel in channels}
+        live_bridges = {bridge.get("id") for bridge in bridges}
+
+        stale_sessions = 0
+        stale_playbacks = 0
+        for session, channel_ids in sessions:
+            missing = channel_ids - live_channels
+            if missing or (session.bridge_id and session.bridge_id not in live_bridges):
+                logger.info(
+                    "ARI resync cleaning up call",
+                    call_id=session.call_id,
+                    missing_channels=sorted(missing),
+                    bridge_missing=bool(session.bridge_id and session.bridge_id not in live_bridges),
+                )
+                await self._cleanup_call(session.call_id)
+                stale_sessions += 1
+                continue
+            # PlaybackFinished may have been missed while disconnected.
+            for playback_id in await self.session_store.list_playbacks_for_call(session.call_id):
+                if not await self.ari_client.playback_exists(playback_id):
+                    await self.playback_manager.on_playback_finished(playback_id)
+                    stale_playbacks += 1
+
+        if self.bridge_pool:
+            await self.bridge_pool.check()
+        elapsed = time.monotonic() - started
+        _ARI_RESYNC_SECONDS.observe(elapsed)
+        _ARI_RESYNC_CLEANED.labels("session").inc(stale_sessions)
+        _ARI_RESYNC_CLEANED.labels("playback").inc(stale_playbacks)
+        logger.info(
+            "ARI state resynchronised",
+            sessions=len(sessions),
+            cleaned_sessions=stale_sessions,
+            finished_playbacks=stale_playbacks,
+            duration_ms=round(elapsed * 1000),
+        )
+
+    def _http_preconnect_urls(self) -> List[str]:
+        """Collect REST origins worth pre-connecting: configured URLs plus provider/pipeline base URLs."""
+        urls: List[str] = list(getattr(self.config.http_client, "preconnect_urls", None) or [])
+        option_blocks: List[Any] = []
+        for provider_cfg in (self.config.providers or {}).values():
+            if isinstance(provider_cfg, dict) and provider_cfg.get("enabled", True):
+                option_blocks.append(provider_cfg)
+        for entry in (self.config.pipelines or {}).values():
+            option_blocks.extend((entry.options or {}).values())
+        for block in option_blocks:
+            if not isinstance(block, dict):
+                continue
+            for key, value in block.items():
+                if (key.endswith("_url") or key == "url") and isinstance(value, str) and value.startswith(("http://", "https://")):
+                    urls.append(value)
+        return urls
+
+    async def _preconnect_http_origins(self) -> None:
+        try:
+            await get_http_client_manager().preconnect(self._http_preconnect_urls())
+        except Exception:
+            logger.debug("HTTP pre-connect failed", exc_info=True)
+
     async def _load_providers(self):
         """Load and initialize AI providers from the configuration."""
         logger.info("Loading AI providers...")
@@ -456,6 +652,14 @@ class Engine:
             except Exception as e:
                 logger.error(f"Failed to load provider '{name}': {e}", exc_info=True)
 
+        # Start warm connection pools for providers that support prewarming
+        for name, provider in self.providers.items():
+            if hasattr(provider, 'start_pool'):
+                try:
+                    await provider.start_pool()
+                except Exception:
+                    logger.warning("Provider warm pool failed to start", provider=name, exc_info=True)
+
         # Validate that default provider is available
         if self.config.default_provider not in self.providers:
             available_providers = list(self.providers.keys())
@@ -542,6 +746,8 @@ class Engine:
 
     async def _handle_external_media_stasis_start(self, external_media_id: str, channel: dict):
         """Handle ExternalMedia channel entering Stasis."""
+        if self.bridge_pool and self.bridge_pool.owns_channel(external_media_id):
+            return  # pooled: the pool has added it to its bridge
         try:
             # Find session by external_media_id
             session = await self.session_store.get_by_channel_id(external_media_id)
@@ -563,16 +769,23 @@ class Engine:
             # Add ExternalMedia channel to the bridge
             bridge_id = session.bridge_id
             if bridge_id:
-                success = await self.ari_client.add_channel_to_bridge(bridge_id, external_media_id)
+                # The provider session connects while the ExternalMedia channel joins the bridge
+                provider_start = await self._start_provider_alongside_media(caller_channel_id, session)
+                success = await self._track_call_setup(
+                    caller_channel_id,
+                    "media_to_bridge",
+                    self.ari_client.add_channel_to_bridge(bridge_id, external_media_id),
+                )
                 if success:
                     logger.info("🎯 EXTERNAL MEDIA - ExternalMedia channel added to bridge",
                                 external_media_id=external_media_id,
                                 bridge_id=bridge_id,
                                 caller_channel_id=caller_channel_id)
-
-                    # Start the provider session now that media path is connected
-                    await self._start_provider_session(caller_channel_id)
+                    if provider_start:
+                        await provider_start
                 else:
+                    if provider_start:
+                        provider_start.cancel()
                     logger.error("🎯 EXTERNAL MEDIA - Failed to add ExternalMedia channel to bridge",
                                  external_media_id=external_media_id,
                                  bridge_id=bridge_id)
@@ -601,153 +814,221 @@ class Engine:
             logger.warning("🎯 HYBRID ARI - Caller already in progress", channel_id=caller_channel_id)
             return
 
+        # Keep caller events (e.g. ChannelDestroyed) flowing even after it leaves Stasis
+        self.ari_client.subscribe(f"channel:{caller_channel_id}")
+
+        plan = start_call_setup(caller_channel_id)
         try:
-            # Step 1: Answer the caller
-            logger.info("🎯 HYBRID ARI - Step 1: Answering caller channel", channel_id=caller_channel_id)
-            await self.ari_client.answer_channel(caller_channel_id)
-            logger.info("🎯 HYBRID ARI - Step 1: ✅ Caller channel answered", channel_id=caller_channel_id)
+            # Independent ARI requests run concurrently; each step starts as soon
+            # as the steps it depends on are done (see src/core/call_setup.py).
+            async def answer() -> None:
+                await self.ari_client.answer_channel(caller_channel_id)
+                logger.info("🎯 HYBRID ARI - ✅ Caller channel answered", channel_id=caller_channel_id)
+
+            pooled = None
+
+            async def create_bridge() -> str:
+                nonlocal pooled
+                pooled = self.bridge_pool.acquire() if self.bridge_pool else None
+                if pooled:
+                    logger.info("🎯 HYBRID ARI - ✅ Pooled bridge attached",
+                                channel_id=caller_channel_id,
+                                bridge_id=pooled.bridge_id,
+                                external_media_id=pooled.external_media_id)
+                    return pooled.bridge_id
+                bridge_id = await self.ari_client.create_bridge(bridge_type="mixing")
+                if not bridge_id:
+                    raise RuntimeError("Failed to create mixing bridge")
+                logger.info("🎯 HYBRID ARI - ✅ Bridge created",
+                            channel_id=caller_channel_id,
+                            bridge_id=bridge_id)
+                return bridge_id
 
-            # Step 2: Create bridge immediately
-            logger.info("🎯 HYBRID ARI - Step 2: Creating bridge immediately", channel_id=caller_channel_id)
-            bridge_id = await self.ari_client.create_bridge(bridge_type="mixing")
-            if not bridge_id:
-                raise RuntimeError("Failed to create mixing bridge")
-            logger.info("🎯 HYBRID ARI - Step 2: ✅ Bridge created",
-                        channel_id=caller_channel_id,
-                        bridge_id=bridge_id)
+            async def create_session() -> CallSession:
+                bridge_id = plan.result("bridge")
+                self.bridges[caller_channel_id] = bridge_id
+                session = CallSession(
+                    call_id=caller_channel_id,
+                    caller_channel_id=caller_channel_id,
+                    bridge_id=bridge_id,
+                    provider_name=self.config.default_provider,
+                    audio_capture_enabled=False,
+                    status="connected"
+                )
+                if pooled and pooled.external_media_id:
+                    # Already in the bridge; the session owns it from here (cleanup hangs it up).
+                    session.external_media_id = pooled.external_media_id
+                    session.status = "external_media_created"
+                await self._save_session(session, new=True)
+                logger.info("🎯 HYBRID ARI - ✅ Caller session created and stored",
+                            channel_id=caller_channel_id,
+                            bridge_id=bridge_id)
+                return session
+
+            async def add_caller_to_bridge() -> None:
+                bridge_id = plan.result("bridge")
+                if not await self.ari_client.add_channel_to_bridge(bridge_id, caller_channel_id):
+                    raise RuntimeError("Failed to add caller channel to bridge")
+                logger.info("🎯 HYBRID ARI - ✅ Caller added to bridge",
+                            channel_id=caller_channel_id,
+                            bridge_id=bridge_id)
 
-            # Step 3: Add caller to bridge
-            logger.info("🎯 HYBRID ARI - Step 3: Adding caller to bridge",
-                        channel_id=caller_channel_id,
-                        bridge_id=bridge_id)
-            caller_success = await self.ari_client.add_channel_to_bridge(bridge_id, caller_channel_id)
-            if not caller_success:
-                raise RuntimeError("Failed to add caller channel to bridge")
-            logger.info("🎯 HYBRID ARI - Step 3: ✅ Caller added to bridge",
-                        channel_id=caller_channel_id,
-                        bridge_id=bridge_id)
-            self.bridges[caller_channel_id] = bridge_id
+            async def resolve_provider() -> None:
+                await self._apply_ai_provider(plan.result("session"), plan.result("ai_provider"))
+
+            async def start_transport() -> None:
+                session = plan.result("session")
+                if self.config.audio_transport == "externalmedia" and session.external_media_id:
+                    # Pooled ExternalMedia channel: no StasisStart will follow, start the provider here.
+                    provider_start = await self._start_provider_alongside_media(caller_channel_id, session)
+                    if provider_start:
+                        await provider_start
+                elif self.config.audio_transport == "externalmedia":
+                    logger.info("🎯 EXTERNAL MEDIA - Creating ExternalMedia channel", channel_id=caller_channel_id)
+                    external_media_id = await self._start_external_media_channel(caller_channel_id)
+                    if external_media_id:
+                        # Update session with ExternalMedia ID
+                        session.external_media_id = external_media_id
+                        session.status = "external_media_created"
+                        await self._save_session(session)
+                        logger.info("🎯 EXTERNAL MEDIA - ExternalMedia channel created, session updated",
+                                    channel_id=caller_channel_id,
+                                    external_media_id=external_media_id)
+                    else:
+                        logger.error("🎯 EXTERNAL MEDIA - Failed to create ExternalMedia channel",
+                                     channel_id=caller_channel_id)
+                else:
+                    logger.info("🎯 HYBRID ARI - Originating AudioSocket channel", channel_id=caller_channel_id)
+                    await self._originate_audiosocket_channel_hybrid(caller_channel_id)
+
+            plan.step("answer", answer)
+            plan.step("bridge", create_bridge)
+            plan.step("ai_provider", lambda: self._read_ai_provider(caller_channel_id))
+            plan.step("session", create_session, after=("bridge",))
+            plan.step("caller_to_bridge", add_caller_to_bridge, after=("answer", "bridge"))
+            plan.step("resolve", resolve_provider, after=("session", "ai_provider"))
+            # The media channel is originated while the caller joins the bridge and
+            # the provider or pipeline is chosen; its StasisStart handler waits for both.
+            plan.step("transport", start_transport, after=("session",))
+            await plan.run()
 
-            # Step 4: Create CallSession and store in SessionStore
-            session = CallSession(
-                call_id=caller_channel_id,
-                caller_channel_id=caller_channel_id,
-                bridge_id=bridge_id,
-                provider_name=self.config.default_provider,
-                audio_capture_enabled=False,
-                status="connected"
+        except Exception as e:
+            logger.error("🎯 HYBRID ARI - Failed to handle caller StasisStart",
+                         caller_channel_id=caller_channel_id,
+                         error=str(e), exc_info=True)
+            await self._cleanup_call(caller_channel_id)
+
+    async def _read_ai_provider(self, caller_channel_id: str) -> Optional[str]:
+        """Read the per-call AI_PROVIDER channel variable (None when unset or unreadable)."""
+        # Milestone7: Per-call override via Asterisk channel var AI_PROVIDER.
+        # Values:
+        #   - openai_realtime | deepgram → full agent override
+        #   - customX (any other token) → pipeline name
+        try:
+            resp = await self.ari_client.send_command(
+                "GET",
+                f"channels/{caller_channel_id}/variable",
+                params={"variable": "AI_PROVIDER"},
             )
-            await self._save_session(session, new=True)
-            logger.info("🎯 HYBRID ARI - Step 4: ✅ Caller session created and stored",
-                        channel_id=caller_channel_id,
-                        bridge_id=bridge_id)
+            if isinstance(resp, dict):
+                return (resp.get("value") or "").strip() or None
+        except Exception:
+            logger.debug(
+                "AI_PROVIDER read failed; continuing with defaults",
+                channel_id=caller_channel_id,
+                exc_info=True,
+            )
+        return None
 
-            # Milestone7: Per-call override via Asterisk channel var AI_PROVIDER.
-            # Values:
-            #   - openai_realtime | deepgram → full agent override
-            #   - customX (any other token) → pipeline name
-            ai_provider_value = None
-            try:
-                resp = await self.ari_client.send_command(
-                    "GET",
-                    f"channels/{caller_channel_id}/variable",
-                    params={"variable": "AI_PROVIDER"},
-                )
-                if isinstance(resp, dict):
-                    ai_provider_value = (resp.get("value") or "").strip()
-            except Exception:
-                logger.debug(
-                    "AI_PROVIDER read failed; continuing with defaults",
-                    channel_id=caller_channel_id,
-                    exc_info=True,
-                )
+    async def _apply_ai_provider(self, session: CallSession, ai_provider_value: Optional[str]) -> None:
+        """Apply the AI_PROVIDER selection (full agent or pipeline) to a new call session."""
+        caller_channel_id = session.caller_channel_id
+        provider_aliases = {
+            "openai": "openai_realtime",
+            "deepgram_agent": "deepgram",
+        }
+        resolved_provider = (
+            provider_aliases.get(ai_provider_value, ai_provider_value)
+            if ai_provider_value
+            else None
+        )
 
-            provider_aliases = {
-                "openai": "openai_realtime",
-                "deepgram_agent": "deepgram",
-            }
-            resolved_provider = (
-                provider_aliases.get(ai_provider_value, ai_provider_value)
-                if ai_provider_value
-                else None
+        pipeline_resolution = None
+        if resolved_provider and resolved_provider in self.providers:
+            # Full agent override for this call
+            previous = session.provider_name
+            session.provider_name = resolved_provider
+            await self._save_session(session)
+            logger.info(
+                "AI provider override applied from channel variable",
+                channel_id=caller_channel_id,
+                variable="AI_PROVIDER",
+                value=ai_provider_value,
+                resolved_provider=resolved_provider,
+                previous_provider=previous,
+                resolved_mode="full_agent",
             )
-
-            pipeline_resolution = None
-            if resolved_provider and resolved_provider in self.providers:
-                # Full agent override for this call
-                previous = session.provider_name
-                session.provider_name = resolved_provider
-                await self._save_session(session)
+        elif ai_provider_value:
+            # Treat as a pipeline name for this call
+            pipeline_resolution = await self._assign_pipeline_to_session(
+                session, pipeline_name=ai_provider_value
+            )
+            if pipeline_resolution:
                 logger.info(
-                    "AI provider override applied from channel variable",
+                    "AI pipeline selection applied from channel variable",
                     channel_id=caller_channel_id,
                     variable="AI_PROVIDER",
                     value=ai_provider_value,
-                    resolved_provider=resolved_provider,
-                    previous_provider=previous,
-                    resolved_mode="full_agent",
+                    pipeline=pipeline_resolution.pipeline_name,
+                    components=pipeline_resolution.component_summary(),
+                    resolved_mode="pipeline",
                 )
-            elif ai_provider_value:
-                # Treat as a pipeline name for this call
-                pipeline_resolution = await self._assign_pipeline_to_session(
-                    session, pipeline_name=ai_provider_value
+                # Opt-in to adapter-driven pipeline execution for this call
+                try:
+                    await self._ensure_pipeline_runner(session, forced=True)
+                except Exception:
+                    logger.debug("Failed to start pipeline runner", call_id=caller_channel_id, exc_info=True)
+            elif getattr(self.pipeline_orchestrator, "started", False):
+                logger.warning(
+                    "Requested pipeline via AI_PROVIDER not found; falling back",
+                    channel_id=caller_channel_id,
+                    requested_pipeline=ai_provider_value,
                 )
-                if pipeline_resolution:
-                    logger.info(
-                        "AI pipeline selection applied from channel variable",
-                        channel_id=caller_channel_id,
-                        variable="AI_PROVIDER",
-                        value=ai_provider_value,
-                        pipeline=pipeline_resolution.pipeline_name,
-                        components=pipeline_resolution.component_summary(),
-                        resolved_mode="pipeline",
-                    )
-                    # Opt-in to adapter-driven pipeline execution for this call
-                    try:
-                        await self._ensure_pipeline_runner(session, forced=True)
-                    except Exception:
-                        logger.debug("Failed to start pipeline runner", call_id=caller_channel_id, exc_info=True)
-                elif getattr(self.pipeline_orchestrator, "started", False):
-                    logger.warning(
-                        "Requested pipeline via AI_PROVIDER not found; falling back",
-                        channel_id=caller_channel_id,
-                        requested_pipeline=ai_provider_value,
-                    )
-                    pipeline_resolution = await self._assign_pipeline_to_session(session)
-            else:
-                # Default behavior (use active_pipeline if configured)
                 pipeline_resolution = await self._assign_pipeline_to_session(session)
-                if not pipeline_resolution and getattr(self.pipeline_orchestrator, "started", False):
-                    logger.info(
-                        "Milestone7 pipeline orchestrator falling back to legacy provider flow",
-                        call_id=caller_channel_id,
-                        provider=session.provider_name,
-                    )
+        else:
+            # Default behavior (use active_pipeline if configured)
+            pipeline_resolution = await self._assign_pipeline_to_session(session)
+            if not pipeline_resolution and getattr(self.pipeline_orchestrator, "started", False):
+                logger.info(
+                    "Milestone7 pipeline orchestrator falling back to legacy provider flow",
+                    call_id=caller_channel_id,
+                    provider=session.provider_name,
+                )
 
-            # Step 5: Create ExternalMedia channel or originate Local channel
-            if self.config.audio_transport == "externalmedia":
-                logger.info("🎯 EXTERNAL MEDIA - Step 5: Creating ExternalMedia channel", channel_id=caller_channel_id)
-                external_media_id = await self._start_external_media_channel(caller_channel_id)
-                if external_media_id:
-                    # Update session with ExternalMedia ID
-                    session.external_media_id = external_media_id
-                    session.status = "external_media_created"
-                    await self._save_session(session)
-                    logger.info("🎯 EXTERNAL MEDIA - ExternalMedia channel created, session updated",
-                                channel_id=caller_channel_id,
-                                external_media_id=external_media_id)
-                else:
-                    logger.error("🎯 EXTERNAL MEDIA - Failed to create ExternalMedia channel",
-                                 channel_id=caller_channel_id)
-            else:
-                logger.info("🎯 HYBRID ARI - Step 5: Originating AudioSocket channel", channel_id=caller_channel_id)
-                await self._originate_audiosocket_channel_hybrid(caller_channel_id)
+    async def _start_provider_alongside_media(self, call_id: str, session: CallSession) -> Optional[asyncio.Task]:
+        """Start the provider session while a media channel is being bridged.
 
-        except Exception as e:
-            logger.error("🎯 HYBRID ARI - Failed to handle caller StasisStart",
-                         caller_channel_id=caller_channel_id,
-                         error=str(e), exc_info=True)
-            await self._cleanup_call(caller_channel_id)
+        The media channel is originated concurrently with the rest of caller
+        setup, so wait until the caller is bridged and the provider or pipeline
+        chosen. The returned task (None when the session is already active)
+        must be awaited, or cancelled if bridging the media channel fails.
+        """
+        plan = get_call_setup(call_id)
+        if plan is not None:
+            await plan.wait("caller_to_bridge")
+            await plan.wait("resolve")
+        if session.provider_session_active:
+            return None
+        return asyncio.create_task(
+            self._track_call_setup(call_id, "provider_session", self._start_provider_session(call_id))
+        )
+
+    async def _track_call_setup(self, call_id: str, step: str, awaitable):
+        """Await ``awaitable``, timing it as a setup step when the call is still setting up."""
+        plan = get_call_setup(call_id)
+        if plan is None:
+            return await awaitable
+        return await plan.track(step, awaitable)
 
     async def _handle_local_stasis_start_hybrid(self, local_channel_id: str, channel: dict):
         """Handle Local channel entering Stasis - Hybrid ARI approach."""
@@ -848,9 +1129,19 @@ class Engine:
             return
 
         try:
-            added = await self.ari_client.add_channel_to_bridge(bridge_id, audiosocket_channel_id)
-            if not added:
-                raise RuntimeError("Failed to add AudioSocket channel to bridge")
+            provider_start = await self._start_provider_alongside_media(caller_channel_id, session)
+            try:
+                added = await self._track_call_setup(
+                    caller_channel_id,
+                    "media_to_bridge",
+                    self.ari_client.add_channel_to_bridge(bridge_id, audiosocket_channel_id),
+                )
+                if not added:
+                    raise RuntimeError("Failed to add AudioSocket channel to bridge")
+            except BaseException:
+                if provider_start:
+                    provider_start.cancel()
+                raise
 
             logger.info(
                 "🎯 HYBRID ARI - ✅ AudioSocket channel added to bridge",
@@ -866,8 +1157,8 @@ class Engine:
             self.audiosocket_channels[caller_channel_id] = audiosocket_channel_id
             self.bridges[audiosocket_channel_id] = bridge_id
 
-            if not session.provider_session_active:
-                await self._start_provider_session(caller_channel_id)
+            if provider_start:
+                await provider_start
         except Exception as exc:
             logger.error(
                 "🎯 HYBRID ARI - Failed to process AudioSocket channel",
@@ -950,6 +1241,28 @@ class Engine:
                 await self._cleanup_call(caller_channel_id)
             await self.ari_client.hangup_channel(local_channel_id)
 
+    async def _start_external_media_channel(self, caller_channel_id: Optional[str] = None) -> Optional[str]:
+        """Create an ExternalMedia channel sending RTP to our RTP server; returns its channel id."""
+        em_cfg = self.config.external_media
+        if not em_cfg:
+            raise RuntimeError("ExternalMedia configuration missing")
+        host = em_cfg.rtp_host or "127.0.0.1"
+        if host in ("0.0.0.0", "::"):
+            host = "127.0.0.1"
+        response = await self.ari_client.create_external_media_channel(
+            self.config.asterisk.app_name,
+            f"{host}:{em_cfg.rtp_port}",
+            format=em_cfg.codec,
+            direction=em_cfg.direction,
+        )
+        external_media_id = response.get("id") if response else None
+        logger.info(
+            "🎯 EXTERNAL MEDIA - ExternalMedia channel created",
+            caller_channel_id=caller_channel_id,
+            external_media_id=external_media_id,
+        )
+        return external_media_id
+
     async def _originate_audiosocket_channel_hybrid(self, caller_channel_id: str):
         """Originate an AudioSocket channel using the native channel interface."""
         if not self.config.audiosocket:
@@ -996,6 +1309,7 @@ class Engine:
             response = await self.ari_client.send_command("POST", "channels", params=orig_params)
             if response and response.get("id"):
                 audiosocket_channel_id = response["id"]
+                self.ari_client.subscribe(f"channel:{audiosocket_channel_id}")
                 self.pending_audiosocket_channels[audiosocket_channel_id] = caller_channel_id
                 self.uuidext_to_channel[audio_uuid] = caller_channel_id
 
@@ -1048,6 +1362,7 @@ class Engine:
             response = await self.ari_client.send_command("POST", "channels", params=orig_params)
             if response and response.get("id"):
                 local_channel_id = response["id"]
+                self.ari_client.subscribe(f"channel:{local_channel_id}")
                 # Store mapping for ExternalMedia binding
                 self.pending_local_channels[local_channel_id] = caller_channel_id
                 self.uuidext_to_channel[audio_uuid] = caller_channel_id
@@ -1099,6 +1414,7 @@ class Engine:
             response = await self.ari_client.send_command("POST", "channels", params=orig_params)
             if response and response.get("id"):
                 local_channel_id = response["id"]
+                self.ari_client.subscribe(f"channel:{local_channel_id}")
                 # Store pending mapping
                 self.pending_local_channels[local_channel_id] = caller_channel_id
                 logger.info("Local channel originated",
@@ -1179,6 +1495,7 @@ class Engine:
 
             call_id = session.call_id
             logger.info("Cleaning up call", call_id=call_id)
+            finish_call_setup(call_id)
 
             # Idempotent re-entrancy guard
             if getattr(session, "cleanup_completed", False):
@@ -1218,14 +1535,20 @@ class Engine:
                     logger.debug("Bridge destroy failed", call_id=call_id, bridge_id=bridge_id, exc_info=True)
 
             # Hang up associated channels.
-            for channel_id in filter(None,
-                                     [session.caller_channel_id, session.local_channel_id, session.external_media_id,
-                                      session.audiosocket_channel_id]):
+            call_channels = list(filter(None, [session.caller_channel_id, session.local_channel_id,
+                                               session.external_media_id, session.audiosocket_channel_id]))
+            for channel_id in call_channels:
                 try:
                     await self.ari_client.hangup_channel(channel_id)
                 except Exception:
                     logger.debug("Hangup failed during cleanup", call_id=call_id, channel_id=channel_id, exc_info=True)
 
+            # Stop receiving events for this call's channels and bridge.
+            self.ari_client.unsubscribe(
+                *(f"channel:{channel_id}" for channel_id in call_channels),
+                *([f"bridge:{bridge_id}"] if bridge_id else []),
+            )
+
             # Remove residual mappings so new calls don’t inherit.
             self.bridges.pop(session.caller_channel_id, None)
             if session.local_channel_id:
@@ -1252,6 +1575,8 @@ class Engine:
             except Exception:
                 logger.debug("Pipeline cleanup failed", call_id=call_id, exc_info=True)
 
+            self._release_uplink_dtx(call_id)
+
             # Remove SSRC mapping for this call (if any)
             try:
                 to_delete = [ssrc for ssrc, cid in self.ssrc_to_caller.items() if cid == call_id]
@@ -1312,8 +1637,10 @@ class Engine:
                         local_channel_id=local_channel_id)
 
             # Add both channels to bridge
-            caller_success = await self.ari_client.add_channel_to_bridge(bridge_id, caller_channel_id)
-            local_success = await self.ari_client.add_channel_to_bridge(bridge_id, local_channel_id)
+            caller_success, local_success = await asyncio.gather(
+                self.ari_client.add_channel_to_bridge(bridge_id, caller_channel_id),
+                self.ari_client.add_channel_to_bridge(bridge_id, local_channel_id),
+            )
 
             if not caller_success:
                 logger.error("Failed to add caller channel to bridge",
@@ -1453,7 +1780,17 @@ class Engine:
             return False
 
     async def _audiosocket_handle_audio(self, conn_id: str, audio_bytes: bytes) -> None:
-        """Forward inbound AudioSocket audio to the active provider for the bound call."""
+        """Forward one inbound AudioSocket frame to the active provider for the bound call."""
+        await self._audiosocket_handle_audio_batch(conn_id, [audio_bytes])
+
+    async def _audiosocket_handle_audio_batch(
+        self, conn_id: str, frames: List[Union[bytes, memoryview]]
+    ) -> None:
+        """Forward the frames parsed from one socket read for the bound call.
+
+        The call and session are resolved once per batch. Frames are views into the
+        server's receive buffer and are only copied when forwarded downstream.
+        """
         try:
             caller_channel_id = self.conn_to_channel.get(conn_id)
             if not caller_channel_id and self.audio_socket_server:
@@ -1469,7 +1806,7 @@ class Engine:
 
             if not caller_channel_id:
                 logger.debug("AudioSocket audio received for unknown connection", conn_id=conn_id,
-                             bytes=len(audio_bytes))
+                             bytes=sum(len(frame) for frame in frames))
                 return
 
             session = await self.session_store.get_by_call_id(caller_channel_id)
@@ -1477,7 +1814,22 @@ class Engine:
                 logger.debug("No session for caller; dropping AudioSocket audio", conn_id=conn_id,
                              caller_channel_id=caller_channel_id)
                 return
+        except Exception as exc:
+            logger.error("Error handling AudioSocket audio", conn_id=conn_id, error=str(exc), exc_info=True)
+            return
 
+        for frame in frames:
+            await self._audiosocket_route_frame(conn_id, caller_channel_id, session, frame)
+
+    async def _audiosocket_route_frame(
+        self,
+        conn_id: str,
+        caller_channel_id: str,
+        session: Any,
+        frame: Union[bytes, memoryview],
+    ) -> None:
+        """Apply TTS gating/barge-in to one inbound frame and forward it to the pipeline or provider."""
+        try:
             # Post-TTS end protection: drop inbound briefly after gating clears to avoid agent echo re-capture
             try:
                 cfg = getattr(self.config, 'barge_in', None)
@@ -1504,7 +1856,7 @@ class Engine:
                 cfg = getattr(self.config, 'barge_in', None)
                 if not cfg or not getattr(cfg, 'enabled', True):
                     logger.debug("Dropping inbound AudioSocket audio during TTS playback (barge-in disabled)",
-                                 conn_id=conn_id, caller_channel_id=caller_channel_id, bytes=len(audio_bytes))
+                                 conn_id=conn_id, caller_channel_id=caller_channel_id, bytes=len(frame))
                     return
 
                 # Protection window from TTS start to avoid initial self-echo
@@ -1525,7 +1877,7 @@ class Engine:
 
                 # Barge-in detection: accumulate candidate window based on energy
                 try:
-                    energy = audioop.rms(audio_bytes, 2)
+                    energy = audioop.rms(frame, 2)
                 except Exception:
                     energy = 0
 
@@ -1581,6 +1933,9 @@ class Engine:
                                  session.barge_in_candidate_ms, energy)
                     return
 
+            # Frames that survive gating leave the receive buffer: take an owned copy.
+            audio_bytes = bytes(frame)
+
             # If pipeline execution is forced, route to pipeline queue after converting to PCM16 @ 16 kHz
             if self._pipeline_forced.get(caller_channel_id):
                 q = self._pipeline_queues.get(caller_channel_id)
@@ -1599,6 +1954,12 @@ class Engine:
                 logger.debug("Provider unavailable for audio", provider=provider_name)
                 return
 
+            dtx = self._uplink_dtx_gate(caller_channel_id, provider_name, provider)
+            if dtx is not None:
+                for dtx_frame in self._uplink_dtx_process(dtx, provider_name, audio_bytes, *self._as_to_pcm16_8k(audio_bytes)):
+                    await provider.send_audio(dtx_frame)
+                return
+
             await provider.send_audio(audio_bytes)
         except Exception as exc:
             logger.error("Error handling AudioSocket audio", conn_id=conn_id, error=str(exc), exc_info=True)
@@ -1632,7 +1993,7 @@ class Engine:
     async def _on_rtp_audio(self, ssrc: int, pcm_16k: bytes) -> None:
         """Route inbound ExternalMedia RTP audio (PCM16 @ 16 kHz) to the active provider.
 
-        This mirrors the gating/barge-in logic of `_audiosocket_handle_audio` and
+        This mirrors the gating/barge-in logic of `_audiosocket_route_frame` and
         establishes an SSRC→call_id mapping the first time we see a new SSRC.
         """
         try:
@@ -1788,6 +2149,12 @@ class Engine:
                 logger.debug("Provider unavailable for RTP audio", provider=provider_name)
                 return
 
+            dtx = self._uplink_dtx_gate(caller_channel_id, provider_name, provider)
+            if dtx is not None:
+                for frame in self._uplink_dtx_process(dtx, provider_name, pcm_16k, pcm_16k, 16000):
+                    await provider.send_audio(frame)
+                return
+
             # Forward PCM16 16k frames to provider
             await provider.send_audio(pcm_16k)
         except Exception as exc:
@@ -1856,6 +2223,10 @@ class Engine:
             if etype == "AgentAudio":
                 chunk: bytes = event.get("data") or b""
                 if chunk:
+                    gate = self._uplink_dtx.get(call_id)
+                    latency = gate.take_turn_latency() if gate is not None else None
+                    if latency is not None:
+                        _UPLINK_DTX_TURN_LATENCY.labels(session.provider_name).observe(latency)
                     session.agent_audio_buffer.extend(chunk)
                     session.last_agent_audio_ts = time.time()
                     await self._save_session(session)
@@ -1877,6 +2248,82 @@ class Engine:
         except Exception as exc:
             logger.error("Error handling provider event", error=str(exc), exc_info=True)
 
+    def _uplink_dtx_gate(self, call_id: str, provider_name: str, provider: Any) -> Optional[UplinkDTX]:
+        """Return the call's DTX gate when uplink silence suppression applies to this provider."""
+        cfg = getattr(self.config, "uplink_dtx", None)
+        if not cfg or not cfg.enabled:
+            return None
+        if cfg.providers and provider_name not in cfg.providers:
+            return None
+        gate = self._uplink_dtx.get(call_id)
+        if gate is not None:
+            return gate
+        gate = UplinkDTX(
+            hangover_ms=cfg.hangover_ms,
+            keepalive_ms=cfg.keepalive_ms,
+            preroll_ms=cfg.preroll_ms,
+            aggressiveness=getattr(self.config.vad, "webrtc_aggressiveness", 0) if self.config.vad else 0,
+            energy_threshold=cfg.energy_threshold,
+        )
+        self._uplink_dtx[call_id] = gate
+        # Server-side turn detection only ends a turn after it has *received* enough
+        # silence, so a shorter hangover would delay end-of-turn until the next frame.
+        turn_detection = getattr(getattr(provider, "config", None), "turn_detection", None)
+        silence_ms = getattr(turn_detection, "silence_duration_ms", None)
+        if silence_ms and cfg.hangover_ms < silence_ms and not self._uplink_dtx_hangover_warned:
+            self._uplink_dtx_hangover_warned = True
+            logger.warning(
+                "Uplink DTX hangover shorter than provider turn-detection silence window",
+                provider=provider_name,
+                hangover_ms=cfg.hangover_ms,
+                silence_duration_ms=silence_ms,
+            )
+        return gate
+
+    def _uplink_dtx_process(
+        self,
+        gate: UplinkDTX,
+        provider_name: str,
+        frame: bytes,
+        pcm16: bytes,
+        sample_rate: int,
+    ) -> List[bytes]:
+        saved_before = gate.bytes_saved
+        frames = gate.process(frame, pcm16, sample_rate)
+        _UPLINK_DTX_FRAMES.labels(provider_name, "sent" if frames else "suppressed").inc()
+        saved = gate.bytes_saved - saved_before
+        if saved > 0:
+            _UPLINK_DTX_BYTES_SAVED.labels(provider_name).inc(saved)
+        return frames
+
+    def _release_uplink_dtx(self, call_id: str) -> None:
+        gate = self._uplink_dtx.pop(call_id, None)
+        if gate is None:
+            return
+        logger.info(
+            "Uplink DTX summary",
+            call_id=call_id,
+            frames=gate.frames_in,
+            talkspurts=gate.talkspurts,
+            keepalives=gate.keepalives,
+            bytes_in=gate.bytes_in,
+            bytes_saved=gate.bytes_saved,
+            suppressed_ratio=round(gate.suppressed_ratio, 3),
+            hangover_ms=gate.hangover_ms,
+        )
+
+    def _as_to_pcm16_8k(self, audio_bytes: bytes) -> tuple:
+        """Return AudioSocket inbound bytes as (PCM16 @ 8 kHz, 8000) for frame classification."""
+        fmt = 'ulaw'
+        try:
+            if self.config and getattr(self.config, 'audiosocket', None):
+                fmt = (self.config.audiosocket.format or 'ulaw').lower()
+        except Exception:
+            fmt = 'ulaw'
+        if fmt in ('ulaw', 'mulaw', 'g711_ulaw'):
+            return audioop.ulaw2lin(audio_bytes, 2), 8000
+        return audio_bytes, 8000
+
     def _as_to_pcm16_16k(self, audio_bytes: bytes) -> bytes:
         """Convert AudioSocket inbound bytes to PCM16 @ 16 kHz for pipeline STT.
 
@@ -1900,6 +2347,17 @@ class Engine:
             logger.debug("AudioSocket -> PCM16 16k conversion failed", exc_info=True)
             return audio_bytes
 
+    @staticmethod
+    def _pipeline_llm_streams(pipeline: Any) -> bool:
+        """Stream LLM replies sentence by sentence when the pipeline or the adapter's config asks for it."""
+        adapter = pipeline.llm_adapter
+        if not hasattr(adapter, "stream_generate"):
+            return False
+        options = pipeline.llm_options or {}
+        if "stream" in options:
+            return bool(options["stream"])
+        return bool(getattr(adapter, "stream_by_default", False))
+
     async def _ensure_pipeline_runner(self, session: CallSession, *, forced: bool = False) -> None:
         """Create per-call queue and start pipeline runner if not already started."""
         call_id = session.call_id
@@ -1977,7 +2435,11 @@ class Engine:
                     for attempt in range(1, max_attempts + 1):
                         try:
                             tts_bytes = bytearray()
-                            async for chunk in pipeline.tts_adapter.synthesize(call_id, greeting, pipeline.tts_options):
+                            async for chunk in stream_component(
+                                pipeline,
+                                "tts",
+                                lambda adapter, options: adapter.synthesize(call_id, greeting, options),
+                            ):
                                 if chunk:
                                     tts_bytes.extend(chunk)
                             if not tts_bytes:
@@ -2094,18 +2556,74 @@ class Engine:
                     pass
 
             if not use_streaming:
+                # Segmentation stage: buffer_queue -> segmenter -> segment_queue -> stt_worker.
+                # "vad" commits padded utterances and drops silence; "fixed" keeps the
+                # legacy commit_ms cadence.
+                segmentation_options = dict((pipeline.stt_options or {}).get("segmentation") or {})
+                try:
+                    segmenter = create_segmenter(
+                        segmentation_options,
+                        getattr(self.config, "vad", None),
+                        commit_bytes=commit_bytes,
+                    )
+                except ValueError:
+                    logger.warning(
+                        "Unknown STT segmentation mode; using fixed chunking",
+                        call_id=call_id,
+                        mode=segmentation_options.get("mode"),
+                    )
+                    segmenter = FixedSegmenter(commit_bytes)
+                segmentation_mode = "fixed" if isinstance(segmenter, FixedSegmenter) else "vad"
+                segment_queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=8)
+
+                def report_segmentation() -> None:
+                    speech_ratio = segmenter.speech_ratio
+                    if speech_ratio is not None:
+                        STT_SPEECH_RATIO.labels(pipeline.pipeline_name).observe(speech_ratio)
+                    logger.info(
+                        "Pipeline STT segmentation summary",
+                        call_id=call_id,
+                        pipeline=pipeline.pipeline_name,
+                        mode=segmentation_mode,
+                        segments=segmenter.utterances,
+                        speech_ratio=round(speech_ratio, 3) if speech_ratio is not None else None,
+                        audio_ms=segmenter.bytes_in // bytes_per_ms,
+                        committed_ms=segmenter.bytes_emitted // bytes_per_ms,
+                    )
+
+                async def commit_segments(segments: List[bytes]) -> None:
+                    for segment in segments:
+                        STT_SEGMENTS_TOTAL.labels(pipeline.pipeline_name, segmentation_mode).inc()
+                        await segment_queue.put(segment)
+
+                async def segment_worker() -> None:
+                    try:
+                        while True:
+                            frame = await buffer_queue.get()
+                            if frame is None:
+                                await commit_segments(segmenter.flush())
+                                await segment_queue.put(None)
+                                break
+                            await commit_segments(segmenter.feed(frame))
+                    except asyncio.CancelledError:
+                        pass
+                    finally:
+                        report_segmentation()
 
                 async def process_audio(audio_chunk: bytes) -> None:
                     transcript = ""
                     try:
-                        transcript = await pipeline.stt_adapter.transcribe(
-                            call_id,
-                            audio_chunk,
-                            16000,
-                            pipeline.stt_options,
+                        transcript = await call_component(
+                            pipeline,
+                            "stt",
+                            lambda adapter, options: adapter.transcribe(call_id, audio_chunk, 16000, options),
                         )
-                    except Exception:
-                        logger.debug("STT transcribe failed", call_id=call_id, exc_info=True)
+                    except CircuitOpenError as exc:
+                        logger.debug("STT skipped; circuit open", call_id=call_id, error=str(exc))
+                        return
+                    except Exception as exc:
+                        logger.warning("STT transcribe failed", call_id=call_id, error=str(exc))
+                        logger.debug("STT transcribe failure detail", call_id=call_id, exc_info=True)
                         return
                     transcript = (transcript or "").strip()
                     if not transcript:
@@ -2125,20 +2643,13 @@ class Engine:
                         await transcript_queue.put(transcript)
 
                 async def stt_worker() -> None:
-                    local_buf = bytearray()
                     try:
                         while True:
-                            frame = await buffer_queue.get()
-                            if frame is None:
-                                if local_buf:
-                                    await process_audio(bytes(local_buf))
+                            segment = await segment_queue.get()
+                            if segment is None:
                                 await transcript_queue.put(None)
                                 break
-                            local_buf.extend(frame)
-                            if len(local_buf) < commit_bytes:
-                                continue
-                            await process_audio(bytes(local_buf))
-                            local_buf.clear()
+                            await process_audio(segment)
                     except asyncio.CancelledError:
                         pass
 
@@ -2226,7 +2737,8 @@ class Engine:
 
             async def dialog_worker() -> None:
                 pending_segments: List[str] = []
-                flush_task: Optional[asyncio.Task] = None
+                # Armed: wheel TimerHandle; firing: the task running the flush.
+                flush_task: Optional[Union[TimerHandle, asyncio.Task]] = None
                 accumulation_timeout = float(
                     (pipeline.llm_options or {}).get("aggregation_timeout_sec", 2.0)
                 )
@@ -2240,31 +2752,65 @@ class Engine:
                     flush_task = None
 
                 async def run_turn(transcript_text: str) -> None:
+                    llm_context = {"messages": [{"role": "user", "content": transcript_text}]}
+                    if self._pipeline_llm_streams(pipeline):
+
+                        async def open_llm_stream(adapter, options):
+                            if hasattr(adapter, "stream_generate"):
+                                async for event in adapter.stream_generate(call_id, transcript_text, llm_context, options):
+                                    yield event
+                                return
+                            # Fallback component without streaming support.
+                            text = await adapter.generate(call_id, transcript_text, llm_context, options)
+                            yield LLMStreamEvent("sentence", text or "")
+
+                        # Speak each sentence as soon as the LLM completes it.
+                        try:
+                            async for event in stream_component(pipeline, "llm", open_llm_stream):
+                                if event.kind == "sentence" and event.text.strip():
+                                    await speak(event.text.strip())
+                        except CircuitOpenError as exc:
+                            logger.debug("LLM skipped; circuit open", call_id=call_id, error=str(exc))
+                        except Exception as exc:
+                            logger.warning("LLM stream failed", call_id=call_id, error=str(exc))
+                            logger.debug("LLM stream failure detail", call_id=call_id, exc_info=True)
+                        return
+
                     response_text = ""
                     try:
-                        response_text = await pipeline.llm_adapter.generate(
-                            call_id,
-                            transcript_text,
-                            {"messages": [{"role": "user", "content": transcript_text}]},
-                            pipeline.llm_options,
+                        response_text = await call_component(
+                            pipeline,
+                            "llm",
+                            lambda adapter, options: adapter.generate(call_id, transcript_text, llm_context, options),
                         )
-                    except Exception:
-                        logger.debug("LLM generate failed", call_id=call_id, exc_info=True)
+                    except CircuitOpenError as exc:
+                        logger.debug("LLM skipped; circuit open", call_id=call_id, error=str(exc))
+                        return
+                    except Exception as exc:
+                        logger.warning("LLM generate failed", call_id=call_id, error=str(exc))
+                        logger.debug("LLM generate failure detail", call_id=call_id, exc_info=True)
                         return
                     response_text = (response_text or "").strip()
                     if not response_text:
                         return
+                    await speak(response_text)
+
+                async def speak(response_text: str) -> None:
                     tts_bytes = bytearray()
                     try:
-                        async for tts_chunk in pipeline.tts_adapter.synthesize(
-                                call_id,
-                                response_text,
-                                pipeline.tts_options,
+                        async for tts_chunk in stream_component(
+                                pipeline,
+                                "tts",
+                                lambda adapter, options: adapter.synthesize(call_id, response_text, options),
                         ):
                             if tts_chunk:
                                 tts_bytes.extend(tts_chunk)
-                    except Exception:
-                        logger.debug("TTS synth failed", call_id=call_id, exc_info=True)
+                    except CircuitOpenError as exc:
+                        logger.debug("TTS skipped; circuit open", call_id=call_id, error=str(exc))
+                        return
+                    except Exception as exc:
+                        logger.warning("TTS synth failed", call_id=call_id, error=str(exc))
+                        logger.debug("TTS synth failure detail", call_id=call_id, exc_info=True)
                         return
                     if not tts_bytes:
                         return
@@ -2330,13 +2876,14 @@ class Engine:
                     await cancel_flush()
 
                     async def _flush() -> None:
+                        nonlocal flush_task
+                        flush_task = asyncio.current_task()
                         try:
-                            await asyncio.sleep(accumulation_timeout)
                             await maybe_respond(force=True, from_flush=True)
                         except asyncio.CancelledError:
                             pass
 
-                    flush_task = asyncio.create_task(_flush())
+                    flush_task = get_timer_wheel().call_later(accumulation_timeout, _flush)
 
                 try:
                     while True:
@@ -2391,6 +2938,7 @@ class Engine:
                     if not stop_called:
                         await pipeline.stt_adapter.stop_stream(call_id)
             else:
+                segment_task = asyncio.create_task(segment_worker())
                 stt_task = asyncio.create_task(stt_worker())
                 dialog_task = asyncio.create_task(dialog_worker())
 
@@ -2398,8 +2946,9 @@ class Engine:
                     await dialog_task
                 finally:
                     ingest_task.cancel()
+                    segment_task.cancel()
                     stt_task.cancel()
-                    await asyncio.gather(ingest_task, stt_task, return_exceptions=True)
+                    await asyncio.gather(ingest_task, segment_task, stt_task, return_exceptions=True)
         except asyncio.CancelledError:
             pass
         except Exception:
@@ -2635,7 +3184,7 @@ class Engine:
             logger.error("Error in PlaybackFinished handler", error=str(exc), exc_info=True)
 
     async def _start_health_server(self):
-        """Start aiohttp health/metrics server on 0.0.0.0:15000."""
+        """Start aiohttp health/metrics server on HEALTH_HOST:HEALTH_PORT (default 0.0.0.0:15000)."""
         try:
             app = web.Application()
             app.router.add_get('/live', self._live_handler)
@@ -2644,10 +3193,12 @@ class Engine:
             app.router.add_get('/metrics', self._metrics_handler)
             runner = web.AppRunner(app)
             await runner.setup()
-            site = web.TCPSite(runner, '0.0.0.0', 15000)
+            host = os.getenv("HEALTH_HOST", "0.0.0.0")
+            port = int(os.getenv("HEALTH_PORT", "15000"))
+            site = web.TCPSite(runner, host, port)
             await site.start()
             self._health_runner = runner
-            logger.info("Health endpoint started", host="0.0.0.0", port=15000)
+            logger.info("Health endpoint started", host=host, port=port)
         except Exception as exc:
             logger.error("Failed to start health endpoint", error=str(exc), exc_info=True)
 
@@ -2700,6 +3251,11 @@ class Engine:
                 },
                 "streaming": {},
                 "streaming_details": [],
+                "pipeline_components": (
+                    self.pipeline_orchestrator.health_snapshot()
+                    if getattr(self, "pipeline_orchestrator", None) is not None
+                    else {}
+                ),
             }
             return web.json_response(payload)
         except Exception as exc:
@@ -2741,21 +3297,37 @@ class Engine:
         """Expose Prometheus metrics."""
         try:
             data = generate_latest()
-            return web.Response(body=data, content_type=CONTENT_TYPE_LATEST)
+            # aiohttp rejects a charset inside content_type=
+            return web.Response(body=data, headers={"Content-Type": CONTENT_TYPE_LATEST})
         except Exception as exc:
             return web.Response(text=str(exc), status=500)
 
 
-async def main():
-    config = load_config()
-    # Initialize structured logging according to YAML-configured level (default INFO)
+def configure_engine_logging(config: AppConfig, service_name: str = "ai-engine") -> None:
+    """Initialize structured logging according to YAML-configured level (default INFO)."""
     try:
         level_name = str(getattr(getattr(config, 'logging', None), 'level', 'info')).upper()
         level = getattr(logging, level_name, logging.INFO)
-        configure_logging(log_level=level)
+        configure_logging(log_level=level, service_name=service_name)
     except Exception:
         # Fallback to INFO if configuration not yet available
-        configure_logging(log_level="INFO")
+        configure_logging(log_level="INFO", service_name=service_name)
+
+
+async def main():
+    config = load_config()
+    configure_engine_logging(config)
+    workers = getattr(config, "workers", None)
+    if workers and workers.count > 1:
+        # Supervisor mode: route calls to engine worker processes (src/supervisor.py)
+        from .supervisor import run_supervisor
+        await run_supervisor(config)
+        return
+    await run_engine(config)
+
+
+async def run_engine(config: AppConfig) -> None:
+    """Run one engine until SIGINT/SIGTERM."""
     engine = Engine(config)
 
     shutdown_event = asyncio.Event()
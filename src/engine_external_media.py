@@ -143,7 +143,7 @@ class ExternalMediaEngine:
             logger.info("Connected to ARI")
             
             # Start WebSocket event loop as background task
-            asyncio.create_task(self.ari_client.start_listening())
+            asyncio.create_task(self.ari_client.run())
             logger.info("ARI WebSocket started")
             
             self.running = True
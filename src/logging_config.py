@@ -19,6 +19,9 @@ from logging.handlers import RotatingFileHandler
 # Context variable for correlation ID
 correlation_id_var = contextvars.ContextVar('correlation_id', default=None)
 
+# Reported as 'service' on every record; engine workers use ai-engine-w<index>
+_service_name = 'ai-engine'
+
 def get_correlation_id():
     """Get the current correlation ID."""
     return correlation_id_var.get()
@@ -38,7 +41,7 @@ def add_correlation_id(logger, method_name, event_dict):
 
 def add_service_context(logger, method_name, event_dict):
     """Add service context to the log record."""
-    event_dict['service'] = 'ai-engine'
+    event_dict['service'] = _service_name
     # Prefer stdlib logger name injected by structlog.stdlib.add_logger_name
     component = event_dict.get('logger')
     if not component:
@@ -61,6 +64,9 @@ def configure_logging(log_level="INFO", log_to_file=False, log_file_path="servic
       - LOG_TO_FILE: 0|1 (default: 0)
       - LOG_FILE_PATH: path (default: service.log)
     """
+    global _service_name
+    _service_name = service_name
+
     # Read env overrides
     env_level = os.getenv("LOG_LEVEL")
     if env_level:
@@ -19,6 +19,8 @@ from .orchestrator import (
     PipelineOrchestrator,
     PipelineOrchestratorError,
     PipelineResolution,
+    call_component,
+    stream_component,
 )
 
 __all__ = [
@@ -34,4 +36,6 @@ __all__ = [
     "PipelineOrchestrator",
     "PipelineOrchestratorError",
     "PipelineResolution",
+    "call_component",
+    "stream_component",
 ]
\ No newline at end of file
@@ -10,8 +10,10 @@ provider.
 
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Dict, Any
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Any, List
 
 
 class Component(ABC):
@@ -58,6 +60,50 @@ class LLMComponent(Component):
         """Generate a response given transcript + context."""
 
 
+@dataclass
+class LLMStreamEvent:
+    """Incremental LLM output.
+
+    ``kind`` is ``"delta"`` for raw text fragments, ``"sentence"`` once a
+    complete sentence is available for TTS, and ``"done"`` with the full text.
+    """
+
+    kind: str
+    text: str
+
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])[\"')\]]*\s+")
+
+
+class SentenceAssembler:
+    """Split streamed text into sentences as soon as each one completes."""
+
+    def __init__(self, min_chars: int = 1):
+        self._buffer = ""
+        self._min_chars = max(1, int(min_chars))
+
+    def feed(self, delta: str) -> List[str]:
+        """Add a fragment and return any sentences completed by it."""
+        if not delta:
+            return []
+        self._buffer += delta
+        sentences: List[str] = []
+        start = 0
+        for match in _SENTENCE_BOUNDARY.finditer(self._buffer):
+            candidate = self._buffer[start:match.end()].strip()
+            if len(candidate) < self._min_chars:
+                continue
+            sentences.append(candidate)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> str:
+        """Return whatever text remains after the stream ends."""
+        remainder, self._buffer = self._buffer.strip(), ""
+        return remainder
+
+
 class TTSComponent(Component):
     """Text-to-speech component."""
 
@@ -14,20 +14,24 @@ import json
 import time
 import uuid
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import aiohttp
 import websockets
 from websockets.client import WebSocketClientProtocol
 
-from ..audio import convert_pcm16le_to_target_format, mulaw_to_pcm16le, resample_audio
+from ..audio import StreamingAudioConverter
+from ..core.http_client import shared_session_factory
 from ..config import AppConfig, DeepgramProviderConfig
 from ..logging_config import get_logger
 from .base import STTComponent, TTSComponent
+from .metrics import TTS_FIRST_AUDIO_SECONDS, TTS_FIRST_BYTE_SECONDS
 
 logger = get_logger(__name__)
 
+_STREAM_READ_BYTES = 4096
+
 
 # Shared helpers -----------------------------------------------------------------
 
@@ -71,13 +75,6 @@ def _merge_dicts(base: Dict[str, Any], override: Optional[Dict[str, Any]]) -> Di
     return merged
 
 
-def _bytes_per_sample(encoding: str) -> int:
-    fmt = (encoding or "").lower()
-    if fmt in ("ulaw", "mulaw", "mu-law", "g711_ulaw"):
-        return 1
-    return 2
-
-
 # Deepgram STT Adapter ------------------------------------------------------------
 
 
@@ -338,6 +335,18 @@ class DeepgramTTSAdapter(TTSComponent):
             "Content-Type": "application/json",
         }
 
+        source_encoding = params.get("encoding", "linear16")
+        source_sample_rate = int(params.get("sample_rate", target_sample_rate))
+        converter = StreamingAudioConverter(
+            source_encoding,
+            source_sample_rate,
+            target_encoding,
+            target_sample_rate,
+            int(merged.get("chunk_size_ms", 20)),
+        )
+        ttfb_ms: Optional[float] = None
+        first_audio_ms: Optional[float] = None
+
         started_at = time.perf_counter()
         async with self._session.post(url, json=payload, params=params, headers=headers) as response:
             if response.status >= 400:
@@ -351,31 +360,36 @@ class DeepgramTTSAdapter(TTSComponent):
                 )
                 response.raise_for_status()
 
-            raw_audio = await response.read()
-            source_encoding = params.get("encoding", "linear16")
-            source_sample_rate = int(params.get("sample_rate", target_sample_rate))
-            converted = self._convert_audio(raw_audio, source_encoding, source_sample_rate, target_encoding, target_sample_rate)
-            latency_ms = (time.perf_counter() - started_at) * 1000.0
+            async for data in response.content.iter_chunked(_STREAM_READ_BYTES):
+                if ttfb_ms is None:
+                    ttfb_ms = (time.perf_counter() - started_at) * 1000.0
+                    TTS_FIRST_BYTE_SECONDS.labels("deepgram").observe(ttfb_ms / 1000.0)
+                for chunk in converter.feed(data):
+                    if first_audio_ms is None:
+                        first_audio_ms = (time.perf_counter() - started_at) * 1000.0
+                        TTS_FIRST_AUDIO_SECONDS.labels("deepgram").observe(first_audio_ms / 1000.0)
+                    yield chunk
+
+        for chunk in converter.flush():
+            yield chunk
 
+        latency_ms = (time.perf_counter() - started_at) * 1000.0
         logger.info(
             "Deepgram TTS synthesis completed",
             call_id=call_id,
             request_id=request_id,
+            ttfb_ms=round(ttfb_ms, 2) if ttfb_ms is not None else None,
+            first_audio_ms=round(first_audio_ms, 2) if first_audio_ms is not None else None,
             latency_ms=round(latency_ms, 2),
-            output_bytes=len(converted),
+            output_bytes=converter.output_bytes,
             target_encoding=target_encoding,
             target_sample_rate=target_sample_rate,
         )
 
-        chunk_ms = int(merged.get("chunk_size_ms", 20))
-        for chunk in self._chunk_audio(converted, target_encoding, target_sample_rate, chunk_ms):
-            if chunk:
-                yield chunk
-
     async def _ensure_session(self) -> None:
         if self._session and not self._session.closed:
             return
-        factory = self._session_factory or aiohttp.ClientSession
+        factory = self._session_factory or shared_session_factory
         self._session = factory()
 
     def _compose_options(self, runtime_options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -426,39 +440,3 @@ class DeepgramTTSAdapter(TTSComponent):
         # Remove None values
         params = {k: v for k, v in params.items() if v is not None}
         return url, params
-
-    @staticmethod
-    def _convert_audio(
-        audio_bytes: bytes,
-        source_encoding: str,
-        source_rate: int,
-        target_encoding: str,
-        target_rate: int,
-    ) -> bytes:
-        if not audio_bytes:
-            return b""
-
-        fmt = (source_encoding or "").lower()
-        if fmt in ("ulaw", "mulaw", "mu-law", "g711_ulaw"):
-            pcm_bytes = mulaw_to_pcm16le(audio_bytes)
-        else:
-            pcm_bytes = audio_bytes
-
-        if source_rate != target_rate:
-            pcm_bytes, _ = resample_audio(pcm_bytes, source_rate, target_rate)
-
-        return convert_pcm16le_to_target_format(pcm_bytes, target_encoding)
-
-    @staticmethod
-    def _chunk_audio(
-        audio_bytes: bytes,
-        encoding: str,
-        sample_rate: int,
-        chunk_ms: int,
-    ) -> Iterable[bytes]:
-        if not audio_bytes:
-            return
-        bytes_per = _bytes_per_sample(encoding)
-        frame_size = max(bytes_per, int(sample_rate * (chunk_ms / 1000.0) * bytes_per))
-        for idx in range(0, len(audio_bytes), frame_size):
-            yield audio_bytes[idx : idx + frame_size]
\ No newline at end of file
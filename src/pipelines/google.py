@@ -8,15 +8,30 @@ import json
 import os
 import time
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Sequence, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence, Tuple
 
 import aiohttp
 
-from ..audio import convert_pcm16le_to_target_format, mulaw_to_pcm16le, resample_audio
+from ..audio import (
+    Base64JSONFieldDecoder,
+    StreamingAudioConverter,
+    UtteranceSegmenter,
+    convert_pcm16le_to_target_format,
+    mulaw_to_pcm16le,
+    resample_audio,
+)
+from ..core.http_client import shared_session_factory
 from ..config import AppConfig, GoogleProviderConfig
 from ..logging_config import get_logger
 from .base import LLMComponent, STTComponent, TTSComponent
+from .metrics import (
+    STT_REQUEST_SECONDS,
+    STT_REQUESTS_TOTAL,
+    TTS_FIRST_AUDIO_SECONDS,
+    TTS_FIRST_BYTE_SECONDS,
+)
 
 logger = get_logger(__name__)
 
@@ -30,6 +45,7 @@ except ImportError:  # pragma: no cover - surfaced via RuntimeError when needed
 
 _GOOGLE_DEFAULT_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
 _GENERATIVE_SCOPE = "https://www.googleapis.com/auth/generative-language"
+_STREAM_READ_BYTES = 4096
 
 
 def _merge_dicts(base: Optional[Dict[str, Any]], override: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -43,22 +59,6 @@ def _merge_dicts(base: Optional[Dict[str, Any]], override: Optional[Dict[str, An
     return merged
 
 
-def _bytes_per_sample(encoding: str) -> int:
-    fmt = (encoding or "").lower()
-    if fmt in ("ulaw", "mulaw", "mu-law", "g711_ulaw"):
-        return 1
-    return 2
-
-
-def _chunk_audio(audio_bytes: bytes, encoding: str, sample_rate: int, chunk_ms: int) -> Iterable[bytes]:
-    if not audio_bytes:
-        return []
-    bytes_per_sample = _bytes_per_sample(encoding)
-    frame_size = max(bytes_per_sample, int(sample_rate * (chunk_ms / 1000.0) * bytes_per_sample))
-    for idx in range(0, len(audio_bytes), frame_size):
-        yield audio_bytes[idx : idx + frame_size]
-
-
 def _extract_stt_transcript(payload: Dict[str, Any]) -> Optional[str]:
     results = payload.get("results") or []
     for entry in results:
@@ -82,12 +82,17 @@ def _extract_candidate_text(payload: Dict[str, Any]) -> str:
     return ""
 
 
-def _decode_google_audio(audio_content: str) -> bytes:
-    try:
-        return base64.b64decode(audio_content)
-    except (base64.binascii.Error, TypeError):
-        logger.error("Failed to decode Google TTS audioContent payload")
-        return b""
+@dataclass
+class _GoogleUtteranceStream:
+    """Per-call state for VAD-segmented recognition (one request per utterance)."""
+
+    options: Dict[str, Any]
+    segmenter: UtteranceSegmenter
+    utterances: asyncio.Queue = field(default_factory=asyncio.Queue)
+    results: asyncio.Queue = field(default_factory=asyncio.Queue)
+    worker: Optional[asyncio.Task] = None
+    resample_state: Optional[tuple] = None
+    requests: int = 0
 
 
 class _GoogleCredentialManager:
@@ -158,6 +163,7 @@ class GoogleSTTAdapter(STTComponent):
         self._session: Optional[aiohttp.ClientSession] = None
         self._credential_manager = _GoogleCredentialManager(provider_config)
         self._auth_scopes = tuple(auth_scopes or (_GOOGLE_DEFAULT_SCOPE,))
+        self._streams: Dict[str, _GoogleUtteranceStream] = {}
 
     async def start(self) -> None:
         logger.debug(
@@ -175,7 +181,126 @@ class GoogleSTTAdapter(STTComponent):
         await self._ensure_session()
 
     async def close_call(self, call_id: str) -> None:
-        return
+        await self.stop_stream(call_id)
+
+    async def start_stream(
+        self,
+        call_id: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Begin utterance mode: audio is VAD-segmented and recognized once per utterance.
+
+        The REST API has no streaming transport (that requires gRPC), so this is
+        the streaming surface the engine drives via ``send_audio``/``iter_results``.
+        """
+        if call_id in self._streams:
+            return
+        await self._ensure_session()
+        runtime_options = dict(options or {})
+        merged = self._compose_options(runtime_options)
+        segmenter = UtteranceSegmenter.from_config(
+            getattr(self._app_config, "vad", None),
+            merged["segmentation"],
+            sample_rate=16000,
+        )
+        stream = _GoogleUtteranceStream(options=runtime_options, segmenter=segmenter)
+        stream.worker = asyncio.create_task(self._utterance_worker(call_id, stream))
+        self._streams[call_id] = stream
+        logger.debug(
+            "Google STT utterance stream started",
+            component=self.component_key,
+            call_id=call_id,
+            frame_ms=segmenter.frame_ms,
+        )
+
+    async def send_audio(
+        self,
+        call_id: str,
+        audio: bytes,
+        *,
+        fmt: str = "pcm16_16k",
+    ) -> None:
+        if not audio:
+            return
+        stream = self._streams.get(call_id)
+        if stream is None:
+            raise RuntimeError(
+                f"Streaming session not started for call {call_id}; call start_stream first"
+            )
+        fmt = (fmt or "pcm16_16k").lower()
+        pcm16 = audio
+        if fmt in {"mulaw8k", "ulaw8k"}:
+            pcm16 = mulaw_to_pcm16le(audio)
+        if fmt in {"mulaw8k", "ulaw8k", "pcm16_8k", "pcm16-8k"}:
+            pcm16, stream.resample_state = resample_audio(pcm16, 8000, 16000, state=stream.resample_state)
+        for utterance in stream.segmenter.feed(pcm16):
+            stream.utterances.put_nowait(utterance)
+
+    def iter_results(self, call_id: str) -> AsyncIterator[str]:
+        stream = self._streams.get(call_id)
+        if stream is None:
+            raise RuntimeError(
+                f"Streaming session not started for call {call_id}; call start_stream first"
+            )
+        # Bind the queue now so results survive stop_stream() dropping the state.
+        return self._drain_results(stream.results)
+
+    @staticmethod
+    async def _drain_results(results: asyncio.Queue) -> AsyncIterator[str]:
+        while True:
+            result = await results.get()
+            if result is None:
+                break
+            yield result
+
+    async def stop_stream(self, call_id: str) -> None:
+        """Recognize the trailing utterance, then end ``iter_results``."""
+        stream = self._streams.pop(call_id, None)
+        if stream is None:
+            return
+        for utterance in stream.segmenter.flush():
+            stream.utterances.put_nowait(utterance)
+        stream.utterances.put_nowait(None)
+        if stream.worker:
+            try:
+                await stream.worker
+            except asyncio.CancelledError:
+                pass
+        segmenter = stream.segmenter
+        logger.info(
+            "Google STT utterance stream closed",
+            component=self.component_key,
+            call_id=call_id,
+            requests=stream.requests,
+            utterances=segmenter.utterances,
+            speech_ratio=round(segmenter.speech_ratio, 3),
+            dropped_bytes=segmenter.dropped_bytes,
+        )
+
+    async def _utterance_worker(self, call_id: str, stream: _GoogleUtteranceStream) -> None:
+        try:
+            while True:
+                utterance = await stream.utterances.get()
+                if utterance is None:
+                    break
+                stream.requests += 1
+                try:
+                    transcript = await self._recognize(
+                        call_id, utterance, 16000, stream.options, mode="utterance"
+                    )
+                except Exception:
+                    logger.warning(
+                        "Google STT utterance recognition failed",
+                        call_id=call_id,
+                        utterance_bytes=len(utterance),
+                        exc_info=True,
+                    )
+                    continue
+                transcript = (transcript or "").strip()
+                if transcript:
+                    await stream.results.put(transcript)
+        finally:
+            stream.results.put_nowait(None)
 
     async def transcribe(
         self,
@@ -183,6 +308,17 @@ class GoogleSTTAdapter(STTComponent):
         audio_pcm16: bytes,
         sample_rate_hz: int,
         options: Dict[str, Any],
+    ) -> str:
+        return await self._recognize(call_id, audio_pcm16, sample_rate_hz, options, mode="chunk")
+
+    async def _recognize(
+        self,
+        call_id: str,
+        audio_pcm16: bytes,
+        sample_rate_hz: int,
+        options: Dict[str, Any],
+        *,
+        mode: str,
     ) -> str:
         await self._ensure_session()
         assert self._session is not None
@@ -227,31 +363,39 @@ class GoogleSTTAdapter(STTComponent):
         url = self._provider_defaults.stt_base_url.rstrip("/") + "/speech:recognize"
 
         started_at = time.perf_counter()
-        async with self._session.post(
-            url,
-            json=request_payload,
-            params=params or None,
-            headers=headers or None,
-            timeout=merged["timeout_sec"],
-        ) as response:
-            body = await response.text()
-            if response.status >= 400:
-                logger.error(
-                    "Google STT recognition failed",
-                    call_id=call_id,
-                    request_id=request_id,
-                    status=response.status,
-                    body_preview=body[:128],
-                )
-                response.raise_for_status()
-            data = json.loads(body)
+        try:
+            async with self._session.post(
+                url,
+                json=request_payload,
+                params=params or None,
+                headers=headers or None,
+                timeout=merged["timeout_sec"],
+            ) as response:
+                body = await response.text()
+                if response.status >= 400:
+                    logger.error(
+                        "Google STT recognition failed",
+                        call_id=call_id,
+                        request_id=request_id,
+                        status=response.status,
+                        body_preview=body[:128],
+                    )
+                    response.raise_for_status()
+                data = json.loads(body)
+        except Exception:
+            STT_REQUESTS_TOTAL.labels("google", mode, "error").inc()
+            raise
 
         transcript = _extract_stt_transcript(data) or ""
         latency_ms = (time.perf_counter() - started_at) * 1000.0
+        STT_REQUEST_SECONDS.labels("google", mode).observe(latency_ms / 1000.0)
+        STT_REQUESTS_TOTAL.labels("google", mode, "ok" if transcript else "empty").inc()
         logger.info(
             "Google STT transcript received",
             call_id=call_id,
             request_id=request_id,
+            mode=mode,
+            audio_ms=len(audio_pcm16) // max(1, sample_rate_hz // 500),
             latency_ms=round(latency_ms, 2),
             transcript_preview=transcript[:80],
         )
@@ -260,7 +404,7 @@ class GoogleSTTAdapter(STTComponent):
     async def _ensure_session(self) -> None:
         if self._session and not self._session.closed:
             return
-        factory = self._session_factory or aiohttp.ClientSession
+        factory = self._session_factory or shared_session_factory
         self._session = factory()
 
     def _compose_options(self, runtime_options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -273,6 +417,7 @@ class GoogleSTTAdapter(STTComponent):
             "timeout_sec": float(merged.get("timeout_sec", 12.0)),
             "config_overrides": dict(merged.get("config_overrides") or merged.get("config") or {}),
             "request_overrides": dict(merged.get("request_overrides") or merged.get("request") or {}),
+            "segmentation": dict(merged.get("segmentation") or {}),
         }
 
 
@@ -363,7 +508,7 @@ class GoogleLLMAdapter(LLMComponent):
     async def _ensure_session(self) -> None:
         if self._session and not self._session.closed:
             return
-        factory = self._session_factory or aiohttp.ClientSession
+        factory = self._session_factory or shared_session_factory
         self._session = factory()
 
     def _compose_options(self, runtime_options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -519,6 +664,18 @@ class GoogleTTSAdapter(TTSComponent):
         payload = _merge_dicts(payload, merged.get("request_overrides"))
 
         request_id = f"google-tts-{uuid.uuid4().hex[:10]}"
+        chunk_value = merged.get("chunk_size_ms")
+        chunk_ms = int(chunk_value if chunk_value is not None else self._default_chunk_ms)
+        converter = StreamingAudioConverter(
+            merged["audio_encoding"],
+            merged["audio_sample_rate"],
+            merged["target_format"]["encoding"],
+            merged["target_format"]["sample_rate"],
+            chunk_ms,
+        )
+        decoder = Base64JSONFieldDecoder(("audioContent",))
+        ttfb_ms: Optional[float] = None
+        first_audio_ms: Optional[float] = None
         started_at = time.perf_counter()
 
         async with self._session.post(
@@ -528,8 +685,8 @@ class GoogleTTSAdapter(TTSComponent):
             headers=headers or None,
             timeout=merged["timeout_sec"],
         ) as response:
-            body = await response.text()
             if response.status >= 400:
+                body = await response.text()
                 logger.error(
                     "Google TTS synthesis failed",
                     call_id=call_id,
@@ -538,46 +695,39 @@ class GoogleTTSAdapter(TTSComponent):
                     body_preview=body[:128],
                 )
                 response.raise_for_status()
-            data = json.loads(body)
 
-        audio_content = data.get("audioContent")
-        if not audio_content:
+            async for data in response.content.iter_chunked(_STREAM_READ_BYTES):
+                if ttfb_ms is None:
+                    ttfb_ms = (time.perf_counter() - started_at) * 1000.0
+                    TTS_FIRST_BYTE_SECONDS.labels("google").observe(ttfb_ms / 1000.0)
+                for chunk in converter.feed(decoder.feed(data)):
+                    if first_audio_ms is None:
+                        first_audio_ms = (time.perf_counter() - started_at) * 1000.0
+                        TTS_FIRST_AUDIO_SECONDS.labels("google").observe(first_audio_ms / 1000.0)
+                    yield chunk
+
+        if not decoder.found:
             logger.warning("Google TTS response missing audioContent", call_id=call_id, request_id=request_id)
             return
 
-        raw_audio = _decode_google_audio(audio_content)
-        converted = self._convert_audio(
-            raw_audio,
-            merged["audio_encoding"],
-            merged["audio_sample_rate"],
-            merged["target_format"]["encoding"],
-            merged["target_format"]["sample_rate"],
-        )
+        for chunk in converter.feed(decoder.finish()) + converter.flush():
+            yield chunk
 
-        latency_ms = (time.perf_counter() - started_at) * 1000.0
         logger.info(
             "Google TTS synthesis completed",
             call_id=call_id,
             request_id=request_id,
-            latency_ms=round(latency_ms, 2),
+            ttfb_ms=round(ttfb_ms, 2) if ttfb_ms is not None else None,
+            first_audio_ms=round(first_audio_ms, 2) if first_audio_ms is not None else None,
+            latency_ms=round((time.perf_counter() - started_at) * 1000.0, 2),
+            output_bytes=converter.output_bytes,
             text_preview=text[:64],
         )
 
-        chunk_value = merged.get("chunk_size_ms")
-        chunk_ms = int(chunk_value if chunk_value is not None else self._default_chunk_ms)
-        for chunk in _chunk_audio(
-            converted,
-            merged["target_format"]["encoding"],
-            merged["target_format"]["sample_rate"],
-            chunk_ms,
-        ):
-            if chunk:
-                yield chunk
-
     async def _ensure_session(self) -> None:
         if self._session and not self._session.closed:
             return
-        factory = self._session_factory or aiohttp.ClientSession
+        factory = self._session_factory or shared_session_factory
         self._session = factory()
 
     def _compose_options(self, runtime_options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -606,29 +756,6 @@ class GoogleTTSAdapter(TTSComponent):
             },
         }
 
-    @staticmethod
-    def _convert_audio(
-        audio_bytes: bytes,
-        source_encoding: str,
-        source_rate: int,
-        target_encoding: str,
-        target_rate: int,
-    ) -> bytes:
-        if not audio_bytes:
-            return b""
-
-        fmt = (source_encoding or "").lower()
-        if fmt in ("ulaw", "mulaw", "mu-law", "g711_ulaw"):
-            pcm_bytes = mulaw_to_pcm16le(audio_bytes)
-        else:
-            pcm_bytes = audio_bytes
-
-        if source_rate != target_rate:
-            pcm_bytes, _ = resample_audio(pcm_bytes, source_rate, target_rate)
-
-        return convert_pcm16le_to_target_format(pcm_bytes, target_encoding)
-
-
 __all__ = [
     "GoogleSTTAdapter",
     "GoogleLLMAdapter",
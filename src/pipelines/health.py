@@ -0,0 +1,291 @@
+"""
+Per-component health tracking and circuit breaking for pipeline adapters.
+
+Each role of a resolved pipeline gets a ``ComponentGuard`` that records call
+outcomes and latency into a process-wide ``ComponentHealth`` (one per
+component key, shared across calls). When the rolling error rate
+(slow calls count as errors when ``slow_call_ms`` is set) crosses the
+threshold the breaker opens: requests are routed to the same role of the
+pipeline's configured fallback, or rejected immediately with
+``CircuitOpenError`` instead of burning a full provider timeout. After
+``open_sec`` a limited number of half-open trial calls decide whether the
+breaker closes again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from prometheus_client import Counter, Gauge
+
+from ..config import CircuitBreakerConfig
+from ..logging_config import get_logger
+from .base import Component
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+_STATE_VALUE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+_COMPONENT_CALLS = Counter(
+    "ai_agent_pipeline_component_calls_total",
+    "Pipeline component calls by outcome",
+    labelnames=("component", "outcome"),  # ok|error|slow|rejected|fallback
+)
+_CIRCUIT_STATE = Gauge(
+    "ai_agent_pipeline_component_circuit_state",
+    "Circuit breaker state per component (0=closed, 1=half_open, 2=open)",
+    labelnames=("component",),
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a component's breaker is open and no fallback is configured."""
+
+
+class ComponentHealth:
+    """Rolling error rate, latency percentiles and breaker state for one component."""
+
+    def __init__(self, component_key: str, config: Optional[CircuitBreakerConfig] = None):
+        config = config or CircuitBreakerConfig()
+        self.component_key = component_key
+        self._min_calls = max(1, int(config.min_calls))
+        self._error_rate_threshold = float(config.error_rate_threshold)
+        self._slow_sec = max(0, int(config.slow_call_ms)) / 1000.0
+        self._open_sec = max(0.0, float(config.open_sec))
+        self._half_open_max = max(1, int(config.half_open_max_calls))
+        self._outcomes: Deque[Tuple[bool, float]] = deque(maxlen=max(1, int(config.window)))
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+        self._trials_inflight = 0
+        self._trial_successes = 0
+        _CIRCUIT_STATE.labels(component_key).set(0)
+
+    def allow(self) -> bool:
+        """Return True if a call may go to the component now."""
+        if self.state == OPEN:
+            if self.opened_at is not None and time.monotonic() - self.opened_at >= self._open_sec:
+                self._transition(HALF_OPEN)
+            else:
+                return False
+        if self.state == HALF_OPEN:
+            if self._trials_inflight >= self._half_open_max:
+                return False
+            self._trials_inflight += 1
+        return True
+
+    def record(self, ok: bool, latency_sec: float) -> None:
+        slow = ok and self._slow_sec > 0 and latency_sec > self._slow_sec
+        success = ok and not slow
+        _COMPONENT_CALLS.labels(self.component_key, "ok" if success else ("slow" if slow else "error")).inc()
+        self._outcomes.append((success, latency_sec))
+
+        if self.state == HALF_OPEN:
+            self._trials_inflight = max(0, self._trials_inflight - 1)
+            if not success:
+                self._transition(OPEN)
+                return
+            self._trial_successes += 1
+            if self._trial_successes >= self._half_open_max:
+                self._outcomes.clear()
+                self._transition(CLOSED)
+            return
+
+        if self.state == CLOSED and len(self._outcomes) >= self._min_calls:
+            if self.error_rate >= self._error_rate_threshold:
+                self._transition(OPEN)
+
+    def cancel(self) -> None:
+        """Release a half-open trial slot for a call that was cancelled."""
+        if self.state == HALF_OPEN:
+            self._trials_inflight = max(0, self._trials_inflight - 1)
+
+    @property
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for ok, _ in self._outcomes if not ok) / len(self._outcomes)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        if not self._outcomes:
+            return None
+        ordered = sorted(latency for _, latency in self._outcomes)
+        index = min(len(ordered) - 1, max(0, int(round(percentile * len(ordered))) - 1))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        p50 = self.latency_percentile(0.5)
+        p95 = self.latency_percentile(0.95)
+        return {
+            "state": self.state,
+            "calls": len(self._outcomes),
+            "error_rate": round(self.error_rate, 3),
+            "p50_ms": round(p50 * 1000.0, 1) if p50 is not None else None,
+            "p95_ms": round(p95 * 1000.0, 1) if p95 is not None else None,
+            "open_for_sec": (
+                round(time.monotonic() - self.opened_at, 1) if self.state != CLOSED and self.opened_at else None
+            ),
+            "times_opened": self.times_opened,
+        }
+
+    def _transition(self, state: str) -> None:
+        previous, self.state = self.state, state
+        if state == OPEN:
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+        if state in (OPEN, HALF_OPEN):
+            self._trials_inflight = 0
+            self._trial_successes = 0
+        if state == CLOSED:
+            self.opened_at = None
+        _CIRCUIT_STATE.labels(self.component_key).set(_STATE_VALUE[state])
+        log = logger.warning if state == OPEN else logger.info
+        log(
+            "Pipeline component circuit state changed",
+            component=self.component_key,
+            previous=previous,
+            state=state,
+            error_rate=round(self.error_rate, 3),
+        )
+
+
+class HealthRegistry:
+    """Process-wide ``ComponentHealth`` instances keyed by component key."""
+
+    def __init__(self, config: Optional[CircuitBreakerConfig] = None):
+        self.config = config or CircuitBreakerConfig()
+        self._components: Dict[str, ComponentHealth] = {}
+
+    def get(self, component_key: str) -> ComponentHealth:
+        health = self._components.get(component_key)
+        if health is None:
+            health = self._components[component_key] = ComponentHealth(component_key, self.config)
+        return health
+
+    def is_open(self, component_key: str) -> bool:
+        health = self._components.get(component_key)
+        return health is not None and health.state == OPEN
+
+    def open_components(self) -> List[str]:
+        return [key for key, health in self._components.items() if health.state != CLOSED]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {key: health.snapshot() for key, health in sorted(self._components.items())}
+
+
+class ComponentGuard:
+    """Run one role's requests for a call through its component's breaker.
+
+    ``invoke(component, options)`` is sent to the primary while the breaker
+    allows it; otherwise to the fallback pipeline's component for the same
+    role (built on first use), or rejected with ``CircuitOpenError``.
+    """
+
+    def __init__(
+        self,
+        role: str,
+        component: Component,
+        options: Dict[str, Any],
+        health: ComponentHealth,
+        fallback_factory: Optional[Callable[[], Tuple[Component, Dict[str, Any]]]] = None,
+    ):
+        self.role = role
+        self.component = component
+        self.options = options
+        self.health = health
+        self._fallback_factory = fallback_factory
+        self._fallback: Optional[Tuple[Component, Dict[str, Any]]] = None
+        self._fallback_open_calls: set = set()
+
+    async def call(
+        self,
+        call_id: str,
+        invoke: Callable[[Component, Dict[str, Any]], Awaitable[T]],
+    ) -> T:
+        if not self.health.allow():
+            component, options = await self._reroute(call_id)
+            return await invoke(component, options)
+
+        started = time.monotonic()
+        try:
+            result = await invoke(self.component, self.options)
+        except asyncio.CancelledError:
+            self.health.cancel()
+            raise
+        except Exception:
+            self.health.record(False, time.monotonic() - started)
+            raise
+        self.health.record(True, time.monotonic() - started)
+        return result
+
+    async def stream(
+        self,
+        call_id: str,
+        open_stream: Callable[[Component, Dict[str, Any]], AsyncIterator[bytes]],
+    ) -> AsyncIterator[bytes]:
+        """Guard a chunk stream; health is judged on time to the first chunk."""
+        streams: List[AsyncIterator[bytes]] = []
+
+        async def first_chunk(component: Component, options: Dict[str, Any]) -> Optional[bytes]:
+            stream = open_stream(component, options).__aiter__()
+            streams.append(stream)
+            try:
+                return await stream.__anext__()
+            except StopAsyncIteration:
+                return None
+
+        chunk = await self.call(call_id, first_chunk)
+        if chunk is None:
+            return
+        yield chunk
+        async for chunk in streams[-1]:
+            yield chunk
+
+    async def release(self, call_id: str) -> None:
+        """Close and stop the fallback component if this call used it."""
+        if self._fallback is None or call_id not in self._fallback_open_calls:
+            return
+        self._fallback_open_calls.discard(call_id)
+        component, _ = self._fallback
+        for step in (component.close_call(call_id), component.stop()):
+            try:
+                await step
+            except Exception:
+                logger.debug("Fallback component shutdown failed", call_id=call_id, role=self.role, exc_info=True)
+
+    async def _reroute(self, call_id: str) -> Tuple[Component, Dict[str, Any]]:
+        component_key = self.health.component_key
+        if self._fallback_factory is None:
+            _COMPONENT_CALLS.labels(component_key, "rejected").inc()
+            raise CircuitOpenError(f"Circuit open for pipeline component '{component_key}'")
+        if self._fallback is None:
+            component, options = self._fallback_factory()
+            await component.start()
+            await component.open_call(call_id, options)
+            self._fallback = (component, options)
+            self._fallback_open_calls.add(call_id)
+            logger.warning(
+                "Rerouting pipeline role to fallback component",
+                call_id=call_id,
+                role=self.role,
+                component=component_key,
+                fallback=getattr(component, "component_key", None),
+            )
+        _COMPONENT_CALLS.labels(component_key, "fallback").inc()
+        return self._fallback
+
+
+__all__ = [
+    "CircuitOpenError",
+    "ComponentGuard",
+    "ComponentHealth",
+    "HealthRegistry",
+]
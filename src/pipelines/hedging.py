@@ -0,0 +1,433 @@
+"""
+Hedged requests for pipeline components.
+
+A hedged role wraps a primary and a secondary component behind the normal
+STT/LLM/TTS interface. Each request goes to the primary first; if it has not
+answered within the primary's learned latency budget (a percentile of a
+rolling window of its recent latencies), the same request is fired at the
+secondary and whichever answers first wins. The loser is cancelled. For TTS
+and streaming LLM output the race is on the first chunk or event, after
+which the winner streams alone. Streaming STT is a long-lived per-call
+session rather than a request, so it runs on the primary only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from prometheus_client import Counter, Gauge
+
+from ..config import HedgePolicyConfig
+from ..logging_config import get_logger
+from .base import Component, LLMComponent, LLMStreamEvent, STTComponent, TTSComponent
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_HEDGE_TOTAL = Counter(
+    "ai_agent_pipeline_hedge_total",
+    "Hedged pipeline requests by outcome",
+    labelnames=("pipeline", "role", "outcome"),  # not_needed|primary_won|secondary_won|failed
+)
+_HEDGE_RATE = Gauge(
+    "ai_agent_pipeline_hedge_rate",
+    "Fraction of recent requests that fired the secondary component",
+    labelnames=("pipeline", "role"),
+)
+_HEDGE_BUDGET_SECONDS = Gauge(
+    "ai_agent_pipeline_hedge_budget_seconds",
+    "Current primary latency budget before a hedge is fired",
+    labelnames=("pipeline", "role"),
+)
+
+
+class LatencyBudget:
+    """Rolling latency window that yields a percentile-based hedge budget."""
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.9,
+        initial_budget_ms: int = 1500,
+        min_budget_ms: int = 200,
+        max_budget_ms: int = 5000,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        self.percentile = min(max(float(percentile), 0.0), 1.0)
+        self._initial = initial_budget_ms / 1000.0
+        self._min = min_budget_ms / 1000.0
+        self._max = max(max_budget_ms, min_budget_ms) / 1000.0
+        self._min_samples = max(1, int(min_samples))
+        self._samples: Deque[float] = deque(maxlen=max(1, int(window)))
+        self._hedged: Deque[bool] = deque(maxlen=max(1, int(window)))
+
+    @classmethod
+    def from_policy(cls, policy: HedgePolicyConfig) -> "LatencyBudget":
+        return cls(
+            percentile=policy.percentile,
+            initial_budget_ms=policy.initial_budget_ms,
+            min_budget_ms=policy.min_budget_ms,
+            max_budget_ms=policy.max_budget_ms,
+            window=policy.window,
+            min_samples=policy.min_samples,
+        )
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(max(0.0, seconds))
+
+    def record(self, hedged: bool) -> None:
+        self._hedged.append(hedged)
+
+    @property
+    def hedge_rate(self) -> float:
+        return sum(self._hedged) / len(self._hedged) if self._hedged else 0.0
+
+    def budget_sec(self) -> float:
+        if len(self._samples) < self._min_samples:
+            budget = self._initial
+        else:
+            ordered = sorted(self._samples)
+            index = max(0, math.ceil(self.percentile * len(ordered)) - 1)
+            budget = ordered[index]
+        return min(max(budget, self._min), self._max)
+
+
+class _StreamPump:
+    """Iterate one stream to completion inside a single task.
+
+    Provider streams may hold task-bound state (request timeouts, locks), so
+    the generator must never be advanced from more than one task. Items are
+    handed to the consumer through a small queue.
+    """
+
+    _END = object()
+
+    def __init__(self, open_stream: Callable[[], AsyncIterator[Any]], maxsize: int = 8):
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.task = asyncio.create_task(self._pump(open_stream))
+
+    async def _pump(self, open_stream: Callable[[], AsyncIterator[Any]]) -> None:
+        try:
+            async for item in open_stream():
+                await self._queue.put((item, None))
+        except Exception as exc:
+            await self._queue.put((self._END, exc))
+        else:
+            await self._queue.put((self._END, None))
+
+    async def next(self) -> Any:
+        """Next item, or ``_StreamPump._END`` once the stream is exhausted."""
+        item, error = await self._queue.get()
+        if error is not None:
+            raise error
+        return item
+
+    async def close(self) -> None:
+        if not self.task.done():
+            self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+
+# Adapters are built per call; budgets must outlive them to learn.
+_BUDGETS: Dict[Tuple[str, str, str], LatencyBudget] = {}
+
+
+def _budget_for(pipeline: str, role: str, primary_key: str, policy: HedgePolicyConfig) -> LatencyBudget:
+    key = (pipeline, role, primary_key)
+    budget = _BUDGETS.get(key)
+    if budget is None:
+        budget = _BUDGETS[key] = LatencyBudget.from_policy(policy)
+    return budget
+
+
+class _HedgedComponent(Component):
+    def __init__(
+        self,
+        pipeline: str,
+        role: str,
+        primary: Component,
+        secondary: Component,
+        policy: HedgePolicyConfig,
+    ):
+        self.component_key = getattr(primary, "component_key", role)
+        self.primary = primary
+        self.secondary = secondary
+        self._pipeline = pipeline
+        self._role = role
+        self._secondary_options = dict(policy.options or {})
+        self._secondary_ready = True
+        self._budget = _budget_for(pipeline, role, self.component_key, policy)
+
+    async def start(self) -> None:
+        await self.primary.start()
+        try:
+            await self.secondary.start()
+        except Exception:
+            self._disable_secondary("start")
+
+    async def stop(self) -> None:
+        try:
+            await self.secondary.stop()
+        except Exception:
+            logger.debug("Hedge secondary stop failed", role=self._role, exc_info=True)
+        await self.primary.stop()
+
+    async def open_call(self, call_id: str, options: Dict[str, Any]) -> None:
+        await self.primary.open_call(call_id, options)
+        if not self._secondary_ready:
+            return
+        try:
+            await self.secondary.open_call(call_id, self._secondary_options)
+        except Exception:
+            self._disable_secondary("open_call", call_id)
+
+    async def close_call(self, call_id: str) -> None:
+        try:
+            await self.secondary.close_call(call_id)
+        except Exception:
+            logger.debug("Hedge secondary close_call failed", call_id=call_id, role=self._role, exc_info=True)
+        await self.primary.close_call(call_id)
+
+    def _disable_secondary(self, stage: str, call_id: Optional[str] = None) -> None:
+        # The call proceeds on the primary alone rather than failing.
+        self._secondary_ready = False
+        logger.warning(
+            "Hedge secondary unavailable; running primary only",
+            call_id=call_id,
+            pipeline=self._pipeline,
+            role=self._role,
+            stage=stage,
+            exc_info=True,
+        )
+
+    def _record(self, outcome: str) -> None:
+        self._budget.record(outcome != "not_needed")
+        _HEDGE_TOTAL.labels(self._pipeline, self._role, outcome).inc()
+        _HEDGE_RATE.labels(self._pipeline, self._role).set(self._budget.hedge_rate)
+
+    async def _race(
+        self,
+        start_primary: Callable[[], Awaitable[T]],
+        start_secondary: Callable[[], Awaitable[T]],
+    ) -> Tuple[T, bool]:
+        """Return ``(result, primary_won)``; the loser is cancelled."""
+        if not self._secondary_ready:
+            return await start_primary(), True
+
+        budget = self._budget.budget_sec()
+        _HEDGE_BUDGET_SECONDS.labels(self._pipeline, self._role).set(budget)
+        started = time.monotonic()
+        primary = asyncio.ensure_future(start_primary())
+        secondary: Optional[asyncio.Future] = None
+        try:
+            await asyncio.wait({primary}, timeout=budget)
+            if primary.done() and primary.exception() is None:
+                self._budget.observe(time.monotonic() - started)
+                self._record("not_needed")
+                return primary.result(), True
+
+            logger.debug(
+                "Hedging pipeline request",
+                pipeline=self._pipeline,
+                role=self._role,
+                budget_ms=round(budget * 1000.0, 1),
+                primary_failed=primary.done(),
+            )
+            secondary = asyncio.ensure_future(start_secondary())
+            pending = {task for task in (primary, secondary) if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in (primary, secondary):
+                    if task in done and task.exception() is None:
+                        if task is primary:
+                            self._budget.observe(time.monotonic() - started)
+                        self._record("primary_won" if task is primary else "secondary_won")
+                        return task.result(), task is primary
+            self._record("failed")
+            raise primary.exception()
+        finally:
+            losers = [task for task in (primary, secondary) if task is not None and not task.done()]
+            if primary in losers:
+                # Censored sample: the primary took at least this long.
+                self._budget.observe(time.monotonic() - started)
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
+
+    async def _race_stream(
+        self,
+        open_primary: Callable[[], AsyncIterator[T]],
+        open_secondary: Callable[[], AsyncIterator[T]],
+    ) -> AsyncIterator[T]:
+        """Race two streams to their first item, then yield the winner's items."""
+        pumps: Dict[bool, _StreamPump] = {}
+
+        async def first_item(is_primary: bool) -> Any:
+            pump = pumps[is_primary] = _StreamPump(open_primary if is_primary else open_secondary)
+            return await pump.next()
+
+        try:
+            item, primary_won = await self._race(lambda: first_item(True), lambda: first_item(False))
+            loser = pumps.pop(not primary_won, None)
+            if loser is not None:
+                await loser.close()
+            winner = pumps[primary_won]
+            while item is not _StreamPump._END:
+                yield item
+                item = await winner.next()
+        finally:
+            for pump in pumps.values():
+                await pump.close()
+
+
+class HedgedSTTComponent(_HedgedComponent, STTComponent):
+    """Hedge chunked ``transcribe`` calls across two STT components."""
+
+    async def transcribe(
+        self,
+        call_id: str,
+        audio_pcm16: bytes,
+        sample_rate_hz: int,
+        options: Dict[str, Any],
+    ) -> str:
+        result, _ = await self._race(
+            lambda: self.primary.transcribe(call_id, audio_pcm16, sample_rate_hz, options),
+            lambda: self.secondary.transcribe(call_id, audio_pcm16, sample_rate_hz, self._secondary_options),
+        )
+        return result
+
+
+class HedgedStreamingSTTComponent(HedgedSTTComponent):
+    """Hedged STT whose primary also streams; the streaming session runs on the primary only."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        logger.info(
+            "Streaming STT is not hedged; only chunked transcribe races the secondary",
+            pipeline=self._pipeline,
+            component=self.component_key,
+        )
+
+    async def start_stream(self, call_id: str, options: Optional[Dict[str, Any]] = None) -> None:
+        await self.primary.start_stream(call_id, options)
+
+    async def send_audio(self, call_id: str, audio: bytes, *, fmt: str = "pcm16_16k") -> None:
+        await self.primary.send_audio(call_id, audio, fmt=fmt)
+
+    def iter_results(self, call_id: str) -> AsyncIterator[str]:
+        return self.primary.iter_results(call_id)
+
+    async def stop_stream(self, call_id: str) -> None:
+        await self.primary.stop_stream(call_id)
+
+
+class HedgedLLMComponent(_HedgedComponent, LLMComponent):
+    """Hedge ``generate`` calls across two LLM components."""
+
+    async def generate(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> str:
+        result, _ = await self._race(
+            lambda: self.primary.generate(call_id, transcript, context, options),
+            lambda: self.secondary.generate(call_id, transcript, context, self._secondary_options),
+        )
+        return result
+
+
+class HedgedStreamingLLMComponent(HedgedLLMComponent):
+    """Hedged LLM whose primary streams; the race is on the first stream event."""
+
+    @property
+    def stream_by_default(self) -> bool:
+        return bool(getattr(self.primary, "stream_by_default", False))
+
+    def stream_generate(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> AsyncIterator[LLMStreamEvent]:
+        return self._race_stream(
+            lambda: self.primary.stream_generate(call_id, transcript, context, options),
+            lambda: self._secondary_stream(call_id, transcript, context),
+        )
+
+    async def _secondary_stream(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+    ) -> AsyncIterator[LLMStreamEvent]:
+        if hasattr(self.secondary, "stream_generate"):
+            async for event in self.secondary.stream_generate(call_id, transcript, context, self._secondary_options):
+                yield event
+            return
+        text = await self.secondary.generate(call_id, transcript, context, self._secondary_options)
+        yield LLMStreamEvent("sentence", text or "")
+        yield LLMStreamEvent("done", text or "")
+
+
+class HedgedTTSComponent(_HedgedComponent, TTSComponent):
+    """Race two TTS components to the first audio chunk; the winner streams the rest."""
+
+    async def synthesize(
+        self,
+        call_id: str,
+        text: str,
+        options: Dict[str, Any],
+    ) -> AsyncIterator[bytes]:
+        async for chunk in self._race_stream(
+            lambda: self.primary.synthesize(call_id, text, options),
+            lambda: self.secondary.synthesize(call_id, text, self._secondary_options),
+        ):
+            yield chunk
+
+
+_HEDGED_CLASS_BY_ROLE = {
+    "stt": HedgedSTTComponent,
+    "llm": HedgedLLMComponent,
+    "tts": HedgedTTSComponent,
+}
+# The engine detects streaming support with hasattr, so the wrapper only
+# offers the streaming methods when the primary has them.
+_STREAMING_CLASS_BY_ROLE = {
+    "stt": (HedgedStreamingSTTComponent, ("start_stream", "send_audio", "iter_results", "stop_stream")),
+    "llm": (HedgedStreamingLLMComponent, ("stream_generate",)),
+}
+
+
+def wrap_hedged(
+    pipeline: str,
+    role: str,
+    primary: Component,
+    secondary: Component,
+    policy: HedgePolicyConfig,
+) -> Component:
+    cls = _HEDGED_CLASS_BY_ROLE[role]
+    streaming = _STREAMING_CLASS_BY_ROLE.get(role)
+    if streaming and all(hasattr(primary, attr) for attr in streaming[1]):
+        cls = streaming[0]
+    return cls(pipeline, role, primary, secondary, policy)
+
+
+__all__ = [
+    "HedgedLLMComponent",
+    "HedgedSTTComponent",
+    "HedgedStreamingLLMComponent",
+    "HedgedStreamingSTTComponent",
+    "HedgedTTSComponent",
+    "LatencyBudget",
+    "wrap_hedged",
+]
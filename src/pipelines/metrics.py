@@ -0,0 +1,56 @@
+"""Prometheus metrics shared by pipeline adapters (module-scope, registered once)."""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Histogram
+
+_LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 10.0)
+
+TTS_FIRST_BYTE_SECONDS = Histogram(
+    "ai_agent_pipeline_tts_first_byte_seconds",
+    "Time from TTS request to the first response body byte",
+    labelnames=("provider",),
+    buckets=_LATENCY_BUCKETS,
+)
+TTS_FIRST_AUDIO_SECONDS = Histogram(
+    "ai_agent_pipeline_tts_first_audio_seconds",
+    "Time from TTS request to the first converted audio frame yielded downstream",
+    labelnames=("provider",),
+    buckets=_LATENCY_BUCKETS,
+)
+STT_REQUESTS_TOTAL = Counter(
+    "ai_agent_pipeline_stt_requests_total",
+    "STT recognition requests issued by pipeline adapters",
+    labelnames=("provider", "mode", "outcome"),
+)
+STT_REQUEST_SECONDS = Histogram(
+    "ai_agent_pipeline_stt_request_seconds",
+    "Latency of a single STT recognition request",
+    labelnames=("provider", "mode"),
+    buckets=_LATENCY_BUCKETS,
+)
+STT_SPEECH_RATIO = Histogram(
+    "ai_agent_pipeline_stt_speech_ratio",
+    "Per-call fraction of inbound audio frames classified as speech by the segmenter",
+    labelnames=("pipeline",),
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+)
+STT_SEGMENTS_TOTAL = Counter(
+    "ai_agent_pipeline_stt_segments_total",
+    "Audio segments committed to chunked STT adapters",
+    labelnames=("pipeline", "mode"),
+)
+
+__all__ = [
+    "TTS_FIRST_BYTE_SECONDS",
+    "TTS_FIRST_AUDIO_SECONDS",
+    "STT_REQUESTS_TOTAL",
+    "STT_REQUEST_SECONDS",
+    "STT_SPEECH_RATIO",
+    "STT_SEGMENTS_TOTAL",
+]
+PIPELINE_FAILOVER_TOTAL = Counter(
+    "ai_agent_pipeline_failover_total",
+    "Calls routed to a fallback pipeline because a component circuit was open",
+    labelnames=("pipeline", "fallback"),
+)
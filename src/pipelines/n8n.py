@@ -1,18 +1,148 @@
-"""Adapter for n8n REST API integration."""
+"""Adapter for n8n REST API integration.
+
+Besides the plain request/response webhook call, the adapter supports:
+
+* a dedicated keep-alive connection pool for the webhook origin (``pool_size``),
+* a process-wide response cache for FAQ-style workflows (``cache_ttl_sec``),
+  keyed by the normalized transcript plus selected call-context keys; without
+  ``cache_context_keys`` replies are only reused within the same call,
+* streamed replies (``stream``): chunked plain text or NDJSON, including n8n's
+  ``{"type": "item", "content": ...}`` streaming format, surfaced as
+  ``LLMStreamEvent`` deltas and sentences so TTS can start early.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import codecs
 import json
-from typing import Any, Callable, Dict, Optional
+import re
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
 
 import aiohttp
+from prometheus_client import Counter, Histogram
 
+from ..core.http_client import get_named_http_client_manager, shared_session_factory
 from ..config import AppConfig, N8nProviderConfig
 from ..logging_config import get_logger
-from .base import LLMComponent
+from .base import LLMComponent, LLMStreamEvent, SentenceAssembler
 
 logger = get_logger(__name__)
 
+_N8N_CACHE_LOOKUPS = Counter(
+    "ai_agent_n8n_cache_lookups_total",
+    "n8n response cache lookups",
+    labelnames=("result",),  # hit|miss
+)
+_N8N_FIRST_TEXT_SECONDS = Histogram(
+    "ai_agent_n8n_first_text_seconds",
+    "Time from webhook request to first response text",
+    labelnames=("mode",),  # buffered|stream
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 10.0),
+)
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+
+
+def _normalize_transcript(transcript: str) -> str:
+    return " ".join(_NON_WORD.sub(" ", (transcript or "").lower()).split())
+
+
+class _ResponseCache:
+    """Small LRU cache with per-entry expiry."""
+
+    def __init__(self) -> None:
+        self._entries: "OrderedDict[Tuple[str, ...], Tuple[float, str]]" = OrderedDict()
+
+    def get(self, key: Tuple[str, ...]) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Tuple[str, ...], value: str, ttl_sec: float, max_entries: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl_sec, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > max(1, max_entries):
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Adapters are built per call, so the cache lives at module scope.
+_RESPONSE_CACHE = _ResponseCache()
+_WARMED_WEBHOOKS: Set[str] = set()
+
+
+def _extract_text(data: Any, response_json_key: str) -> str:
+    """Pull reply text out of one JSON document or NDJSON line."""
+    if isinstance(data, str):
+        return data
+    if isinstance(data, list):
+        return "".join(_extract_text(item, response_json_key) for item in data)
+    if not isinstance(data, dict):
+        return ""
+    kind = data.get("type")
+    if kind == "item":
+        return str(data.get("content") or "")
+    if kind in ("begin", "end"):
+        return ""
+    if kind == "error":
+        logger.warning("n8n stream reported an error", content=str(data.get("content"))[:128])
+        return ""
+    value = data.get(response_json_key)
+    return value if isinstance(value, str) else ""
+
+
+async def _iter_stream_text(response: aiohttp.ClientResponse, response_json_key: str) -> AsyncIterator[str]:
+    """Yield reply text from a chunked response as it arrives."""
+    content_type = (response.headers.get("Content-Type") or "").lower()
+    if "json" not in content_type:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        async for chunk in response.content.iter_any():
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+        return
+
+    # NDJSON: one document per line. A body that is not line-delimited (e.g. a
+    # pretty-printed buffered reply) is collected and parsed once at the end.
+    pending: List[str] = []
+    async for raw_line in response.content:
+        line = raw_line.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+        if not pending:
+            try:
+                text = _extract_text(json.loads(line), response_json_key)
+            except json.JSONDecodeError:
+                pending.append(line)
+                continue
+            if text:
+                yield text
+            continue
+        pending.append(line)
+    if pending:
+        body = "\n".join(pending)
+        try:
+            text = _extract_text(json.loads(body), response_json_key)
+        except json.JSONDecodeError:
+            text = body
+        if text:
+            yield text
+
 
 class N8nAdapter(LLMComponent):
     """LLMComponent adapter for making calls to an n8n webhook."""
@@ -38,6 +168,9 @@ class N8nAdapter(LLMComponent):
             "n8n adapter initialized",
             component=self.component_key,
             webhook_url=self._provider_config.webhook_url,
+            pooled=self._provider_config.pool_size > 0,
+            stream=self._provider_config.stream,
+            cache_ttl_sec=self._provider_config.cache_ttl_sec,
         )
 
     async def stop(self) -> None:
@@ -45,6 +178,11 @@ class N8nAdapter(LLMComponent):
             await self._session.close()
         self._session = None
 
+    @property
+    def stream_by_default(self) -> bool:
+        """Whether the engine should use ``stream_generate`` when the pipeline sets no ``stream`` option."""
+        return self._compose_options(None)["stream"]
+
     async def generate(
         self,
         call_id: str,
@@ -52,23 +190,119 @@ class N8nAdapter(LLMComponent):
         context: Dict[str, Any],
         options: Dict[str, Any],
     ) -> str:
+        merged = self._compose_options(options)
+
+        if merged["stream"]:
+            response_text = ""
+            async for event in self.stream_generate(call_id, transcript, context, options):
+                if event.kind == "done":
+                    response_text = event.text
+            return response_text
+
+        cache_key = self._cache_key(call_id, transcript, context, merged)
+        if cache_key is not None:
+            cached = _RESPONSE_CACHE.get(cache_key)
+            _N8N_CACHE_LOOKUPS.labels("hit" if cached is not None else "miss").inc()
+            if cached is not None:
+                logger.info("n8n response served from cache", call_id=call_id, preview=cached[:80])
+                return cached
+
+        response_text = await self._post_buffered(call_id, transcript, context, merged)
+        if cache_key is not None and response_text:
+            _RESPONSE_CACHE.put(cache_key, response_text, merged["cache_ttl_sec"], merged["cache_max_entries"])
+        return response_text
+
+    async def stream_generate(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> AsyncIterator[LLMStreamEvent]:
+        """Stream the webhook reply as text deltas and complete sentences."""
+        merged = self._compose_options(options)
+        assembler = SentenceAssembler(int(merged.get("sentence_min_chars") or 1))
+
+        cache_key = self._cache_key(call_id, transcript, context, merged)
+        if cache_key is not None:
+            cached = _RESPONSE_CACHE.get(cache_key)
+            _N8N_CACHE_LOOKUPS.labels("hit" if cached is not None else "miss").inc()
+            if cached is not None:
+                logger.info("n8n response served from cache", call_id=call_id, preview=cached[:80])
+                yield LLMStreamEvent("delta", cached)
+                for sentence in assembler.feed(cached):
+                    yield LLMStreamEvent("sentence", sentence)
+                remainder = assembler.flush()
+                if remainder:
+                    yield LLMStreamEvent("sentence", remainder)
+                yield LLMStreamEvent("done", cached.strip())
+                return
+
         await self._ensure_session()
         assert self._session is not None
+        parts: List[str] = []
+        first_text_sec: Optional[float] = None
+        sentences = 0
+
+        logger.info("Sending streaming request to n8n webhook", call_id=call_id, url=merged["webhook_url"])
+        started_at = time.perf_counter()
+        async with self._session.post(
+            merged["webhook_url"],
+            json=self._build_payload(call_id, transcript, context),
+            headers={"Accept": "application/x-ndjson, text/plain;q=0.9, application/json;q=0.8"},
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=merged["timeout_sec"]),
+        ) as response:
+            if response.status >= 400:
+                body = await response.text()
+                logger.error(
+                    "n8n webhook stream request failed",
+                    call_id=call_id,
+                    status=response.status,
+                    body_preview=body[:128],
+                )
+                response.raise_for_status()
 
-        # Merge options
-        merged_options = self._pipeline_defaults.copy()
-        merged_options.update(options)
+            async for delta in _iter_stream_text(response, merged["response_json_key"]):
+                if first_text_sec is None:
+                    first_text_sec = time.perf_counter() - started_at
+                    _N8N_FIRST_TEXT_SECONDS.labels("stream").observe(first_text_sec)
+                parts.append(delta)
+                yield LLMStreamEvent("delta", delta)
+                for sentence in assembler.feed(delta):
+                    sentences += 1
+                    yield LLMStreamEvent("sentence", sentence)
 
-        webhook_url = merged_options.get("webhook_url", self._provider_config.webhook_url)
-        timeout = float(merged_options.get("timeout_sec", self._provider_config.timeout_sec))
-        # The key in the response that holds the text to be spoken.
-        response_json_key = merged_options.get("response_json_key", self._provider_config.response_json_key)
+        remainder = assembler.flush()
+        if remainder:
+            sentences += 1
+            yield LLMStreamEvent("sentence", remainder)
 
-        payload = {
-            "call_id": call_id,
-            "transcript": transcript,
-            "context": context,
-        }
+        content = "".join(parts).strip()
+        logger.info(
+            "n8n response streamed",
+            call_id=call_id,
+            first_text_ms=round(first_text_sec * 1000.0, 2) if first_text_sec is not None else None,
+            latency_ms=round((time.perf_counter() - started_at) * 1000.0, 2),
+            sentences=sentences,
+            preview=content[:80],
+        )
+        if cache_key is not None and content:
+            _RESPONSE_CACHE.put(cache_key, content, merged["cache_ttl_sec"], merged["cache_max_entries"])
+        yield LLMStreamEvent("done", content)
+
+    async def _post_buffered(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        merged: Dict[str, Any],
+    ) -> str:
+        await self._ensure_session()
+        assert self._session is not None
+
+        webhook_url = merged["webhook_url"]
+        # The key in the response that holds the text to be spoken.
+        response_json_key = merged["response_json_key"]
 
         logger.info(
             "Sending request to n8n webhook",
@@ -76,10 +310,11 @@ class N8nAdapter(LLMComponent):
             url=webhook_url,
         )
 
+        started_at = time.perf_counter()
         async with self._session.post(
             webhook_url,
-            json=payload,
-            timeout=timeout,
+            json=self._build_payload(call_id, transcript, context),
+            timeout=merged["timeout_sec"],
         ) as response:
             if response.status >= 400:
                 body = await response.text()
@@ -93,6 +328,7 @@ class N8nAdapter(LLMComponent):
 
             try:
                 response_data = await response.json()
+                _N8N_FIRST_TEXT_SECONDS.labels("buffered").observe(time.perf_counter() - started_at)
                 response_text = response_data.get(response_json_key, "")
                 if not response_text:
                      logger.warning(
@@ -101,7 +337,7 @@ class N8nAdapter(LLMComponent):
                         response_json_key=response_json_key,
                         response_data=response_data,
                     )
-                
+
                 logger.info(
                     "n8n response received",
                     call_id=call_id,
@@ -111,6 +347,7 @@ class N8nAdapter(LLMComponent):
 
             except (json.JSONDecodeError, aiohttp.ContentTypeError):
                 text_response = await response.text()
+                _N8N_FIRST_TEXT_SECONDS.labels("buffered").observe(time.perf_counter() - started_at)
                 logger.info(
                     "n8n returned non-JSON response, returning as plain text",
                     call_id=call_id,
@@ -118,11 +355,77 @@ class N8nAdapter(LLMComponent):
                 )
                 return text_response
 
+    def _compose_options(self, runtime_options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        merged = dict(self._pipeline_defaults)
+        merged.update(runtime_options or {})
+        config = self._provider_config
+        return {
+            **merged,
+            "webhook_url": merged.get("webhook_url", config.webhook_url),
+            "timeout_sec": float(merged.get("timeout_sec", config.timeout_sec)),
+            "response_json_key": merged.get("response_json_key", config.response_json_key),
+            "stream": bool(merged.get("stream", config.stream)),
+            "cache_ttl_sec": float(merged.get("cache_ttl_sec", config.cache_ttl_sec)),
+            "cache_max_entries": int(merged.get("cache_max_entries", config.cache_max_entries)),
+            "cache_context_keys": list(merged.get("cache_context_keys", config.cache_context_keys) or []),
+        }
+
+    @staticmethod
+    def _build_payload(call_id: str, transcript: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "call_id": call_id,
+            "transcript": transcript,
+            "context": context,
+        }
+
+    @staticmethod
+    def _cache_key(
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        merged: Dict[str, Any],
+    ) -> Optional[Tuple[str, ...]]:
+        if merged["cache_ttl_sec"] <= 0:
+            return None
+        normalized = _normalize_transcript(transcript)
+        if not normalized:
+            return None
+        context = context or {}
+        keys = merged["cache_context_keys"]
+        if not keys:
+            # Nothing says which callers may share a reply: keep it to this call.
+            scope: Dict[str, Any] = {"call_id": call_id}
+        elif any(context.get(key) is None for key in keys):
+            # A missing scoping key would make the entry visible to unrelated callers.
+            return None
+        else:
+            scope = {key: context[key] for key in keys}
+        return (merged["webhook_url"], normalized, json.dumps(scope, sort_keys=True, default=str))
 
     async def _ensure_session(self) -> None:
         if self._session and not self._session.closed:
             return
-        factory = self._session_factory or aiohttp.ClientSession
-        self._session = factory()
+        if self._session_factory:
+            self._session = self._session_factory()
+            return
+        pool_size = int(self._provider_config.pool_size or 0)
+        if pool_size <= 0:
+            self._session = shared_session_factory()
+            return
+        manager = get_named_http_client_manager(
+            "n8n",
+            SimpleNamespace(
+                limit=pool_size,
+                limit_per_host=pool_size,
+                keepalive_timeout_sec=self._provider_config.keepalive_timeout_sec,
+            ),
+        )
+        webhook_url = self._provider_config.webhook_url
+        if webhook_url not in _WARMED_WEBHOOKS:
+            # First use: warm the webhook origin in the background for later calls.
+            _WARMED_WEBHOOKS.add(webhook_url)
+            asyncio.create_task(manager.preconnect([webhook_url]))
+        self._session = manager.session()
+
 
-__all__ = ["N8nAdapter"]
\ No newline at end of file
+__all__ = ["N8nAdapter"]
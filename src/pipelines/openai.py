@@ -14,20 +14,43 @@ import base64
 import json
 import time
 import uuid
-from dataclasses import dataclass
-from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
 
 import aiohttp
 import websockets
+from prometheus_client import Counter, Histogram
 from websockets.client import WebSocketClientProtocol
 
-from ..audio import convert_pcm16le_to_target_format, mulaw_to_pcm16le, resample_audio
+from ..audio import Base64JSONFieldDecoder, StreamingAudioConverter, resample_audio
+from ..core.http_client import shared_session_factory
 from ..config import AppConfig, OpenAIProviderConfig
 from ..logging_config import get_logger
-from .base import LLMComponent, STTComponent, TTSComponent
+from .base import LLMComponent, LLMStreamEvent, SentenceAssembler, STTComponent, TTSComponent
+from .metrics import TTS_FIRST_AUDIO_SECONDS, TTS_FIRST_BYTE_SECONDS
 
 logger = get_logger(__name__)
 
+_STREAM_READ_BYTES = 4096
+_AUDIO_JSON_KEYS = ("data", "audio")
+
+_REALTIME_LLM_TTFT_SECONDS = Histogram(
+    "ai_agent_openai_realtime_llm_ttft_seconds",
+    "Time from response.create to the first text delta on the per-call realtime LLM session",
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0),
+)
+_REALTIME_LLM_RECONNECTS_TOTAL = Counter(
+    "ai_agent_openai_realtime_llm_reconnects_total",
+    "Number of times the per-call realtime LLM websocket was re-established",
+)
+_REALTIME_LLM_ABANDONED_TOTAL = Counter(
+    "ai_agent_openai_realtime_llm_abandoned_total",
+    "Realtime LLM responses abandoned before response.done",
+    labelnames=("reason",),  # reason: timeout|cancelled
+)
+# How long an abandoned response may take to acknowledge response.cancel before the session is rebuilt
+_REALTIME_CANCEL_DRAIN_SEC = 2.0
+
 
 # Shared helpers -----------------------------------------------------------------
 
@@ -43,22 +66,6 @@ def _merge_dicts(base: Dict[str, Any], override: Optional[Dict[str, Any]]) -> Di
     return merged
 
 
-def _bytes_per_sample(encoding: str) -> int:
-    fmt = (encoding or "").lower()
-    if fmt in ("ulaw", "mulaw", "mu-law", "g711_ulaw"):
-        return 1
-    return 2
-
-
-def _chunk_audio(audio_bytes: bytes, encoding: str, sample_rate: int, chunk_ms: int) -> Iterable[bytes]:
-    if not audio_bytes:
-        return
-    bytes_per_sample = _bytes_per_sample(encoding)
-    frame_size = max(bytes_per_sample, int(sample_rate * (chunk_ms / 1000.0) * bytes_per_sample))
-    for idx in range(0, len(audio_bytes), frame_size):
-        yield audio_bytes[idx : idx + frame_size]
-
-
 def _make_ws_headers(options: Dict[str, Any]) -> Iterable[tuple[str, str]]:
     headers = [
         ("Authorization", f"Bearer {options['api_key']}"),
@@ -85,20 +92,33 @@ def _make_http_headers(options: Dict[str, Any]) -> Dict[str, str]:
     return headers
 
 
-def _decode_audio_payload(raw_bytes: bytes) -> bytes:
-    try:
-        payload = json.loads(raw_bytes.decode("utf-8"))
-    except (json.JSONDecodeError, UnicodeDecodeError):
-        return raw_bytes
-
-    audio_b64 = payload.get("data") or payload.get("audio")
-    if not audio_b64:
-        return raw_bytes
-    try:
-        return base64.b64decode(audio_b64)
-    except (base64.binascii.Error, TypeError):
-        logger.warning("Failed to base64 decode OpenAI audio payload")
-        return raw_bytes
+async def _iter_sse_data(response: Any) -> AsyncIterator[str]:
+    """Yield the ``data`` field of each server-sent event as it arrives."""
+    pending = b""
+    data_lines: list[str] = []
+    async for chunk in response.content.iter_any():
+        pending += chunk
+        while True:
+            newline = pending.find(b"\n")
+            if newline < 0:
+                break
+            line = pending[:newline].rstrip(b"\r").decode("utf-8", errors="ignore")
+            pending = pending[newline + 1 :]
+            if not line:
+                if data_lines:
+                    yield "\n".join(data_lines)
+                    data_lines = []
+                continue
+            if line.startswith(":"):
+                continue
+            field_name, _, value = line.partition(":")
+            if field_name == "data":
+                data_lines.append(value[1:] if value.startswith(" ") else value)
+    tail = pending.decode("utf-8", errors="ignore").strip()
+    if tail.startswith("data:"):
+        data_lines.append(tail[5:].lstrip())
+    if data_lines:
+        yield "\n".join(data_lines)
 
 
 @dataclass
@@ -108,6 +128,44 @@ class _RealtimeSessionState:
     session_id: str
 
 
+@dataclass
+class _RealtimeConversationState:
+    """Per-call realtime LLM session mirrored against the server-side conversation."""
+
+    websocket: WebSocketClientProtocol
+    options: Dict[str, Any]
+    session_id: str
+    history: List[Dict[str, str]] = field(default_factory=list)
+    synced_items: int = 0
+    turns: int = 0
+    reconnects: int = 0
+    last_ttft_ms: Optional[float] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Cancels and drains a response abandoned by a cancelled turn; awaited before the next turn
+    abandoned: Optional[asyncio.Task] = None
+
+
+def _realtime_response_id(payload: Dict[str, Any]) -> Optional[str]:
+    """Response id carried by a realtime server event, if any."""
+    response = payload.get("response")
+    if isinstance(response, dict) and response.get("id"):
+        return response["id"]
+    return payload.get("response_id")
+
+
+def _to_realtime_item(message: Dict[str, str]) -> Dict[str, Any]:
+    role = message.get("role") or "user"
+    content_type = "text" if role == "assistant" else "input_text"
+    return {
+        "type": "conversation.item.create",
+        "item": {
+            "type": "message",
+            "role": role,
+            "content": [{"type": content_type, "text": message.get("content") or ""}],
+        },
+    }
+
+
 # Milestone7: OpenAI Realtime STT Adapter ----------------------------------------
 
 
@@ -331,6 +389,9 @@ class OpenAILLMAdapter(LLMComponent):
         self._pipeline_defaults = options or {}
         self._session_factory = session_factory
         self._session: Optional[aiohttp.ClientSession] = None
+        self._realtime_sessions: Dict[str, _RealtimeConversationState] = {}
+        # Serializes creation of a call's realtime session so concurrent turns share one socket
+        self._realtime_open_locks: Dict[str, asyncio.Lock] = {}
         self._default_timeout = float(self._pipeline_defaults.get("response_timeout_sec", provider_config.response_timeout_sec))
 
     async def start(self) -> None:
@@ -341,10 +402,44 @@ class OpenAILLMAdapter(LLMComponent):
         )
 
     async def stop(self) -> None:
+        for call_id in list(self._realtime_sessions.keys()):
+            await self.close_call(call_id)
         if self._session and not self._session.closed:
             await self._session.close()
         self._session = None
 
+    async def open_call(self, call_id: str, options: Dict[str, Any]) -> None:
+        merged = self._compose_options(options)
+        if not merged.get("use_realtime"):
+            return
+        if not merged["api_key"]:
+            raise RuntimeError("OpenAI LLM requires an API key")
+        await self._ensure_realtime_session(call_id, merged)
+
+    async def close_call(self, call_id: str) -> None:
+        open_lock = self._realtime_open_locks.pop(call_id, None)
+        if open_lock is not None:
+            async with open_lock:  # let a session being opened land so it is closed too
+                state = self._realtime_sessions.pop(call_id, None)
+        else:
+            state = self._realtime_sessions.pop(call_id, None)
+        if not state:
+            return
+        if state.abandoned is not None:
+            state.abandoned.cancel()
+        try:
+            await state.websocket.close()
+        except Exception:
+            logger.debug("OpenAI realtime LLM close failed", call_id=call_id, exc_info=True)
+        finally:
+            logger.info(
+                "OpenAI realtime LLM session closed",
+                call_id=call_id,
+                session_id=state.session_id,
+                turns=state.turns,
+                reconnects=state.reconnects,
+            )
+
     async def generate(
         self,
         call_id: str,
@@ -360,6 +455,13 @@ class OpenAILLMAdapter(LLMComponent):
         if use_realtime:
             return await self._generate_realtime(call_id, transcript, context, merged)
 
+        if merged.get("stream"):
+            response_text = ""
+            async for event in self.stream_generate(call_id, transcript, context, options):
+                if event.kind == "done":
+                    response_text = event.text
+            return response_text
+
         await self._ensure_session()
         assert self._session
         payload = self._build_chat_payload(transcript, context, merged)
@@ -400,6 +502,81 @@ class OpenAILLMAdapter(LLMComponent):
             )
             return content
 
+    async def stream_generate(
+        self,
+        call_id: str,
+        transcript: str,
+        context: Dict[str, Any],
+        options: Dict[str, Any],
+    ) -> AsyncIterator[LLMStreamEvent]:
+        """Stream a Chat Completions response as text deltas and complete sentences."""
+        merged = self._compose_options(options)
+        if not merged["api_key"]:
+            raise RuntimeError("OpenAI LLM requires an API key")
+
+        await self._ensure_session()
+        assert self._session
+        payload = self._build_chat_payload(transcript, context, merged)
+        payload["stream"] = True
+        headers = _make_http_headers(merged)
+        headers["Accept"] = "text/event-stream"
+        url = merged["chat_base_url"].rstrip("/") + "/chat/completions"
+        assembler = SentenceAssembler(int(merged.get("sentence_min_chars") or 1))
+        parts: list[str] = []
+        ttft_ms: Optional[float] = None
+        sentences = 0
+
+        started_at = time.perf_counter()
+        async with self._session.post(url, json=payload, headers=headers, timeout=merged["timeout_sec"]) as response:
+            if response.status >= 400:
+                body = await response.text()
+                logger.error(
+                    "OpenAI chat completion stream failed",
+                    call_id=call_id,
+                    status=response.status,
+                    body_preview=body[:128],
+                )
+                response.raise_for_status()
+
+            async for data in _iter_sse_data(response):
+                if data.strip() == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data)
+                except json.JSONDecodeError:
+                    logger.debug("OpenAI chat stream received non-JSON event", call_id=call_id, preview=data[:64])
+                    continue
+                choices = chunk.get("choices") or []
+                if not choices:
+                    continue
+                delta = (choices[0].get("delta") or {}).get("content") or ""
+                if not delta:
+                    continue
+                if ttft_ms is None:
+                    ttft_ms = (time.perf_counter() - started_at) * 1000.0
+                parts.append(delta)
+                yield LLMStreamEvent("delta", delta)
+                for sentence in assembler.feed(delta):
+                    sentences += 1
+                    yield LLMStreamEvent("sentence", sentence)
+
+        remainder = assembler.flush()
+        if remainder:
+            sentences += 1
+            yield LLMStreamEvent("sentence", remainder)
+
+        content = "".join(parts).strip()
+        logger.info(
+            "OpenAI chat completion streamed",
+            call_id=call_id,
+            model=payload.get("model"),
+            ttft_ms=round(ttft_ms, 2) if ttft_ms is not None else None,
+            latency_ms=round((time.perf_counter() - started_at) * 1000.0, 2),
+            sentences=sentences,
+            preview=content[:80],
+        )
+        yield LLMStreamEvent("done", content)
+
     async def _generate_realtime(
         self,
         call_id: str,
@@ -407,36 +584,59 @@ class OpenAILLMAdapter(LLMComponent):
         context: Dict[str, Any],
         merged: Dict[str, Any],
     ) -> str:
-        headers = list(_make_ws_headers(merged))
-        websocket = await websockets.connect(
-            merged["realtime_base_url"],
-            extra_headers=headers,
-            max_size=8 * 1024 * 1024,
-        )
+        state = await self._ensure_realtime_session(call_id, merged, context)
+        messages = self._coalesce_messages(transcript, context, merged)
 
-        session_payload = {
-            "type": "session.create",
-            "session": {
-                "model": merged["realtime_model"],
-                "modalities": merged.get("modalities"),
-                "instructions": merged.get("system_prompt") or context.get("system_prompt"),
-            },
-        }
-        await websocket.send(json.dumps(session_payload))
+        async with state.lock:
+            if state.abandoned is not None:
+                abandoned, state.abandoned = state.abandoned, None
+                await abandoned
+            # Reconnect only under the lock, once any abandoned response has drained.
+            if getattr(state.websocket, "closed", False):
+                await self._reconnect_realtime_session(call_id, state, context)
+            state.history.extend(self._new_messages(state, messages))
+            for attempt in (1, 2):
+                try:
+                    return await self._run_realtime_turn(call_id, state, merged)
+                except (websockets.ConnectionClosed, OSError) as exc:
+                    if attempt == 2:
+                        raise
+                    logger.warning(
+                        "OpenAI realtime LLM connection lost; reconnecting",
+                        call_id=call_id,
+                        session_id=state.session_id,
+                        error=str(exc),
+                    )
+                    await self._reconnect_realtime_session(call_id, state, context)
+        return ""
+
+    async def _run_realtime_turn(
+        self,
+        call_id: str,
+        state: _RealtimeConversationState,
+        merged: Dict[str, Any],
+    ) -> str:
+        websocket = state.websocket
+        # Only append the items the server has not seen yet; after a reconnect
+        # synced_items is reset so the whole conversation is replayed.
+        for message in state.history[state.synced_items :]:
+            await websocket.send(json.dumps(_to_realtime_item(message)))
+        state.synced_items = len(state.history)
 
-        messages = self._coalesce_messages(transcript, context, merged)
         request_payload = {
             "type": "response.create",
             "response": {
                 "modalities": ["text"],
                 "instructions": merged.get("instructions"),
                 "metadata": {"component": self.component_key, "call_id": call_id},
-                "conversation": {"messages": messages},
             },
         }
+        started_at = time.perf_counter()
         await websocket.send(json.dumps(request_payload))
 
         buffer: list[str] = []
+        ttft_ms: Optional[float] = None
+        response_id: Optional[str] = None
         try:
             while True:
                 message = await asyncio.wait_for(websocket.recv(), timeout=merged["timeout_sec"])
@@ -444,23 +644,202 @@ class OpenAILLMAdapter(LLMComponent):
                     continue
                 payload = json.loads(message)
                 event_type = payload.get("type")
+                event_response_id = _realtime_response_id(payload)
+                if event_type == "response.created" and response_id is None:
+                    response_id = event_response_id
+                elif event_response_id is not None and event_response_id != response_id:
+                    continue  # left over from an earlier response
                 if event_type == "response.output_text.delta":
+                    if ttft_ms is None:
+                        ttft_ms = (time.perf_counter() - started_at) * 1000.0
+                        _REALTIME_LLM_TTFT_SECONDS.observe(ttft_ms / 1000.0)
                     buffer.append(payload.get("delta") or "")
-                elif event_type in ("response.output_text.done", "response.completed"):
-                    response_text = "".join(buffer).strip()
-                    logger.info("OpenAI realtime LLM response", call_id=call_id, preview=response_text[:80])
-                    return response_text
-                elif event_type == "response.error":
-                    logger.error("OpenAI realtime LLM error", call_id=call_id, error=payload.get("error"))
+                elif event_type == "response.done":
                     break
-        finally:
-            await websocket.close()
-        return ""
+                elif event_type in ("error", "response.error"):
+                    logger.error("OpenAI realtime LLM error", call_id=call_id, error=payload.get("error"))
+                    await self._abandon_realtime_turn(call_id, state, response_id, "error")
+                    return ""
+        except asyncio.TimeoutError:
+            _REALTIME_LLM_ABANDONED_TOTAL.labels("timeout").inc()
+            await self._abandon_realtime_turn(call_id, state, response_id, "timeout")
+            raise
+        except asyncio.CancelledError:
+            # Barge-in: finish abandoning in the background; the next turn waits for it.
+            _REALTIME_LLM_ABANDONED_TOTAL.labels("cancelled").inc()
+            state.abandoned = asyncio.create_task(
+                self._abandon_realtime_turn(call_id, state, response_id, "cancelled")
+            )
+            raise
+
+        response_text = "".join(buffer).strip()
+        state.turns += 1
+        state.last_ttft_ms = ttft_ms
+        if response_text:
+            # The server already holds the assistant item it generated.
+            state.history.append({"role": "assistant", "content": response_text})
+            state.synced_items = len(state.history)
+        logger.info(
+            "OpenAI realtime LLM response",
+            call_id=call_id,
+            session_id=state.session_id,
+            turn=state.turns,
+            ttft_ms=round(ttft_ms, 2) if ttft_ms is not None else None,
+            latency_ms=round((time.perf_counter() - started_at) * 1000.0, 2),
+            preview=response_text[:80],
+        )
+        return response_text
+
+    async def _abandon_realtime_turn(
+        self,
+        call_id: str,
+        state: _RealtimeConversationState,
+        response_id: Optional[str],
+        reason: str,
+    ) -> None:
+        """Cancel an unfinished response and drain it so its events and items do not leak into the next turn.
+
+        Output items of the abandoned response are deleted from the server-side
+        conversation, which keeps it equal to ``state.history``. If the server
+        does not confirm within ``_REALTIME_CANCEL_DRAIN_SEC`` the socket is
+        closed and the next turn reconnects and replays the history.
+        """
+        websocket = state.websocket
+
+        async def drain() -> Dict[str, Any]:
+            while True:
+                message = await websocket.recv()
+                if isinstance(message, bytes):
+                    continue
+                payload = json.loads(message)
+                if payload.get("type") != "response.done":
+                    continue
+                done_id = _realtime_response_id(payload)
+                if response_id is None or done_id is None or done_id == response_id:
+                    return payload
+
+        try:
+            cancel: Dict[str, Any] = {"type": "response.cancel"}
+            if response_id:
+                cancel["response_id"] = response_id
+            await websocket.send(json.dumps(cancel))
+            done = await asyncio.wait_for(drain(), timeout=_REALTIME_CANCEL_DRAIN_SEC)
+            for item in (done.get("response") or {}).get("output") or []:
+                if item.get("id"):
+                    await websocket.send(json.dumps({"type": "conversation.item.delete", "item_id": item["id"]}))
+            logger.info(
+                "OpenAI realtime LLM response abandoned",
+                call_id=call_id,
+                session_id=state.session_id,
+                response_id=response_id,
+                reason=reason,
+            )
+        except Exception:
+            logger.warning(
+                "OpenAI realtime LLM response could not be cancelled; resetting session",
+                call_id=call_id,
+                session_id=state.session_id,
+                reason=reason,
+                exc_info=True,
+            )
+            try:
+                await websocket.close()
+            except Exception:
+                logger.debug("OpenAI realtime LLM socket close failed", call_id=call_id, exc_info=True)
+
+    async def _ensure_realtime_session(
+        self,
+        call_id: str,
+        merged: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> _RealtimeConversationState:
+        """Return the call's session, opening it once; a closed socket is reconnected by the next turn."""
+        state = self._realtime_sessions.get(call_id)
+        if state is not None:
+            return state
+        open_lock = self._realtime_open_locks.setdefault(call_id, asyncio.Lock())
+        async with open_lock:
+            state = self._realtime_sessions.get(call_id)
+            if state is not None:
+                return state
+            websocket = await self._connect_realtime(merged, context)
+            state = _RealtimeConversationState(
+                websocket=websocket,
+                options=merged,
+                session_id=str(uuid.uuid4()),
+            )
+            self._realtime_sessions[call_id] = state
+        logger.info(
+            "OpenAI realtime LLM session opened",
+            call_id=call_id,
+            session_id=state.session_id,
+            model=merged["realtime_model"],
+        )
+        return state
+
+    async def _reconnect_realtime_session(
+        self,
+        call_id: str,
+        state: _RealtimeConversationState,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        try:
+            await state.websocket.close()
+        except Exception:
+            logger.debug("OpenAI realtime LLM stale socket close failed", call_id=call_id, exc_info=True)
+        state.websocket = await self._connect_realtime(state.options, context)
+        state.synced_items = 0
+        state.reconnects += 1
+        _REALTIME_LLM_RECONNECTS_TOTAL.inc()
+        logger.info(
+            "OpenAI realtime LLM session re-established",
+            call_id=call_id,
+            session_id=state.session_id,
+            reconnects=state.reconnects,
+            replay_items=len(state.history),
+        )
+
+    async def _connect_realtime(
+        self,
+        merged: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> WebSocketClientProtocol:
+        headers = list(_make_ws_headers(merged))
+        websocket = await websockets.connect(
+            merged["realtime_base_url"],
+            extra_headers=headers,
+            max_size=8 * 1024 * 1024,
+        )
+        session_payload = {
+            "type": "session.create",
+            "session": {
+                "model": merged["realtime_model"],
+                "modalities": merged.get("modalities"),
+                "instructions": merged.get("system_prompt") or (context or {}).get("system_prompt"),
+            },
+        }
+        await websocket.send(json.dumps(session_payload))
+        return websocket
+
+    @staticmethod
+    def _new_messages(
+        state: _RealtimeConversationState,
+        messages: List[Dict[str, str]],
+    ) -> List[Dict[str, str]]:
+        """Return the messages not yet mirrored in the session history.
+
+        Callers may pass either the full conversation (a superset of what was
+        already sent) or only the latest turn; both are handled.
+        """
+        history = state.history
+        if history and len(messages) >= len(history) and messages[: len(history)] == history:
+            return list(messages[len(history) :])
+        return [m for m in messages if not (m.get("role") == "system" and m in history)]
 
     async def _ensure_session(self) -> None:
         if self._session and not self._session.closed:
             return
-        factory = self._session_factory or aiohttp.ClientSession
+        factory = self._session_factory or shared_session_factory
         self._session = factory()
 
     def _compose_options(self, runtime_options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -495,6 +874,8 @@ class OpenAILLMAdapter(LLMComponent):
             "max_tokens": runtime_options.get("max_tokens", self._pipeline_defaults.get("max_tokens")),
             "timeout_sec": float(runtime_options.get("timeout_sec", self._pipeline_defaults.get("timeout_sec", self._default_timeout))),
             "use_realtime": runtime_options.get("use_realtime", self._pipeline_defaults.get("use_realtime", False)),
+            "stream": runtime_options.get("stream", self._pipeline_defaults.get("stream", False)),
+            "sentence_min_chars": runtime_options.get("sentence_min_chars", self._pipeline_defaults.get("sentence_min_chars", 1)),
         }
         # Fallback persona when missing
         try:
@@ -623,10 +1004,25 @@ class OpenAITTSAdapter(TTSComponent):
             text_preview=text[:64],
         )
 
+        converter = StreamingAudioConverter(
+            merged["source_format"]["encoding"],
+            merged["source_format"]["sample_rate"],
+            merged["target_format"]["encoding"],
+            merged["target_format"]["sample_rate"],
+            int(merged.get("chunk_size_ms", self._chunk_size_ms)),
+        )
+        # The body is either raw audio or a JSON envelope with base64 audio;
+        # the first non-whitespace byte decides which.
+        decoder: Optional[Base64JSONFieldDecoder] = None
+        sniffed = False
+        prefix = b""
+        ttfb_ms: Optional[float] = None
+        first_audio_ms: Optional[float] = None
+
+        started_at = time.perf_counter()
         async with self._session.post(url, json=payload, headers=headers, timeout=merged["timeout_sec"]) as response:
-            data = await response.read()
             if response.status >= 400:
-                body = data.decode("utf-8", errors="ignore")
+                body = await response.text()
                 logger.error(
                     "OpenAI TTS synthesis failed",
                     call_id=call_id,
@@ -635,37 +1031,47 @@ class OpenAITTSAdapter(TTSComponent):
                 )
                 response.raise_for_status()
 
-            audio_bytes = _decode_audio_payload(data)
-            converted = self._convert_audio(
-                audio_bytes,
-                merged["source_format"]["encoding"],
-                merged["source_format"]["sample_rate"],
-                merged["target_format"]["encoding"],
-                merged["target_format"]["sample_rate"],
-            )
+            async for data in response.content.iter_chunked(_STREAM_READ_BYTES):
+                if ttfb_ms is None:
+                    ttfb_ms = (time.perf_counter() - started_at) * 1000.0
+                    TTS_FIRST_BYTE_SECONDS.labels("openai").observe(ttfb_ms / 1000.0)
+                if not sniffed:
+                    prefix += data
+                    if not prefix.strip():
+                        continue
+                    sniffed = True
+                    if prefix.lstrip()[:1] == b"{":
+                        decoder = Base64JSONFieldDecoder(_AUDIO_JSON_KEYS)
+                    data, prefix = prefix, b""
+                audio = decoder.feed(data) if decoder else data
+                for chunk in converter.feed(audio):
+                    if first_audio_ms is None:
+                        first_audio_ms = (time.perf_counter() - started_at) * 1000.0
+                        TTS_FIRST_AUDIO_SECONDS.labels("openai").observe(first_audio_ms / 1000.0)
+                    yield chunk
+
+        tail = b""
+        if decoder is not None:
+            # JSON that never carried an audio field is treated as raw audio, as before.
+            tail = decoder.finish() if decoder.found else decoder.raw
+        for chunk in converter.feed(tail) + converter.flush():
+            yield chunk
 
         logger.info(
             "OpenAI TTS synthesis completed",
             call_id=call_id,
-            output_bytes=len(converted),
+            ttfb_ms=round(ttfb_ms, 2) if ttfb_ms is not None else None,
+            first_audio_ms=round(first_audio_ms, 2) if first_audio_ms is not None else None,
+            latency_ms=round((time.perf_counter() - started_at) * 1000.0, 2),
+            output_bytes=converter.output_bytes,
             target_encoding=merged["target_format"]["encoding"],
             target_sample_rate=merged["target_format"]["sample_rate"],
         )
 
-        chunk_ms = int(merged.get("chunk_size_ms", self._chunk_size_ms))
-        for chunk in _chunk_audio(
-            converted,
-            merged["target_format"]["encoding"],
-            merged["target_format"]["sample_rate"],
-            chunk_ms,
-        ):
-            if chunk:
-                yield chunk
-
     async def _ensure_session(self) -> None:
         if self._session and not self._session.closed:
             return
-        factory = self._session_factory or aiohttp.ClientSession
+        factory = self._session_factory or shared_session_factory
         self._session = factory()
 
     def _compose_options(self, runtime_options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -718,31 +1124,8 @@ class OpenAITTSAdapter(TTSComponent):
         }
         return merged
 
-    @staticmethod
-    def _convert_audio(
-        audio_bytes: bytes,
-        source_encoding: str,
-        source_rate: int,
-        target_encoding: str,
-        target_rate: int,
-    ) -> bytes:
-        if not audio_bytes:
-            return b""
-
-        fmt = (source_encoding or "").lower()
-        if fmt in ("ulaw", "mulaw", "mu-law", "g711_ulaw"):
-            pcm_bytes = mulaw_to_pcm16le(audio_bytes)
-        else:
-            pcm_bytes = audio_bytes
-
-        if source_rate != target_rate:
-            pcm_bytes, _ = resample_audio(pcm_bytes, source_rate, target_rate)
-
-        return convert_pcm16le_to_target_format(pcm_bytes, target_encoding)
-
-
 __all__ = [
     "OpenAISTTAdapter",
     "OpenAILLMAdapter",
     "OpenAITTSAdapter",
-]
\ No newline at end of file
+]
@@ -10,8 +10,8 @@ NotImplementedError when invoked. Phase 4 will replace these placeholders.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
 
 from ..config import (
     AppConfig,
@@ -24,6 +24,9 @@ from ..config import (
 )
 from ..logging_config import get_logger
 from .base import Component, STTComponent, LLMComponent, TTSComponent
+from .health import ComponentGuard, HealthRegistry
+from .hedging import wrap_hedged
+from .metrics import PIPELINE_FAILOVER_TOTAL
 from .deepgram import DeepgramSTTAdapter, DeepgramTTSAdapter
 from .google import GoogleLLMAdapter, GoogleSTTAdapter, GoogleTTSAdapter
 from .local import LocalLLMAdapter, LocalSTTAdapter, LocalTTSAdapter
@@ -33,6 +36,7 @@ from .n8n import N8nAdapter
 logger = get_logger(__name__)
 
 ComponentFactory = Callable[[str, Dict[str, Any]], Component]
+T = TypeVar("T")
 
 
 class PipelineOrchestratorError(Exception):
@@ -55,6 +59,7 @@ class PipelineResolution:
     tts_options: Dict[str, Any]
     primary_provider: Optional[str] = None
     prepared: bool = False
+    guards: Dict[str, ComponentGuard] = field(default_factory=dict)
 
     def component_summary(self) -> Dict[str, str]:
         return {
@@ -149,6 +154,33 @@ def _extract_role(component_key: str) -> str:
     return parts[1]
 
 
+async def call_component(
+    resolution: Any,
+    role: str,
+    invoke: Callable[[Component, Dict[str, Any]], Awaitable[T]],
+) -> T:
+    """Run ``invoke(adapter, options)`` for a pipeline role through its circuit breaker, if any."""
+    guard = (getattr(resolution, "guards", None) or {}).get(role)
+    if guard is None:
+        return await invoke(getattr(resolution, f"{role}_adapter"), getattr(resolution, f"{role}_options"))
+    return await guard.call(resolution.call_id, invoke)
+
+
+async def stream_component(
+    resolution: Any,
+    role: str,
+    open_stream: Callable[[Component, Dict[str, Any]], AsyncIterator[Any]],
+) -> AsyncIterator[Any]:
+    """Stream ``open_stream(adapter, options)`` for a pipeline role through its circuit breaker, if any."""
+    guard = (getattr(resolution, "guards", None) or {}).get(role)
+    if guard is None:
+        stream = open_stream(getattr(resolution, f"{role}_adapter"), getattr(resolution, f"{role}_options"))
+    else:
+        stream = guard.stream(resolution.call_id, open_stream)
+    async for item in stream:
+        yield item
+
+
 def _extract_provider(component_key: str) -> Optional[str]:
     parts = component_key.rsplit("_", 1)
     if len(parts) != 2:
@@ -213,6 +245,11 @@ class PipelineOrchestrator:
         self._n8n_provider_config: Optional[N8nProviderConfig] = self._hydrate_n8n_config()
         self._register_builtin_factories()
 
+        breaker_config = getattr(config, "circuit_breaker", None)
+        self._health: Optional[HealthRegistry] = (
+            HealthRegistry(breaker_config) if breaker_config is not None and breaker_config.enabled else None
+        )
+
         self._assignments: Dict[str, PipelineResolution] = {}
         self._started: bool = False
         self._enabled: bool = bool(getattr(config, "pipelines", {}) or {})
@@ -288,10 +325,46 @@ class PipelineOrchestrator:
             except StopIteration:
                 return None
 
+        selected_name, entry = self._apply_failover(call_id, selected_name, entry)
         resolution = self._build_resolution(call_id, selected_name, entry)
         self._assignments[call_id] = resolution
         return resolution
 
+    def health_snapshot(self) -> Dict[str, Any]:
+        """Per-component breaker state, error rate and latency percentiles for /health."""
+        if self._health is None:
+            return {"enabled": False, "components": {}, "open": []}
+        return {
+            "enabled": True,
+            "components": self._health.snapshot(),
+            "open": self._health.open_components(),
+        }
+
+    def _apply_failover(self, call_id: str, pipeline_name: str, entry: PipelineEntry):
+        if self._health is None or not entry.fallback:
+            return pipeline_name, entry
+        open_keys = [key for key in (entry.stt, entry.llm, entry.tts) if self._health.is_open(key)]
+        if not open_keys:
+            return pipeline_name, entry
+        fallback_entry = (getattr(self.config, "pipelines", {}) or {}).get(entry.fallback)
+        if fallback_entry is None:
+            logger.warning(
+                "Fallback pipeline not found; keeping degraded pipeline",
+                call_id=call_id,
+                pipeline=pipeline_name,
+                fallback=entry.fallback,
+            )
+            return pipeline_name, entry
+        logger.warning(
+            "Routing call to fallback pipeline; component circuit open",
+            call_id=call_id,
+            pipeline=pipeline_name,
+            fallback=entry.fallback,
+            open_components=open_keys,
+        )
+        PIPELINE_FAILOVER_TOTAL.labels(pipeline_name, entry.fallback).inc()
+        return entry.fallback, fallback_entry
+
     async def release_pipeline(self, call_id: str) -> None:
         resolution = self._assignments.pop(call_id, None)
         if not resolution:
@@ -299,6 +372,8 @@ class PipelineOrchestrator:
 
         for adapter in (resolution.stt_adapter, resolution.llm_adapter, resolution.tts_adapter):
             await self._shutdown_component(adapter, call_id)
+        for guard in resolution.guards.values():
+            await guard.release(call_id)
 
     def register_factory(self, component_key: str, factory: ComponentFactory) -> None:
         self._registry[component_key] = factory
@@ -744,6 +819,18 @@ class PipelineOrchestrator:
     def _validate_pipeline_entry(self, pipeline_name: str, entry: PipelineEntry) -> None:
         for key in (entry.stt, entry.llm, entry.tts):
             self._resolve_factory(key)
+        for role, policy in (entry.hedging or {}).items():
+            if role not in ("stt", "llm", "tts"):
+                raise PipelineOrchestratorError(
+                    f"Pipeline '{pipeline_name}' has hedging for unknown role '{role}'"
+                )
+            self._resolve_factory(policy.secondary)
+        if entry.fallback:
+            pipelines = getattr(self.config, "pipelines", {}) or {}
+            if entry.fallback not in pipelines or entry.fallback == pipeline_name:
+                raise PipelineOrchestratorError(
+                    f"Pipeline '{pipeline_name}' has invalid fallback pipeline '{entry.fallback}'"
+                )
 
     def _build_resolution(
         self,
@@ -756,9 +843,31 @@ class PipelineOrchestrator:
         llm_options = dict(options_map.get("llm", {}))
         tts_options = dict(options_map.get("tts", {}))
 
-        stt_adapter = self._build_component(entry.stt, stt_options)
-        llm_adapter = self._build_component(entry.llm, llm_options)
-        tts_adapter = self._build_component(entry.tts, tts_options)
+        pipelines = getattr(self.config, "pipelines", {}) or {}
+        fallback_entry = pipelines.get(entry.fallback) if entry.fallback else None
+        adapters = {
+            "stt": self._build_component(entry.stt, stt_options),
+            "llm": self._build_component(entry.llm, llm_options),
+            "tts": self._build_component(entry.tts, tts_options),
+        }
+        for role, policy in (entry.hedging or {}).items():
+            secondary = self._build_component(policy.secondary, dict(policy.options or {}))
+            adapters[role] = wrap_hedged(pipeline_name, role, adapters[role], secondary, policy)
+        stt_adapter = adapters["stt"]
+        llm_adapter = adapters["llm"]
+        tts_adapter = adapters["tts"]
+
+        guards: Dict[str, ComponentGuard] = {}
+        if self._health is not None:
+            role_options = {"stt": stt_options, "llm": llm_options, "tts": tts_options}
+            for role, component_key in (("stt", entry.stt), ("llm", entry.llm), ("tts", entry.tts)):
+                guards[role] = ComponentGuard(
+                    role,
+                    adapters[role],
+                    role_options[role],
+                    self._health.get(component_key),
+                    self._make_fallback_factory(role, component_key, fallback_entry),
+                )
 
         primary_provider = self._derive_primary_provider(entry)
 
@@ -775,8 +884,25 @@ class PipelineOrchestrator:
             tts_adapter=tts_adapter,
             tts_options=tts_options,
             primary_provider=primary_provider,
+            guards=guards,
         )
 
+    def _make_fallback_factory(
+        self,
+        role: str,
+        component_key: str,
+        fallback_entry: Optional[PipelineEntry],
+    ) -> Optional[Callable[[], Tuple[Component, Dict[str, Any]]]]:
+        fallback_key = getattr(fallback_entry, role, None) if fallback_entry is not None else None
+        if not fallback_key or fallback_key == component_key:
+            return None
+        fallback_options = dict((fallback_entry.options or {}).get(role, {}))
+
+        def factory() -> Tuple[Component, Dict[str, Any]]:
+            return self._build_component(fallback_key, dict(fallback_options)), dict(fallback_options)
+
+        return factory
+
     async def _shutdown_component(self, component: Component, call_id: str) -> None:
         try:
             await component.close_call(call_id)
@@ -11,9 +11,12 @@ from ..audio.resampler import (
 )
 from ..config import LLMConfig
 from .base import AIProviderInterface
+from .pool import WarmConnectionPool
 
 logger = get_logger(__name__)
 
+_AGENT_WS_URL = "wss://agent.deepgram.com/v1/agent/converse"
+
 class DeepgramProvider(AIProviderInterface):
     def __init__(self, config: Dict[str, Any], llm_config: LLMConfig, on_event: Callable[[Dict[str, Any]], None]):
         super().__init__(on_event)
@@ -35,19 +38,50 @@ class DeepgramProvider(AIProviderInterface):
             self._dg_input_rate = int(getattr(self.config, 'input_sample_rate_hz', 8000) or 8000)
         except Exception:
             self._dg_input_rate = 8000
+        # Optional warm pool of connected agent websockets (see start_pool)
+        self._pool: Optional[WarmConnectionPool] = None
 
     @property
     def supported_codecs(self) -> List[str]:
         return ["ulaw"]
 
-    async def start_session(self, call_id: str):
-        ws_url = f"wss://agent.deepgram.com/v1/agent/converse"
+    async def start_pool(self) -> None:
+        """Keep ``pool_size`` connected agent websockets ready for new calls.
+
+        Only the connection is prewarmed: Settings carries the greeting, which the
+        agent speaks as soon as it is applied, so it is still sent per call.
+        """
+        size = int(getattr(self.config, 'pool_size', 0) or 0)
+        if self._pool or size <= 0 or not getattr(self.config, 'api_key', None):
+            return
+        self._pool = WarmConnectionPool(
+            "deepgram",
+            self._connect_websocket,
+            lambda ws: ws.close(),
+            size=size,
+            idle_timeout_sec=getattr(self.config, 'pool_idle_timeout_sec', 60.0),
+        )
+        await self._pool.start()
+
+    async def stop_pool(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool:
+            await pool.stop()
+
+    async def _connect_websocket(self) -> websockets.WebSocketClientProtocol:
         headers = {'Authorization': f'Token {self.config.api_key}'}
+        return await websockets.connect(_AGENT_WS_URL, extra_headers=list(headers.items()))
 
+    async def start_session(self, call_id: str):
         try:
-            logger.info("Connecting to Deepgram Voice Agent...", url=ws_url)
-            self.websocket = await websockets.connect(ws_url, extra_headers=list(headers.items()))
-            logger.info("✅ Successfully connected to Deepgram Voice Agent.")
+            warm = await self._pool.acquire() if self._pool else None
+            if warm is not None:
+                self.websocket = warm
+                logger.info("Using warm Deepgram Voice Agent connection", call_id=call_id)
+            else:
+                logger.info("Connecting to Deepgram Voice Agent...", url=_AGENT_WS_URL)
+                self.websocket = await self._connect_websocket()
+                logger.info("✅ Successfully connected to Deepgram Voice Agent.")
 
             # Persist call context for downstream events
             self.call_id = call_id
@@ -18,12 +18,14 @@ import uuid
 from typing import Any, Dict, Optional
 
 import websockets
+from prometheus_client import Counter
 from websockets import WebSocketClientProtocol
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 
 from structlog import get_logger
 
 from .base import AIProviderInterface
+from .pool import WarmConnectionPool
 from ..audio import (
     convert_pcm16le_to_target_format,
     mulaw_to_pcm16le,
@@ -36,6 +38,24 @@ logger = get_logger(__name__)
 _COMMIT_INTERVAL_SEC = 0.2
 _KEEPALIVE_INTERVAL_SEC = 15.0
 
+# input_audio_buffer.append is sent many times per second; base64 never needs JSON
+# escaping, so the message is assembled from a fixed template instead of json.dumps.
+_APPEND_PREFIX = '{"type":"input_audio_buffer.append","audio":"'
+_APPEND_SUFFIX = '"}'
+
+_UPLINK_MESSAGES = Counter(
+    "ai_agent_openai_realtime_uplink_messages_total",
+    "input_audio_buffer.append messages sent to OpenAI Realtime",
+)
+_UPLINK_DROPPED_MS = Counter(
+    "ai_agent_openai_realtime_uplink_dropped_ms_total",
+    "Inbound audio (ms) dropped because the OpenAI Realtime uplink queue was full",
+)
+
+
+def _append_message(pcm16: bytes) -> str:
+    return _APPEND_PREFIX + base64.b64encode(pcm16).decode("ascii") + _APPEND_SUFFIX
+
 
 class OpenAIRealtimeProvider(AIProviderInterface):
     """
@@ -80,6 +100,18 @@ class OpenAIRealtimeProvider(AIProviderInterface):
         self._audio_lock: asyncio.Lock = asyncio.Lock()
         # Track provider output format we requested in session.update
         self._provider_output_format: str = "pcm16"
+        # Coalesced uplink (server VAD mode): raw inbound bytes -> bounded batch queue -> sender task
+        self._uplink_pending: bytearray = bytearray()
+        self._uplink_queue: Optional[asyncio.Queue] = None
+        self._uplink_task: Optional[asyncio.Task] = None
+        self._uplink_batch_bytes: int = 0
+        self._uplink_bytes_per_ms: int = 1
+        self._uplink_coalesce_sec: float = 0.06
+        self._uplink_pending_since: float = 0.0
+        # Deadline of the loop's current wait; armed only while a partial batch is pending.
+        self._uplink_timeout: Optional[asyncio.Timeout] = None
+        # Optional warm pool of configured websockets (see start_pool)
+        self._pool: Optional[WarmConnectionPool] = None
 
     @property
     def supported_codecs(self):
@@ -101,22 +133,21 @@ class OpenAIRealtimeProvider(AIProviderInterface):
         self._closing = False
         self._closed = False
 
-        url = self._build_ws_url()
-        headers = [
-            ("Authorization", f"Bearer {self.config.api_key}"),
-            ("OpenAI-Beta", "realtime=v1"),
-        ]
-        if self.config.organization:
-            headers.append(("OpenAI-Organization", self.config.organization))
-
-        logger.info("Connecting to OpenAI Realtime", url=url, call_id=call_id)
-        try:
-            self.websocket = await websockets.connect(url, extra_headers=headers)
-        except Exception:
-            logger.error("Failed to connect to OpenAI Realtime", call_id=call_id, exc_info=True)
-            raise
+        warm = await self._pool.acquire() if self._pool else None
+        if warm is not None:
+            # Connected and session.update already sent while idle in the pool.
+            self.websocket = warm
+            self._provider_output_format = self._output_audio_format()
+            logger.info("Using warm OpenAI Realtime connection", call_id=call_id)
+        else:
+            logger.info("Connecting to OpenAI Realtime", url=self._build_ws_url(), call_id=call_id)
+            try:
+                self.websocket = await self._connect_websocket()
+            except Exception:
+                logger.error("Failed to connect to OpenAI Realtime", call_id=call_id, exc_info=True)
+                raise
 
-        await self._send_session_update()
+            await self._send_session_update()
 
         # Proactively request an initial response so the agent can greet
         # even before user audio arrives. Prefer explicit greeting text
@@ -131,9 +162,28 @@ class OpenAIRealtimeProvider(AIProviderInterface):
 
         self._receive_task = asyncio.create_task(self._receive_loop())
         self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+        self._start_uplink()
 
         logger.info("OpenAI Realtime session established", call_id=call_id)
 
+    async def start_pool(self) -> None:
+        """Begin keeping ``pool_size`` configured websockets ready for new calls."""
+        if self._pool or int(self.config.pool_size or 0) <= 0 or not self.config.api_key:
+            return
+        self._pool = WarmConnectionPool(
+            "openai_realtime",
+            self._open_warm_connection,
+            lambda ws: ws.close(),
+            size=self.config.pool_size,
+            idle_timeout_sec=self.config.pool_idle_timeout_sec,
+        )
+        await self._pool.start()
+
+    async def stop_pool(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool:
+            await pool.stop()
+
     async def send_audio(self, audio_chunk: bytes):
         if not audio_chunk:
             return
@@ -156,6 +206,13 @@ class OpenAIRealtimeProvider(AIProviderInterface):
                 except Exception:
                     pass
 
+            # If server VAD is enabled, just append frames; do not commit. Frames are
+            # coalesced and converted/sent by the uplink task.
+            vad_enabled = getattr(self.config, "turn_detection", None) is not None
+            if vad_enabled and self._uplink_queue is not None:
+                self._enqueue_uplink(audio_chunk)
+                return
+
             pcm16 = self._convert_inbound_audio(audio_chunk)
             if not pcm16:
                 return
@@ -172,12 +229,9 @@ class OpenAIRealtimeProvider(AIProviderInterface):
                 except Exception:
                     pass
 
-            # If server VAD is enabled, just append frames; do not commit.
-            vad_enabled = getattr(self.config, "turn_detection", None) is not None
             if vad_enabled:
                 try:
-                    audio_b64 = base64.b64encode(pcm16).decode("ascii")
-                    await self._send_json({"type": "input_audio_buffer.append", "audio": audio_b64})
+                    await self._send_append(pcm16)
                 except Exception:
                     logger.error("Failed to append input audio buffer (VAD)", call_id=self._call_id, exc_info=True)
             else:
@@ -192,9 +246,8 @@ class OpenAIRealtimeProvider(AIProviderInterface):
                     if len(self._pending_audio_16k) >= commit_threshold_bytes:
                         chunk = bytes(self._pending_audio_16k)
                         self._pending_audio_16k.clear()
-                        audio_b64 = base64.b64encode(chunk).decode("ascii")
                         try:
-                            await self._send_json({"type": "input_audio_buffer.append", "audio": audio_b64})
+                            await self._send_append(chunk)
                             await self._send_json({"type": "input_audio_buffer.commit"})
                             self._last_commit_ts = time.monotonic()
                             logger.debug(
@@ -217,6 +270,7 @@ class OpenAIRealtimeProvider(AIProviderInterface):
 
         self._closing = True
         try:
+            await self._stop_uplink()
             if self._receive_task:
                 self._receive_task.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
@@ -269,21 +323,48 @@ class OpenAIRealtimeProvider(AIProviderInterface):
         base = base.rstrip("/")
         return f"{base}?model={self.config.model}"
 
-    async def _send_session_update(self):
-        # Map config modalities to output_modalities per latest guide
-        output_modalities = [m for m in (self.config.response_modalities or []) if m in ("audio", "text")]
-        if not output_modalities:
-            output_modalities = ["audio"]
+    async def _connect_websocket(self) -> WebSocketClientProtocol:
+        headers = [
+            ("Authorization", f"Bearer {self.config.api_key}"),
+            ("OpenAI-Beta", "realtime=v1"),
+        ]
+        if self.config.organization:
+            headers.append(("OpenAI-Organization", self.config.organization))
+        return await websockets.connect(self._build_ws_url(), extra_headers=headers)
+
+    async def _open_warm_connection(self) -> WebSocketClientProtocol:
+        websocket = await self._connect_websocket()
+        try:
+            await websocket.send(json.dumps(self._session_update_payload()))
+        except Exception:
+            await websocket.close()
+            raise
+        return websocket
 
+    def _output_audio_format(self) -> str:
         # Choose OpenAI output format for this session:
         # If downstream target is μ-law, request g711_ulaw from provider to test end-to-end μ-law.
         # Otherwise keep PCM16.
-        out_fmt = "pcm16"
         try:
             if (self.config.target_encoding or "").lower() in ("ulaw", "mulaw", "g711_ulaw"):
-                out_fmt = "g711_ulaw"
+                return "g711_ulaw"
         except Exception:
             pass
+        return "pcm16"
+
+    async def _send_session_update(self):
+        payload = self._session_update_payload()
+        # Record provider output format for runtime handling
+        self._provider_output_format = payload["session"]["output_audio_format"]
+        await self._send_json(payload)
+
+    def _session_update_payload(self) -> Dict[str, Any]:
+        # Map config modalities to output_modalities per latest guide
+        output_modalities = [m for m in (self.config.response_modalities or []) if m in ("audio", "text")]
+        if not output_modalities:
+            output_modalities = ["audio"]
+
+        out_fmt = self._output_audio_format()
 
         session: Dict[str, Any] = {
             # Model is selected via URL; keep accepted keys here
@@ -292,8 +373,6 @@ class OpenAIRealtimeProvider(AIProviderInterface):
             "output_audio_format": out_fmt,
             "voice": self.config.voice,
         }
-        # Record provider output format for runtime handling
-        self._provider_output_format = out_fmt
         # Optional server-side VAD/turn detection at session level
         if getattr(self.config, "turn_detection", None):
             try:
@@ -310,14 +389,12 @@ class OpenAIRealtimeProvider(AIProviderInterface):
         if self.config.instructions:
             session["instructions"] = self.config.instructions
 
-        payload: Dict[str, Any] = {
+        return {
             "type": "session.update",
             "event_id": f"sess-{uuid.uuid4()}",
             "session": session,
         }
 
-        await self._send_json(payload)
-
     async def _send_explicit_greeting(self):
         greeting = (self.config.greeting or "").strip()
         if not greeting or not self.websocket or self.websocket.closed:
@@ -376,6 +453,114 @@ class OpenAIRealtimeProvider(AIProviderInterface):
         async with self._send_lock:
             await self.websocket.send(message)
 
+    async def _send_append(self, pcm16: bytes) -> None:
+        if not self.websocket or self.websocket.closed:
+            return
+        message = _append_message(pcm16)
+        async with self._send_lock:
+            await self.websocket.send(message)
+        _UPLINK_MESSAGES.inc()
+
+    def _start_uplink(self) -> None:
+        fmt = (self.config.input_encoding or "slin16").lower()
+        bytes_per_sample = 1 if fmt in ("ulaw", "mulaw", "mu-law") else 2
+        self._uplink_bytes_per_ms = max(1, self.config.input_sample_rate_hz * bytes_per_sample // 1000)
+        coalesce_ms = min(100, max(20, int(self.config.uplink_coalesce_ms)))
+        self._uplink_batch_bytes = self._uplink_bytes_per_ms * coalesce_ms
+        self._uplink_coalesce_sec = coalesce_ms / 1000.0
+        max_batches = max(1, int(self.config.uplink_queue_ms) // coalesce_ms)
+        self._uplink_pending.clear()
+        self._uplink_queue = asyncio.Queue(maxsize=max_batches)
+        self._uplink_task = asyncio.create_task(self._uplink_loop(self._uplink_queue))
+
+    async def _stop_uplink(self) -> None:
+        task, self._uplink_task = self._uplink_task, None
+        queue, self._uplink_queue = self._uplink_queue, None
+        if task:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        # Send what is still buffered so the tail of the caller's speech is not lost.
+        tail = []
+        while queue is not None and not queue.empty():
+            tail.append(queue.get_nowait())
+        tail.append(self._take_uplink_pending())
+        audio = b"".join(tail)
+        if not audio or self.websocket is None or self.websocket.closed:
+            return
+        pcm16 = self._convert_inbound_audio(audio)
+        if not pcm16:
+            return
+        try:
+            await asyncio.wait_for(self._send_append(pcm16), timeout=1.0)
+        except Exception:
+            logger.debug("Failed to flush OpenAI uplink tail", call_id=self._call_id, exc_info=True)
+
+    def _take_uplink_pending(self) -> bytes:
+        batch = bytes(self._uplink_pending)
+        self._uplink_pending.clear()
+        return batch
+
+    def _uplink_flush_deadline(self) -> Optional[float]:
+        """Loop time at which the partial batch has waited a full coalesce interval (None when empty)."""
+        if not self._uplink_pending:
+            return None
+        return self._uplink_pending_since + self._uplink_coalesce_sec
+
+    def _enqueue_uplink(self, audio_chunk: bytes) -> None:
+        first_bytes = not self._uplink_pending
+        if first_bytes:
+            self._uplink_pending_since = asyncio.get_running_loop().time()
+        self._uplink_pending.extend(audio_chunk)
+        if len(self._uplink_pending) < self._uplink_batch_bytes:
+            timeout = self._uplink_timeout
+            if first_bytes and timeout is not None and timeout.when() is None:
+                # The loop is parked without a deadline: arm it for this partial batch.
+                timeout.reschedule(self._uplink_flush_deadline())
+            return
+        batch = self._take_uplink_pending()
+        queue = self._uplink_queue
+        if queue is None:
+            return
+        if queue.full():
+            # The socket is not keeping up; shed the oldest audio rather than
+            # letting latency grow behind a backlog.
+            with contextlib.suppress(asyncio.QueueEmpty):
+                dropped = queue.get_nowait()
+                _UPLINK_DROPPED_MS.inc(len(dropped) / self._uplink_bytes_per_ms)
+                logger.debug(
+                    "OpenAI uplink backlog full; dropping oldest batch",
+                    call_id=self._call_id,
+                    dropped_bytes=len(dropped),
+                )
+        queue.put_nowait(batch)
+
+    async def _uplink_loop(self, queue: asyncio.Queue) -> None:
+        while True:
+            try:
+                # No deadline while idle; a partial batch arms one (see _enqueue_uplink).
+                async with asyncio.timeout_at(self._uplink_flush_deadline()) as timeout:
+                    self._uplink_timeout = timeout
+                    batch = await queue.get()
+            except TimeoutError:
+                # No full batch within one interval (e.g. DTX stopped the frames):
+                # send the partial batch rather than hold the end of a turn.
+                batch = self._take_uplink_pending()
+                if not batch:
+                    continue
+            finally:
+                self._uplink_timeout = None
+            pcm16 = self._convert_inbound_audio(batch)
+            if not pcm16:
+                continue
+            try:
+                await self._send_append(pcm16)
+            except (ConnectionClosedError, ConnectionClosedOK):
+                logger.warning("OpenAI Realtime socket closed while sending audio", call_id=self._call_id)
+                return
+            except Exception:
+                logger.error("Failed to append input audio buffer (VAD)", call_id=self._call_id, exc_info=True)
+
     def _convert_inbound_audio(self, audio_chunk: bytes) -> Optional[bytes]:
         fmt = (self.config.input_encoding or "slin16").lower()
         pcm_8k = audio_chunk
@@ -0,0 +1,168 @@
+"""
+Warm connection pool for realtime provider websockets.
+
+Realtime providers otherwise pay DNS, TLS, the websocket upgrade and their
+session configuration round-trip while the caller waits for the greeting.
+``WarmConnectionPool`` keeps up to ``size`` idle, already-configured
+connections per provider, replenishes them in the background, hands one to
+``start_session`` on demand and recycles connections that sat idle past
+``idle_timeout_sec``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+_POOL_ACQUIRE_TOTAL = Counter(
+    "ai_agent_provider_pool_acquire_total",
+    "Provider session setups served from the warm pool (hit) or connected inline (miss)",
+    labelnames=("provider", "result"),
+)
+_POOL_SETUP_SAVED_SECONDS = Histogram(
+    "ai_agent_provider_pool_setup_saved_seconds",
+    "Connection setup latency taken off the call path by a warm pool hit",
+    labelnames=("provider",),
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0),
+)
+_POOL_RECYCLED_TOTAL = Counter(
+    "ai_agent_provider_pool_recycled_total",
+    "Warm connections closed without being used",
+    labelnames=("provider", "reason"),  # reason: idle|dead|shutdown
+)
+_POOL_IDLE = Gauge(
+    "ai_agent_provider_pool_idle",
+    "Idle warm connections currently held",
+    labelnames=("provider",),
+)
+
+
+@dataclass
+class _WarmConnection:
+    connection: Any
+    created_at: float
+    setup_sec: float
+
+
+class WarmConnectionPool:
+    """Keep ``size`` pre-connected provider sessions ready for incoming calls."""
+
+    def __init__(
+        self,
+        provider: str,
+        connect: Callable[[], Awaitable[Any]],
+        close: Callable[[Any], Awaitable[None]],
+        *,
+        size: int,
+        idle_timeout_sec: float = 60.0,
+        is_alive: Optional[Callable[[Any], bool]] = None,
+        retry_backoff_sec: float = 2.0,
+    ):
+        self.provider = provider
+        self.size = max(0, int(size))
+        self.idle_timeout_sec = max(1.0, float(idle_timeout_sec))
+        self._connect = connect
+        self._close = close
+        self._is_alive = is_alive or (lambda conn: not getattr(conn, "closed", False))
+        self._retry_backoff_sec = retry_backoff_sec
+        self._idle: Deque[_WarmConnection] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    async def start(self) -> None:
+        if self.size <= 0 or self._task:
+            return
+        self._task = asyncio.create_task(self._maintain())
+        logger.info("Provider warm pool started", provider=self.provider, size=self.size)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        while self._idle:
+            await self._discard(self._idle.popleft(), "shutdown")
+
+    async def acquire(self) -> Optional[Any]:
+        """Return a warm connection, or ``None`` if the caller must connect inline."""
+        now = time.monotonic()
+        while self._idle:
+            entry = self._idle.popleft()
+            self._update_gauge()
+            if now - entry.created_at > self.idle_timeout_sec:
+                await self._discard(entry, "idle")
+                continue
+            if not self._is_alive(entry.connection):
+                await self._discard(entry, "dead")
+                continue
+            self.hits += 1
+            _POOL_ACQUIRE_TOTAL.labels(self.provider, "hit").inc()
+            _POOL_SETUP_SAVED_SECONDS.labels(self.provider).observe(entry.setup_sec)
+            self._wakeup.set()
+            return entry.connection
+        self.misses += 1
+        _POOL_ACQUIRE_TOTAL.labels(self.provider, "miss").inc()
+        self._wakeup.set()
+        return None
+
+    async def _maintain(self) -> None:
+        while True:
+            await self._expire_idle()
+            if len(self._idle) < self.size:
+                started = time.monotonic()
+                try:
+                    connection = await self._connect()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.warning("Provider warm pool connect failed", provider=self.provider, exc_info=True)
+                    await asyncio.sleep(self._retry_backoff_sec)
+                    continue
+                finished = time.monotonic()
+                self._idle.append(_WarmConnection(connection, finished, finished - started))
+                self._update_gauge()
+                continue
+            self._wakeup.clear()
+            # Wake on acquire() to replenish, or periodically to expire idle entries.
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=min(5.0, self.idle_timeout_sec / 2))
+
+    async def _expire_idle(self) -> None:
+        now = time.monotonic()
+        while self._idle and (
+            now - self._idle[0].created_at > self.idle_timeout_sec or not self._is_alive(self._idle[0].connection)
+        ):
+            entry = self._idle.popleft()
+            reason = "dead" if not self._is_alive(entry.connection) else "idle"
+            await self._discard(entry, reason)
+        self._update_gauge()
+
+    async def _discard(self, entry: _WarmConnection, reason: str) -> None:
+        _POOL_RECYCLED_TOTAL.labels(self.provider, reason).inc()
+        try:
+            await self._close(entry.connection)
+        except Exception:
+            logger.debug("Provider warm pool close failed", provider=self.provider, exc_info=True)
+        self._update_gauge()
+
+    def _update_gauge(self) -> None:
+        _POOL_IDLE.labels(self.provider).set(len(self._idle))
+
+
+__all__ = ["WarmConnectionPool"]
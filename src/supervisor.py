@@ -0,0 +1,262 @@
+"""
+Supervisor mode: run ``workers.count`` engine processes on one host.
+
+A single engine runs every call's RTP decode, resampling, VAD and provider
+encoding on one event loop, so one core caps the number of concurrent calls.
+With ``workers.count > 1`` ``main()`` starts this supervisor instead:
+
+- Each worker is a separate process running an ordinary ``Engine`` with a
+  derived config (``worker_config``): its own Stasis application
+  ``<app_name>-w<index>``, its own AudioSocket port and RTP port (base port
+  plus the worker index) and its own health/metrics port (``HEALTH_PORT``
+  plus one plus the index).
+- The supervisor owns the dialplan's Stasis application and moves each
+  caller channel into the least-loaded worker's application
+  (``ShardRouter``). The worker then originates the AudioSocket or
+  ExternalMedia channel for that call pointing at its own port, so media and
+  ARI events for a call reach only the worker that owns it. No shared
+  socket is needed; ``SO_REUSEPORT`` would spread packets by source address
+  rather than by call.
+- A worker that exits is restarted after ``workers.restart_backoff_sec``;
+  the calls it owned are hung up because their state died with it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import signal
+import time
+from typing import Any, Callable, List, Optional
+
+from aiohttp import web
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, generate_latest
+
+from .ari_client import ARIClient
+from .config import AppConfig
+from .core.shard_router import ShardRouter, worker_app_name
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_WORKER_RESTARTS_TOTAL = Counter(
+    "ai_agent_worker_restarts_total",
+    "Engine worker processes restarted after exiting",
+    labelnames=("worker",),
+)
+_WORKERS_ALIVE = Gauge(
+    "ai_agent_workers_alive",
+    "Engine worker processes currently running",
+)
+
+# Seconds between router.reconcile() passes that release calls whose ChannelDestroyed was missed
+_RECONCILE_INTERVAL_SEC = 30.0
+
+
+def worker_config(config: AppConfig, index: int) -> AppConfig:
+    """Config for engine worker ``index``: own Stasis app and own media ports."""
+    derived = config.model_copy(deep=True)
+    derived.asterisk.app_name = worker_app_name(config.asterisk.app_name, index)
+    if derived.audiosocket:
+        derived.audiosocket.port += index
+    if derived.external_media:
+        derived.external_media.rtp_port += index
+    if derived.workers:
+        derived.workers.count = 1
+    return derived
+
+
+def _run_worker(config: AppConfig, index: int, health_port: int) -> None:
+    """Worker process entry point."""
+    os.environ["HEALTH_PORT"] = str(health_port)
+    from .engine import configure_engine_logging, run_engine
+
+    configure_engine_logging(config, service_name=f"ai-engine-w{index}")
+    try:
+        asyncio.run(run_engine(config))
+    except KeyboardInterrupt:
+        pass
+
+
+class EngineSupervisor:
+    """Start, watch and restart engine worker processes and route calls to them."""
+
+    def __init__(self, config: AppConfig, *, target: Callable[..., None] = _run_worker):
+        self.config = config
+        workers_cfg = config.workers
+        self.count = max(1, int(workers_cfg.count))
+        self.restart_backoff_sec = max(0.0, float(workers_cfg.restart_backoff_sec))
+        self.shutdown_timeout_sec = max(0.0, float(workers_cfg.shutdown_timeout_sec))
+        self.health_port = int(os.getenv("HEALTH_PORT", "15000"))
+        self._target = target
+        self._context = multiprocessing.get_context("spawn")  # never fork a running event loop
+        self.processes: List[Optional[Any]] = [None] * self.count
+        self.restarts = [0] * self.count
+        self._restart_at: List[Optional[float]] = [None] * self.count
+        self._stopping = False
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._health_runner: Optional[web.AppRunner] = None
+        asterisk = config.asterisk
+        self.ari_client = ARIClient(
+            username=asterisk.username,
+            password=asterisk.password,
+            base_url=f"http://{asterisk.host}:{asterisk.port}/ari",
+            app_name=asterisk.app_name,
+            event_workers=asterisk.event_workers,
+            event_queue_max=asterisk.event_queue_max,
+            subscribe_all=asterisk.subscribe_all,
+            reconnect_backoff_min_sec=asterisk.reconnect_backoff_min_sec,
+            reconnect_backoff_max_sec=asterisk.reconnect_backoff_max_sec,
+            http_pool_size=asterisk.http_pool_size,
+        )
+        self.router = ShardRouter(
+            self.ari_client, [worker_app_name(asterisk.app_name, index) for index in range(self.count)]
+        )
+
+    async def start(self, *, connect_ari: bool = True) -> None:
+        for index in range(self.count):
+            self._spawn(index)
+        self._monitor_task = asyncio.create_task(self._monitor())
+        await self._start_health_server()
+        if connect_ari:
+            self.router.start()
+            self.ari_client.on_reconnect(self.router.reconcile)
+            await self.ari_client.connect()
+            asyncio.create_task(self.ari_client.run())
+        logger.info("Supervisor started", workers=self.count, app_name=self.config.asterisk.app_name)
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            await asyncio.gather(self._monitor_task, return_exceptions=True)
+            self._monitor_task = None
+        await self.ari_client.disconnect()
+        running = [process for process in self.processes if process is not None and process.is_alive()]
+        for process in running:
+            process.terminate()  # SIGTERM: the worker's engine cleans up its calls
+        deadline = time.monotonic() + self.shutdown_timeout_sec
+        for process in running:
+            await asyncio.to_thread(process.join, max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning("Worker did not stop in time; killing", pid=process.pid)
+                process.kill()
+                await asyncio.to_thread(process.join, 5.0)
+        _WORKERS_ALIVE.set(0)
+        if self._health_runner:
+            await self._health_runner.cleanup()
+            self._health_runner = None
+        logger.info("Supervisor stopped")
+
+    def _spawn(self, index: int) -> None:
+        config = worker_config(self.config, index)
+        process = self._context.Process(
+            target=self._target,
+            args=(config, index, self.health_port + 1 + index),
+            name=f"ai-engine-w{index}",
+        )
+        process.start()
+        self.processes[index] = process
+        self._restart_at[index] = None
+        self.router.set_available(index, True)
+        logger.info("Worker started", worker=index, pid=process.pid, app_name=config.asterisk.app_name)
+
+    async def _monitor(self) -> None:
+        next_reconcile = time.monotonic() + _RECONCILE_INTERVAL_SEC
+        while not self._stopping:
+            now = time.monotonic()
+            for index, process in enumerate(self.processes):
+                if self._restart_at[index] is not None:
+                    if now >= self._restart_at[index]:
+                        self.restarts[index] += 1
+                        _WORKER_RESTARTS_TOTAL.labels(str(index)).inc()
+                        self._spawn(index)
+                    continue
+                if process is not None and not process.is_alive():
+                    logger.error("Worker exited", worker=index, pid=process.pid, exitcode=process.exitcode)
+                    self.router.set_available(index, False)
+                    self._restart_at[index] = now + self.restart_backoff_sec
+                    try:
+                        await self.router.release_worker(index)
+                    except Exception:
+                        logger.warning("Failed to release calls of exited worker", worker=index, exc_info=True)
+            _WORKERS_ALIVE.set(sum(1 for process in self.processes if process is not None and process.is_alive()))
+            if now >= next_reconcile and self.ari_client.running:
+                next_reconcile = now + _RECONCILE_INTERVAL_SEC
+                try:
+                    await self.router.reconcile()
+                except Exception:
+                    logger.debug("Shard reconcile failed", exc_info=True)
+            await asyncio.sleep(0.5)
+
+    def status(self) -> List[dict]:
+        return [
+            {
+                "worker": index,
+                "pid": process.pid if process is not None else None,
+                "alive": bool(process is not None and process.is_alive()),
+                "app_name": self.router.worker_apps[index],
+                "health_port": self.health_port + 1 + index,
+                "active_calls": self.router.active[index],
+                "restarts": self.restarts[index],
+            }
+            for index, process in enumerate(self.processes)
+        ]
+
+    async def _start_health_server(self) -> None:
+        try:
+            app = web.Application()
+            app.router.add_get('/live', self._live_handler)
+            app.router.add_get('/ready', self._ready_handler)
+            app.router.add_get('/health', self._health_handler)
+            app.router.add_get('/metrics', self._metrics_handler)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            host = os.getenv("HEALTH_HOST", "0.0.0.0")
+            site = web.TCPSite(runner, host, self.health_port)
+            await site.start()
+            self._health_runner = runner
+            logger.info("Supervisor health endpoint started", host=host, port=self.health_port)
+        except Exception as exc:
+            logger.error("Failed to start supervisor health endpoint", error=str(exc), exc_info=True)
+
+    async def _live_handler(self, request):
+        return web.Response(text="ok", status=200)
+
+    async def _ready_handler(self, request):
+        """200 once ARI is connected and at least one worker is running."""
+        workers_alive = sum(1 for worker in self.status() if worker["alive"])
+        ready = bool(self.ari_client.running) and workers_alive > 0
+        return web.json_response(
+            {"ari_connected": bool(self.ari_client.running), "workers_alive": workers_alive, "ready": ready},
+            status=200 if ready else 503,
+        )
+
+    async def _health_handler(self, request):
+        return web.json_response({
+            "status": "healthy",
+            "mode": "supervisor",
+            "ari_connected": bool(self.ari_client.running),
+            "active_calls": sum(self.router.active),
+            "workers": self.status(),
+        })
+
+    async def _metrics_handler(self, request):
+        """Supervisor metrics only; each worker exposes its own on its health port."""
+        return web.Response(body=generate_latest(), headers={"Content-Type": CONTENT_TYPE_LATEST})
+
+
+async def run_supervisor(config: AppConfig) -> None:
+    """Run the supervisor and its workers until SIGINT/SIGTERM."""
+    supervisor = EngineSupervisor(config)
+    shutdown_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, shutdown_event.set)
+    await supervisor.start()
+    await shutdown_event.wait()
+    await supervisor.stop()
+
+
+__all__ = ["EngineSupervisor", "run_supervisor", "worker_config"]
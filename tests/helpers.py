@@ -0,0 +1,74 @@
+"""Shared test utilities: condition polling and local stand-in servers on ephemeral ports."""
+
+import asyncio
+import json
+
+import websockets
+from aiohttp import web
+
+
+async def wait_for(predicate, timeout=5.0):
+    """Poll ``predicate`` until it is truthy; fail the test after ``timeout`` seconds."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+class StandInHttpServer:
+    """Local aiohttp server; subclasses register their handlers in ``add_routes``."""
+
+    def __init__(self):
+        self.port = None
+        self._runner = None
+
+    def add_routes(self, app: web.Application) -> None:
+        raise NotImplementedError
+
+    async def start(self) -> int:
+        app = web.Application()
+        self.add_routes(app)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+
+class StandInWebSocketServer:
+    """Local websocket server that records each connection's JSON messages."""
+
+    def __init__(self):
+        self.connections = []
+        self.port = None
+        self._server = None
+
+    async def _handler(self, websocket, path=None):
+        received = []
+        self.connections.append(received)
+        try:
+            async for message in websocket:
+                received.append(json.loads(message))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    async def __aenter__(self):
+        self._server = await websockets.serve(self._handler, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
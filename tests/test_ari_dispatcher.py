@@ -0,0 +1,142 @@
+import asyncio
+import json
+import random
+
+import pytest
+import websockets
+
+from src.ari_client import ARIClient
+from src.core.ari_dispatcher import AriEventDispatcher, event_key
+from src.core.call_setup import CallSetupPlan
+
+
+def _storm(channels=40, varsets=5, seed=7):
+    """StasisStart, ChannelVarset*, ChannelDtmfReceived, StasisEnd per channel, interleaved across channels."""
+    rng = random.Random(seed)
+    per_channel = []
+    for index in range(channels):
+        channel = {"id": f"1700000000.{index}", "name": f"PJSIP/trunk-{index:08x}", "state": "Up"}
+        events = [{"type": "StasisStart", "channel": channel, "args": []}]
+        events += [
+            {"type": "ChannelVarset", "channel": channel, "variable": f"VAR{n}", "value": str(n)} for n in range(varsets)
+        ]
+        events.append({"type": "ChannelDtmfReceived", "channel": channel, "digit": "5", "duration_ms": 120})
+        events.append({"type": "StasisEnd", "channel": channel})
+        for seq, event in enumerate(events):
+            event["seq"] = seq
+        per_channel.append(events)
+    storm = []
+    while any(per_channel):
+        events = rng.choice([events for events in per_channel if events])
+        storm.append(events.pop(0))
+    return storm
+
+
+async def _serve(messages):
+    async def handler(websocket, *args):
+        for message in messages:
+            await websocket.send(message)
+        await websocket.close()
+
+    server = await websockets.serve(handler, "127.0.0.1", 0)
+    return server, f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+@pytest.mark.asyncio
+async def test_event_storm_replay_is_ordered_per_channel_and_bounded():
+    storm = _storm()
+    server, url = await _serve([json.dumps(event) for event in storm] + ["not json"])
+    client = ARIClient("user", "pass", "http://127.0.0.1:8088/ari", "app", event_workers=4, event_queue_max=32)
+    seen = {}
+    running = 0
+    peak = {"running": 0, "pending": 0}
+    rng = random.Random(1)
+
+    async def record(event):
+        nonlocal running
+        running += 1
+        peak["running"] = max(peak["running"], running)
+        peak["pending"] = max(peak["pending"], client.dispatcher.pending)
+        await asyncio.sleep(rng.random() * 0.002)
+        seen.setdefault(event["channel"]["id"], []).append((event["type"], event["seq"]))
+        running -= 1
+
+    for event_type in ("StasisStart", "ChannelVarset", "ChannelDtmfReceived", "StasisEnd"):
+        client.add_event_handler(event_type, record)
+
+    client.websocket = await websockets.connect(url)
+    client.running = True
+    await asyncio.wait_for(client.start_listening(), 10)
+    await asyncio.wait_for(client.dispatcher.drain(), 10)
+
+    expected = {}
+    for event in storm:
+        expected.setdefault(event["channel"]["id"], []).append((event["type"], event["seq"]))
+    assert seen == expected
+    for events in seen.values():
+        assert events[0][0] == "StasisStart" and events[-1][0] == "StasisEnd"
+    assert 1 < peak["running"] <= 4
+    assert peak["pending"] <= 32
+
+    await client.disconnect()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_block_channel_queue():
+    handled = []
+
+    async def boom(event):
+        raise RuntimeError("handler bug")
+
+    async def record(event):
+        handled.append(event["type"])
+
+    dispatcher = AriEventDispatcher({"StasisStart": [boom, record], "StasisEnd": [record]}, workers=2)
+    channel = {"id": "c1"}
+    await dispatcher.dispatch({"type": "StasisStart", "channel": channel})
+    await dispatcher.dispatch({"type": "ChannelHangupRequest", "channel": channel})  # no handler: not queued
+    await dispatcher.dispatch({"type": "StasisEnd", "channel": channel})
+    await dispatcher.drain()
+    assert handled == ["StasisStart", "StasisEnd"]
+    await dispatcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_aborted_call_setup_does_not_kill_event_workers():
+    handled = []
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("session failed")
+
+    async def media_stasis_start(event):
+        plan = event["plan"]
+        await plan.wait("resolve")  # the media channel's StasisStart waits on caller setup
+
+    async def record(event):
+        handled.append(event["channel"]["id"])
+
+    dispatcher = AriEventDispatcher({"StasisStart": [media_stasis_start], "StasisEnd": [record]}, workers=2)
+    for index in range(4):
+        plan = CallSetupPlan(f"c{index}")
+        plan.step("session", fail)
+        plan.step("resolve", fail, after=("session",))  # cancelled, never run
+        await dispatcher.dispatch({"type": "StasisStart", "channel": {"id": f"as{index}"}, "plan": plan})
+        await asyncio.sleep(0)
+        with pytest.raises(RuntimeError):
+            await plan.run()
+    await asyncio.wait_for(dispatcher.drain(), 2)
+    assert all(not task.done() for task in dispatcher._tasks)
+    await dispatcher.dispatch({"type": "StasisEnd", "channel": {"id": "c9"}})
+    await asyncio.wait_for(dispatcher.drain(), 2)
+    assert handled == ["c9"]
+    await dispatcher.stop()
+
+
+def test_event_key_prefers_channel_then_playback_target_then_bridge():
+    assert event_key({"channel": {"id": "c1"}, "bridge": {"id": "b1"}}) == "channel:c1"
+    assert event_key({"playback": {"id": "p1", "target_uri": "bridge:b1"}}) == "bridge:b1"
+    assert event_key({"bridge": {"id": "b2"}}) == "bridge:b2"
+    assert event_key({"type": "ApplicationReplaced"}) == ""
@@ -0,0 +1,164 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from src.ari_client import ARIClient
+from src.config import AppConfig
+from src.core.http_client import get_http_client_manager
+from src.core.models import CallSession, PlaybackRef
+from src.engine import Engine
+from tests.helpers import StandInHttpServer, wait_for
+
+
+class _FakeAsterisk(StandInHttpServer):
+    """ARI REST + events websocket; ``drop()`` closes the websocket, ``refuse`` rejects reconnects."""
+
+    def __init__(self):
+        super().__init__()
+        self.channels = set()
+        self.bridges = set()
+        self.playbacks = set()
+        self.subscription_posts = []
+        self.connections = 0
+        self.refuse = 0
+        self.sockets = []
+
+    async def events(self, request):
+        if self.refuse:
+            self.refuse -= 1
+            return web.Response(status=503)
+        self.connections += 1
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.sockets.append(ws)
+        async for _ in ws:
+            pass
+        return ws
+
+    async def rest(self, request):
+        path = request.match_info["tail"]
+        if request.method == "GET" and path == "channels":
+            return web.json_response([{"id": channel_id} for channel_id in sorted(self.channels)])
+        if request.method == "GET" and path == "asterisk/info":
+            return web.json_response({"system": {"version": "20"}})
+        if request.method == "GET" and path == "bridges":
+            return web.json_response([{"id": bridge_id} for bridge_id in sorted(self.bridges)])
+        if request.method == "GET" and path.startswith("playbacks/"):
+            playback_id = path.split("/", 1)[1]
+            if playback_id not in self.playbacks:
+                return web.Response(status=404)
+            return web.json_response({"id": playback_id})
+        if path.endswith("/subscription") and request.method == "POST":
+            self.subscription_posts.append(request.query["eventSource"])
+        return web.Response(status=204)
+
+    async def send(self, event):
+        await self.sockets[-1].send_json(event)
+
+    async def drop(self):
+        await self.sockets[-1].close()
+
+    def add_routes(self, app):
+        app.router.add_get("/ari/events", self.events)
+        app.router.add_route("*", "/ari/{tail:.*}", self.rest)
+
+    async def start(self):
+        return f"http://127.0.0.1:{await super().start()}/ari"
+
+
+@pytest.mark.asyncio
+async def test_reconnects_with_backoff_and_resubscribes():
+    asterisk = _FakeAsterisk()
+    url = await asterisk.start()
+    client = ARIClient("u", "p", url, "app", reconnect_backoff_min_sec=0.02, reconnect_backoff_max_sec=0.05)
+    seen = []
+    reconnected = asyncio.Event()
+
+    async def on_varset(event):
+        seen.append(event["value"])
+
+    async def on_reconnect():
+        reconnected.set()
+
+    client.add_event_handler("ChannelVarset", on_varset)
+    client.on_reconnect(on_reconnect)
+    await client.connect()
+    assert client.http_session.connector is not get_http_client_manager().connector  # own REST pool
+    runner = asyncio.create_task(client.run())
+    client.subscribe("channel:c1", "bridge:b1")
+    await wait_for(lambda: asterisk.sockets and asterisk.subscription_posts)
+
+    await asterisk.send({"type": "ChannelVarset", "channel": {"id": "c1"}, "value": "before"})
+    await wait_for(lambda: seen == ["before"])
+    asterisk.refuse = 2  # two failed attempts before the reconnect succeeds
+    await asterisk.drop()
+    await asyncio.wait_for(reconnected.wait(), 5)
+    assert asterisk.connections == 2 and asterisk.refuse == 0
+    await wait_for(lambda: len(asterisk.subscription_posts) == 2)
+    assert asterisk.subscription_posts[-1] == "bridge:b1,channel:c1"
+
+    await asterisk.send({"type": "ChannelVarset", "channel": {"id": "c1"}, "value": "after"})
+    await wait_for(lambda: seen == ["before", "after"])
+
+    await client.disconnect()
+    await asyncio.wait_for(runner, 5)
+    await asterisk.stop()
+
+
+@pytest.mark.asyncio
+async def test_resync_cleans_up_sessions_whose_channels_vanished():
+    asterisk = _FakeAsterisk()
+    url = await asterisk.start()
+    engine = Engine(AppConfig(
+        default_provider="local",
+        providers={"local": {"enabled": True}},
+        asterisk={
+            "host": "127.0.0.1", "username": "u", "password": "p", "app_name": "app",
+            "reconnect_backoff_min_sec": 0.02, "reconnect_backoff_max_sec": 0.05,
+        },
+        llm={"initial_greeting": "hi", "prompt": "You are helpful", "model": "gpt-4o"},
+        audio_transport="audiosocket",
+    ))
+    client = engine.ari_client = ARIClient(
+        "u", "p", url, "app", reconnect_backoff_min_sec=0.02, reconnect_backoff_max_sec=0.05
+    )
+    resynced = asyncio.Event()
+
+    async def resync():
+        await engine._resync_ari_state()
+        resynced.set()
+
+    client.on_reconnect(resync)
+    asterisk.channels = {"alive", "alive-as", "gone"}
+    asterisk.bridges = {"bridge-alive", "bridge-gone"}
+    asterisk.playbacks = {"pb-playing", "pb-finished"}
+    await engine.session_store.upsert_call(CallSession(
+        call_id="alive", caller_channel_id="alive", audiosocket_channel_id="alive-as", bridge_id="bridge-alive",
+    ))
+    await engine.session_store.upsert_call(CallSession(
+        call_id="gone", caller_channel_id="gone", bridge_id="bridge-gone",
+    ))
+    for playback_id in ("pb-playing", "pb-finished"):
+        await engine.session_store.add_playback(PlaybackRef(
+            playback_id=playback_id, call_id="alive", channel_id="alive",
+            bridge_id="bridge-alive", media_uri="sound:x", audio_file="",
+        ))
+    await client.connect()
+    runner = asyncio.create_task(client.run())
+    await wait_for(lambda: asterisk.sockets)
+
+    # Caller "gone" hangs up and its PlaybackFinished is lost while the websocket is down.
+    asterisk.channels.discard("gone")
+    asterisk.bridges.discard("bridge-gone")
+    asterisk.playbacks.discard("pb-finished")
+    await asterisk.drop()
+    await asyncio.wait_for(resynced.wait(), 5)
+
+    assert await engine.session_store.get_by_call_id("gone") is None
+    assert await engine.session_store.get_by_call_id("alive") is not None
+    assert await engine.session_store.list_playbacks_for_call("alive") == ["pb-playing"]
+
+    await client.disconnect()
+    await asyncio.wait_for(runner, 5)
+    await asterisk.stop()
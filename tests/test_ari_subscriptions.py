@@ -0,0 +1,50 @@
+import pytest
+
+from src.ari_client import ARIClient
+
+
+def _client(statuses=None, **kwargs):
+    client = ARIClient("user", "pass", "http://127.0.0.1:8088/ari", "ai app", **kwargs)
+    calls = []
+
+    async def send_command(method, resource, data=None, params=None, tolerate_statuses=None):
+        calls.append((method, resource, params["eventSource"]))
+        return {"status": (statuses or {}).get(params["eventSource"], 204)}
+
+    client.send_command = send_command
+    return client, calls
+
+
+@pytest.mark.asyncio
+async def test_changes_in_one_iteration_are_sent_as_one_request():
+    client, calls = _client()
+    assert "subscribeAll=false" in client.ws_url
+
+    client.subscribe("channel:c1")
+    client.subscribe("bridge:b1", "channel:c1")
+    await client.flush_subscriptions()
+    assert calls == [("POST", "applications/ai%20app/subscription", "bridge:b1,channel:c1")]
+
+    client.subscribe("channel:c2")
+    client.unsubscribe("channel:c2", "channel:c1", "bridge:b1", "channel:unknown")
+    await client.flush_subscriptions()
+    # c2 never reached Asterisk, so only the two live subscriptions are removed.
+    assert calls[1:] == [("DELETE", "applications/ai%20app/subscription", "bridge:b1,channel:c1")]
+    assert client.subscriptions == set()
+
+
+@pytest.mark.asyncio
+async def test_batch_with_vanished_source_is_retried_per_source():
+    client, calls = _client(statuses={"channel:gone,channel:live": 422, "channel:gone": 422})
+    client.subscribe("channel:live", "channel:gone")
+    await client.flush_subscriptions()
+    assert [call[2] for call in calls] == ["channel:gone,channel:live", "channel:gone", "channel:live"]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_all_mode_skips_explicit_subscriptions():
+    client, calls = _client(subscribe_all=True)
+    assert "subscribeAll=true" in client.ws_url
+    client.subscribe("channel:c1")
+    await client.flush_subscriptions()
+    assert calls == [] and client.subscriptions == set()
@@ -0,0 +1,62 @@
+from src.audio.dtx import UplinkDTX
+
+_FRAME = 640  # 20 ms of PCM16 @ 16 kHz
+
+
+def _tone_frame(amplitude: int = 6000) -> bytes:
+    return b"".join(
+        (amplitude if (i // 8) % 2 else -amplitude).to_bytes(2, "little", signed=True)
+        for i in range(_FRAME // 2)
+    )
+
+
+_SILENCE = b"\x00\x00" * (_FRAME // 2)
+_SPEECH = _tone_frame()
+
+
+def _run(gate: UplinkDTX, frames):
+    sent = []
+    for frame in frames:
+        sent.append(gate.process(frame, frame, 16000))
+    return sent
+
+
+def test_dtx_sends_speech_and_hangover_then_suppresses():
+    gate = UplinkDTX(hangover_ms=100, preroll_ms=40, use_webrtc=False)
+    frames = [_SPEECH] * 5 + [_SILENCE] * 50
+    sent = _run(gate, frames)
+
+    assert all(out == [_SPEECH] for out in sent[:5])
+    # 100 ms hangover = five silent frames still forwarded for server-side VAD.
+    assert all(out == [_SILENCE] for out in sent[5:10])
+    assert all(out == [] for out in sent[10:])
+    assert gate.talkspurts == 1
+    assert gate.bytes_saved == 43 * _FRAME  # 45 suppressed minus 2 frames held as pre-roll
+    assert 0.7 < gate.suppressed_ratio < 0.8
+
+
+def test_dtx_replays_preroll_on_speech_resume():
+    gate = UplinkDTX(hangover_ms=20, preroll_ms=40, use_webrtc=False)
+    _run(gate, [_SPEECH, _SILENCE] + [_SILENCE] * 10)
+    resumed = gate.process(_SPEECH, _SPEECH, 16000)
+
+    assert resumed == [_SILENCE, _SILENCE, _SPEECH]
+    assert gate.talkspurts == 2
+
+
+def test_dtx_keepalive_forwards_periodic_comfort_frames():
+    gate = UplinkDTX(hangover_ms=0, keepalive_ms=200, preroll_ms=0, use_webrtc=False)
+    sent = _run(gate, [_SILENCE] * 50)
+
+    assert sum(1 for out in sent if out) == 5
+    assert gate.keepalives == 5
+
+
+def test_dtx_turn_latency_measured_once_from_last_voiced_frame():
+    gate = UplinkDTX(hangover_ms=40, use_webrtc=False)
+    assert gate.take_turn_latency() is None
+    _run(gate, [_SPEECH] * 3 + [_SILENCE] * 10)
+
+    latency = gate.take_turn_latency()
+    assert latency is not None and 0.0 <= latency < 1.0
+    assert gate.take_turn_latency() is None  # one sample per caller turn
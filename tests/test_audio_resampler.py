@@ -1,7 +1,12 @@
 import audioop
+import base64
+import json
+
 import pytest
 
 from src.audio import (
+    Base64JSONFieldDecoder,
+    StreamingAudioConverter,
     convert_pcm16le_to_target_format,
     mulaw_to_pcm16le,
     pcm16le_to_mulaw,
@@ -32,4 +37,26 @@ def test_resample_identity_when_rates_match():
 def test_convert_pcm_to_ulaw_format():
     pcm = b"\x01\x02" * 160
     ulaw = convert_pcm16le_to_target_format(pcm, "ulaw")
-    assert len(ulaw) == len(pcm) // 2  # μ-law is 1 byte per sample
\ No newline at end of file
+    assert len(ulaw) == len(pcm) // 2  # μ-law is 1 byte per sample
+
+def test_streaming_converter_matches_whole_buffer_resample():
+    pcm = bytes(range(256)) * 25
+    converter = StreamingAudioConverter("linear16", 16000, "mulaw", 8000, 20)
+    frames = []
+    for idx in range(0, len(pcm), 333):  # odd sizes split samples
+        frames.extend(converter.feed(pcm[idx : idx + 333]))
+    frames.extend(converter.flush())
+
+    resampled, _ = resample_audio(pcm, 16000, 8000)
+    assert b"".join(frames) == convert_pcm16le_to_target_format(resampled, "mulaw")
+    assert all(len(frame) == 160 for frame in frames[:-1])
+
+
+def test_base64_field_decoder_handles_split_json():
+    audio = bytes(range(200)) * 3
+    body = json.dumps({"meta": "audioContent", "audioContent": base64.b64encode(audio).decode("ascii")}).encode()
+    for step in (1, 5, 64, len(body)):
+        decoder = Base64JSONFieldDecoder(["audioContent"])
+        decoded = b"".join(decoder.feed(body[i : i + step]) for i in range(0, len(body), step))
+        assert decoded + decoder.finish() == audio
+        assert decoder.found
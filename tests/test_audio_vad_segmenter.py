@@ -0,0 +1,72 @@
+from src.audio import UtteranceSegmenter
+
+_FRAME = 640  # 20 ms of PCM16 @ 16 kHz
+
+
+def _tone(frames: int, amplitude: int = 6000) -> bytes:
+    samples = 320 * frames
+    return b"".join(
+        (amplitude if (i // 8) % 2 else -amplitude).to_bytes(2, "little", signed=True)
+        for i in range(samples)
+    )
+
+
+def _silence(frames: int) -> bytes:
+    return b"\x00\x00" * 320 * frames
+
+
+def _segmenter(**overrides) -> UtteranceSegmenter:
+    params = dict(use_webrtc=False, start_frames=2, end_silence_frames=5, padding_ms=60, min_speech_ms=100)
+    params.update(overrides)
+    return UtteranceSegmenter(**params)
+
+
+def test_segmenter_emits_padded_utterance_and_drops_silence():
+    segmenter = _segmenter()
+    audio = _silence(20) + _tone(10) + _silence(20)
+
+    utterances = []
+    for idx in range(0, len(audio), 999):  # arbitrary, frame-misaligned chunks
+        utterances.extend(segmenter.feed(audio[idx : idx + 999]))
+    utterances.extend(segmenter.flush())
+
+    assert len(utterances) == 1
+    # 3 padding frames before, 10 speech frames, 3 padding frames after.
+    assert len(utterances[0]) == (3 + 10 + 3) * _FRAME
+    assert segmenter.utterances == 1
+    assert segmenter.speech_ratio == 10 / 50
+    assert segmenter.dropped_bytes == (50 - 16) * _FRAME
+
+
+def test_segmenter_ignores_short_blips_and_pure_silence():
+    segmenter = _segmenter()
+    assert segmenter.feed(_silence(30) + _tone(3) + _silence(30)) == []
+    assert segmenter.flush() == []
+    assert segmenter.utterances == 0
+
+
+def test_segmenter_splits_long_speech_at_max_length():
+    segmenter = _segmenter(max_utterance_ms=400)
+    utterances = segmenter.feed(_tone(50))
+    utterances.extend(segmenter.flush())
+
+    assert len(utterances) >= 2
+    assert all(len(u) <= 20 * _FRAME for u in utterances)
+    assert sum(len(u) for u in utterances) == 50 * _FRAME
+
+
+def test_segmenter_from_config_applies_overrides():
+    class _VAD:
+        webrtc_aggressiveness = 2
+        webrtc_start_frames = 4
+        webrtc_end_silence_frames = 30
+        utterance_padding_ms = 100
+        max_utterance_duration_ms = 8000
+
+    segmenter = UtteranceSegmenter.from_config(_VAD(), {"end_silence_frames": 12, "bogus": 1})
+    assert segmenter._start_frames == 4
+    assert segmenter._end_silence_frames == 12
+    assert segmenter._padding_frames == 5
+
+    # The legacy utterance end-of-silence (here 30 frames) does not set the turn end.
+    assert UtteranceSegmenter.from_config(_VAD())._end_silence_frames == 25
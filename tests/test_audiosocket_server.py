@@ -0,0 +1,247 @@
+import asyncio
+import socket
+import uuid
+
+import pytest
+
+from src.audio import audiosocket_server
+from src.audio.audiosocket_server import TYPE_AUDIO, TYPE_UUID, AudioSocketServer
+
+
+async def _server(**kwargs):
+    bound = []
+
+    async def on_uuid(conn_id, uuid_str):
+        bound.append(conn_id)
+        return True
+
+    async def on_audio(conn_id, payload):
+        return None
+
+    server = AudioSocketServer("127.0.0.1", 0, on_uuid=on_uuid, on_audio=on_audio, **kwargs)
+    await server.start()
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    writer.write(bytes([TYPE_UUID]) + (16).to_bytes(2, "big") + uuid.uuid4().bytes)
+    await writer.drain()
+    while not bound:
+        await asyncio.sleep(0.005)
+    return server, bound[0], reader, writer
+
+
+async def _read_frames(reader, count):
+    frames = []
+    for _ in range(count):
+        header = await asyncio.wait_for(reader.readexactly(3), 2)
+        frames.append((header[0], await reader.readexactly(int.from_bytes(header[1:], "big"))))
+    return frames
+
+
+@pytest.mark.asyncio
+async def test_queued_frames_are_framed_in_order():
+    server, conn_id, reader, writer = await _server()
+    payloads = [bytes([i]) * 320 for i in range(5)] + [b"\x01" * 7]
+    for payload in payloads:
+        assert await server.send_audio(conn_id, payload)
+    assert await _read_frames(reader, len(payloads)) == [(TYPE_AUDIO, p) for p in payloads]
+    writer.close()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_peer_drops_oldest_frames_without_stalling_sender():
+    server, conn_id, reader, writer = await _server(send_queue_frames=4, send_high_water_bytes=1024)
+    writer.transport.pause_reading()
+    outbound = server._outbound[conn_id]
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for index in range(3000):
+        assert server.queue_audio(conn_id, index.to_bytes(2, "big") * 160)
+        if index % 50 == 0:
+            await asyncio.sleep(0)
+    assert loop.time() - started < 1.0
+    assert outbound.dropped > 0
+    assert len(outbound.frames) <= 8  # header + payload per frame
+
+    writer.close()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_writer_waits_once_for_drain_below_default_buffer_limit():
+    server, conn_id, reader, writer = await _server(send_queue_frames=4, send_high_water_bytes=4096)
+    writer.transport.pause_reading()
+    connection = server._writers[conn_id]
+    connection.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+    assert connection.transport.get_write_buffer_limits()[1] == 4096
+    stalls_before = audiosocket_server._AUDIO_TX_STALLED._value.get()
+
+    for index in range(5000):  # until the socket buffers are full
+        if connection._write_paused:
+            break
+        server.queue_audio(conn_id, index.to_bytes(2, "big") * 160)
+        await asyncio.sleep(0)
+    for index in range(200):  # keep sending to the congested peer
+        server.queue_audio(conn_id, index.to_bytes(2, "big") * 160)
+        await asyncio.sleep(0)
+
+    # The writer parks in drain() until the peer reads instead of re-arming every iteration.
+    assert connection._write_paused
+    assert audiosocket_server._AUDIO_TX_STALLED._value.get() - stalls_before <= 2
+
+    writer.close()
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_send_to_unknown_connection_fails():
+    server, conn_id, reader, writer = await _server()
+    assert not await server.send_audio("missing", b"\x00" * 320)
+    writer.close()
+    await server.stop()
+
+
+class _Transport:
+    def __init__(self):
+        self.paused = False
+
+    def pause_reading(self):
+        self.paused = True
+
+    def resume_reading(self):
+        self.paused = False
+
+    def is_closing(self):
+        return False
+
+
+class _ParserHost:
+    def _connection_made(self, connection):
+        return None
+
+
+def _feed(connection, data, chunk):
+    for offset in range(0, len(data), chunk):
+        piece = data[offset:offset + chunk]
+        buf = connection.get_buffer(len(piece))
+        n = min(len(buf), len(piece))
+        buf[:n] = piece[:n]
+        connection.buffer_updated(n)
+        if n < len(piece):
+            _feed(connection, piece[n:], chunk)
+
+
+def _tlv(msg_type, payload):
+    return bytes([msg_type]) + len(payload).to_bytes(2, "big") + payload
+
+
+@pytest.mark.asyncio
+async def test_protocol_parses_split_and_coalesced_frames_into_batches():
+    from src.audio.audiosocket_server import _AudioSocketConnection
+
+    connection = _AudioSocketConnection(_ParserHost(), buffer_size=1024)
+    connection.connection_made(_Transport())
+    frames = [_tlv(TYPE_AUDIO, bytes([i]) * 320) for i in range(6)]
+    stream = b"".join(frames)
+
+    _feed(connection, stream[:700], 700)  # two whole frames and part of the third
+    batch = await connection.next_batch()
+    assert [(t, bytes(p)) for t, p in batch] == [(TYPE_AUDIO, bytes([0]) * 320), (TYPE_AUDIO, bytes([1]) * 320)]
+
+    # Views stay valid while the batch is outstanding, even when later reads need a new buffer.
+    _feed(connection, stream[700:], 100)
+    seen = [bytes(p) for _, p in batch]
+    rest = []
+    while connection._batches:
+        rest.extend(bytes(p) for _, p in await connection.next_batch())
+        connection.release()
+    connection.release()
+    assert seen == [bytes([0]) * 320, bytes([1]) * 320]
+    assert rest == [bytes([i]) * 320 for i in range(2, 6)]
+    assert connection._start == connection._end == 0
+
+
+@pytest.mark.asyncio
+async def test_frame_larger_than_receive_buffer_is_reassembled():
+    from src.audio.audiosocket_server import _AudioSocketConnection
+
+    connection = _AudioSocketConnection(_ParserHost(), buffer_size=256)
+    connection.connection_made(_Transport())
+    payload = bytes(range(256)) * 4
+    _feed(connection, _tlv(TYPE_AUDIO, payload), 64)
+    batch = await connection.next_batch()
+    assert bytes(batch[0][1]) == payload
+
+
+@pytest.mark.asyncio
+async def test_audio_batch_callback_receives_memoryviews():
+    received = []
+
+    async def on_uuid(conn_id, uuid_str):
+        return True
+
+    async def on_audio(conn_id, payload):
+        raise AssertionError("batch consumer should be used")
+
+    async def on_audio_batch(conn_id, frames):
+        assert all(isinstance(frame, memoryview) for frame in frames)
+        received.extend(bytes(frame) for frame in frames)
+
+    server = AudioSocketServer("127.0.0.1", 0, on_uuid=on_uuid, on_audio=on_audio, on_audio_batch=on_audio_batch)
+    await server.start()
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    payloads = [bytes([i]) * 160 for i in range(10)]
+    writer.write(_tlv(TYPE_UUID, uuid.uuid4().bytes) + b"".join(_tlv(TYPE_AUDIO, p) for p in payloads))
+    await writer.drain()
+    for _ in range(100):
+        if len(received) == len(payloads):
+            break
+        await asyncio.sleep(0.01)
+    assert received == payloads
+    writer.close()
+    await server.stop()
+
+
+class _RecordingProvider:
+    def __init__(self):
+        self.frames = []
+
+    async def send_audio(self, frame):
+        self.frames.append(frame)
+
+
+@pytest.mark.asyncio
+async def test_engine_batch_handler_resolves_session_once_and_copies_forwarded_frames():
+    from src.config import AppConfig
+    from src.core.models import CallSession
+    from src.engine import Engine
+
+    engine = Engine(AppConfig(
+        default_provider="fake",
+        providers={"fake": {"enabled": True}},
+        asterisk={"host": "127.0.0.1", "username": "u", "password": "p", "app_name": "ai-voice-agent"},
+        llm={"initial_greeting": "hi", "prompt": "You are helpful", "model": "gpt-4o"},
+        audio_transport="audiosocket",
+    ))
+    provider = engine.providers["fake"] = _RecordingProvider()
+    await engine.session_store.upsert_call(
+        CallSession(call_id="caller-1", caller_channel_id="caller-1", provider_name="fake", audio_capture_enabled=True)
+    )
+    engine.conn_to_channel["conn-1"] = "caller-1"
+    lookups = []
+    get_by_call_id = engine.session_store.get_by_call_id
+
+    async def counting_get(call_id):
+        lookups.append(call_id)
+        return await get_by_call_id(call_id)
+
+    engine.session_store.get_by_call_id = counting_get
+
+    receive_buffer = bytearray(bytes([1]) * 160 + bytes([2]) * 160)
+    view = memoryview(receive_buffer)
+    await engine._audiosocket_handle_audio_batch("conn-1", [view[:160], view[160:]])
+    receive_buffer[:] = bytes(320)  # the server reuses its buffer once the callback returns
+
+    assert lookups == ["caller-1"]
+    assert provider.frames == [bytes([1]) * 160, bytes([2]) * 160]
+    assert all(type(frame) is bytes for frame in provider.frames)
@@ -0,0 +1,101 @@
+import pytest
+
+from src.core.bridge_pool import BridgePool
+from tests.helpers import wait_for
+
+
+class _FakeARI:
+    """In-memory bridges/channels with the ARIClient calls the pool uses."""
+
+    def __init__(self):
+        self.bridges = {}
+        self.channels = set()
+        self.handlers = {}
+        self.created = 0
+
+    def add_event_handler(self, event_type, handler):
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, *sources):
+        pass
+
+    async def create_bridge(self, bridge_type="mixing"):
+        self.created += 1
+        bridge_id = f"bridge-{self.created}"
+        self.bridges[bridge_id] = set()
+        return bridge_id
+
+    async def create_external_media(self):
+        channel_id = f"em-{self.created}"
+        self.channels.add(channel_id)
+        return channel_id
+
+    async def add_channel_to_bridge(self, bridge_id, channel_id):
+        self.bridges[bridge_id].add(channel_id)
+        return True
+
+    async def send_command(self, method, resource, data=None, params=None, tolerate_statuses=None):
+        bridge_id = resource.split("/")[1]
+        if bridge_id not in self.bridges:
+            return {"status": 404}
+        return {"id": bridge_id, "channels": sorted(self.bridges[bridge_id])}
+
+    async def destroy_bridge(self, bridge_id):
+        self.bridges.pop(bridge_id, None)
+        return True
+
+    async def hangup_channel(self, channel_id):
+        self.channels.discard(channel_id)
+        for members in self.bridges.values():
+            members.discard(channel_id)
+
+
+@pytest.mark.asyncio
+async def test_pool_prefills_hands_out_and_refills_with_external_media():
+    ari = _FakeARI()
+    pool = BridgePool(ari, size=2, create_external_media=ari.create_external_media)
+    await pool.start()
+    await wait_for(lambda: pool.idle_count == 2)
+
+    entry = pool.acquire()
+    assert entry.external_media_id in ari.bridges[entry.bridge_id]
+    assert not pool.owns_channel(entry.external_media_id)  # the call owns it now
+    await wait_for(lambda: pool.idle_count == 2)
+    assert ari.created == 3 and pool.hits == 1
+
+    await pool.stop()
+    assert list(ari.bridges) == [entry.bridge_id]  # idle ones were torn down, the call's was not
+    assert ari.channels == {entry.external_media_id}
+
+
+@pytest.mark.asyncio
+async def test_health_check_and_destroy_events_discard_stale_entries():
+    ari = _FakeARI()
+    pool = BridgePool(ari, size=3, create_external_media=ari.create_external_media)
+    await pool.start()
+    await wait_for(lambda: pool.idle_count == 3)
+    first, second, third = list(pool._idle)
+
+    del ari.bridges[first.bridge_id]                 # bridge vanished (e.g. Asterisk restart)
+    ari.bridges[second.bridge_id].add("intruder")    # no longer idle
+    assert await pool.check() == 2
+    assert list(pool._idle) == [third]
+
+    await ari.handlers["ChannelDestroyed"][0]({"type": "ChannelDestroyed", "channel": {"id": third.external_media_id}})
+    assert third.bridge_id not in ari.bridges
+    await wait_for(lambda: pool.idle_count == 3)
+    assert not {first.bridge_id, second.bridge_id, third.bridge_id} & {entry.bridge_id for entry in pool._idle}
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_empty_or_expired_pool_is_a_miss():
+    ari = _FakeARI()
+    pool = BridgePool(ari, size=1, idle_timeout_sec=1.0)
+    await pool.start()
+    await wait_for(lambda: pool.idle_count == 1)
+    pool._idle[0].created_at -= 5
+    assert pool.acquire() is None and pool.misses == 1
+    await wait_for(lambda: pool.idle_count == 1)
+    assert pool.acquire() is not None
+    await pool.stop()
@@ -0,0 +1,145 @@
+import asyncio
+import time
+
+import pytest
+
+from src.config import AppConfig
+from src.core.call_setup import CallSetupPlan, get_call_setup
+from src.engine import Engine
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_overlap_and_dependencies_are_respected():
+    plan = CallSetupPlan("c1")
+    order = []
+
+    def step(name, delay, value=None):
+        async def run():
+            order.append(("start", name))
+            await asyncio.sleep(delay)
+            order.append(("end", name))
+            return value
+
+        return run
+
+    plan.step("a", step("a", 0.05, "A"))
+    plan.step("b", step("b", 0.05))
+    plan.step("c", step("c", 0.01), after=("a", "b"))
+    started = time.monotonic()
+    await plan.run()
+    assert time.monotonic() - started < 0.1
+    assert order.index(("start", "c")) > max(order.index(("end", "a")), order.index(("end", "b")))
+    assert plan.result("a") == "A" and await plan.wait("a") == "A"
+    assert set(plan.timeline) == {"a", "b", "c"}
+    assert plan.timeline["c"][0] >= plan.timeline["a"][1]
+
+    with pytest.raises(ValueError):
+        plan.step("d", step("d", 0), after=("missing",))
+
+
+@pytest.mark.asyncio
+async def test_first_failure_cancels_remaining_steps_and_fails_waiters():
+    plan = CallSetupPlan("c1")
+    cancelled = asyncio.Event()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("bridge failed")
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def never():
+        raise AssertionError("depends on a failed step")
+
+    plan.step("bridge", fail)
+    plan.step("answer", slow)
+    plan.step("session", never, after=("bridge",))
+    waiter = asyncio.create_task(plan.wait("session"))
+    with pytest.raises(RuntimeError, match="bridge failed"):
+        await plan.run()
+    assert cancelled.is_set()
+    with pytest.raises(RuntimeError, match="aborted"):
+        await waiter
+
+
+class _FakeARI:
+    """Answers after ``latency`` seconds and tracks how many requests overlap."""
+
+    def __init__(self, latency=0.02):
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = []
+
+    async def _request(self, name):
+        self.calls.append(name)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+
+    def subscribe(self, *sources):
+        pass
+
+    async def answer_channel(self, channel_id):
+        await self._request("answer")
+
+    async def create_bridge(self, bridge_type="mixing"):
+        await self._request("create_bridge")
+        return "bridge-1"
+
+    async def add_channel_to_bridge(self, bridge_id, channel_id):
+        await self._request(f"add:{channel_id}")
+        return True
+
+    async def send_command(self, method, resource, data=None, params=None, tolerate_statuses=None):
+        if resource.endswith("/variable"):
+            await self._request("get_var")
+            return {"value": ""}
+        await self._request("originate")
+        return {"id": "as-1"}
+
+
+@pytest.mark.asyncio
+async def test_caller_setup_runs_ari_requests_concurrently():
+    engine = Engine(AppConfig(
+        default_provider="local",
+        providers={"local": {"enabled": True}},
+        asterisk={"host": "127.0.0.1", "username": "u", "password": "p", "app_name": "ai-voice-agent"},
+        llm={"initial_greeting": "hi", "prompt": "You are helpful", "model": "gpt-4o"},
+        audio_transport="audiosocket",
+    ))
+    ari = engine.ari_client = _FakeARI()
+    provider_started = []
+
+    async def start_provider_session(call_id):
+        provider_started.append((ari.calls.copy(), ari.in_flight))
+
+    engine._start_provider_session = start_provider_session
+
+    started = time.monotonic()
+    await engine._handle_caller_stasis_start_hybrid("caller-1", {"caller": {}})
+    elapsed = time.monotonic() - started
+    # answer, create_bridge and get_var overlap; then add caller and originate overlap.
+    assert ari.peak >= 3
+    assert elapsed < 4 * ari.latency
+    session = await engine.session_store.get_by_call_id("caller-1")
+    assert session.bridge_id == "bridge-1" and session.audiosocket_uuid
+
+    plan = get_call_setup("caller-1")
+    await engine._handle_audiosocket_channel_stasis_start("as-1", {"name": "AudioSocket/as-1"})
+    assert "add:as-1" in ari.calls and provider_started
+    # The provider session started before the media channel finished joining the bridge.
+    calls_before, in_flight = provider_started[0]
+    assert "add:caller-1" in calls_before and "add:as-1" in calls_before and in_flight == 1
+    assert {"answer", "bridge", "caller_to_bridge", "transport", "media_to_bridge", "provider_session"} <= set(
+        plan.timeline
+    )
+
+    await engine._cleanup_call("caller-1")
+    assert get_call_setup("caller-1") is None
@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from src.config import HttpClientConfig
+from src.core.http_client import HttpClientManager
+from tests.helpers import StandInHttpServer
+
+
+class _StandInServer(StandInHttpServer):
+    """Records the peer port of every request."""
+
+    def __init__(self):
+        super().__init__()
+        self.peers = []
+
+    async def _handler(self, request):
+        self.peers.append(request.transport.get_extra_info("peername")[1])
+        return web.Response(text="ok")
+
+    def add_routes(self, app):
+        app.router.add_route("*", "/{tail:.*}", self._handler)
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_keepalive_pool_across_adapters():
+    async with _StandInServer() as server:
+        manager = HttpClientManager(HttpClientConfig())
+        url = f"http://127.0.0.1:{server.port}/v1/transcribe"
+
+        first = manager.session()
+        async with first.get(url) as response:
+            assert await response.text() == "ok"
+        # An adapter closing its own session must not tear down the shared pool.
+        await first.close()
+        assert not manager.connector.closed
+
+        second = manager.session()
+        async with second.get(url) as response:
+            await response.read()
+        await second.close()
+
+        assert len(server.peers) == 2
+        assert server.peers[0] == server.peers[1]  # same TCP connection reused
+
+        await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_preconnect_warms_each_origin_once():
+    async with _StandInServer() as server:
+        manager = HttpClientManager(HttpClientConfig())
+        origin = f"http://127.0.0.1:{server.port}"
+
+        warmed = await manager.preconnect(
+            [f"{origin}/v1/a", f"{origin}/v1/b", "wss://ignored.example/ws", "not a url"]
+        )
+        assert warmed == [origin]
+        assert len(server.peers) == 1
+
+        session = manager.session()
+        async with session.post(f"{origin}/v1/a") as response:
+            await response.read()
+        await session.close()
+        assert server.peers[1] == server.peers[0]  # first real request rides the warm connection
+
+        await manager.close()
+
+
+def test_connector_left_on_a_previous_loop_is_closed():
+    manager = HttpClientManager(HttpClientConfig())
+
+    async def current_connector():
+        connector = manager.connector
+        await asyncio.sleep(0)  # let a retired connector's close run
+        return connector
+
+    old = asyncio.run(current_connector())
+    new = asyncio.run(current_connector())
+    assert new is not old
+    assert old.closed and not new.closed
+
+
+def test_preconnect_is_opt_in():
+    # Warming sends HEAD / to every provider origin, including customer webhooks.
+    assert HttpClientConfig().preconnect is False
@@ -0,0 +1,71 @@
+import asyncio
+import os
+import time
+import wave
+
+import pytest
+
+from src.ari_client import ARIClient
+from src.core.media_io import LoopLagMonitor, MediaIO
+
+
+@pytest.mark.asyncio
+async def test_write_check_and_remove_roundtrip(tmp_path):
+    media_io = MediaIO(workers=2)
+    path = str(tmp_path / "audio.ulaw")
+
+    assert await media_io.write_file(path, b"\xff" * 160, owner=None) == 160
+    assert await media_io.ready_size(path) == 160
+    assert await media_io.remove(path)
+    assert not await media_io.remove(path)
+    assert await media_io.ready_size(path) is None
+
+    empty = str(tmp_path / "empty.ulaw")
+    await media_io.write_file(empty, b"", owner=None)
+    assert await media_io.ready_size(empty) is None
+    media_io.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_write_wav_and_remove_stale(tmp_path):
+    media_io = MediaIO(workers=1)
+    path = str(tmp_path / "response-1.wav")
+    size = await media_io.write_wav(path, b"\x00\x01" * 800, sample_rate=8000)
+    with wave.open(path, "rb") as wav_file:
+        assert wav_file.getframerate() == 8000
+        assert wav_file.getnframes() == 800
+    assert size == os.path.getsize(path)
+    assert oct(os.stat(path).st_mode)[-3:] == "644"
+
+    fresh = str(tmp_path / "response-2.wav")
+    await media_io.write_file(fresh, b"\xff", owner=None)
+    old = time.time() - 60
+    os.utime(path, (old, old))
+    assert await media_io.remove_stale(str(tmp_path / "response-*.wav"), 30) == 1
+    assert not os.path.exists(path) and os.path.exists(fresh)
+    media_io.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_reports_blocking_call():
+    monitor = LoopLagMonitor(interval_sec=0.02)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    time.sleep(0.15)  # block the loop on purpose
+    await asyncio.sleep(0.05)
+    monitor.stop()
+    assert monitor.samples >= 2
+    assert monitor.max_lag >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_play_audio_file_missing_file_fails_without_blocking_loop(tmp_path):
+    client = ARIClient("user", "pass", "http://127.0.0.1:8088/ari", "app")
+    monitor = LoopLagMonitor(interval_sec=0.01)
+    monitor.start()
+    started = time.perf_counter()
+    assert not await client.play_audio_file("chan-1", str(tmp_path / "missing.wav"))
+    await asyncio.sleep(0.03)
+    monitor.stop()
+    assert time.perf_counter() - started < 0.5
+    assert monitor.max_lag < 0.1
@@ -0,0 +1,78 @@
+import os
+import time
+
+import pytest
+
+from src.core.media_io import MediaIO
+from src.core.media_store import MediaStore
+
+
+def _store(tmp_path, **kwargs):
+    media_io = MediaIO(workers=1)
+    return MediaStore(str(tmp_path), media_io=media_io, **kwargs), media_io
+
+
+async def _write(store, media_io, name, size):
+    path = os.path.join(store.root, name)
+    await media_io.write_file(path, b"\xff" * size, owner=None)
+    await store.add(path, size)
+    return path
+
+
+@pytest.mark.asyncio
+async def test_release_deletes_file_once_last_reference_drops(tmp_path):
+    store, media_io = _store(tmp_path)
+    path = await _write(store, media_io, "a.ulaw", 100)
+    assert store.acquire(path)
+    assert store.refs(path) == 2
+
+    await store.release(path)
+    assert os.path.exists(path) and store.bytes_used == 100
+    await store.release(path)
+    assert not os.path.exists(path)
+    assert len(store) == 0 and store.bytes_used == 0
+    media_io.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_budget_evicts_unreferenced_files_in_lru_order(tmp_path):
+    store, media_io = _store(tmp_path, max_bytes=250, max_files=10)
+    first = await _write(store, media_io, "1.ulaw", 100)
+    second = await _write(store, media_io, "2.ulaw", 100)
+    await store.release(first, remove=False)
+    await store.release(second, remove=False)
+    store.acquire(first)
+    await store.release(first, remove=False)  # first is now most recently used
+
+    third = await _write(store, media_io, "3.ulaw", 100)
+    assert second not in store and not os.path.exists(second)
+    assert first in store and third in store
+    assert store.bytes_used == 200
+
+    # Files in use are never evicted, even over budget.
+    fourth = await _write(store, media_io, "4.ulaw", 300)
+    assert third in store and fourth in store and first not in store
+    assert store.bytes_used > store.budget_bytes
+    media_io.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sweep_reclaims_orphans_and_stale_references(tmp_path):
+    store, media_io = _store(tmp_path, orphan_age_sec=60, max_ref_age_sec=30, max_files=10)
+    orphan = tmp_path / "response-old.ulaw"
+    orphan.write_bytes(b"\xff" * 10)
+    old = time.time() - 120
+    os.utime(orphan, (old, old))
+    fresh_untracked = tmp_path / "response-new.ulaw"
+    fresh_untracked.write_bytes(b"\xff" * 10)
+
+    stuck = await _write(store, media_io, "stuck.ulaw", 50)
+    live = await _write(store, media_io, "live.ulaw", 50)
+    store._entries[stuck].last_acquired -= 31
+
+    counts = await store.sweep()
+    assert counts["orphan"] == 1 and counts["stale_ref"] == 1
+    assert not orphan.exists() and fresh_untracked.exists()
+    assert not os.path.exists(stuck) and os.path.exists(live)
+    assert store.budget_bytes > 0  # sized from the filesystem when max_bytes is 0
+    media_io.shutdown()
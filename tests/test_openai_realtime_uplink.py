@@ -0,0 +1,118 @@
+import asyncio
+import base64
+import json
+
+import pytest
+
+from src.config import OpenAIRealtimeProviderConfig
+from src.providers.openai_realtime import OpenAIRealtimeProvider
+
+
+class _FakeWebSocket:
+    def __init__(self, gate: asyncio.Event = None):
+        self.closed = False
+        self.sent = []
+        self._gate = gate
+
+    async def send(self, message):
+        if self._gate is not None:
+            await self._gate.wait()
+        self.sent.append(message)
+
+
+def _provider(**overrides) -> OpenAIRealtimeProvider:
+    params = dict(
+        api_key="test",
+        input_encoding="slin16",
+        input_sample_rate_hz=8000,
+        turn_detection={"type": "server_vad"},
+    )
+    params.update(overrides)
+
+    async def _on_event(event):
+        return None
+
+    return OpenAIRealtimeProvider(OpenAIRealtimeProviderConfig(**params), _on_event)
+
+
+_FRAME_20MS = b"\x10\x00" * 160  # PCM16 @ 8 kHz
+
+
+@pytest.mark.asyncio
+async def test_uplink_coalesces_frames_into_append_batches():
+    provider = _provider(uplink_coalesce_ms=60)
+    provider.websocket = _FakeWebSocket()
+    provider._start_uplink()
+
+    for _ in range(10):
+        await provider.send_audio(_FRAME_20MS)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    sent = provider.websocket.sent
+    assert len(sent) == 3  # 9 frames in three 60 ms batches; the 10th is still pending
+    for message in sent:
+        payload = json.loads(message)
+        assert payload["type"] == "input_audio_buffer.append"
+        # 60 ms resampled to 16 kHz PCM16 is ~1920 bytes
+        assert abs(len(base64.b64decode(payload["audio"])) - 1920) <= 8
+
+    await provider._stop_uplink()
+
+
+@pytest.mark.asyncio
+async def test_uplink_drops_oldest_batches_when_socket_stalls():
+    gate = asyncio.Event()
+    provider = _provider(uplink_coalesce_ms=40, uplink_queue_ms=120)
+    provider.websocket = _FakeWebSocket(gate)
+    provider._start_uplink()
+
+    for _ in range(40):  # 800 ms of audio while the socket is blocked
+        await provider.send_audio(_FRAME_20MS)
+    await asyncio.sleep(0)
+
+    assert provider._uplink_queue.qsize() <= 3
+    gate.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    # One in-flight batch plus at most the three queued batches reach the socket.
+    assert 1 <= len(provider.websocket.sent) <= 4
+
+    await provider._stop_uplink()
+
+
+@pytest.mark.asyncio
+async def test_uplink_flushes_partial_batch_after_coalesce_interval_and_on_stop():
+    provider = _provider(uplink_coalesce_ms=100)
+    provider.websocket = _FakeWebSocket()
+    provider._start_uplink()
+
+    await provider.send_audio(_FRAME_20MS)  # then the caller goes quiet (e.g. DTX)
+    await asyncio.sleep(0.05)
+    assert provider.websocket.sent == []
+    await asyncio.sleep(0.1)
+    assert len(provider.websocket.sent) == 1
+
+    await provider.send_audio(_FRAME_20MS)
+    await provider._stop_uplink()
+    assert len(provider.websocket.sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_uplink_waits_without_deadline_until_a_partial_batch_exists():
+    provider = _provider(uplink_coalesce_ms=100)
+    provider.websocket = _FakeWebSocket()
+    provider._start_uplink()
+    await asyncio.sleep(0)
+    assert provider._uplink_timeout.when() is None  # idle: no periodic wakeups
+
+    await asyncio.sleep(0.08)
+    await provider.send_audio(_FRAME_20MS)  # first frame arrives late in what was an interval
+    assert provider._uplink_timeout.when() is not None
+    await asyncio.sleep(0.05)
+    assert provider.websocket.sent == []  # measured from the frame, not from when the loop parked
+    await asyncio.sleep(0.08)
+    assert len(provider.websocket.sent) == 1
+    assert provider._uplink_timeout.when() is None
+
+    await provider._stop_uplink()
@@ -3,7 +3,7 @@ import json
 
 import pytest
 
-from src.audio.resampler import convert_pcm16le_to_target_format
+from src.audio.resampler import convert_pcm16le_to_target_format, resample_audio
 from src.config import AppConfig, DeepgramProviderConfig
 from src.pipelines.deepgram import DeepgramSTTAdapter, DeepgramTTSAdapter
 from src.pipelines.orchestrator import PipelineOrchestrator
@@ -64,10 +64,22 @@ class _MockWebSocket:
         self._queue.put_nowait(message)
 
 
+class _FakeStreamContent:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def iter_chunked(self, size):
+        # Deliver odd-sized pieces to exercise sample realignment.
+        step = max(1, min(size, 33))
+        for idx in range(0, len(self._body), step):
+            yield self._body[idx : idx + step]
+
+
 class _FakeResponse:
     def __init__(self, body: bytes, status: int = 200):
         self._body = body
         self.status = status
+        self.content = _FakeStreamContent(body)
 
     async def __aenter__(self):
         return self
@@ -156,6 +168,31 @@ async def test_deepgram_tts_adapter_synthesizes_chunks():
     assert request["params"]["target_sample_rate"] == 8000
 
 
+@pytest.mark.asyncio
+async def test_deepgram_tts_adapter_streams_resampled_frames():
+    app_config = _build_app_config()
+    provider_config = DeepgramProviderConfig(**app_config.providers["deepgram"])
+    pcm_audio = bytes(range(256)) * 25  # 200 ms @ 16 kHz PCM16
+    fake_session = _FakeSession(pcm_audio)
+    adapter = DeepgramTTSAdapter(
+        "deepgram_tts",
+        app_config,
+        provider_config,
+        {
+            "format": {"encoding": "mulaw", "sample_rate": 8000},
+            "source_format": {"encoding": "linear16", "sample_rate": 16000},
+        },
+        session_factory=lambda: fake_session,
+    )
+
+    chunks = [chunk async for chunk in adapter.synthesize("call-1", "Hello caller", {})]
+    resampled, _ = resample_audio(pcm_audio, 16000, 8000)
+    expected = convert_pcm16le_to_target_format(resampled, "mulaw")
+
+    assert b"".join(chunks) == expected
+    assert all(len(chunk) == 160 for chunk in chunks[:-1])
+
+
 @pytest.mark.asyncio
 async def test_pipeline_orchestrator_registers_deepgram_adapters():
     app_config = _build_app_config()
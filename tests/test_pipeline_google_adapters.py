@@ -49,10 +49,21 @@ def _build_app_config() -> AppConfig:
     )
 
 
+class _FakeStreamContent:
+    def __init__(self, body: str):
+        self._body = body.encode("utf-8")
+
+    async def iter_chunked(self, size):
+        step = max(1, min(size, 17))
+        for idx in range(0, len(self._body), step):
+            yield self._body[idx : idx + step]
+
+
 class _FakeResponse:
     def __init__(self, body: str, status: int = 200):
         self._body = body
         self.status = status
+        self.content = _FakeStreamContent(body)
 
     async def __aenter__(self):
         return self
@@ -116,6 +127,73 @@ async def test_google_stt_adapter_transcribes(monkeypatch):
     assert request["json"]["config"]["languageCode"] == "en-US"
 
 
+def _tone(ms: int, amplitude: int = 6000) -> bytes:
+    samples = 16 * ms
+    return b"".join(
+        (amplitude if (i // 8) % 2 else -amplitude).to_bytes(2, "little", signed=True)
+        for i in range(samples)
+    )
+
+
+@pytest.mark.asyncio
+async def test_google_stt_utterance_stream_sends_one_request_per_utterance():
+    app_config = _build_app_config()
+    provider_config = GoogleProviderConfig(**app_config.providers["google"])
+    payload = json.dumps({"results": [{"alternatives": [{"transcript": "book a table"}]}]})
+    fake_session = _FakeSession(payload)
+
+    adapter = GoogleSTTAdapter(
+        "google_stt",
+        app_config,
+        provider_config,
+        {"segmentation": {"use_webrtc": False, "end_silence_frames": 10}},
+        session_factory=lambda: fake_session,
+    )
+    await adapter.start_stream("call-1", {})
+
+    silence = b"\x00\x00" * 16 * 1000
+    audio = silence + _tone(600) + silence + _tone(400)
+    for idx in range(0, len(audio), 5120):  # 160 ms commits, as the engine sends them
+        await adapter.send_audio("call-1", audio[idx : idx + 5120])
+
+    results_iter = adapter.iter_results("call-1")
+
+    async def collect():
+        return [text async for text in results_iter]
+
+    collector = asyncio.create_task(collect())
+    await adapter.stop_stream("call-1")
+    results = await asyncio.wait_for(collector, timeout=1.0)
+
+    # 3.0 s of audio would be ~19 chunked requests; utterance mode issues two.
+    assert results == ["book a table", "book a table"]
+    assert len(fake_session.requests) == 2
+    first_audio = base64.b64decode(fake_session.requests[0]["json"]["audio"]["content"])
+    assert len(first_audio) < 2 * len(_tone(600))
+
+
+@pytest.mark.asyncio
+async def test_google_stt_utterance_stream_skips_silence():
+    app_config = _build_app_config()
+    provider_config = GoogleProviderConfig(**app_config.providers["google"])
+    fake_session = _FakeSession(json.dumps({"results": []}))
+
+    adapter = GoogleSTTAdapter(
+        "google_stt",
+        app_config,
+        provider_config,
+        {"segmentation": {"use_webrtc": False}},
+        session_factory=lambda: fake_session,
+    )
+    await adapter.start_stream("call-1", {})
+    await adapter.send_audio("call-1", b"\xff" * 8000, fmt="mulaw8k")  # 1 s of μ-law silence
+    results = adapter.iter_results("call-1")
+    await adapter.close_call("call-1")
+
+    assert [text async for text in results] == []
+    assert fake_session.requests == []
+
+
 @pytest.mark.asyncio
 async def test_google_llm_adapter_generate(monkeypatch):
     app_config = _build_app_config()
@@ -181,6 +259,24 @@ async def test_google_tts_adapter_synthesizes_chunks():
     assert request["json"]["voice"]["name"] == "en-US-Neural2-C"
 
 
+@pytest.mark.asyncio
+async def test_google_tts_adapter_missing_audio_content_yields_nothing():
+    app_config = _build_app_config()
+    provider_config = GoogleProviderConfig(**app_config.providers["google"])
+    fake_session = _FakeSession(json.dumps({"error": "quota"}))
+
+    adapter = GoogleTTSAdapter(
+        "google_tts",
+        app_config,
+        provider_config,
+        {"format": {"encoding": "mulaw", "sample_rate": 8000}},
+        session_factory=lambda: fake_session,
+    )
+
+    chunks = [chunk async for chunk in adapter.synthesize("call-1", "Hello caller", {})]
+    assert chunks == []
+
+
 @pytest.mark.asyncio
 async def test_google_orchestrator_falls_back_without_credentials(monkeypatch):
     app_config = _build_app_config()
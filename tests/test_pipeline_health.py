@@ -0,0 +1,144 @@
+import pytest
+
+from src.config import AppConfig, CircuitBreakerConfig
+from src.pipelines.base import LLMComponent, TTSComponent
+from src.pipelines.health import CircuitOpenError, ComponentHealth
+from src.pipelines.orchestrator import PipelineOrchestrator, call_component, stream_component
+
+
+class _FakeLLM(LLMComponent):
+    def __init__(self, component_key, fail=False):
+        self.component_key = component_key
+        self.fail = fail
+        self.calls = 0
+        self.opened = []
+
+    async def open_call(self, call_id, options):
+        self.opened.append(call_id)
+
+    async def generate(self, call_id, transcript, context, options):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("provider down")
+        return f"{self.component_key}:{options.get('tag')}"
+
+
+class _FakeTTS(TTSComponent):
+    def __init__(self, component_key):
+        self.component_key = component_key
+
+    async def synthesize(self, call_id, text, options):
+        yield b"\x00" * 160
+
+
+def test_breaker_opens_on_error_rate_and_recovers_through_half_open():
+    health = ComponentHealth("llm", CircuitBreakerConfig(window=10, min_calls=4, error_rate_threshold=0.5, open_sec=0))
+    for ok in (True, False, True, False):
+        assert health.allow()
+        health.record(ok, 0.1)
+    assert health.state == "open"
+
+    # open_sec=0: the next request is admitted as a single half-open trial.
+    assert health.allow()
+    assert health.state == "half_open"
+    assert not health.allow()
+    health.record(False, 0.1)
+    assert health.state == "open"
+
+    assert health.allow()
+    health.record(True, 0.1)
+    assert health.state == "closed"
+    assert health.snapshot()["times_opened"] == 2
+
+
+def test_slow_calls_count_as_failures():
+    health = ComponentHealth("tts", CircuitBreakerConfig(min_calls=3, error_rate_threshold=0.6, slow_call_ms=500, open_sec=60))
+    for latency in (0.9, 1.2, 0.1):
+        assert health.allow()
+        health.record(True, latency)
+    assert health.state == "open"
+    assert not health.allow()
+    assert health.snapshot()["p95_ms"] == 1200.0
+
+
+def _app_config(**pipeline_overrides) -> AppConfig:
+    main = {"stt": "local_stt", "llm": "main_llm", "tts": "fake_tts", "options": {"llm": {"tag": "main"}}}
+    main.update(pipeline_overrides)
+    return AppConfig(
+        default_provider="local",
+        providers={},
+        asterisk={"host": "127.0.0.1", "username": "ari", "password": "secret"},
+        llm={"initial_greeting": "hi", "prompt": "prompt", "model": "gpt-4o"},
+        audio_transport="audiosocket",
+        downstream_mode="stream",
+        pipelines={
+            "main": main,
+            "backup": {"stt": "local_stt", "llm": "backup_llm", "tts": "fake_tts", "options": {"llm": {"tag": "backup"}}},
+        },
+        active_pipeline="main",
+        circuit_breaker={"enabled": True, "window": 10, "min_calls": 3, "error_rate_threshold": 0.5, "open_sec": 60},
+    )
+
+
+def _orchestrator(config):
+    built = []
+
+    def llm_factory(component_key, options):
+        component = _FakeLLM(component_key, fail=component_key == "main_llm")
+        built.append(component)
+        return component
+
+    registry = {"main_llm": llm_factory, "backup_llm": llm_factory, "fake_tts": lambda key, opts: _FakeTTS(key)}
+    return PipelineOrchestrator(config, registry=registry), built
+
+
+async def _generate(resolution):
+    return await call_component(resolution, "llm", lambda adapter, options: adapter.generate("c", "hi", {}, options))
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_reroutes_role_and_new_calls_to_fallback_pipeline():
+    orchestrator, built = _orchestrator(_app_config(fallback="backup"))
+    await orchestrator.start()
+    resolution = orchestrator.get_pipeline("call-1")
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            await _generate(resolution)
+    primary = built[0]
+    assert primary.calls == 3
+
+    # Breaker open: the same call is served by the fallback pipeline's LLM without touching the primary.
+    assert await _generate(resolution) == "backup_llm:backup"
+    assert primary.calls == 3
+    assert built[-1].opened == ["call-1"]
+
+    # New calls are assigned the fallback pipeline outright.
+    rerouted = orchestrator.get_pipeline("call-2")
+    assert rerouted.pipeline_name == "backup"
+
+    snapshot = orchestrator.health_snapshot()
+    assert snapshot["open"] == ["main_llm"]
+    assert snapshot["components"]["main_llm"]["state"] == "open"
+    assert snapshot["components"]["main_llm"]["error_rate"] == 1.0
+
+    chunks = [
+        c async for c in stream_component(rerouted, "tts", lambda adapter, options: adapter.synthesize("c", "x", options))
+    ]
+    assert chunks == [b"\x00" * 160]
+    await orchestrator.stop()
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_without_fallback_fails_fast():
+    orchestrator, built = _orchestrator(_app_config())
+    await orchestrator.start()
+    resolution = orchestrator.get_pipeline("call-1")
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            await _generate(resolution)
+    with pytest.raises(CircuitOpenError):
+        await _generate(resolution)
+    assert built[0].calls == 3
+    await orchestrator.stop()
@@ -0,0 +1,211 @@
+import asyncio
+
+import pytest
+
+from src.config import AppConfig, HedgePolicyConfig
+from src.pipelines import hedging
+from src.pipelines.base import LLMComponent, LLMStreamEvent, STTComponent, TTSComponent
+from src.pipelines.hedging import (
+    HedgedLLMComponent,
+    HedgedStreamingLLMComponent,
+    HedgedStreamingSTTComponent,
+    HedgedTTSComponent,
+    LatencyBudget,
+    wrap_hedged,
+)
+from src.pipelines.orchestrator import PipelineOrchestrator
+
+
+class _FakeLLM(LLMComponent):
+    def __init__(self, component_key, reply, delay=0.0, fail=False):
+        self.component_key = component_key
+        self.reply = reply
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = False
+
+    async def generate(self, call_id, transcript, context, options):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError("upstream error")
+        return self.reply
+
+
+class _FakeStreamingLLM(_FakeLLM):
+    async def stream_generate(self, call_id, transcript, context, options):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        yield LLMStreamEvent("sentence", self.reply)
+        yield LLMStreamEvent("done", self.reply)
+
+
+class _FakeStreamingSTT(STTComponent):
+    def __init__(self):
+        self.component_key = "main_stt"
+        self.sent = []
+
+    async def transcribe(self, call_id, audio_pcm16, sample_rate_hz, options):
+        return "chunked"
+
+    async def start_stream(self, call_id, options=None):
+        self.sent.append("start")
+
+    async def send_audio(self, call_id, audio, *, fmt="pcm16_16k"):
+        self.sent.append(audio)
+
+    async def iter_results(self, call_id):
+        yield "streamed"
+
+    async def stop_stream(self, call_id):
+        self.sent.append("stop")
+
+
+class _FakeTTS(TTSComponent):
+    def __init__(self, component_key, chunks, first_delay=0.0):
+        self.component_key = component_key
+        self.chunks = chunks
+        self.first_delay = first_delay
+        self.closed = False
+        self.tasks = set()
+
+    async def synthesize(self, call_id, text, options):
+        try:
+            await asyncio.sleep(self.first_delay)
+            for chunk in self.chunks:
+                self.tasks.add(asyncio.current_task())
+                yield chunk
+        finally:
+            self.closed = True
+
+
+def _policy(**overrides) -> HedgePolicyConfig:
+    params = dict(secondary="backup_llm", initial_budget_ms=50, min_budget_ms=10, min_samples=5)
+    params.update(overrides)
+    return HedgePolicyConfig(**params)
+
+
+@pytest.fixture(autouse=True)
+def _reset_budgets():
+    hedging._BUDGETS.clear()
+    yield
+    hedging._BUDGETS.clear()
+
+
+def test_latency_budget_tracks_rolling_percentile():
+    budget = LatencyBudget(percentile=0.9, initial_budget_ms=1500, min_budget_ms=100, max_budget_ms=800, min_samples=10)
+    assert budget.budget_sec() == pytest.approx(0.8)  # initial 1.5 s clamped to max before min_samples
+    for ms in range(10, 110, 10):  # 10..100 ms
+        budget.observe(ms / 1000.0)
+    assert budget.budget_sec() == pytest.approx(0.1)  # p90 = 90 ms, clamped up to min 100 ms
+    for ms in range(100, 1100, 10):
+        budget.observe(ms / 1000.0)
+    assert budget.budget_sec() == pytest.approx(0.8)  # clamped to max
+
+
+@pytest.mark.asyncio
+async def test_hedge_not_fired_when_primary_is_within_budget():
+    primary = _FakeLLM("main_llm", "primary", delay=0.0)
+    secondary = _FakeLLM("backup_llm", "secondary")
+    component = HedgedLLMComponent("p", "llm", primary, secondary, _policy())
+
+    assert await component.generate("call-1", "hi", {}, {}) == "primary"
+    assert secondary.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_fires_secondary_and_cancels_slow_primary():
+    primary = _FakeLLM("main_llm", "primary", delay=5.0)
+    secondary = _FakeLLM("backup_llm", "secondary", delay=0.01)
+    component = HedgedLLMComponent("p", "llm", primary, secondary, _policy())
+
+    started = asyncio.get_running_loop().time()
+    assert await component.generate("call-1", "hi", {}, {}) == "secondary"
+    assert asyncio.get_running_loop().time() - started < 1.0
+    assert primary.cancelled
+    assert component._budget.hedge_rate == 1.0
+
+
+@pytest.mark.asyncio
+async def test_hedge_falls_back_when_primary_fails_fast():
+    primary = _FakeLLM("main_llm", "primary", fail=True)
+    secondary = _FakeLLM("backup_llm", "secondary")
+    component = HedgedLLMComponent("p", "llm", primary, secondary, _policy())
+
+    assert await component.generate("call-1", "hi", {}, {}) == "secondary"
+
+    secondary.fail = True
+    with pytest.raises(RuntimeError):
+        await component.generate("call-1", "hi", {}, {})
+
+
+@pytest.mark.asyncio
+async def test_tts_hedge_races_first_chunk_and_streams_winner():
+    primary = _FakeTTS("main_tts", [b"p1", b"p2"], first_delay=5.0)
+    secondary = _FakeTTS("backup_tts", [b"s1", b"s2", b"s3"])
+    component = HedgedTTSComponent("p", "tts", primary, secondary, _policy(secondary="backup_tts"))
+
+    chunks = [chunk async for chunk in component.synthesize("call-1", "hello", {})]
+    assert chunks == [b"s1", b"s2", b"s3"]
+    assert primary.closed
+    assert len(secondary.tasks) == 1  # the winning stream is advanced by one task only
+
+
+@pytest.mark.asyncio
+async def test_streaming_methods_follow_the_primary():
+    slow_primary = _FakeStreamingLLM("main_llm", "primary", delay=5.0)
+    llm = wrap_hedged("p", "llm", slow_primary, _FakeLLM("backup_llm", "secondary"), _policy())
+    assert isinstance(llm, HedgedStreamingLLMComponent)
+    events = [event async for event in llm.stream_generate("call-1", "hi", {}, {})]
+    assert [(event.kind, event.text) for event in events] == [("sentence", "secondary"), ("done", "secondary")]
+    assert not hasattr(wrap_hedged("p", "llm", _FakeLLM("a", "x"), _FakeLLM("b", "y"), _policy()), "stream_generate")
+
+    primary = _FakeStreamingSTT()
+    stt = wrap_hedged("p", "stt", primary, _FakeStreamingSTT(), _policy(secondary="backup_stt"))
+    assert isinstance(stt, HedgedStreamingSTTComponent)
+    await stt.start_stream("call-1", {})
+    await stt.send_audio("call-1", b"frame")
+    assert [text async for text in stt.iter_results("call-1")] == ["streamed"]
+    await stt.stop_stream("call-1")
+    assert primary.sent == ["start", b"frame", "stop"]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_wraps_hedged_role():
+    config = AppConfig(
+        default_provider="local",
+        providers={},
+        asterisk={"host": "127.0.0.1", "username": "ari", "password": "secret"},
+        llm={"initial_greeting": "hi", "prompt": "prompt", "model": "gpt-4o"},
+        audio_transport="audiosocket",
+        downstream_mode="stream",
+        pipelines={
+            "hedged": {
+                "stt": "local_stt",
+                "llm": "main_llm",
+                "tts": "local_tts",
+                "hedging": {"llm": {"secondary": "backup_llm", "options": {"model": "small"}}},
+            }
+        },
+        active_pipeline="hedged",
+    )
+    built = {}
+
+    def factory(component_key, options):
+        built[component_key] = options
+        return _FakeLLM(component_key, component_key)
+
+    orchestrator = PipelineOrchestrator(config, registry={"main_llm": factory, "backup_llm": factory})
+    await orchestrator.start()
+    resolution = orchestrator.get_pipeline("call-1")
+
+    assert isinstance(resolution.llm_adapter, HedgedLLMComponent)
+    assert resolution.llm_key == "main_llm"
+    assert built["backup_llm"] == {"model": "small"}
+    assert await resolution.llm_adapter.generate("call-1", "hi", {}, {}) == "main_llm"
+    await orchestrator.stop()
@@ -0,0 +1,220 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from src.config import AppConfig, N8nProviderConfig
+from src.core.models import CallSession
+from src.engine import Engine
+from src.pipelines.base import STTComponent, TTSComponent
+from src.pipelines import n8n as n8n_module
+from src.pipelines.n8n import N8nAdapter
+from tests.helpers import StandInHttpServer
+
+
+def _build_app_config() -> AppConfig:
+    return AppConfig(
+        default_provider="local",
+        providers={},
+        asterisk={"host": "127.0.0.1", "username": "ari", "password": "secret"},
+        llm={"initial_greeting": "hi", "prompt": "prompt", "model": "gpt-4o"},
+        audio_transport="audiosocket",
+        downstream_mode="stream",
+    )
+
+
+class _StandInWebhook(StandInHttpServer):
+    """n8n webhook stand-in; ``reply`` builds the response for each request."""
+
+    def __init__(self, reply):
+        super().__init__()
+        self.requests = []
+        self._reply = reply
+
+    async def _handler(self, request):
+        self.requests.append(await request.json())
+        return await self._reply(request)
+
+    def add_routes(self, app):
+        app.router.add_post("/webhook", self._handler)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.port}/webhook"
+
+
+def _adapter(url: str, **overrides) -> N8nAdapter:
+    return N8nAdapter("n8n_llm", _build_app_config(), N8nProviderConfig(webhook_url=url, **overrides), {})
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    n8n_module._RESPONSE_CACHE.clear()
+    yield
+    n8n_module._RESPONSE_CACHE.clear()
+
+
+@pytest.mark.asyncio
+async def test_n8n_cache_serves_repeat_questions_by_normalized_transcript():
+    async def reply(request):
+        return web.json_response({"response": "We open at nine."})
+
+    async with _StandInWebhook(reply) as server:
+        adapter = _adapter(server.url, cache_ttl_sec=60, cache_context_keys=["tenant"])
+
+        first = await adapter.generate("call-1", "What time do you open?", {"tenant": "a"}, {})
+        second = await adapter.generate("call-2", "  what time do you OPEN ", {"tenant": "a"}, {})
+        assert first == second == "We open at nine."
+        assert len(server.requests) == 1
+
+        # A different value for a cached context key is a separate entry.
+        await adapter.generate("call-3", "What time do you open?", {"tenant": "b"}, {})
+        assert len(server.requests) == 2
+
+        # Without the scoping key the reply must not be cached for anyone.
+        await adapter.generate("call-4", "What time do you open?", {}, {})
+        await adapter.generate("call-5", "What time do you open?", {}, {})
+        assert len(server.requests) == 4
+        await adapter.stop()
+
+
+@pytest.mark.asyncio
+async def test_n8n_cache_without_context_keys_is_scoped_to_the_call():
+    async def reply(request):
+        body = await request.json()
+        return web.json_response({"response": f"Hello {body['call_id']}"})
+
+    async with _StandInWebhook(reply) as server:
+        adapter = _adapter(server.url, cache_ttl_sec=60)
+
+        assert await adapter.generate("call-1", "who am I", {}, {}) == "Hello call-1"
+        assert await adapter.generate("call-1", "Who am I?", {}, {}) == "Hello call-1"
+        assert len(server.requests) == 1
+        assert await adapter.generate("call-2", "who am I", {}, {}) == "Hello call-2"
+        assert len(server.requests) == 2
+        await adapter.stop()
+
+
+@pytest.mark.asyncio
+async def test_n8n_stream_emits_first_sentence_before_reply_completes():
+    release = asyncio.Event()
+
+    async def reply(request):
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        await response.write(b'{"type":"begin"}\n{"type":"item","content":"Sure, let me check. "}\n')
+        await release.wait()
+        await response.write(b'{"type":"item","content":"Your order has shipped."}\n{"type":"end"}\n')
+        await response.write_eof()
+        return response
+
+    async with _StandInWebhook(reply) as server:
+        adapter = _adapter(server.url, stream=True)
+        events = []
+        async for event in adapter.stream_generate("call-1", "where is my order", {}, {}):
+            events.append(event)
+            if event.kind == "sentence" and not release.is_set():
+                assert event.text == "Sure, let me check."
+                release.set()
+
+        sentences = [e.text for e in events if e.kind == "sentence"]
+        assert sentences == ["Sure, let me check.", "Your order has shipped."]
+        assert events[-1].kind == "done"
+        assert events[-1].text == "Sure, let me check. Your order has shipped."
+        await adapter.stop()
+
+
+@pytest.mark.asyncio
+async def test_n8n_stream_accepts_chunked_plain_text_and_buffered_json():
+    async def plain(request):
+        response = web.StreamResponse(headers={"Content-Type": "text/plain; charset=utf-8"})
+        await response.prepare(request)
+        for chunk in ("Hello ", "there. ", "Bye."):
+            await response.write(chunk.encode())
+        await response.write_eof()
+        return response
+
+    async with _StandInWebhook(plain) as server:
+        adapter = _adapter(server.url)
+        text = await adapter.generate("call-1", "hi", {}, {"stream": True})
+        assert text == "Hello there. Bye."
+        await adapter.stop()
+
+    async def pretty_json(request):
+        return web.Response(text=json.dumps({"response": "Fallback works."}, indent=2), content_type="application/json")
+
+    async with _StandInWebhook(pretty_json) as server:
+        adapter = _adapter(server.url, stream=True)
+        assert await adapter.generate("call-1", "hi", {}, {}) == "Fallback works."
+        await adapter.stop()
+
+
+class _OneTranscriptSTT(STTComponent):
+    def __init__(self, transcript):
+        self.transcript = transcript
+
+    async def transcribe(self, call_id, audio_pcm16, sample_rate_hz, options):
+        transcript, self.transcript = self.transcript, ""
+        return transcript
+
+
+class _RecordingTTS(TTSComponent):
+    def __init__(self):
+        self.texts = []
+
+    async def synthesize(self, call_id, text, options):
+        self.texts.append(text)
+        yield b"\xff" * 160
+
+
+class _Resolution:
+    def __init__(self, llm_adapter, tts_adapter):
+        self.pipeline_name = "n8n"
+        self.stt_adapter = _OneTranscriptSTT("where is my order")
+        self.llm_adapter = llm_adapter
+        self.tts_adapter = tts_adapter
+        self.stt_options = {"segmentation": {"mode": "fixed"}}
+        self.llm_options = {}  # no pipeline-level "stream": only providers.n8n.stream is set
+        self.tts_options = {}
+        self.prepared = True
+
+
+@pytest.mark.asyncio
+async def test_engine_speaks_each_sentence_when_only_the_provider_enables_streaming(monkeypatch):
+    async def reply(request):
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        await response.write(b'{"type":"item","content":"Sure, let me check. "}\n')
+        await response.write(b'{"type":"item","content":"Your order has shipped."}\n')
+        await response.write_eof()
+        return response
+
+    async with _StandInWebhook(reply) as server:
+        config = _build_app_config().model_copy(update={"pipelines": {"n8n": {}}, "active_pipeline": "n8n"})
+        engine = Engine(config)
+        engine.pipeline_orchestrator._started = True
+        tts = _RecordingTTS()
+        resolution = _Resolution(_adapter(server.url, stream=True), tts)
+        monkeypatch.setattr(engine.pipeline_orchestrator, "get_pipeline", lambda call_id, pipeline_name=None: resolution)
+
+        async def play_audio(call_id, audio, playback_type):
+            return "pb"
+
+        monkeypatch.setattr(engine.playback_manager, "play_audio", play_audio)
+
+        call_id = "call-n8n"
+        session = CallSession(call_id=call_id, caller_channel_id=call_id)
+        session.pipeline_name = "n8n"
+        await engine.session_store.upsert_call(session)
+        await engine._ensure_pipeline_runner(session, forced=True)
+        queue = engine._pipeline_queues[call_id]
+        for _ in range(10):
+            await queue.put(b"\x00\x00" * 320)
+        await queue.put(None)
+        await asyncio.wait_for(engine._pipeline_tasks[call_id], timeout=5.0)
+        await engine._cleanup_call(call_id)
+        await resolution.llm_adapter.stop()
+
+    # Buffered generate() would have sent the whole reply to TTS as one text.
+    assert tts.texts[1:] == ["Sure, let me check.", "Your order has shipped."]  # after the greeting
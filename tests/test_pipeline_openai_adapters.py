@@ -74,11 +74,33 @@ class _MockWebSocket:
     def push(self, message):
         self._queue.put_nowait(message)
 
+    def push_response(self, response_id, text, item_id=None):
+        """A realtime text response: response.created, one delta, response.done."""
+        self.push(json.dumps({"type": "response.created", "response": {"id": response_id}}))
+        self.push(json.dumps({"type": "response.output_text.delta", "response_id": response_id, "delta": text}))
+        output = [{"id": item_id or f"item-{response_id}"}]
+        self.push(json.dumps({"type": "response.done", "response": {"id": response_id, "output": output}}))
+
+
+class _FakeStreamContent:
+    def __init__(self, body: bytes, chunk_size: int = 7):
+        self._body = body
+        self._chunk_size = chunk_size
+
+    async def iter_any(self):
+        for idx in range(0, len(self._body), self._chunk_size):
+            yield self._body[idx : idx + self._chunk_size]
+
+    async def iter_chunked(self, size):
+        async for chunk in self.iter_any():
+            yield chunk
+
 
 class _FakeResponse:
     def __init__(self, body: bytes, status: int = 200):
         self._body = body
         self.status = status
+        self.content = _FakeStreamContent(body)
 
     async def __aenter__(self):
         return self
@@ -170,6 +192,62 @@ async def test_openai_llm_adapter_chat_completion(monkeypatch):
     assert request["json"]["messages"][-1] == {"role": "user", "content": "hello"}
 
 
+def _sse_body(deltas) -> bytes:
+    events = []
+    for delta in deltas:
+        chunk = {"choices": [{"delta": {"content": delta}}]}
+        events.append(f"data: {json.dumps(chunk)}\n\n")
+    events.append("data: [DONE]\n\n")
+    return "".join(events).encode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_openai_llm_adapter_streams_sentences():
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+    fake_session = _FakeSession(_sse_body(["Hello", " there.", " How can", " I help?", " Bye"]))
+
+    adapter = OpenAILLMAdapter(
+        "openai_llm",
+        app_config,
+        provider_config,
+        {"use_realtime": False, "stream": True},
+        session_factory=lambda: fake_session,
+    )
+
+    events = [event async for event in adapter.stream_generate("call-1", "hello", {}, {})]
+    kinds = [event.kind for event in events]
+    assert kinds.count("delta") == 5
+    assert [event.text for event in events if event.kind == "sentence"] == [
+        "Hello there.",
+        "How can I help?",
+        "Bye",
+    ]
+    assert events[-1].kind == "done"
+    assert events[-1].text == "Hello there. How can I help? Bye"
+    # The first sentence is available before the stream has finished.
+    assert kinds.index("sentence") < len(kinds) - 3
+    assert fake_session.requests[0]["json"]["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_openai_llm_adapter_generate_uses_stream_when_enabled():
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+    fake_session = _FakeSession(_sse_body(["hi", " there"]))
+
+    adapter = OpenAILLMAdapter(
+        "openai_llm",
+        app_config,
+        provider_config,
+        {"use_realtime": False},
+        session_factory=lambda: fake_session,
+    )
+
+    response = await adapter.generate("call-1", "hello", {}, {"stream": True})
+    assert response == "hi there"
+
+
 @pytest.mark.asyncio
 async def test_openai_llm_adapter_realtime(monkeypatch):
     app_config = _build_app_config()
@@ -194,16 +272,191 @@ async def test_openai_llm_adapter_realtime(monkeypatch):
     )
 
     await asyncio.sleep(0)
-    mock_ws.push(json.dumps({"type": "response.output_text.delta", "delta": "response"}))
-    mock_ws.push(json.dumps({"type": "response.output_text.done"}))
+    mock_ws.push_response("resp-1", "response")
 
     result = await task
     assert result == "response"
 
-    session_event = json.loads(mock_ws.sent[0])
-    assert session_event["type"] == "session.create"
-    response_event = json.loads(mock_ws.sent[1])
-    assert response_event["type"] == "response.create"
+    sent = [json.loads(evt) for evt in mock_ws.sent]
+    assert [evt["type"] for evt in sent] == [
+        "session.create",
+        "conversation.item.create",
+        "conversation.item.create",
+        "response.create",
+    ]
+    assert sent[2]["item"]["role"] == "user"
+    assert sent[2]["item"]["content"][0]["text"] == "hello listener"
+
+
+@pytest.mark.asyncio
+async def test_openai_llm_adapter_realtime_session_persists_across_turns(monkeypatch):
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+    adapter = OpenAILLMAdapter("openai_llm", app_config, provider_config, {"use_realtime": True})
+
+    sockets = []
+
+    async def fake_connect(*args, **kwargs):
+        ws = _MockWebSocket()
+        sockets.append(ws)
+        return ws
+
+    monkeypatch.setattr("src.pipelines.openai.websockets.connect", fake_connect)
+
+    await adapter.open_call("call-1", {"use_realtime": True})
+    assert len(sockets) == 1
+
+    for turn, reply in (("first question", "one"), ("second question", "two")):
+        sockets[0].push_response(f"resp-{reply}", reply)
+        context = {"messages": [{"role": "user", "content": turn}]}
+        assert await adapter.generate("call-1", turn, context, {"use_realtime": True}) == reply
+
+    assert len(sockets) == 1
+    sent = [json.loads(evt) for evt in sockets[0].sent]
+    assert [evt["type"] for evt in sent].count("session.create") == 1
+    items = [evt["item"]["content"][0]["text"] for evt in sent if evt["type"] == "conversation.item.create"]
+    assert items == ["first question", "second question"]
+
+    state = adapter._realtime_sessions["call-1"]
+    assert state.turns == 2
+    assert state.last_ttft_ms is not None
+
+    await adapter.close_call("call-1")
+    assert sockets[0].closed
+    assert "call-1" not in adapter._realtime_sessions
+
+
+@pytest.mark.asyncio
+async def test_openai_llm_adapter_realtime_reconnects_and_replays(monkeypatch):
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+    adapter = OpenAILLMAdapter("openai_llm", app_config, provider_config, {"use_realtime": True})
+
+    sockets = []
+
+    async def fake_connect(*args, **kwargs):
+        ws = _MockWebSocket()
+        sockets.append(ws)
+        return ws
+
+    monkeypatch.setattr("src.pipelines.openai.websockets.connect", fake_connect)
+
+    await adapter.open_call("call-1", {"use_realtime": True})
+    sockets[0].push_response("resp-1", "one")
+    context = {"messages": [{"role": "user", "content": "first"}]}
+    assert await adapter.generate("call-1", "first", context, {}) == "one"
+
+    sockets[0].closed = True
+    task = asyncio.create_task(
+        adapter.generate("call-1", "second", {"messages": [{"role": "user", "content": "second"}]}, {})
+    )
+    while len(sockets) < 2:
+        await asyncio.sleep(0)
+    sockets[1].push_response("resp-2", "two")
+    assert await task == "two"
+
+    replayed = [json.loads(evt) for evt in sockets[1].sent]
+    assert replayed[0]["type"] == "session.create"
+    texts = [evt["item"]["content"][0]["text"] for evt in replayed if evt["type"] == "conversation.item.create"]
+    assert texts == ["first", "one", "second"]
+    assert adapter._realtime_sessions["call-1"].reconnects == 1
+
+
+@pytest.mark.asyncio
+async def test_openai_llm_adapter_realtime_cancelled_turn_is_drained_before_next(monkeypatch):
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+    adapter = OpenAILLMAdapter("openai_llm", app_config, provider_config, {"use_realtime": True})
+    ws = _MockWebSocket()
+
+    async def fake_connect(*args, **kwargs):
+        return ws
+
+    monkeypatch.setattr("src.pipelines.openai.websockets.connect", fake_connect)
+    await adapter.open_call("call-1", {"use_realtime": True})
+
+    # Barge-in cancels the first turn while its response is still streaming.
+    first = asyncio.create_task(
+        adapter.generate("call-1", "first", {"messages": [{"role": "user", "content": "first"}]}, {})
+    )
+    ws.push(json.dumps({"type": "response.created", "response": {"id": "resp-1"}}))
+    ws.push(json.dumps({"type": "response.output_text.delta", "response_id": "resp-1", "delta": "stale"}))
+    while not any(json.loads(evt)["type"] == "response.create" for evt in ws.sent):
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    # The rest of the abandoned response arrives after the cancel, then the next answer.
+    ws.push(json.dumps({"type": "response.output_text.delta", "response_id": "resp-1", "delta": " answer"}))
+    ws.push(json.dumps({"type": "response.done", "response": {"id": "resp-1", "output": [{"id": "item-1"}]}}))
+    ws.push_response("resp-2", "fresh")
+    second = await adapter.generate("call-1", "second", {"messages": [{"role": "user", "content": "second"}]}, {})
+    assert second == "fresh"
+
+    sent = [json.loads(evt) for evt in ws.sent]
+    types = [evt["type"] for evt in sent]
+    assert types.index("response.cancel") < types.index("conversation.item.delete") < len(types) - 1
+    assert sent[types.index("response.cancel")]["response_id"] == "resp-1"
+    assert sent[types.index("conversation.item.delete")]["item_id"] == "item-1"
+    state = adapter._realtime_sessions["call-1"]
+    assert [message["content"] for message in state.history] == ["first", "second", "fresh"]
+
+
+@pytest.mark.asyncio
+async def test_openai_llm_adapter_realtime_concurrent_first_turns_share_one_session(monkeypatch):
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+    adapter = OpenAILLMAdapter("openai_llm", app_config, provider_config, {"use_realtime": True})
+    sockets = []
+    release = asyncio.Event()
+
+    async def fake_connect(*args, **kwargs):
+        await release.wait()  # slow handshake: both turns arrive while it is in flight
+        ws = _MockWebSocket()
+        sockets.append(ws)
+        return ws
+
+    monkeypatch.setattr("src.pipelines.openai.websockets.connect", fake_connect)
+    turns = [
+        asyncio.create_task(adapter.generate("call-1", text, {"messages": [{"role": "user", "content": text}]}, {}))
+        for text in ("first", "second")
+    ]
+    for _ in range(5):
+        await asyncio.sleep(0)
+    release.set()
+    while not sockets:
+        await asyncio.sleep(0)
+    sockets[0].push_response("resp-1", "one")
+    sockets[0].push_response("resp-2", "two")
+    assert await asyncio.gather(*turns) == ["one", "two"]
+    assert len(sockets) == 1
+
+    await adapter.close_call("call-1")
+    assert sockets[0].closed
+
+
+@pytest.mark.asyncio
+async def test_openai_llm_adapter_realtime_ignores_events_of_other_responses(monkeypatch):
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+    adapter = OpenAILLMAdapter("openai_llm", app_config, provider_config, {"use_realtime": True})
+    ws = _MockWebSocket()
+
+    async def fake_connect(*args, **kwargs):
+        return ws
+
+    monkeypatch.setattr("src.pipelines.openai.websockets.connect", fake_connect)
+    await adapter.open_call("call-1", {"use_realtime": True})
+    ws.push(json.dumps({"type": "response.output_text.delta", "response_id": "old", "delta": "stale"}))
+    ws.push(json.dumps({"type": "response.done", "response": {"id": "old"}}))
+    ws.push(json.dumps({"type": "response.created", "response": {"id": "resp-2"}}))
+    ws.push(json.dumps({"type": "response.output_text.delta", "response_id": "resp-2", "delta": "right"}))
+    ws.push(json.dumps({"type": "response.output_text.done", "response_id": "resp-2", "text": "right"}))
+    ws.push(json.dumps({"type": "response.output_text.delta", "response_id": "old", "delta": " wrong"}))
+    ws.push(json.dumps({"type": "response.done", "response": {"id": "resp-2"}}))
+    assert await adapter.generate("call-1", "q", {"messages": [{"role": "user", "content": "q"}]}, {}) == "right"
 
 
 @pytest.mark.asyncio
@@ -236,6 +489,27 @@ async def test_openai_tts_adapter_synthesizes_chunks():
     assert request["json"]["voice"] == "alloy"
 
 
+@pytest.mark.asyncio
+async def test_openai_tts_adapter_streams_raw_audio_body():
+    app_config = _build_app_config()
+    provider_config = OpenAIProviderConfig(**app_config.providers["openai"])
+
+    pcm_audio = b"\x00\x10" * 800  # 100 ms @ 8 kHz
+    fake_session = _FakeSession(pcm_audio)
+
+    adapter = OpenAITTSAdapter(
+        "openai_tts",
+        app_config,
+        provider_config,
+        {"format": {"encoding": "mulaw", "sample_rate": 8000}},
+        session_factory=lambda: fake_session,
+    )
+
+    chunks = [chunk async for chunk in adapter.synthesize("call-1", "Hello caller", {})]
+    assert b"".join(chunks) == convert_pcm16le_to_target_format(pcm_audio, "mulaw")
+    assert [len(chunk) for chunk in chunks] == [160] * 5
+
+
 @pytest.mark.asyncio
 async def test_pipeline_orchestrator_registers_openai_adapters():
     app_config = _build_app_config()
@@ -82,3 +82,67 @@ async def test_pipeline_runner_lifecycle(monkeypatch):
     assert call_id not in engine._pipeline_tasks
     assert call_id not in engine._pipeline_queues
     assert call_id not in engine._pipeline_forced
+
+
+class _RecordingSTT(STTComponent):
+    def __init__(self):
+        self.chunks = []
+
+    async def transcribe(self, call_id, audio_pcm16, sample_rate_hz, options):
+        self.chunks.append(audio_pcm16)
+        return ""
+
+
+def _tone(ms: int, amplitude: int = 6000) -> bytes:
+    return b"".join(
+        (amplitude if (i // 8) % 2 else -amplitude).to_bytes(2, "little", signed=True)
+        for i in range(16 * ms)
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "segmentation, expected_commits",
+    [
+        ({"use_webrtc": False, "end_silence_frames": 10}, 1),
+        ({"mode": "fixed"}, 13),  # 2.0 s of audio at the 160 ms commit cadence
+    ],
+)
+async def test_pipeline_runner_segments_chunked_stt(monkeypatch, segmentation, expected_commits):
+    config_data = {
+        "default_provider": "local",
+        "providers": {"local": {"enabled": True}},
+        "asterisk": {"host": "127.0.0.1", "port": 8088, "username": "u", "password": "p", "app_name": "ai-voice-agent"},
+        "llm": {"initial_greeting": "hi", "prompt": "You are helpful", "model": "gpt-4o"},
+        "pipelines": {"local_only": {}},
+        "active_pipeline": "local_only",
+        "audio_transport": "externalmedia",
+    }
+    engine = Engine(AppConfig(**config_data))
+    engine.pipeline_orchestrator._started = True
+
+    resolution = _StubResolution()
+    stt = _RecordingSTT()
+    resolution.stt_adapter = stt
+    resolution.stt_options = {"segmentation": segmentation}
+    monkeypatch.setattr(engine.pipeline_orchestrator, "get_pipeline", lambda call_id, pipeline_name=None: resolution)
+
+    from src.core.models import CallSession
+    call_id = "call-vad"
+    session = CallSession(call_id=call_id, caller_channel_id=call_id)
+    session.pipeline_name = "local_only"
+    await engine.session_store.upsert_call(session)
+    await engine._ensure_pipeline_runner(session, forced=True)
+
+    silence = b"\x00\x00" * 16 * 700
+    audio = silence + _tone(600) + silence
+    q = engine._pipeline_queues[call_id]
+    for idx in range(0, len(audio), 640):  # 20 ms frames, as AudioSocket delivers them
+        await q.put(audio[idx : idx + 640])
+    await q.put(None)
+
+    await asyncio.wait_for(engine._pipeline_tasks[call_id], timeout=2.0)
+    await engine._cleanup_call(call_id)
+
+    assert len(stt.chunks) == expected_commits
+    assert sum(len(c) for c in stt.chunks) <= len(audio)
@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+import pytest
+
+from src.core.playout_scheduler import PlayoutScheduler
+
+
+class _Sink:
+    def __init__(self, fail_after=None):
+        self.times = []
+        self.frames = []
+        self.fail_after = fail_after
+
+    async def send(self, frame):
+        if self.fail_after is not None and len(self.frames) >= self.fail_after:
+            return False
+        self.times.append(time.monotonic())
+        self.frames.append(frame)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_frames_follow_absolute_deadlines_without_drift():
+    scheduler = PlayoutScheduler(frame_ms=10)
+    sink = _Sink()
+    stream = scheduler.register("call-1", sink.send, prebuffer_frames=2)
+    for index in range(20):
+        assert await stream.put(bytes([index]))
+    assert await stream.drain()
+
+    assert [f[0] for f in sink.frames] == list(range(20))
+    elapsed = sink.times[-1] - sink.times[0]
+    # 19 intervals of 10 ms; sleep-after-send pacing would add send time and loop lag per frame.
+    assert 0.17 <= elapsed <= 0.25
+    assert stream.stats.frames_sent == 20
+    assert stream.stats.underruns == 0
+    assert abs(stream.stats.drift_ms) < 15
+    scheduler.unregister("call-1")
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_late_tick_catches_up_within_limit_then_reanchors():
+    scheduler = PlayoutScheduler(frame_ms=10, max_catchup_frames=2)
+    sink = _Sink()
+    stream = scheduler.register("call-1", sink.send)
+    for index in range(30):
+        await stream.put(bytes([index]))
+    await asyncio.sleep(0.035)
+    time.sleep(0.06)  # block the loop for ~6 ticks
+    assert await stream.drain()
+
+    stats = stream.stats
+    assert stats.frames_sent == 30
+    assert stats.catchup_frames >= 2
+    assert stats.skipped_ticks >= 1
+    assert stats.max_lateness_ms >= 40
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_underrun_is_counted_and_stream_rebuffers():
+    scheduler = PlayoutScheduler(frame_ms=10)
+    sink = _Sink()
+    stream = scheduler.register("call-1", sink.send, prebuffer_frames=2, rebuffer_frames=3)
+    await stream.put(b"a")
+    await stream.put(b"b")
+    await asyncio.sleep(0.06)
+    assert sink.frames == [b"a", b"b"]
+    assert stream.stats.underruns == 1
+    assert not stream.playing
+
+    await stream.put(b"c")
+    await asyncio.sleep(0.04)
+    assert sink.frames == [b"a", b"b"]  # waiting for rebuffer_frames
+    await stream.put(b"d")
+    await stream.put(b"e")
+    assert await stream.drain()
+    assert sink.frames == [b"a", b"b", b"c", b"d", b"e"]
+    assert stream.stats.gap_frames >= 4
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_put_applies_backpressure_and_reports_transport_failure():
+    scheduler = PlayoutScheduler(frame_ms=10)
+    sink = _Sink(fail_after=3)
+    stream = scheduler.register("call-1", sink.send, max_queued_frames=2)
+    results = [await stream.put(bytes([i])) for i in range(3)]
+    assert results == [True, True, True]
+    assert len(stream.frames) <= 2
+
+    ok = True
+    for index in range(3, 10):
+        ok = await stream.put(bytes([index]))
+        if not ok:
+            break
+    assert not ok
+    assert stream.failed
+    assert not await stream.drain()
+    assert len(sink.frames) == 3
+    await scheduler.stop()
@@ -0,0 +1,83 @@
+import pytest
+import websockets
+
+from src.config import OpenAIRealtimeProviderConfig
+from src.providers.openai_realtime import OpenAIRealtimeProvider
+from src.providers.pool import WarmConnectionPool
+from tests.helpers import StandInWebSocketServer, wait_for
+
+
+@pytest.mark.asyncio
+async def test_pool_prewarms_hands_out_and_replenishes():
+    async with StandInWebSocketServer() as server:
+        url = f"ws://127.0.0.1:{server.port}"
+        pool = WarmConnectionPool(
+            "test",
+            lambda: websockets.connect(url),
+            lambda ws: ws.close(),
+            size=2,
+        )
+        await pool.start()
+        await wait_for(lambda: pool.idle_count == 2)
+
+        first = await pool.acquire()
+        assert first is not None and not first.closed
+        assert pool.hits == 1
+        # Background task tops the pool back up after a hand-out.
+        await wait_for(lambda: pool.idle_count == 2)
+        assert len(server.connections) == 3
+
+        await first.close()
+        await pool.stop()
+        assert pool.idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_recycles_idle_connections_and_reports_miss():
+    async with StandInWebSocketServer() as server:
+        url = f"ws://127.0.0.1:{server.port}"
+        pool = WarmConnectionPool(
+            "test",
+            lambda: websockets.connect(url),
+            lambda ws: ws.close(),
+            size=1,
+            idle_timeout_sec=1.0,
+        )
+        await pool.start()
+        await wait_for(lambda: pool.idle_count == 1)
+        for entry in pool._idle:
+            entry.created_at -= 5.0  # age past idle timeout
+
+        assert await pool.acquire() is None
+        assert pool.misses == 1
+        await wait_for(lambda: pool.idle_count == 1)
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_openai_realtime_start_session_uses_warm_connection():
+    async with StandInWebSocketServer() as server:
+        events = []
+
+        async def on_event(event):
+            events.append(event)
+
+        config = OpenAIRealtimeProviderConfig(
+            api_key="test",
+            base_url=f"ws://127.0.0.1:{server.port}",
+            pool_size=1,
+            greeting="Hello there",
+        )
+        provider = OpenAIRealtimeProvider(config, on_event)
+        await provider.start_pool()
+        await wait_for(lambda: provider._pool.idle_count == 1)
+        # session.update is sent while the connection idles in the pool.
+        await wait_for(lambda: [m["type"] for m in server.connections[0]] == ["session.update"])
+
+        await provider.start_session("call-1")
+        assert provider._pool.hits == 1
+        await wait_for(lambda: len(server.connections[0]) == 2)
+        assert server.connections[0][1]["type"] == "response.create"
+
+        await provider.stop_session()
+        await provider.stop_pool()
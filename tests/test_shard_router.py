@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from src.config import AppConfig
+from src.core.shard_router import ShardRouter, worker_app_name
+from src.supervisor import EngineSupervisor, worker_config
+
+
+def _config(**overrides):
+    return AppConfig(
+        default_provider="local",
+        providers={"local": {"enabled": True}},
+        asterisk={"host": "127.0.0.1", "username": "u", "password": "p", "app_name": "ai-voice-agent"},
+        llm={"initial_greeting": "hi", "prompt": "You are helpful", "model": "gpt-4o"},
+        **overrides,
+    )
+
+
+class _FakeARI:
+    """Records moves/hangups; ``registered`` are the worker apps currently connected."""
+
+    def __init__(self, registered):
+        self.registered = set(registered)
+        self.handlers = {}
+        self.moves = []
+        self.hangups = []
+        self.subscribed = set()
+        self.channels = set()
+
+    def add_event_handler(self, event_type, handler):
+        self.handlers[event_type] = handler
+
+    def subscribe(self, *sources):
+        self.subscribed.update(sources)
+
+    def unsubscribe(self, *sources):
+        self.subscribed.difference_update(sources)
+
+    async def move_channel(self, channel_id, app, app_args=None):
+        self.moves.append((channel_id, app, app_args))
+        return app in self.registered
+
+    async def hangup_channel(self, channel_id):
+        self.hangups.append(channel_id)
+
+    async def list_channels(self):
+        return [{"id": channel_id} for channel_id in self.channels]
+
+    async def stasis_start(self, channel_id, args=()):
+        self.channels.add(channel_id)
+        await self.handlers["StasisStart"]({"type": "StasisStart", "channel": {"id": channel_id}, "args": list(args)})
+
+    async def destroyed(self, channel_id):
+        self.channels.discard(channel_id)
+        await self.handlers["ChannelDestroyed"]({"type": "ChannelDestroyed", "channel": {"id": channel_id}})
+
+
+@pytest.mark.asyncio
+async def test_calls_go_to_least_loaded_worker_and_skip_unavailable_ones():
+    apps = [worker_app_name("app", index) for index in range(3)]
+    ari = _FakeARI(apps[:2])  # worker 2 has not registered its app yet
+    router = ShardRouter(ari, apps)
+    router.start()
+
+    for channel_id in ("c1", "c2", "c3", "c4"):
+        await ari.stasis_start(channel_id, args=["sales"])
+    assert [router.owner(channel_id) for channel_id in ("c1", "c2", "c3", "c4")] == [0, 1, 0, 1]
+    assert ("c1", "app-w0", ["sales"]) in ari.moves
+    assert router.active == [2, 2, 0]
+    assert "channel:c1" in ari.subscribed
+
+    await ari.destroyed("c1")
+    assert router.active == [1, 2, 0] and "channel:c1" not in ari.subscribed
+    await ari.stasis_start("c5")
+    assert router.owner("c5") == 0
+
+    router.set_available(0, False)
+    router.set_available(1, False)
+    await ari.stasis_start("c6")
+    assert router.owner("c6") is None and ari.hangups == ["c6"]
+
+
+@pytest.mark.asyncio
+async def test_exited_worker_calls_are_hung_up_and_missed_destroys_reconciled():
+    apps = [worker_app_name("app", index) for index in range(2)]
+    ari = _FakeARI(apps)
+    router = ShardRouter(ari, apps)
+    router.start()
+    for channel_id in ("c1", "c2", "c3"):
+        await ari.stasis_start(channel_id)
+
+    assert await router.release_worker(0) == 2
+    assert sorted(ari.hangups) == ["c1", "c3"] and router.active == [0, 1]
+
+    ari.channels.discard("c2")  # ChannelDestroyed lost while the websocket was down
+    assert await router.reconcile() == 1
+    assert router.active == [0, 0]
+
+
+def test_worker_config_gives_each_worker_its_own_app_and_ports():
+    config = _config(audio_transport="audiosocket", workers={"count": 4})
+    derived = worker_config(config, 2)
+    assert derived.asterisk.app_name == "ai-voice-agent-w2"
+    assert derived.audiosocket.port == config.audiosocket.port + 2
+    assert derived.external_media.rtp_port == config.external_media.rtp_port + 2
+    assert derived.workers.count == 1
+    assert config.asterisk.app_name == "ai-voice-agent" and config.workers.count == 4
+
+
+def _exit_immediately(config, index, health_port):
+    raise SystemExit(3)
+
+
+@pytest.mark.asyncio
+async def test_supervisor_restarts_exited_workers(monkeypatch):
+    monkeypatch.setenv("HEALTH_PORT", "0")
+    supervisor = EngineSupervisor(
+        _config(workers={"count": 2, "restart_backoff_sec": 0.0, "shutdown_timeout_sec": 2.0}),
+        target=_exit_immediately,
+    )
+    await supervisor.start(connect_ari=False)
+    try:
+        deadline = asyncio.get_running_loop().time() + 60
+        while min(supervisor.restarts) < 1:
+            assert asyncio.get_running_loop().time() < deadline, supervisor.status()
+            await asyncio.sleep(0.1)
+        assert {worker["app_name"] for worker in supervisor.status()} == {"ai-voice-agent-w0", "ai-voice-agent-w1"}
+    finally:
+        await supervisor.stop()
+    assert not any(worker["alive"] for worker in supervisor.status())
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from src.core.models import CallSession
+from src.core.session_store import SessionStore
+from src.core.streaming_playback_manager import StreamingPlaybackManager
+
+
+class _CountingStore(SessionStore):
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+
+    async def get_by_call_id(self, call_id):
+        self.lookups += 1
+        return await super().get_by_call_id(call_id)
+
+
+class _AudioSocket:
+    def __init__(self, dead=()):
+        self.sent = []
+        self.dead = set(dead)
+
+    async def send_audio(self, conn_id, payload):
+        if conn_id in self.dead:
+            return False
+        self.sent.append(conn_id)
+        return True
+
+
+async def _manager(store, audiosocket):
+    await store.upsert_call(CallSession(call_id="call-1", caller_channel_id="call-1", audiosocket_conn_id="conn-1"))
+    return StreamingPlaybackManager(
+        store,
+        None,
+        streaming_config={"min_start_ms": 20, "low_watermark_ms": 0, "provider_grace_ms": 0},
+        audio_transport="audiosocket",
+        audiosocket_server=audiosocket,
+    )
+
+
+async def _play(manager, chunks):
+    queue = asyncio.Queue()
+    await manager.start_streaming_playback("call-1", queue)
+    task = manager.active_streams["call-1"]["streaming_task"]
+    for chunk in chunks:
+        await queue.put(chunk)
+    await queue.put(None)
+    await task
+
+
+@pytest.mark.asyncio
+async def test_frame_path_uses_cached_context_and_flushes_counters_at_end():
+    store = _CountingStore()
+    audiosocket = _AudioSocket()
+    manager = await _manager(store, audiosocket)
+
+    await _play(manager, [b"\xff" * 160] * 20)
+
+    assert len(audiosocket.sent) == 20
+    # Stream start and cleanup only; nothing per chunk or per frame.
+    assert store.lookups <= 6
+    session = await store.get_by_call_id("call-1")
+    assert session.streaming_bytes_sent == 20 * 160
+    assert "call-1" not in manager._stream_contexts
+
+
+@pytest.mark.asyncio
+async def test_replaced_audiosocket_connection_is_picked_up_mid_stream():
+    store = SessionStore()
+    audiosocket = _AudioSocket(dead={"conn-1"})
+    manager = await _manager(store, audiosocket)
+    session = await store.get_by_call_id("call-1")
+    session.audiosocket_conn_id = "conn-2"  # reconnected after the stream context was bound
+
+    await manager.start_streaming_playback("call-1", asyncio.Queue())
+    manager._stream_contexts["call-1"].conn_id = "conn-1"
+    stream_id = manager.active_streams["call-1"]["stream_id"]
+
+    assert await manager._send_audio_chunk("call-1", stream_id, b"\xff" * 160)
+    assert audiosocket.sent == ["conn-2"]
+    assert manager._stream_contexts["call-1"].conn_id == "conn-2"
+    await manager.stop_streaming_playback("call-1")
@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import pytest
+
+from src.core.timer_wheel import TimerWheel
+
+
+@pytest.mark.asyncio
+async def test_call_later_fires_once_and_cancel_prevents_firing():
+    wheel = TimerWheel(tick_ms=5)
+    fired = []
+    wheel.call_later(0.02, fired.append, "a")
+    cancelled = wheel.call_later(0.02, fired.append, "b")
+    cancelled.cancel()
+    assert len(wheel) == 1
+
+    await asyncio.sleep(0.08)
+    assert fired == ["a"]
+    assert len(wheel) == 0
+    await wheel.stop()
+
+
+@pytest.mark.asyncio
+async def test_call_every_repeats_until_cancelled():
+    wheel = TimerWheel(tick_ms=5)
+    ticks = []
+    handle = wheel.call_every(0.01, lambda: ticks.append(1))
+    await asyncio.sleep(0.08)
+    handle.cancel()
+    seen = len(ticks)
+    assert seen >= 3
+    await asyncio.sleep(0.03)
+    assert len(ticks) == seen
+    assert handle.done()
+    await wheel.stop()
+
+
+@pytest.mark.asyncio
+async def test_long_delays_cascade_through_levels():
+    wheel = TimerWheel(tick_ms=2, wheel_sizes=(4, 4, 4))
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    fired = []
+    # 30 ticks is beyond level 0 (4 ticks) and level 1 (16 ticks).
+    wheel.call_later(0.06, lambda: fired.append(loop.time() - started))
+    await asyncio.sleep(0.15)
+    assert len(fired) == 1
+    assert fired[0] >= 0.06
+    await wheel.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_callback_runs_as_task_and_periodic_runs_do_not_overlap():
+    wheel = TimerWheel(tick_ms=5)
+    running = 0
+    overlaps = 0
+    runs = 0
+
+    async def slow():
+        nonlocal running, overlaps, runs
+        running += 1
+        overlaps = max(overlaps, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        runs += 1
+
+    handle = wheel.call_every(0.005, slow)
+    await asyncio.sleep(0.1)
+    handle.cancel()
+    await asyncio.sleep(0.03)
+    assert runs >= 2
+    assert overlaps == 1
+    await wheel.stop()
+
+
+@pytest.mark.asyncio
+async def test_timer_scheduled_while_wheel_lags_does_not_fire_early():
+    wheel = TimerWheel(tick_ms=10)
+    wheel.call_later(5.0, lambda: None)  # keeps the wheel from jumping to the clock
+    await asyncio.sleep(0)
+    time.sleep(0.2)  # block the loop: the wheel is now ~20 ticks behind
+    loop = asyncio.get_running_loop()
+    scheduled = loop.time()
+    fired = asyncio.Event()
+    wheel.call_later(0.1, fired.set)
+    await asyncio.wait_for(fired.wait(), 1.0)
+    assert loop.time() - scheduled >= 0.09
+    await wheel.stop()